@@ -0,0 +1,139 @@
+"""Mode batch: memuat daftar URL tanpa interaksi dan mencatat metrik JSONL.
+
+WebView dibuat lewat ASGBrowser.create_webview() sehingga konfigurasinya
+sama dengan tab biasa, tetapi ditempatkan di Gtk.OffscreenWindow agar
+tetap dianggap terlihat (tidak di-throttle). Jalankan di bawah Xvfb:
+
+    xvfb-run -a python browser.py --batch urls.txt --concurrency 4 --output hasil.jsonl
+"""
+import json
+import statistics
+import sys
+import time
+
+import gi
+gi.require_version('Gtk', '3.0')
+gi.require_version('WebKit2', '4.1')
+from gi.repository import GLib, Gtk, WebKit2
+
+from netlog import NetLog
+from tab import Tab
+
+
+def read_url_file(path):
+    """Satu URL per baris; baris kosong dan baris berawalan # diabaikan."""
+    with open(path, 'r') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+class BatchJob:
+    __slots__ = ("url", "tab", "window", "webview", "timeout_id", "error", "start")
+
+    def __init__(self, url):
+        self.url = url
+        self.tab = None
+        self.window = None
+        self.webview = None
+        self.timeout_id = None
+        self.error = None
+        self.start = 0.0
+
+
+class BatchRunner:
+    def __init__(self, browser, urls, concurrency=4, output=sys.stdout, timeout=30):
+        self.browser = browser
+        self.queue = list(reversed(urls))
+        self.concurrency = max(1, concurrency)
+        self.output = output
+        self.timeout = timeout
+        self.active = 0
+        self.results = []
+        self.elapsed = 0.0
+
+    def run(self):
+        """Memuat semua URL lalu kembali; mengembalikan daftar hasil."""
+        start = time.perf_counter()
+        for _ in range(self.concurrency):
+            self._next()
+        if self.active:
+            Gtk.main()
+        self.elapsed = time.perf_counter() - start
+        return self.results
+
+    def _next(self):
+        if not self.queue:
+            if self.active == 0 and Gtk.main_level():
+                Gtk.main_quit()
+            return
+        job = BatchJob(self.queue.pop())
+        self.active += 1
+
+        job.tab = Tab()
+        job.tab.netlog = NetLog(capacity=5000)
+        job.window = Gtk.OffscreenWindow()
+        job.window.set_default_size(1280, 800)
+        job.window.add(job.tab)
+
+        job.webview = self.browser.create_webview()
+        if not self.browser.config["network_log_size"]:
+            # Metrik diambil dari log jaringan walaupun dimatikan untuk tab biasa
+            job.webview.connect("resource-load-started", self.browser.on_resource_load_started)
+        job.tab.attach(job.webview)
+        job.webview.connect("load-changed", self._on_load_changed, job)
+        job.webview.connect("load-failed", self._on_load_failed, job)
+        job.window.show_all()
+
+        job.timeout_id = GLib.timeout_add_seconds(self.timeout, self._on_timeout, job)
+        job.start = time.perf_counter()
+        job.webview.load_uri(job.url)
+
+    def _on_load_failed(self, webview, event, uri, error, job):
+        job.error = error.message
+        return False
+
+    def _on_load_changed(self, webview, event, job):
+        if event == WebKit2.LoadEvent.FINISHED:
+            self._finish(job)
+
+    def _on_timeout(self, job):
+        job.timeout_id = None
+        job.error = "timeout"
+        self._finish(job)
+        return False
+
+    def _finish(self, job):
+        if job.webview is None:
+            return
+        if job.timeout_id is not None:
+            GLib.source_remove(job.timeout_id)
+            job.timeout_id = None
+
+        result = {"url": job.url, "ok": job.error is None, "error": job.error}
+        page = job.tab.netlog.current_page
+        if page is not None:
+            result.update(job.tab.netlog.summary(page))
+        result["wall_ms"] = round((time.perf_counter() - job.start) * 1000, 1)
+        self.results.append(result)
+        self.output.write(json.dumps(result) + "\n")
+        self.output.flush()
+
+        webview, job.webview = job.webview, None
+        webview.disconnect_by_func(self._on_load_changed)
+        webview.stop_loading()
+        job.tab.detach()
+        self.browser.ui.forget(job.tab)
+        self.browser.context_pool.release(webview)
+        webview.destroy()
+        job.window.destroy()
+        self.active -= 1
+        # Lanjut di iterasi berikutnya, bukan di dalam handler sinyal WebView
+        GLib.idle_add(self._next)
+
+    def summary(self):
+        finished = [r["finish_ms"] for r in self.results if r["ok"] and r.get("finish_ms") is not None]
+        return {
+            "urls": len(self.results),
+            "failed": sum(1 for r in self.results if not r["ok"]),
+            "median_finish_ms": round(statistics.median(finished), 1) if finished else None,
+            "pages_per_s": round(len(self.results) / self.elapsed, 2) if self.elapsed else None,
+        }
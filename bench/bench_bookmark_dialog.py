@@ -0,0 +1,71 @@
+"""Waktu membuka dialog bookmark dan menghapus satu entri.
+
+Diukur pada 1k, 10k dan 100k bookmark. Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_bookmark_dialog.py
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk
+
+from bookmark_list import BookmarkDialog
+from bookmark_store import BookmarkStore
+
+
+def drain_events():
+    while Gtk.events_pending():
+        Gtk.main_iteration_do(False)
+
+
+def measure(count, tmp):
+    store = BookmarkStore(os.path.join(tmp, f"bookmarks-{count}.sqlite"))
+    for i in range(count):
+        store.add(f"https://example{i % 997}.com/page/{i}", f"Halaman contoh {i}")
+    store.flush()
+
+    parent = Gtk.Window()
+    start = time.perf_counter()
+    dialog = BookmarkDialog(parent, store, lambda url: None)
+    dialog.show_all()
+    drain_events()
+    open_ms = (time.perf_counter() - start) * 1000
+
+    item = dialog.model.get_item(0)
+    start = time.perf_counter()
+    dialog.delete_item(item)
+    drain_events()
+    delete_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for query in ("h", "ha", "hal", "halaman 9", "halaman 99"):
+        dialog.apply_filter(query)
+        drain_events()
+    filter_ms = (time.perf_counter() - start) * 1000 / 5
+
+    dialog.destroy()
+    parent.destroy()
+    store.close()
+    return open_ms, delete_ms, filter_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    args = parser.parse_args()
+    print(f"{'bookmark':>9} {'buka (ms)':>10} {'hapus (ms)':>11} {'filter (ms)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in map(int, args.sizes.split(",")):
+            open_ms, delete_ms, filter_ms = measure(count, tmp)
+            print(f"{count:>9} {open_ms:>10.1f} {delete_ms:>11.1f} {filter_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark BookmarkStore: tambah, cari dan hapus pada 100k bookmark.
+
+    python bench/bench_bookmark_store.py --count 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bookmark_store import BookmarkStore
+
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:>10.1f} ms  {elapsed / count * 1e6:>8.2f} us/op")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+    n = args.count
+    urls = [f"https://example{i % 997}.com/page/{i}" for i in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, "bookmarks.json")
+        with open(legacy, "w") as f:
+            json.dump([{"title": f"Halaman {i}", "url": u} for i, u in enumerate(urls)], f, indent=4)
+        path = os.path.join(tmp, "bookmarks.sqlite")
+
+        start = time.perf_counter()
+        store = BookmarkStore(path, legacy_json=legacy)
+        print(f"{'migrasi json':<28} {(time.perf_counter() - start) * 1000:>10.1f} ms  ({len(store)} bookmark)")
+        store.close()
+
+        start = time.perf_counter()
+        store = BookmarkStore(path)
+        print(f"{'muat ulang':<28} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+        extra = [f"https://extra.example/{i}" for i in range(n)]
+        timed("tambah (main thread)", n, lambda: [store.add(u, "Extra", "Folder", ("tag",)) for u in extra])
+        timed("tunggu penulisan", n, store.flush)
+        timed("cari (ada)", n, lambda: [u in store for u in urls])
+        timed("cari (tidak ada)", n, lambda: [u + "#x" in store for u in urls])
+        timed("hapus (main thread)", n, lambda: [store.remove(u) for u in extra])
+        timed("tunggu penulisan", n, store.flush)
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark waktu muat halaman dengan dan tanpa pemblokir konten.
+
+Halaman /news.html dari server fixture memuat 15 skrip iklan dan 15
+piksel pelacak yang lambat. Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_content_blocking.py --loads 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+FILTER_LIST = """[Adblock Plus 2.0]
+! Daftar uji untuk benchmark
+/ads/*
+/track/*
+##.ad-box
+"""
+
+
+def run_child(url, loads):
+    from gi.repository import Gtk, WebKit2
+    import browser
+    import procstat
+
+    win = browser.ASGBrowser()
+    if win.content_blocker.enabled:
+        # Tunggu sampai filter selesai dikompilasi / dimuat dari cache
+        deadline = time.monotonic() + 60
+        while win.content_blocker.filter is None and time.monotonic() < deadline:
+            Gtk.main_iteration_do(True)
+
+    times = []
+    for _ in range(loads):
+        win.new_tab(uri=url)
+        webview = win.get_current_webview()
+        done = {}
+        webview.connect("load-changed",
+                        lambda w, e: e == WebKit2.LoadEvent.FINISHED and done.setdefault("t", time.perf_counter()))
+        start = time.perf_counter()
+        while "t" not in done:
+            Gtk.main_iteration_do(True)
+        times.append((done["t"] - start) * 1000)
+        blocked = win.get_current_tab().blocked_requests
+        win.close_tab(None, win.get_current_tab())
+
+    cpu = 0.0
+    for pid in procstat.web_process_pids():
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu += (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    print(json.dumps({"times": times, "blocked": blocked, "web_cpu_s": cpu}))
+
+
+def run_mode(enabled, url, loads):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(os.path.join(base_dir, "filters"))
+        with open(os.path.join(base_dir, "filters", "bench.txt"), "w") as f:
+            f.write(FILTER_LIST)
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"content_blocking": enabled}, f)
+        out = subprocess.run([sys.executable, __file__, "--child", "--url", url, "--loads", str(loads)],
+                             env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+        for line in reversed(out.stdout.splitlines()):
+            if line.startswith("{"):
+                return json.loads(line)
+        raise RuntimeError(out.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loads", type=int, default=10)
+    parser.add_argument("--url")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.url, args.loads)
+        return
+
+    import fixture_server
+    server = fixture_server.start()
+    url = fixture_server.base_url(server) + "/news.html"
+    print(f"{'pemblokir':<10} {'median (ms)':>12} {'diblokir':>9} {'CPU web (s)':>12}")
+    for enabled in (False, True):
+        r = run_mode(enabled, url, args.loads)
+        print(f"{'aktif' if enabled else 'mati':<10} {statistics.median(r['times']):>12.1f} "
+              f"{r['blocked']:>9} {r['web_cpu_s']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark RSS dan waktu muat warm-cache untuk N tab per model proses.
+
+Setiap model proses dijalankan di proses terpisah dengan profil baru,
+memuat halaman dari server fixture lokal. Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_context_pool.py --tabs 30
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("per-tab", "shared", "per-site", "capped")
+
+
+def run_child(tabs, url, timeout):
+    from gi.repository import Gtk, GLib, WebKit2
+    import browser
+    import procstat
+
+    win = browser.ASGBrowser()
+    result = {}
+    state = {"pending": 0, "start": 0.0}
+
+    def on_load_changed(webview, event):
+        if event == WebKit2.LoadEvent.FINISHED:
+            state["pending"] -= 1
+            if state["pending"] == 0:
+                Gtk.main_quit()
+
+    def wait_all():
+        timer = {"fired": False}
+
+        def on_timeout():
+            timer["fired"] = True
+            Gtk.main_quit()
+            return False
+
+        source = GLib.timeout_add_seconds(timeout, on_timeout)
+        Gtk.main()
+        if not timer["fired"]:
+            GLib.source_remove(source)
+
+    state["pending"] = tabs
+    state["start"] = time.perf_counter()
+    for _ in range(tabs):
+        win.new_tab(uri=url)
+        win.get_current_webview().connect("load-changed", on_load_changed)
+    wait_all()
+    result["cold_load_s"] = time.perf_counter() - state["start"]
+    result["incomplete"] = state["pending"]
+
+    # Beri waktu web process selesai mengalokasi sebelum RSS dibaca
+    GLib.timeout_add(1000, Gtk.main_quit)
+    Gtk.main()
+    result["rss_kb"] = procstat.tree_rss_kb()
+    result["web_processes"] = len(procstat.web_process_pids())
+
+    state["pending"] = tabs
+    state["start"] = time.perf_counter()
+    for webview in win.stack.get_children()[1:]:
+        webview.load_uri(url)
+    wait_all()
+    result["warm_load_s"] = time.perf_counter() - state["start"]
+    result["incomplete"] += state["pending"]
+    result.update(win.context_pool.stats())
+    print(json.dumps(result))
+
+
+def run_mode(mode, args, url):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(base_dir)
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"process_model": mode, "web_process_limit": args.limit}, f)
+        env = dict(os.environ, XDG_DATA_HOME=tmp)
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", "--tabs", str(args.tabs),
+             "--url", url, "--timeout", str(args.timeout)],
+            env=env, capture_output=True, text=True
+        )
+        for line in reversed(out.stdout.splitlines()):
+            if line.startswith("{"):
+                return json.loads(line)
+        raise RuntimeError(f"mode {mode} gagal:\n{out.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=4, help="web_process_limit untuk mode capped")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--timeout", type=int, default=120)
+    parser.add_argument("--url")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.tabs, args.url, args.timeout)
+        return
+
+    import fixture_server
+    server = fixture_server.start()
+    url = fixture_server.base_url(server) + "/page.html"
+    print(f"{'mode':<10} {'RSS (MiB)':>10} {'web proc':>9} {'cold (s)':>9} {'warm (s)':>9}")
+    for mode in args.modes.split(","):
+        r = run_mode(mode, args, url)
+        print(f"{mode:<10} {r['rss_kb'] / 1024:>10.1f} {r['web_processes']:>9} "
+              f"{r['cold_load_s']:>9.2f} {r['warm_load_s']:>9.2f}"
+              + (f"  ({r['incomplete']} tab tidak selesai)" if r["incomplete"] else ""))
+
+
+if __name__ == "__main__":
+    main()
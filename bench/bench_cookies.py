@@ -0,0 +1,118 @@
+"""Benchmark backend cookie (teks vs SQLite) dengan 10k cookie.
+
+Mengukur migrasi cookies.txt -> SQLite dan pembersihan cookie
+kedaluwarsa (tanpa gi), lalu di proses anak mengukur startup dingin
+(pencarian cookie pertama, termasuk memuat jar) dan pencarian berikutnya
+lewat CookieManager WebKit untuk setiap backend:
+
+    python bench/bench_cookies.py --cookies 10000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cookie_store
+
+
+def write_text_jar(path, count, domains, expired_ratio, seed=1):
+    rng = random.Random(seed)
+    now = int(time.time())
+    with open(path, "w") as f:
+        f.write("# Netscape HTTP Cookie File\n")
+        for i in range(count):
+            expiry = now - 3600 if rng.random() < expired_ratio else now + 86400 * 30
+            prefix = cookie_store.HTTP_ONLY_PREFIX if i % 3 == 0 else ""
+            f.write(f"{prefix}.site{i % domains}.test\tTRUE\t/\tFALSE\t{expiry}\tc{i}\t{'v' * 40}{i}\tLax\n")
+
+
+def run_child(path, backend, lookups, domains):
+    import gi
+    gi.require_version('WebKit2', '4.1')
+    from gi.repository import GLib, WebKit2
+
+    loop = GLib.MainLoop()
+    data_manager = WebKit2.WebsiteDataManager(base_data_directory=os.path.dirname(path),
+                                              base_cache_directory=os.path.dirname(path))
+    storage = {"sqlite": WebKit2.CookiePersistentStorage.SQLITE,
+               "text": WebKit2.CookiePersistentStorage.TEXT}[backend]
+    start = time.perf_counter()
+    cookie_manager = data_manager.get_cookie_manager()
+    cookie_manager.set_persistent_storage(path, storage)
+
+    def lookup(uri):
+        result = {}
+
+        def done(manager, res):
+            result["cookies"] = manager.get_cookies_finish(res)
+            loop.quit()
+        cookie_manager.get_cookies(uri, None, done)
+        loop.run()
+        return len(result["cookies"])
+
+    found = lookup("http://site0.test/")
+    cold = (time.perf_counter() - start) * 1000
+    times = []
+    rng = random.Random(2)
+    for _ in range(lookups):
+        t = time.perf_counter()
+        lookup(f"http://site{rng.randrange(domains)}.test/")
+        times.append((time.perf_counter() - t) * 1000)
+    print(json.dumps({"cold_ms": cold, "lookup_ms": statistics.median(times), "found": found}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cookies", type=int, default=10000)
+    parser.add_argument("--domains", type=int, default=2000)
+    parser.add_argument("--expired", type=float, default=0.2, help="porsi cookie kedaluwarsa")
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--child", nargs=2, metavar=("PATH", "BACKEND"))
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.child[0], args.child[1], args.lookups, args.domains)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_dir = os.path.join(tmp, "text")
+        sqlite_dir = os.path.join(tmp, "sqlite")
+        os.makedirs(text_dir)
+        os.makedirs(sqlite_dir)
+        text_path = cookie_store.cookie_file(text_dir, "text")
+        write_text_jar(text_path, args.cookies, args.domains, args.expired)
+
+        # Migrasi tanpa membuang cookie kedaluwarsa agar pembersihan ikut terukur
+        source = cookie_store.cookie_file(sqlite_dir, "text")
+        shutil.copy(text_path, source)
+        db_path = cookie_store.cookie_file(sqlite_dir, "sqlite")
+        start = time.perf_counter()
+        migrated = cookie_store.migrate_text_to_sqlite(source, db_path, now=0)
+        print(f"migrasi teks -> SQLite : {migrated} cookie, {(time.perf_counter() - start) * 1000:.1f} ms")
+        start = time.perf_counter()
+        removed = cookie_store.prune_expired(db_path)
+        print(f"pembersihan kedaluwarsa: {removed} cookie, {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        print(f"{'backend':<8} {'startup dingin (ms)':>20} {'lookup (ms)':>12}")
+        for backend, path in (("text", text_path), ("sqlite", db_path)):
+            out = subprocess.run([sys.executable, __file__, "--child", path, backend,
+                                  "--lookups", str(args.lookups), "--domains", str(args.domains)],
+                                 capture_output=True, text=True)
+            for line in reversed(out.stdout.splitlines()):
+                if line.startswith("{"):
+                    r = json.loads(line)
+                    print(f"{backend:<8} {r['cold_ms']:>20.1f} {r['lookup_ms']:>12.3f}")
+                    break
+            else:
+                print(f"{backend:<8} gagal: {out.stderr.strip().splitlines()[-1:]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Harness pengelola unduhan: throughput paralel, lanjut unduh dan pembatalan.
+
+Tidak butuh display. File biner besar disajikan server fixture lokal
+yang mendukung Range/If-Range (isinya dibuat dari pola, jadi bisa
+diverifikasi dengan sha256 tanpa disimpan di memori) lalu diunduh
+DownloadManager ke direktori sementara:
+
+- throughput --files file sekaligus dengan 1 dan --parallel transfer,
+  beserta jumlah laporan progres dibanding potongan data yang diterima;
+- koneksi yang diputus server di tengah jalan dilanjutkan dengan Range,
+  server tanpa Range diunduh ulang dari awal, file yang berubah di
+  server (ETag lain) tidak disambung;
+- jeda, tutup & buka ulang pengelola (downloads.json), lalu lanjutkan;
+- pembatalan, pemeriksaan ruang disk dan batas transfer paralel.
+
+    python bench/bench_downloads.py --size-mb 256 --files 4 --parallel 4
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fixture_server
+from downloads import CANCELLED, DONE, FAILED, PAUSED, RUNNING, DownloadManager
+
+MB = 1024 * 1024
+
+
+def sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(4 * MB), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def check(label, ok):
+    print(f"{'ok   ' if ok else 'GAGAL'} {label}")
+    return ok
+
+
+def intact(download, size):
+    return download.state == DONE and os.path.getsize(download.path) == size \
+        and sha256(download.path) == fixture_server.file_digest(size)
+
+
+def wait_for(predicate, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def reset_stats():
+    for key in fixture_server.FILE_STATS:
+        if key != "active":
+            fixture_server.FILE_STATS[key] = 0
+
+
+def manager(tmp, **kwargs):
+    """DownloadManager yang mencatat puncak unduhan berjalan di setiap laporan."""
+    kwargs.setdefault("retry_delay", 0.05)
+    mgr = DownloadManager(tmp, **kwargs)
+    mgr.peak = 0
+
+    def on_change(download):
+        mgr.peak = max(mgr.peak, mgr.stats()[RUNNING])
+
+    mgr.on_change = on_change
+    return mgr
+
+
+def run_throughput(base, size, files, parallel):
+    results = []
+    for n in (1, parallel):
+        with tempfile.TemporaryDirectory() as tmp:
+            reset_stats()
+            mgr = manager(tmp, max_parallel=n)
+            start = time.perf_counter()
+            downloads = [mgr.add(f"{base}/files/big{i}.bin") for i in range(files)]
+            mgr.wait()
+            elapsed = time.perf_counter() - start
+            ok = all(intact(d, size) for d in downloads)
+            stats = mgr.stats()
+            print(f"{n} paralel: {files} × {size // MB} MB dalam {elapsed:.2f} s · "
+                  f"{files * size / MB / elapsed:.0f} MB/s · maks {mgr.peak} berjalan · "
+                  f"{stats['reports']} laporan progres untuk {stats['chunks']} potongan "
+                  f"({stats['reports'] / files / elapsed:.1f}/s per unduhan)")
+            results.append(check(f"{n} paralel: semua file utuh", ok))
+            results.append(check(f"{n} paralel: tidak melebihi batas", mgr.peak <= n))
+            results.append(check(f"{n} paralel: laporan jauh lebih sedikit dari potongan data",
+                                 stats["reports"] * 10 < stats["chunks"]))
+    return all(results)
+
+
+def run_resume(base, size):
+    results = []
+    drops = [size // 4, size // 2, size * 3 // 4]
+    with tempfile.TemporaryDirectory() as tmp:
+        mgr = manager(tmp)
+
+        reset_stats()
+        fixture_server.FILES["/files/resume.bin"]["drop_after"] = list(drops)
+        download = mgr.add(f"{base}/files/resume.bin")
+        mgr.wait()
+        sent = fixture_server.FILE_STATS["bytes"]
+        print(f"Range: {len(drops)} koneksi putus · {fixture_server.FILE_STATS['ranged']} permintaan Range · "
+              f"{sent / MB:.0f} MB dikirim untuk {size / MB:.0f} MB")
+        results.append(check("koneksi putus dilanjutkan dengan Range",
+                             intact(download, size) and fixture_server.FILE_STATS["ranged"] == len(drops)))
+        results.append(check("tidak ada byte yang diunduh dua kali", sent == size))
+
+        reset_stats()
+        fixture_server.FILES["/files/noranges.bin"]["drop_after"] = [size // 2]
+        download = mgr.add(f"{base}/files/noranges.bin")
+        mgr.wait()
+        print(f"tanpa Range: {fixture_server.FILE_STATS['requests']} permintaan · "
+              f"{fixture_server.FILE_STATS['bytes'] / MB:.0f} MB dikirim")
+        results.append(check("server tanpa Range diunduh ulang dari awal",
+                             intact(download, size) and fixture_server.FILE_STATS["ranged"] == 0))
+
+        # File berubah di server saat dijeda: If-Range tidak cocok -> dari awal
+        reset_stats()
+        slow = fixture_server.FILES["/files/slow.bin"]
+        download = mgr.add(f"{base}/files/slow.bin")
+        wait_for(lambda: download.received > size // 8)
+        mgr.pause(download.id)
+        mgr.wait()
+        slow["etag"] = '"versi-baru"'
+        slow["rate"] = 0
+        mgr.resume(download.id)
+        mgr.wait()
+        results.append(check("file yang berubah tidak disambung (If-Range)",
+                             intact(download, size) and fixture_server.FILE_STATS["ranged"] == 0))
+        slow["rate"] = size / 4
+        mgr.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state = os.path.join(tmp, "downloads.json")
+        reset_stats()
+        mgr = manager(tmp, state_path=state)
+        download = mgr.add(f"{base}/files/slow.bin")
+        wait_for(lambda: download.received > size // 4)
+        mgr.close()
+        paused = download.state == PAUSED and os.path.exists(download.part_path)
+        received = download.received
+
+        mgr = manager(tmp, state_path=state)
+        restored = mgr.get(download.id)
+        fixture_server.FILES["/files/slow.bin"]["rate"] = 0
+        mgr.resume(restored.id)
+        mgr.wait()
+        print(f"buka ulang: dijeda di {received / MB:.0f} MB · "
+              f"{fixture_server.FILE_STATS['bytes'] / MB:.0f} MB dikirim total")
+        results.append(check("dijeda saat ditutup, .part tersisa", paused))
+        results.append(check("dilanjutkan setelah dibuka ulang", restored is not None and intact(restored, size)
+                             and fixture_server.FILE_STATS["ranged"] == 1))
+        mgr.close()
+    return all(results)
+
+
+def run_cancel(base, size):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_server.FILES["/files/slow.bin"]["rate"] = size / 4
+        mgr = manager(tmp)
+        download = mgr.add(f"{base}/files/slow.bin")
+        wait_for(lambda: download.received > size // 8)
+        part = download.part_path
+        received = download.received
+        start = time.perf_counter()
+        mgr.cancel(download.id)
+        mgr.wait()
+        cancel_ms = (time.perf_counter() - start) * 1000
+        closed = wait_for(lambda: fixture_server.FILE_STATS["active"] == 0, 5)
+        print(f"batal di {received / MB:.0f} MB: berhenti dalam {cancel_ms:.1f} ms")
+        results.append(check("dibatalkan, .part dihapus",
+                             download.state == CANCELLED and not os.path.exists(part)))
+        results.append(check("koneksi ke server ditutup", closed))
+        results.append(check("tidak ada file di direktori unduhan", os.listdir(tmp) == []))
+
+        # Antrian: yang belum mulai dibatalkan tanpa pernah terhubung
+        reset_stats()
+        mgr.set_max_parallel(1)
+        first = mgr.add(f"{base}/files/slow.bin")
+        queued = mgr.add(f"{base}/files/slow.bin")
+        mgr.cancel(queued.id)
+        mgr.cancel(first.id)
+        mgr.wait()
+        results.append(check("unduhan dalam antrian dibatalkan tanpa koneksi",
+                             queued.state == CANCELLED and fixture_server.FILE_STATS["requests"] == 1))
+
+        # Ruang disk: cadangan lebih besar dari sisa disk -> gagal sebelum menulis
+        full = manager(tmp, reserve_bytes=10 ** 15)
+        download = full.add(f"{base}/files/big0.bin")
+        full.wait()
+        print(f"ruang disk: {download.error}")
+        results.append(check("ruang disk diperiksa sebelum mulai",
+                             download.state == FAILED and not os.path.exists(download.part_path)))
+        mgr.close()
+        full.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reset_stats()
+        small = size // 16
+        for i in range(8):
+            fixture_server.add_file(f"/files/small{i}.bin", small, rate=small * 4)
+        mgr = manager(tmp, max_parallel=2)
+        downloads = [mgr.add(f"{base}/files/small{i}.bin") for i in range(8)]
+        mgr.wait()
+        print(f"batas paralel 2: maks {mgr.peak} berjalan")
+        results.append(check("antrian menghormati batas paralel",
+                             mgr.peak == 2 and all(intact(d, small) for d in downloads)))
+        mgr.close()
+    return all(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--parallel", type=int, default=4)
+    args = parser.parse_args()
+
+    size = args.size_mb * MB
+    for i in range(args.files):
+        fixture_server.add_file(f"/files/big{i}.bin", size, filename=f"artefak-{i}.img")
+    fixture_server.add_file("/files/resume.bin", size)
+    fixture_server.add_file("/files/noranges.bin", size, ranges=False)
+    # ~4 detik per file: cukup lama untuk dijeda/dibatalkan di tengah
+    fixture_server.add_file("/files/slow.bin", size, rate=size / 4)
+    server = fixture_server.start()
+    base = fixture_server.base_url(server)
+
+    ok = run_throughput(base, size, args.files, args.parallel)
+    ok &= run_resume(base, size)
+    ok &= run_cancel(base, size)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
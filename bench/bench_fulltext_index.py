@@ -0,0 +1,119 @@
+"""Benchmark indeks teks halaman: throughput pengindeksan dan latensi query FTS5.
+
+Tidak butuh display. Halaman sintetis (kosakata berdistribusi Zipf,
+judul & isi) dimasukkan lewat FullTextIndex.submit seperti dari browser;
+waktu terlama satu submit dicatat karena itulah yang dibayar main thread.
+Lalu sebagian halaman dikirim ulang tanpa perubahan (harus dilewati
+lewat hash) dan query berbagai jenis diukur median & p95-nya:
+
+    python bench/bench_fulltext_index.py --pages 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fulltext_index import FullTextIndex
+
+SYLLABLES = ("ka", "ma", "ra", "ta", "sa", "na", "la", "pa", "ba", "da", "ga", "ja",
+             "ki", "mi", "ri", "ti", "si", "ni", "ku", "mu", "ru", "tu", "su", "nu")
+
+
+def make_vocabulary(rng, size):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def make_page(rng, vocab, weights, words):
+    body = rng.choices(vocab, weights, k=words)
+    for i in range(0, len(body), 12):
+        body[i] = body[i].capitalize()
+    title = " ".join(rng.choices(vocab, weights, k=rng.randint(3, 7))).capitalize()
+    return title, " ".join(body) + "."
+
+
+def submit_all(index, pages, start_id=0):
+    """Mengirim semua halaman; menunggu jika antrian penuh. Mengembalikan submit terlama (µs)."""
+    worst = 0.0
+    for n, (title, text) in enumerate(pages, start_id):
+        while True:
+            t = time.perf_counter()
+            ok = index.submit(f"https://situs{n % 500}.example/halaman/{n}", title, text)
+            worst = max(worst, time.perf_counter() - t)
+            if ok:
+                break
+            time.sleep(0.001)
+    return worst * 1e6
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100000)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    vocab = make_vocabulary(rng, args.vocabulary)
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    pages = [make_page(rng, vocab, weights, args.words) for _ in range(args.pages)]
+    text_mb = sum(len(t) + len(b) for t, b in pages) / 1e6
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fulltext.sqlite")
+        index = FullTextIndex(path)
+
+        start = time.perf_counter()
+        worst_us = submit_all(index, pages)
+        index.flush()
+        elapsed = time.perf_counter() - start
+        size_mb = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)) / 1e6
+        print(f"indeks {args.pages} halaman ({text_mb:.0f} MB teks): {elapsed:.1f} s · "
+              f"{args.pages / elapsed:.0f} halaman/s · submit terlama {worst_us:.0f} µs · "
+              f"berkas {size_mb:.0f} MB")
+
+        repeat = pages[:min(10000, len(pages))]
+        start = time.perf_counter()
+        submit_all(index, repeat)
+        index.flush()
+        elapsed = time.perf_counter() - start
+        print(f"kunjungan ulang tanpa perubahan: {len(repeat)} halaman {elapsed:.2f} s · "
+              f"dilewati {index.unchanged}/{len(repeat)}")
+
+        index.optimize()
+        index.flush()
+        kinds = {
+            "kata umum": lambda: vocab[rng.randint(0, 20)],
+            "kata jarang": lambda: vocab[rng.randint(len(vocab) // 2, len(vocab) - 1)],
+            "dua kata": lambda: f"{vocab[rng.randint(0, 200)]} {vocab[rng.randint(0, 2000)]}",
+            "awalan": lambda: vocab[rng.randint(0, 2000)][:4] + "*",
+        }
+        print(f"{'query':<12} {'median':>9} {'p95':>9} {'hasil':>6}")
+        for label, make in kinds.items():
+            times, hits = [], []
+            for _ in range(args.queries):
+                text = make()
+                t = time.perf_counter()
+                hits.append(len(index.search(text)))
+                times.append((time.perf_counter() - t) * 1000)
+            print(f"{label:<12} {statistics.median(times):7.2f}ms {percentile(times, 95):7.2f}ms "
+                  f"{statistics.median(hits):6.0f}")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark riwayat: memuat indeks dan latensi query omnibox pada 1 juta baris.
+
+    python bench/bench_history.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history import HistoryIndex, HistoryStore, SCHEMA
+
+WORDS = ("berita", "cuaca", "resep", "kamus", "peta", "jadwal", "harga", "belanja",
+         "video", "musik", "forum", "dokumentasi", "laporan", "kursus", "wiki")
+
+
+def make_db(path, rows):
+    rnd = random.Random(1)
+    now = time.time()
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+
+    def gen():
+        for i in range(rows):
+            host = f"{rnd.choice(WORDS)}{i % 5000}.example.com"
+            title = f"{rnd.choice(WORDS).title()} {rnd.choice(WORDS)} {i}"
+            yield (f"https://{host}/p/{i}", title, rnd.randint(1, 50), rnd.randint(0, 5),
+                   now - rnd.random() * 200 * 86400)
+
+    conn.executemany(
+        "INSERT INTO urls (url, title, visit_count, typed_count, last_visit) VALUES (?, ?, ?, ?, ?)",
+        gen()
+    )
+    conn.commit()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.sqlite")
+        start = time.perf_counter()
+        make_db(path, args.rows)
+        print(f"isi database: {time.perf_counter() - start:.1f} s ({args.rows} baris)")
+
+        index = HistoryIndex()
+        start = time.perf_counter()
+        index.load(path)
+        print(f"muat indeks (di thread latar): {time.perf_counter() - start:.1f} s")
+
+        queries = ["b", "be", "ber", "berita1", "https://cuaca42", "www.peta", "resep 12",
+                   "dokumen", "kursus wiki", "tidakadasamasekali", "p/99", "jadwal4999"]
+        print(f"{'query':<22} {'p50 (ms)':>9} {'maks (ms)':>10} {'hasil':>6}")
+        for q in queries:
+            times = []
+            for _ in range(20):
+                start = time.perf_counter()
+                results = index.search(q)
+                times.append((time.perf_counter() - start) * 1000)
+            print(f"{q:<22} {statistics.median(times):>9.2f} {max(times):>10.2f} {len(results):>6}")
+
+        store = HistoryStore(path, lambda cb, *a: cb(*a))
+        n = 10000
+        start = time.perf_counter()
+        for i in range(n):
+            store.record_visit(f"https://baru.example.com/{i}", f"Baru {i}", "link")
+        queued = time.perf_counter() - start
+        store.writer.flush()
+        total = time.perf_counter() - start
+        print(f"catat {n} kunjungan: {queued * 1e6 / n:.1f} us/kunjungan di main thread, "
+              f"{total:.2f} s sampai tertulis")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
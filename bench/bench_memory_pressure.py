@@ -0,0 +1,138 @@
+"""Harness tahap reaksi tekanan memori dengan sumber tekanan sintetis.
+
+Tanpa --tabs (tidak butuh display): SyntheticPressure menurunkan memori
+tersedia lalu memulihkannya; tahap MemoryMonitor di setiap sampel
+dibandingkan dengan tahap yang diharapkan (status keluar 1 jika
+berbeda) dan biaya satu sampel /proc asli juga diukur. Dengan --tabs N
+browser membuka N tab fixture lalu tahap digerakkan lewat
+BrowserServices.check_memory sambil mengukur RSS browser:
+
+    python bench/bench_memory_pressure.py
+    xvfb-run -a python bench/bench_memory_pressure.py --tabs 20
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from memory_monitor import STAGE_NAMES, MemoryMonitor, SyntheticPressure, read_sample
+
+# Memori tersedia (persen) per sampel: turun bertahap lalu pulih
+RAMP = [60, 30, 18, 15, 9, 8, 4, 3, 12, 12, 12, 25, 25, 25, 60, 60, 60]
+# Tahap yang diharapkan: naik seketika, turun setelah 3 sampel tenang
+EXPECTED = [0, 0, 1, 1, 2, 2, 3, 3, 3, 3, 1, 1, 1, 0, 0, 0, 0]
+
+
+def run_synthetic():
+    source = SyntheticPressure()
+    changes = []
+    monitor = MemoryMonitor(lambda old, new, sample: changes.append((old, new)), source)
+    ok = True
+    print("sampel  tersedia  tahap")
+    for n, (pct, expected) in enumerate(zip(RAMP, EXPECTED)):
+        source.set(available_pct=pct)
+        stage = monitor.check()
+        mark = "" if stage == expected else f"  GAGAL (seharusnya {STAGE_NAMES[expected]})"
+        ok &= stage == expected
+        print(f"{n:6d}  {pct:7d}%  {STAGE_NAMES[stage]}{mark}")
+    print("perubahan tahap: " + ", ".join(f"{STAGE_NAMES[a]}→{STAGE_NAMES[b]}" for a, b in changes))
+    print(f"tahap dimasuki : {monitor.stats()['entered']}")
+
+    start = time.perf_counter()
+    for _ in range(50):
+        read_sample()
+    print(f"biaya sampel /proc: {(time.perf_counter() - start) * 1000 / 50:.2f} ms")
+    return ok
+
+
+def run_child(url, tabs):
+    from gi.repository import Gtk, WebKit2
+    import browser
+    import procstat
+
+    win = browser.ASGBrowser()
+    services = win.services
+    source = SyntheticPressure()
+    services.memory.source = source
+    pending = set()
+
+    def on_load_changed(webview, event):
+        if event == WebKit2.LoadEvent.FINISHED:
+            pending.discard(webview)
+
+    def settle(seconds):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            Gtk.main_iteration_do(False)
+            time.sleep(0.01)
+
+    for _ in range(tabs):
+        win.new_tab(uri=url)
+        webview = win.get_current_webview()
+        webview.connect("load-changed", on_load_changed)
+        pending.add(webview)
+    deadline = time.monotonic() + 120
+    while pending and time.monotonic() < deadline:
+        Gtk.main_iteration_do(True)
+    settle(2)
+
+    rows = []
+    for pct in (60, 15, 8, 3, 60, 60, 60):
+        source.set(available_pct=pct)
+        stage = services.check_memory()
+        settle(3)
+        live = sum(1 for tab in win.stack.get_children() if not tab.hibernated)
+        rows.append({"available_pct": pct, "stage": STAGE_NAMES[stage], "live_tabs": live,
+                     "prewarm_blocked": services.context_pool.prewarm_blocked,
+                     "rss_kb": procstat.tree_rss_kb()})
+    print(json.dumps(rows))
+
+
+def run_browser(tabs):
+    import fixture_server
+    server = fixture_server.start()
+    url = fixture_server.base_url(server) + "/page.html"
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(base_dir)
+        # Timer pemantau dimatikan; tahap hanya digerakkan oleh harness
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"hibernate_idle_timeout": 0, "hibernate_max_live_tabs": 0,
+                       "memory_check_interval": 0}, f)
+        out = subprocess.run([sys.executable, __file__, "--child", "--url", url, "--tabs", str(tabs)],
+                             env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith("["):
+            rows = json.loads(line)
+            break
+    else:
+        raise RuntimeError(out.stderr)
+    print("tersedia  tahap   tab hidup  prewarm  RSS browser")
+    for r in rows:
+        print(f"{r['available_pct']:7d}%  {r['stage']:<7} {r['live_tabs']:9d}  "
+              f"{'ditolak' if r['prewarm_blocked'] else 'boleh':<7}  {r['rss_kb'] / 1024:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=0)
+    parser.add_argument("--url")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.url, args.tabs)
+    elif args.tabs:
+        run_browser(args.tabs)
+    else:
+        sys.exit(0 if run_synthetic() else 1)
+
+
+if __name__ == "__main__":
+    main()
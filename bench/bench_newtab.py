@@ -0,0 +1,65 @@
+"""Latensi membuka tab baru: load_html("file:///") lama vs asg://newtab.
+
+Mengukur waktu dari new_tab() sampai LoadEvent.FINISHED untuk N tab per
+mode. Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_newtab.py --tabs 30
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure(win, tabs):
+    from gi.repository import Gtk, WebKit2
+    times = []
+    for _ in range(tabs):
+        done = {}
+        start = time.perf_counter()
+        win.new_tab()
+        webview = win.get_current_webview()
+
+        def on_load_changed(webview, event):
+            if event == WebKit2.LoadEvent.FINISHED:
+                done["t"] = time.perf_counter()
+
+        webview.connect("load-changed", on_load_changed)
+        while "t" not in done:
+            Gtk.main_iteration_do(True)
+        times.append((done["t"] - start) * 1000)
+    for tab in win.stack.get_children()[1:]:
+        win.close_tab(None, tab)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=30)
+    args = parser.parse_args()
+    os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp()
+
+    import browser
+    win = browser.ASGBrowser()
+
+    def legacy_start_page(webview):
+        webview.load_html(win.homepage_html, "file:///")
+
+    measure(win, 3)  # pemanasan web process
+    print(f"{'mode':<22} {'median (ms)':>12} {'p90 (ms)':>10}")
+    for label, loader in (("load_html file:///", legacy_start_page), ("asg://newtab", None)):
+        if loader:
+            win.load_start_page = loader
+        else:
+            del win.load_start_page
+        times = sorted(measure(win, args.tabs))
+        print(f"{label:<22} {statistics.median(times):>12.1f} {times[int(len(times) * 0.9) - 1]:>10.1f}")
+    win.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Harness arsip offline: deduplikasi, pemangkasan LRU dan fallback saat jaringan gagal.
+
+Tanpa --browser (tidak butuh display): halaman fixture diambil dari
+server lokal lalu disimpan ke OfflineArchive di direktori sementara
+(sebagian dua kali dan di bawah URL lain untuk deduplikasi), dengan
+kuota kecil agar LRU bekerja; hasilnya diperiksa setelah arsip dibuka
+ulang. Dengan --browser: halaman fixture disimpan lewat WebView.save
+(MHTML), lalu dimuat ulang setelah server dimatikan (fallback load-failed)
+dan dalam mode offline, dan waktu muatnya dibandingkan:
+
+    python bench/bench_offline_archive.py
+    xvfb-run -a python bench/bench_offline_archive.py --browser
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fixture_server
+from offline_archive import OfflineArchive, archive_key
+
+PAGES = ("/page.html", "/news.html", "/suite/text.html", "/suite/images.html") + fixture_server.ARTICLES
+
+
+def fetch(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read()
+
+
+def check(label, ok):
+    print(f"{'ok   ' if ok else 'GAGAL'} {label}")
+    return ok
+
+
+def run_archive(copies):
+    server = fixture_server.start()
+    base = fixture_server.base_url(server)
+    bodies = {base + path: fetch(base + path) for path in PAGES}
+    largest = max(len(body) for body in bodies.values())
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Kuota muat sekitar separuh halaman: sisanya harus dibuang LRU
+        quota = max(sum(len(body) for body in bodies.values()) // 2, largest)
+        archive = OfflineArchive(tmp, quota)
+        start = time.perf_counter()
+        for url, body in bodies.items():
+            for n in range(copies):
+                archive.store(url + f"#salinan{n}", "Fixture", body)
+            # URL lain dengan isi sama berbagi blob
+            archive.store(url + "?mirror=1", "Cermin", body)
+        archive.flush()
+        store_ms = (time.perf_counter() - start) * 1000
+        stats = archive.stats()
+        on_disk = sum(len(files) for _, _, files in os.walk(os.path.join(tmp, "blobs")))
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            for url in bodies:
+                archive.get(url)
+        lookup_us = (time.perf_counter() - start) * 1e6 / (1000 * len(bodies))
+        kept = [url for url in bodies if archive.get(url) is not None]
+        intact = all(archive.read(url) == bodies[url] for url in kept)
+        archive.close()
+
+        start = time.perf_counter()
+        reopened = OfflineArchive(tmp, quota)
+        open_ms = (time.perf_counter() - start) * 1000
+        same = sorted(p.url for p in reopened.pages()) == sorted(archive_key(u) for u in archive.latest)
+        reopened.close()
+
+    print(f"{len(bodies)} halaman × {copies + 1} simpanan: {store_ms:.1f} ms · lookup {lookup_us:.2f} µs "
+          f"· buka ulang {open_ms:.1f} ms")
+    print(f"arsip {stats['bytes'] / 1024:.0f} KB dari kuota {quota / 1024:.0f} KB · {on_disk} blob di disk "
+          f"· {stats['pruned_blobs']} dibuang · {len(kept)} halaman tersisa")
+    results.append(check("ukuran arsip di bawah kuota", stats["bytes"] <= quota))
+    results.append(check("satu file per isi (deduplikasi)", on_disk <= len(bodies)))
+    results.append(check("LRU membuang sebagian halaman", 0 < len(kept) < len(bodies)))
+    results.append(check("salinan yang tersisa utuh", intact))
+    results.append(check("indeks sama setelah dibuka ulang", same))
+    return all(results)
+
+
+def run_child(path):
+    from gi.repository import Gtk, WebKit2
+    import browser
+
+    server = fixture_server.start()
+    url = fixture_server.base_url(server) + path
+    win = browser.ASGBrowser()
+    services = win.services
+
+    def iterate(seconds, until):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline and not until():
+            Gtk.main_iteration_do(False)
+            time.sleep(0.005)
+
+    def load(uri):
+        """Waktu sampai navigasi (termasuk fallback ke arsip) selesai, dan URI akhirnya."""
+        done = []
+
+        def on_load_changed(webview, event):
+            # FINISHED setelah load-failed diikuti muat arsip: tunggu yang terakhir
+            if event == WebKit2.LoadEvent.FINISHED and not webview.is_loading():
+                done.append(webview.get_uri() or "")
+
+        handler = webview.connect("load-changed", on_load_changed)
+        start = time.perf_counter()
+        webview.load_uri(uri)
+        iterate(60, lambda: done)
+        webview.disconnect(handler)
+        return (time.perf_counter() - start) * 1000, webview.get_uri() or ""
+
+    services.setup_offline_archive()
+    win.new_tab()
+    webview = win.get_current_webview()
+    network_ms, _ = load(url)
+    saved = []
+    services.save_offline(webview, url, webview.get_title(), lambda page, new: saved.append(page))
+    iterate(30, lambda: saved)
+
+    server.shutdown()
+    server.server_close()
+    webview.load_uri("about:blank")
+    iterate(5, lambda: not webview.is_loading())
+    fallback_ms, fallback_uri = load(url)
+    services.set_offline_mode(True)
+    offline_ms, offline_uri = load(url)
+    print(json.dumps({"saved": bool(saved and saved[0]), "size": saved[0].size if saved and saved[0] else 0,
+                      "network_ms": network_ms, "fallback_ms": fallback_ms, "fallback_uri": fallback_uri,
+                      "offline_ms": offline_ms, "offline_uri": offline_uri}))
+
+
+def run_browser(path):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, "asg-browser"))
+        out = subprocess.run([sys.executable, __file__, "--child", "--path", path],
+                             env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith("{"):
+            r = json.loads(line)
+            break
+    else:
+        raise RuntimeError(out.stderr)
+    print(f"muat dari jaringan {r['network_ms']:7.1f} ms · MHTML {r['size'] / 1024:.0f} KB")
+    print(f"fallback load-failed {r['fallback_ms']:7.1f} ms · {r['fallback_uri']}")
+    print(f"mode offline         {r['offline_ms']:7.1f} ms · {r['offline_uri']}")
+    ok = check("disimpan", r["saved"])
+    ok &= check("fallback dari arsip", r["fallback_uri"].startswith("asg://offline/"))
+    ok &= check("mode offline dari arsip", r["offline_uri"].startswith("asg://offline/"))
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", action="store_true")
+    parser.add_argument("--copies", type=int, default=2)
+    parser.add_argument("--path", default=fixture_server.ARTICLES[0])
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.path)
+        return
+    ok = run_browser(args.path) if args.browser else run_archive(args.copies)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
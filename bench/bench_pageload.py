@@ -0,0 +1,101 @@
+"""Benchmark waktu muat & throughput halaman sintetis lewat mode batch.
+
+Menjalankan ``browser.py --batch`` terhadap server fixture lokal (tanpa
+jaringan) dan merangkum metrik per halaman. Hasil bisa disimpan lalu
+dibandingkan dengan versi sebelumnya. Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_pageload.py --repeat 5 --save hasil.json
+    xvfb-run -a python bench/bench_pageload.py --repeat 5 --baseline hasil.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_batch(urls, concurrency):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, "asg-browser"))
+        url_file = os.path.join(tmp, "urls.txt")
+        out_file = os.path.join(tmp, "hasil.jsonl")
+        with open(url_file, "w") as f:
+            f.write("\n".join(urls) + "\n")
+        proc = subprocess.run([sys.executable, os.path.join(ROOT, "browser.py"), "--batch", url_file,
+                               "--concurrency", str(concurrency), "--output", out_file],
+                              env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+        if not os.path.exists(out_file):
+            raise RuntimeError(proc.stderr)
+        with open(out_file) as f:
+            results = [json.loads(line) for line in f if line.strip()]
+        summary = json.loads(proc.stderr.strip().splitlines()[-1])
+    return results, summary
+
+
+def summarize(results, base):
+    pages = {}
+    for r in results:
+        path = r["url"][len(base):]
+        pages.setdefault(path, []).append(r)
+    out = {}
+    for path, rs in pages.items():
+        ok = [r for r in rs if r["ok"]]
+        out[path] = {
+            "commit_ms": statistics.median(r["commit_ms"] for r in ok) if ok else None,
+            "finish_ms": statistics.median(r["finish_ms"] for r in ok) if ok else None,
+            "requests": ok[-1]["requests"] if ok else 0,
+            "bytes": ok[-1]["bytes"] if ok else 0,
+            "failures": len(rs) - len(ok) + sum(r["failures"] for r in ok),
+        }
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="jumlah muat per halaman")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--save", metavar="FILE", help="simpan ringkasan sebagai acuan")
+    parser.add_argument("--baseline", metavar="FILE", help="bandingkan dengan ringkasan tersimpan")
+    args = parser.parse_args()
+
+    import fixture_server
+    server = fixture_server.start()
+    base = fixture_server.base_url(server)
+    urls = [base + path for _ in range(args.repeat) for path in fixture_server.SUITE]
+
+    results, batch_summary = run_batch(urls, args.concurrency)
+    pages = summarize(results, base)
+    report = {"pages": pages, "pages_per_s": batch_summary["pages_per_s"]}
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"{'halaman':<28} {'commit':>8} {'selesai':>8} {'req':>5} {'KB':>8} {'gagal':>6} {'Δ selesai':>10}")
+    for path, p in pages.items():
+        delta = ""
+        old = baseline["pages"].get(path) if baseline else None
+        if old and old["finish_ms"] and p["finish_ms"]:
+            delta = f"{(p['finish_ms'] / old['finish_ms'] - 1) * 100:+.1f}%"
+        commit = f"{p['commit_ms']:.0f}" if p["commit_ms"] is not None else "-"
+        finish = f"{p['finish_ms']:.0f}" if p["finish_ms"] is not None else "-"
+        print(f"{path:<28} {commit:>8} {finish:>8} {p['requests']:>5} "
+              f"{p['bytes'] / 1024:>8.0f} {p['failures']:>6} {delta:>10}")
+    line = f"throughput: {report['pages_per_s']} halaman/detik (concurrency {args.concurrency})"
+    if baseline and baseline.get("pages_per_s"):
+        line += f", acuan {baseline['pages_per_s']}"
+    print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Harness prefetch DNS dengan resolver stub dan server HTTP lokal.
+
+Resolver stub (UDP, jeda buatan) menjawab nama ``*.test`` dengan
+127.0.0.1. Jejak sintetis berisi hover link, jeda berpikir dan navigasi
+diputar dua kali: tanpa prefetch dan dengan DNSPrefetcher yang
+menghangatkan cache resolver saat hover. Tidak butuh display:
+
+    python bench/bench_prefetch.py --navigations 40 --dns-delay 0.08
+"""
+import argparse
+import http.client
+import os
+import random
+import socket
+import statistics
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from prefetch import DNSPrefetcher
+
+
+# ================= RESOLVER STUB =================
+def _read_qname(data, offset):
+    labels = []
+    while data[offset]:
+        length = data[offset]
+        labels.append(data[offset + 1:offset + 1 + length].decode("ascii"))
+        offset += length + 1
+    return ".".join(labels), offset + 1
+
+
+def start_stub_resolver(delay):
+    """Server DNS UDP minimal; mengembalikan (alamat, penghitung query)."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    queries = {"count": 0}
+
+    def answer(data, addr):
+        time.sleep(delay)
+        name, end = _read_qname(data, 12)
+        question = data[12:end + 4]
+        if name.endswith(".test"):
+            header = struct.pack(">HHHHHH", struct.unpack(">H", data[:2])[0], 0x8180, 1, 1, 0, 0)
+            record = struct.pack(">HHHIH", 0xC00C, 1, 1, 60, 4) + socket.inet_aton("127.0.0.1")
+        else:
+            header = struct.pack(">HHHHHH", struct.unpack(">H", data[:2])[0], 0x8183, 1, 0, 0, 0)
+            record = b""
+        sock.sendto(header + question + record, addr)
+
+    def serve():
+        while True:
+            data, addr = sock.recvfrom(512)
+            queries["count"] += 1
+            threading.Thread(target=answer, args=(data, addr), daemon=True).start()
+
+    threading.Thread(target=serve, daemon=True).start()
+    return sock.getsockname(), queries
+
+
+def stub_lookup(server, host):
+    query_id = random.randrange(65536)
+    qname = b"".join(bytes([len(p)]) + p.encode("ascii") for p in host.split(".")) + b"\0"
+    packet = struct.pack(">HHHHHH", query_id, 0x0100, 1, 0, 0, 0) + qname + struct.pack(">HH", 1, 1)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(2)
+        sock.sendto(packet, server)
+        data = sock.recv(512)
+    if struct.unpack(">H", data[2:4])[0] & 0xF:
+        raise OSError(f"NXDOMAIN: {host}")
+    return socket.inet_ntoa(data[-4:])
+
+
+class CachingResolver:
+    """Cache resolver seperti di network process: query yang sedang berjalan ikut ditunggu."""
+
+    def __init__(self, server, pool):
+        self.server = server
+        self.pool = pool
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def _future(self, host):
+        with self.lock:
+            future = self.cache.get(host)
+            if future is None:
+                future = self.pool.submit(stub_lookup, self.server, host)
+                self.cache[host] = future
+            return future
+
+    def prefetch(self, host):
+        self._future(host)
+
+    def resolve(self, host):
+        return self._future(host).result()
+
+
+# ================= JEJAK =================
+def make_trace(navigations, hosts, seed=1):
+    rng = random.Random(seed)
+    trace = []
+    for i in range(navigations):
+        target = f"site{rng.randrange(hosts)}.test"
+        # Sesekali kursor menyapu banyak link sekaligus
+        sweep = 20 if i % 10 == 0 else 3
+        for _ in range(sweep - 1):
+            trace.append(("hover", f"site{rng.randrange(hosts)}.test"))
+        trace.append(("hover", target))
+        trace.append(("think", 0.12))
+        trace.append(("nav", target))
+    return trace
+
+
+def replay(trace, dns_server, http_port, prefetch):
+    pool = ThreadPoolExecutor(4)
+    resolver = CachingResolver(dns_server, pool)
+    prefetcher = DNSPrefetcher(resolver.prefetch) if prefetch else None
+    latencies = []
+    for kind, value in trace:
+        if kind == "hover":
+            if prefetcher is not None:
+                prefetcher.hint(f"http://{value}:{http_port}/page.html")
+        elif kind == "think":
+            time.sleep(value)
+        else:
+            url = f"http://{value}:{http_port}/page.html"
+            start = time.perf_counter()
+            ip = resolver.resolve(value)
+            conn = http.client.HTTPConnection(ip, http_port)
+            conn.request("GET", "/page.html", headers={"Host": value})
+            conn.getresponse().read()
+            conn.close()
+            latencies.append((time.perf_counter() - start) * 1000)
+            if prefetcher is not None:
+                prefetcher.navigated(url)
+    pool.shutdown()
+    return latencies, prefetcher.stats() if prefetcher else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--navigations", type=int, default=40)
+    parser.add_argument("--hosts", type=int, default=60)
+    parser.add_argument("--dns-delay", type=float, default=0.08, help="jeda resolver stub (detik)")
+    args = parser.parse_args()
+
+    import fixture_server
+    server = fixture_server.start()
+    http_port = server.server_address[1]
+    trace = make_trace(args.navigations, args.hosts)
+
+    print(f"{'mode':<10} {'median (ms)':>12} {'p90 (ms)':>10} {'query DNS':>10}")
+    for prefetch in (False, True):
+        dns_server, queries = start_stub_resolver(args.dns_delay)
+        latencies, stats = replay(trace, dns_server, http_port, prefetch)
+        p90 = statistics.quantiles(latencies, n=10)[-1]
+        print(f"{'prefetch' if prefetch else 'dingin':<10} {statistics.median(latencies):>12.1f} "
+              f"{p90:>10.1f} {queries['count']:>10}")
+    print("penghitung prefetch:", stats)
+
+
+if __name__ == "__main__":
+    main()
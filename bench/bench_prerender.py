@@ -0,0 +1,98 @@
+"""Benchmark waktu-sampai-tampil: hit prerender dibanding muat dingin.
+
+Setiap percobaan mengetik URL di url_entry lalu menekan Enter. Pada mode
+prerender, halaman yang sama lebih dulu di-prerender di WebView
+tersembunyi. Waktu diukur sampai halaman selesai dimuat di tab yang
+terlihat dan satu frame digambar. Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_prerender.py --trials 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_child(url, trials):
+    from gi.repository import Gtk
+    import browser
+
+    win = browser.ASGBrowser()
+
+    def spin_until(cond, timeout=30):
+        deadline = time.monotonic() + timeout
+        while not cond() and time.monotonic() < deadline:
+            Gtk.main_iteration_do(True)
+
+    def time_to_visible(target):
+        win.url_entry.set_text(target)
+        start = time.perf_counter()
+        win.load_url(win.url_entry)
+
+        def loaded():
+            webview = win.get_current_webview()
+            return (webview is not None and not webview.is_loading()
+                    and (webview.get_uri() or "").rstrip("/") == target.rstrip("/"))
+        spin_until(loaded)
+        painted = []
+        win.get_current_webview().add_tick_callback(lambda *_: painted.append(time.perf_counter()) and False)
+        spin_until(lambda: painted)
+        return (painted[0] - start) * 1000
+
+    results = {"cold": [], "prerender": []}
+    for i in range(trials):
+        results["cold"].append(time_to_visible(f"{url}?cold={i}"))
+
+        target = f"{url}?hit={i}"
+        win.prerenderer.start(target, "typed")
+        spin_until(lambda: win.prerenderer.webview is not None and not win.prerenderer.webview.is_loading())
+        results["prerender"].append(time_to_visible(target))
+
+    print(json.dumps(dict(results, stats=win.prerenderer.stats())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--page", default="/suite/images.html")
+    parser.add_argument("--url")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.url, args.trials)
+        return
+
+    import fixture_server
+    server = fixture_server.start()
+    url = fixture_server.base_url(server) + args.page
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(base_dir)
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"prerender": True, "hibernate_idle_timeout": 0}, f)
+        out = subprocess.run([sys.executable, __file__, "--child", "--url", url, "--trials", str(args.trials)],
+                             env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith("{"):
+            r = json.loads(line)
+            break
+    else:
+        raise RuntimeError(out.stderr)
+
+    print(f"{'mode':<10} {'median (ms)':>12} {'min (ms)':>9} {'max (ms)':>9}")
+    for mode in ("cold", "prerender"):
+        times = r[mode]
+        print(f"{mode:<10} {statistics.median(times):>12.1f} {min(times):>9.1f} {max(times):>9.1f}")
+    print("penghitung prerender:", r["stats"])
+
+
+if __name__ == "__main__":
+    main()
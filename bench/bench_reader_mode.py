@@ -0,0 +1,148 @@
+"""Harness mode baca: memori dan kelancaran scroll artikel biasa vs mode baca.
+
+Artikel fixture (iklan yang terus menyegarkan DOM, handler scroll yang
+memaksa layout, gambar, menu & sidebar) dibuka di browser, sekali biasa
+dan sekali dari situs yang diingat untuk mode baca. Setelah halaman
+tenang diukur RSS seluruh proses browser, lalu halaman di-scroll 40 px
+per frame selama --frames frame dan interval requestAnimationFrame-nya
+dicatat (median, p95, frame > 25 ms):
+
+    xvfb-run -a python bench/bench_reader_mode.py --runs 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+JANK_MS = 25
+
+SCROLL_JS = """
+(function () {
+    var deltas = [], last = 0, n = 0;
+    function frame(ts) {
+        if (last) deltas.push(ts - last);
+        last = ts;
+        if (window.innerHeight + window.scrollY >= document.documentElement.scrollHeight)
+            window.scrollTo(0, 0);
+        else
+            window.scrollBy(0, 40);
+        if (++n <= %d) requestAnimationFrame(frame);
+        else window.__asgScroll = deltas;
+    }
+    requestAnimationFrame(frame);
+})();
+"""
+
+
+def run_child(url, frames):
+    from gi.repository import GLib, Gtk
+    import browser
+    import procstat
+
+    win = browser.ASGBrowser()
+    win.new_tab(uri=url)
+    tab = win.get_current_tab()
+    reader = win.services.reader.remembered(url)
+
+    def iterate(seconds, until=None):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline and not (until and until()):
+            Gtk.main_iteration_do(False)
+            time.sleep(0.005)
+
+    def loaded():
+        webview = tab.webview
+        if webview is None or webview.is_loading() or webview.get_estimated_load_progress() < 1:
+            return False
+        return not reader or tab.reader is not None
+
+    start = time.monotonic()
+    iterate(60, loaded)
+    load_s = time.monotonic() - start
+    iterate(3)
+    rss_kb = procstat.tree_rss_kb()
+
+    result = []
+
+    def poll():
+        def on_value(webview, res):
+            try:
+                value = webview.run_javascript_finish(res).get_js_value().to_string()
+            except GLib.Error:
+                return
+            if value != "null":
+                result.append(json.loads(value))
+        tab.webview.run_javascript("JSON.stringify(window.__asgScroll || null)", None, on_value)
+
+    tab.webview.run_javascript(SCROLL_JS % frames, None, None)
+    deadline = time.monotonic() + 60
+    while not result and time.monotonic() < deadline:
+        poll()
+        iterate(0.25, lambda: bool(result))
+    deltas = result[0] if result else []
+    print(json.dumps({"reader": tab.reader is not None, "load_s": load_s, "rss_kb": rss_kb,
+                      "frames_ms": deltas}))
+
+
+def measure(url, reader, frames):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(base_dir)
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"content_blocking": False, "prerender": False}, f)
+        with open(os.path.join(base_dir, "reader_sites.json"), "w") as f:
+            json.dump([urlsplit(url).hostname] if reader else [], f)
+        out = subprocess.run([sys.executable, __file__, "--child", "--url", url, "--frames", str(frames)],
+                             env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(out.stderr)
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))] if values else 0.0
+
+
+def run_browser(runs, frames):
+    import fixture_server
+    server = fixture_server.start()
+    base = fixture_server.base_url(server)
+    print(f"{'mode':<7} {'muat':>7} {'RSS':>10} {'frame median':>13} {'p95':>8} {'jank':>6}")
+    for label, reader in (("biasa", False), ("baca", True)):
+        results = [measure(base + fixture_server.ARTICLES[n % len(fixture_server.ARTICLES)], reader, frames)
+                   for n in range(runs)]
+        if reader and not all(r["reader"] for r in results):
+            print("peringatan: mode baca tidak aktif di sebagian percobaan")
+        frames_ms = [d for r in results for d in r["frames_ms"]]
+        jank = sum(1 for d in frames_ms if d > JANK_MS) / max(1, len(frames_ms))
+        print(f"{label:<7} {statistics.median(r['load_s'] for r in results):6.2f}s "
+              f"{statistics.median(r['rss_kb'] for r in results) / 1024:7.1f} MB "
+              f"{percentile(frames_ms, 50):10.1f} ms {percentile(frames_ms, 95):5.1f} ms {jank:6.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--url")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.url, args.frames)
+    else:
+        run_browser(args.runs, args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Waktu dari peluncuran sampai URL tampil: cold start vs diteruskan ke instance berjalan.
+
+Cold: proses baru memulai ASGApplication dengan URL. Diteruskan:
+``browser.py URL`` dijalankan saat instance sudah berjalan, sehingga
+URL dikirim lewat D-Bus dan dibuka sebagai tab baru. "Tampil" dihitung
+saat halaman fixture selesai dimuat di instance utama. Butuh display
+dan session bus, misalnya:
+
+    xvfb-run -a dbus-run-session python bench/bench_remote_open.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+BROWSER = os.path.join(ROOT, "browser.py")
+
+
+def run_child(urls):
+    from gi.repository import WebKit2
+    import browser
+
+    # Laporkan setiap halaman fixture yang selesai dimuat (jam dinding,
+    # dibandingkan dengan waktu peluncuran di proses induk)
+    create_webview = browser.ASGBrowser.create_webview
+
+    def on_load_changed(webview, event):
+        if event == WebKit2.LoadEvent.FINISHED and "bench=" in (webview.get_uri() or ""):
+            print(json.dumps({"uri": webview.get_uri(), "time": time.time()}), flush=True)
+
+    def patched(self, uri=None):
+        webview = create_webview(self, uri)
+        webview.connect("load-changed", on_load_changed)
+        return webview
+
+    browser.ASGBrowser.create_webview = patched
+    app = browser.ASGApplication()
+    sys.exit(app.run([sys.argv[0]] + urls))
+
+
+def wait_report(proc, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        line = proc.stdout.readline()
+        if not line:
+            break
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError("instance utama tidak melaporkan halaman selesai dimuat")
+
+
+def start_primary(env, url):
+    start = time.time()
+    proc = subprocess.Popen([sys.executable, __file__, "--child", url], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    return proc, wait_report(proc)["time"] - start
+
+
+def stop(proc):
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+def _ms(values):
+    return f"median {statistics.median(values) * 1000:7.1f} ms  min {min(values) * 1000:7.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true")
+    parser.add_argument("urls", nargs="*")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.urls)
+        return
+    if not os.environ.get("DBUS_SESSION_BUS_ADDRESS"):
+        sys.exit("Session bus tidak ada; jalankan lewat dbus-run-session")
+
+    import fixture_server
+    server = fixture_server.start()
+    base = fixture_server.base_url(server) + "/page.html?bench="
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, XDG_DATA_HOME=tmp, XDG_CACHE_HOME=os.path.join(tmp, "cache"))
+        cold = []
+        for n in range(args.runs):
+            proc, elapsed = start_primary(env, f"{base}cold{n}")
+            cold.append(elapsed)
+            stop(proc)
+
+        proc, _ = start_primary(env, f"{base}primary")
+        forwarded = []
+        launcher = []
+        try:
+            for n in range(args.runs):
+                start = time.time()
+                subprocess.run([sys.executable, BROWSER, f"{base}remote{n}"], env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+                launcher.append(time.time() - start)
+                forwarded.append(wait_report(proc)["time"] - start)
+        finally:
+            stop(proc)
+
+    print(f"cold start            : {_ms(cold)}")
+    print(f"diteruskan lewat D-Bus: {_ms(forwarded)}")
+    print(f"  proses peluncur     : {_ms(launcher)}")
+
+
+if __name__ == "__main__":
+    main()
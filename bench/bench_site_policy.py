@@ -0,0 +1,151 @@
+"""Harness kebijakan per situs: biaya pencarian trie dan waktu CPU halaman dibatasi.
+
+Tanpa --browser (tidak butuh display): waktu lookup PolicyStore dengan
+10 sampai 100.000 aturan, dibandingkan dengan pencocokan linear. Dengan
+--browser: halaman dasbor fixture dibuka dari 127.0.0.1 (tanpa aturan)
+dan dari localhost (JS, WebGL, gambar, font & autoplay dimatikan), lalu
+waktu CPU web process selama halaman terbuka dibandingkan:
+
+    python bench/bench_site_policy.py
+    xvfb-run -a python bench/bench_site_policy.py --browser --seconds 10
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from site_policy import FORMAT_VERSION, PolicyStore, SitePolicy, parse_site
+
+RESTRICTED = {"javascript": False, "webgl": False, "images": False, "fonts": False, "autoplay": False}
+
+
+def random_site(rng):
+    labels = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9)))
+              for _ in range(rng.randint(1, 3))]
+    site = ".".join(labels) + "." + rng.choice(("com", "org", "net", "id", "co.id"))
+    return ("*." + site) if rng.random() < 0.5 else site
+
+
+def linear_lookup(rules, host):
+    policy = SitePolicy()
+    for site, rule in rules:
+        domain, suffix = parse_site(site)
+        if host == domain or (suffix and host.endswith("." + domain)):
+            policy = policy.merged(rule)
+    return policy
+
+
+def run_lookup(lookups):
+    rng = random.Random(1)
+    print(f"{'aturan':>8}  {'trie':>10}  {'linear':>10}")
+    for count in (10, 1000, 10000, 100000):
+        store = PolicyStore(None)
+        sites = [random_site(rng) for _ in range(count)]
+        store.add_rules((site, SitePolicy(javascript=False)) for site in sites)
+        hosts = ["www." + parse_site(rng.choice(sites))[0] for _ in range(lookups // 2)]
+        hosts += [random_site(rng).lstrip("*.") for _ in range(lookups // 2)]
+
+        start = time.perf_counter()
+        for host in hosts:
+            store.lookup(host)
+        trie_us = (time.perf_counter() - start) * 1e6 / len(hosts)
+
+        rules = list(store.rules.items())
+        sample = hosts[:max(1, min(len(hosts), 200000 // count))]
+        start = time.perf_counter()
+        for host in sample:
+            linear_lookup(rules, host)
+        linear_us = (time.perf_counter() - start) * 1e6 / len(sample)
+        print(f"{count:>8}  {trie_us:>8.2f}µs  {linear_us:>8.1f}µs")
+
+
+def run_child(url, seconds):
+    from gi.repository import Gtk, WebKit2
+    import browser
+    import procstat
+
+    win = browser.ASGBrowser()
+    done = []
+
+    def on_load_changed(webview, event):
+        if event == WebKit2.LoadEvent.FINISHED:
+            done.append(webview)
+
+    def cpu():
+        return sum(procstat.read_cpu_seconds(p) for p in procstat.web_process_pids())
+
+    # Font filter dikompilasi asinkron; tunggu sebelum navigasi
+    deadline = time.monotonic() + 10
+    while win.services.site_settings.font_filter is None and time.monotonic() < deadline:
+        Gtk.main_iteration_do(True)
+    start_cpu = cpu()
+    win.new_tab(uri=url)
+    win.get_current_webview().connect("load-changed", on_load_changed)
+    deadline = time.monotonic() + 60
+    while not done and time.monotonic() < deadline:
+        Gtk.main_iteration_do(True)
+    load_cpu = cpu() - start_cpu
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        Gtk.main_iteration_do(False)
+        time.sleep(0.005)
+    print(json.dumps({"load_cpu": load_cpu, "total_cpu": cpu() - start_cpu,
+                      "applied": win.services.site_settings.applied}))
+
+
+def measure(url, seconds):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(base_dir)
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"content_blocking": False}, f)
+        with open(os.path.join(base_dir, "site_policies.json"), "w") as f:
+            json.dump({"version": FORMAT_VERSION, "rules": [dict(site="localhost", **RESTRICTED)]}, f)
+        out = subprocess.run([sys.executable, __file__, "--child", "--url", url, "--seconds", str(seconds)],
+                             env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(out.stderr)
+
+
+def run_browser(seconds, runs):
+    import fixture_server
+    server = fixture_server.start()
+    port = server.server_address[1]
+    for label, host in (("tanpa aturan", "127.0.0.1"), ("dibatasi", "localhost")):
+        results = [measure(f"http://{host}:{port}/dashboard.html", seconds) for _ in range(runs)]
+        load = statistics.median(r["load_cpu"] for r in results)
+        total = statistics.median(r["total_cpu"] for r in results)
+        print(f"{label:<13} CPU muat {load:6.2f} s · CPU {seconds} s terbuka {total:6.2f} s "
+              f"· kebijakan diterapkan {results[0]['applied']}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", action="store_true")
+    parser.add_argument("--seconds", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=100000)
+    parser.add_argument("--url")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.url, args.seconds)
+    elif args.browser:
+        run_browser(args.seconds, args.runs)
+    else:
+        run_lookup(args.lookups)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark startup cold/warm di bawah Xvfb.
+
+Menjalankan browser.py berulang kali dengan ASG_STARTUP_TRACE dan
+ASG_STARTUP_EXIT=1, lalu melaporkan median waktu per fase. Cold memakai
+profil baru setiap kali (dan membuang page cache jika dijalankan sebagai
+root); warm memakai profil yang sama. Xvfb dijalankan otomatis jika
+DISPLAY belum ada.
+
+    python bench/bench_startup.py --runs 5 --saved-tabs 100
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BROWSER = os.path.join(ROOT, "browser.py")
+
+
+def start_xvfb():
+    if os.environ.get("DISPLAY"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        sys.exit("DISPLAY tidak ada dan Xvfb tidak ditemukan")
+    display = ":97"
+    proc = subprocess.Popen([xvfb, display, "-screen", "0", "1280x800x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(1)
+    os.environ["DISPLAY"] = display
+    return proc
+
+
+def drop_caches():
+    if os.geteuid() != 0:
+        return False
+    subprocess.run(["sync"])
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+    return True
+
+
+def write_session(profile, tabs):
+    base_dir = os.path.join(profile, "asg-browser")
+    os.makedirs(base_dir, exist_ok=True)
+    if not tabs:
+        return
+    session = {"version": 1, "active": 0, "tabs": [
+        {"uri": f"http://127.0.0.1:9/tab/{i}", "title": f"Tab {i}", "state": None}
+        for i in range(tabs)
+    ]}
+    with open(os.path.join(base_dir, "session.json"), "w") as f:
+        json.dump(session, f)
+
+
+def run_once(profile):
+    trace_file = os.path.join(profile, "trace.json")
+    env = dict(os.environ, XDG_DATA_HOME=profile, XDG_CACHE_HOME=os.path.join(profile, "cache"),
+               ASG_STARTUP_TRACE=trace_file, ASG_STARTUP_EXIT="1")
+    start = time.perf_counter()
+    subprocess.run([sys.executable, BROWSER, "--new-instance"], env=env, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, timeout=120)
+    wall = time.perf_counter() - start
+    with open(trace_file) as f:
+        report = json.load(f)
+    os.unlink(trace_file)
+    return report, wall
+
+
+def summarize(label, reports):
+    print(f"\n{label}")
+    phases = [row["phase"] for row in reports[0][0]["phases"]]
+    for phase in phases:
+        values = [next(r["ms"] for r in rep["phases"] if r["phase"] == phase) for rep, _ in reports]
+        print(f"  {phase:<24} {statistics.median(values):>9.1f} ms")
+    paint = [next(r["at_ms"] for r in rep["phases"] if r["phase"] == "first paint") for rep, _ in reports]
+    print(f"  {'paint pertama (t)':<24} {statistics.median(paint):>9.1f} ms")
+    print(f"  {'total proses':<24} {statistics.median(w for _, w in reports) * 1000:>9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--saved-tabs", type=int, default=0,
+                        help="jumlah tab di session.json yang dipulihkan saat startup")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb()
+    try:
+        cold = []
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as profile:
+                write_session(profile, args.saved_tabs)
+                drop_caches()
+                cold.append(run_once(profile))
+        summarize("cold (profil baru" + (", page cache dibuang)" if os.geteuid() == 0 else ")"), cold)
+
+        with tempfile.TemporaryDirectory() as profile:
+            write_session(profile, args.saved_tabs)
+            run_once(profile)  # pemanasan
+            warm = []
+            for _ in range(args.runs):
+                write_session(profile, args.saved_tabs)
+                warm.append(run_once(profile))
+        summarize("warm", warm)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Mengukur latensi pindah tab & pembaruan judul dengan 10, 100 dan 500 tab.
+
+Tab dibuat sebagai placeholder (tanpa WebView, pemulihan hibernasi
+dimatikan) sehingga yang diukur hanya biaya deretan tab dan Gtk.Stack.
+Latensi dihitung dari perubahan sampai frame berikutnya selesai (dan
+animasi transisi selesai jika diaktifkan). Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_tab_strip.py
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def run_child(tabs, rounds):
+    from gi.repository import Gtk
+    import browser
+    from tab import Tab
+
+    win = browser.ASGBrowser()
+    # Placeholder tetap tanpa WebView selama pengukuran
+    win.hibernation.restore = lambda tab: None
+    for i in range(tabs):
+        tab = Tab(f"Halaman contoh {i}")
+        tab.uri = f"https://example{i}.test/artikel/{i}"
+        win.add_tab(tab)
+
+    def settle():
+        while Gtk.events_pending():
+            Gtk.main_iteration_do(False)
+
+    def wait_frame():
+        done = []
+        win.add_tick_callback(lambda *_: done.append(1) or False)
+        while not done or win.stack.get_transition_running():
+            Gtk.main_iteration_do(True)
+
+    settle()
+    wait_frame()
+    rng = random.Random(1)
+    children = win.stack.get_children()
+
+    switch = []
+    for _ in range(rounds):
+        tab = rng.choice(children)
+        if tab is win.get_current_tab():
+            continue
+        start = time.perf_counter()
+        win.stack.set_visible_child(tab)
+        wait_frame()
+        switch.append((time.perf_counter() - start) * 1000)
+
+    title = []
+    for n in range(rounds):
+        tab = rng.choice(children)
+        start = time.perf_counter()
+        win.ui.update(tab, "title", f"Judul baru {n} untuk tab yang cukup panjang")
+        wait_frame()
+        title.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        win.tab_strip.index.search("hlmn 42")
+    search = (time.perf_counter() - start) * 1000 / rounds
+
+    print(json.dumps({"switch": switch, "title": title, "search_ms": search}))
+
+
+def measure(tabs, rounds, animation):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(base_dir)
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"hibernate_idle_timeout": 0, "hibernate_max_live_tabs": 0,
+                       "tab_switch_animation": animation, "prerender": False}, f)
+        cmd = [sys.executable, __file__, "--child", "--tabs", str(tabs), "--rounds", str(rounds)]
+        out = subprocess.run(cmd, env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(out.stderr)
+
+
+def _ms(values):
+    values = sorted(values)
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    return f"median {statistics.median(values):6.1f} ms  p95 {p95:6.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--animation", action="store_true", help="Bandingkan juga dengan animasi geser")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.tabs[0], args.rounds)
+        return
+
+    modes = [False, True] if args.animation else [False]
+    for tabs in args.tabs:
+        for animation in modes:
+            r = measure(tabs, args.rounds, animation)
+            label = "animasi" if animation else "instan"
+            print(f"{tabs:4d} tab ({label})")
+            print(f"  pindah tab     : {_ms(r['switch'])}")
+            print(f"  ubah judul     : {_ms(r['title'])}")
+            print(f"  cari tab       : {r['search_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Mengukur penggabungan pembaruan UI saat banyak tab dimuat ulang bersamaan.
+
+Membuka N tab halaman fixture, lalu memuat ulang semuanya sekaligus dan
+membandingkan jumlah sinyal WebView yang diterima dengan jumlah pembaruan
+widget yang benar-benar diterapkan. Butuh display, misalnya:
+
+    xvfb-run -a python bench/bench_ui_scheduler.py --tabs 50
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_child(url, tabs):
+    from gi.repository import Gtk, WebKit2
+    import browser
+
+    win = browser.ASGBrowser()
+    pending = set()
+
+    def on_load_changed(webview, event):
+        if event == WebKit2.LoadEvent.FINISHED:
+            pending.discard(webview)
+
+    def wait(timeout=120):
+        deadline = time.monotonic() + timeout
+        while pending and time.monotonic() < deadline:
+            Gtk.main_iteration_do(True)
+
+    webviews = []
+    for _ in range(tabs):
+        win.new_tab(uri=url)
+        webview = win.get_current_webview()
+        webview.connect("load-changed", on_load_changed)
+        webviews.append(webview)
+        pending.add(webview)
+    wait()
+    while Gtk.events_pending():
+        Gtk.main_iteration_do(False)
+
+    # Badai reload: semua tab dimuat ulang sekaligus
+    ui = win.ui
+    ui.signals_received = ui.updates_applied = ui.frames = 0
+    start = time.perf_counter()
+    for webview in webviews:
+        pending.add(webview)
+        webview.reload()
+    wait()
+    while Gtk.events_pending():
+        Gtk.main_iteration_do(False)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(json.dumps(dict(ui.stats(), elapsed_ms=elapsed)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=50)
+    parser.add_argument("--url")
+    parser.add_argument("--child", action="store_true")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.url, args.tabs)
+        return
+
+    import fixture_server
+    server = fixture_server.start()
+    url = fixture_server.base_url(server) + "/page.html"
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = os.path.join(tmp, "asg-browser")
+        os.makedirs(base_dir)
+        # Tanpa hibernasi agar semua tab tetap hidup selama pengukuran
+        with open(os.path.join(base_dir, "config.json"), "w") as f:
+            json.dump({"hibernate_idle_timeout": 0, "hibernate_max_live_tabs": 0}, f)
+        out = subprocess.run([sys.executable, __file__, "--child", "--url", url, "--tabs", str(args.tabs)],
+                             env=dict(os.environ, XDG_DATA_HOME=tmp), capture_output=True, text=True)
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith("{"):
+            r = json.loads(line)
+            break
+    else:
+        raise RuntimeError(out.stderr)
+
+    print(f"tab                : {args.tabs}")
+    print(f"sinyal diterima    : {r['signals_received']}")
+    print(f"pembaruan widget   : {r['updates_applied']}")
+    print(f"frame              : {r['frames']}")
+    print(f"waktu reload       : {r['elapsed_ms']:.0f} ms")
+    if r["updates_applied"]:
+        print(f"rasio penggabungan : {r['signals_received'] / r['updates_applied']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""Server HTTP lokal untuk benchmark, tanpa akses jaringan.
+
+Halaman dan aset dibuat di memori saat modul dimuat. Jalankan langsung
+untuk menyajikannya secara manual:
+
+    python bench/fixture_server.py --port 8000
+"""
+import argparse
+import hashlib
+import random
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+PAGES = {}
+# File unduhan besar, isinya dibuat dari pola saat dikirim
+FILES = {}
+# Statistik file unduhan: byte terkirim, permintaan, koneksi bersamaan
+FILE_STATS = {"bytes": 0, "requests": 0, "ranged": 0, "active": 0, "max_active": 0}
+_stats_lock = threading.Lock()
+# Panjang pola prima: potongan yang tersambung di offset salah tidak cocok
+PATTERN_SIZE = 1048573
+_PATTERN = random.Random(3).randbytes(PATTERN_SIZE) * 2
+_RANGE = re.compile(r"bytes=(\d+)-(\d*)$")
+
+
+def add_page(path, body, content_type="text/html; charset=utf-8", max_age=3600, delay=0.0):
+    """Mendaftarkan halaman; delay (detik) meniru server pihak ketiga yang lambat."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    PAGES[path] = (content_type, body, max_age, delay)
+
+
+def add_file(path, size, etag=None, ranges=True, rate=0, filename=None):
+    """Mendaftarkan file unduhan sebesar size byte tanpa menyimpannya di memori.
+
+    ranges=False meniru server tanpa dukungan Range, rate membatasi
+    byte/detik per koneksi. Offset di FILES[path]["drop_after"] memutus
+    koneksi sekali saat byte itu tercapai (meniru jaringan yang putus).
+    """
+    FILES[path] = {"size": size, "etag": etag or f'"{path}-{size}"', "ranges": ranges, "rate": rate,
+                   "filename": filename, "drop_after": []}
+
+
+def file_chunks(start, end, chunk_size=256 * 1024):
+    """Isi file unduhan dari byte start sampai sebelum end, per potongan."""
+    view = memoryview(_PATTERN)
+    while start < end:
+        n = min(chunk_size, end - start, PATTERN_SIZE)
+        offset = start % PATTERN_SIZE
+        yield view[offset:offset + n]
+        start += n
+
+
+def file_digest(size):
+    digest = hashlib.sha256()
+    for chunk in file_chunks(0, size, 4 * 1024 * 1024):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _build_pages():
+    # Gambar 1x1 GIF transparan
+    gif = (b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!"
+           b"\xf9\x04\x01\x00\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00"
+           b"\x00\x02\x02D\x01\x00;")
+    for i in range(40):
+        add_page(f"/img/{i}.gif", gif, "image/gif")
+    for i in range(10):
+        add_page(f"/js/{i}.js", f"window.v{i} = {i};\n" + "//" + "x" * 4000 + "\n",
+                 "application/javascript")
+    add_page("/css/site.css", "body { font-family: sans-serif; }\n" + "/*" + "x" * 8000 + "*/\n",
+             "text/css")
+
+    imgs = "".join(f'<img src="/img/{i}.gif" width="16" height="16">' for i in range(40))
+    scripts = "".join(f'<script src="/js/{i}.js"></script>' for i in range(10))
+    add_page("/page.html",
+             "<html><head><meta charset='utf-8'><title>Fixture</title>"
+             f"<link rel='stylesheet' href='/css/site.css'>{scripts}</head>"
+             f"<body><h1>Fixture</h1><p>{'Lorem ipsum dolor sit amet. ' * 200}</p>{imgs}</body></html>")
+
+    # Halaman berita dengan iklan & pelacak lambat (untuk benchmark pemblokir)
+    for i in range(15):
+        add_page(f"/ads/ad{i}.js",
+                 "var s = 0; for (var i = 0; i < 2e6; i++) { s += i; }\n"
+                 f"document.write('<div class=\"ad-box\">Iklan {i}</div>');\n",
+                 "application/javascript", max_age=0, delay=0.15)
+        add_page(f"/track/pixel{i}.gif", gif, "image/gif", max_age=0, delay=0.15)
+    ads = "".join(f'<script src="/ads/ad{i}.js"></script>' for i in range(15))
+    pixels = "".join(f'<img src="/track/pixel{i}.gif" width="1" height="1">' for i in range(15))
+    add_page("/news.html",
+             "<html><head><meta charset='utf-8'><title>Berita</title>"
+             "<link rel='stylesheet' href='/css/site.css'></head>"
+             f"<body><h1>Berita</h1><p>{'Isi berita yang panjang. ' * 300}</p>{ads}{pixels}</body></html>",
+             max_age=0)
+
+    # Dasbor berat: animasi & polling terus-menerus, font web dan gambar
+    # (untuk harness kebijakan per situs)
+    add_page("/fonts/dashboard.woff", b"wOFF" + b"\0" * 60000, "font/woff")
+    add_page("/dashboard.html",
+             "<html><head><meta charset='utf-8'><title>Dasbor</title><style>"
+             "@font-face { font-family: Dash; src: url(/fonts/dashboard.woff); }"
+             "body { font-family: Dash, sans-serif; }</style></head><body><h1>Dasbor</h1>"
+             "<canvas id='c' width='600' height='300'></canvas><div id='rows'></div>"
+             + "".join(f'<img src="/img/{i}.gif" width="16" height="16">' for i in range(40))
+             + "<script>"
+             "var c = document.getElementById('c').getContext('2d'), t = 0;"
+             "function frame() { t++; for (var i = 0; i < 400; i++) {"
+             " c.fillStyle = 'hsl(' + ((t + i) % 360) + ',70%,50%)';"
+             " c.fillRect((i * 37 + t) % 600, (i * 13) % 300, 12, 12); }"
+             " requestAnimationFrame(frame); }"
+             "requestAnimationFrame(frame);"
+             "setInterval(function () { var rows = document.getElementById('rows'); rows.textContent = '';"
+             " for (var i = 0; i < 300; i++) { var d = document.createElement('div');"
+             " d.textContent = 'baris ' + i + ' ' + Math.random(); rows.appendChild(d); } }, 100);"
+             "</script></body></html>", max_age=0)
+
+    _build_articles(gif)
+    _build_suite(gif)
+
+
+# Artikel panjang penuh iklan & skrip (untuk bench_reader_mode.py)
+ARTICLES = (
+    "/articles/0.html",
+    "/articles/1.html",
+    "/articles/2.html",
+)
+
+
+def _build_articles(gif):
+    for i in range(12):
+        # Iklan: kerja CPU, sisipan DOM dan penyegaran berkala
+        add_page(f"/articles/ads/ad{i}.js",
+                 "var s = 0; for (var i = 0; i < 1e6; i++) { s += i; }\n"
+                 f"var box{i} = document.createElement('div'); box{i}.className = 'ad-slot';"
+                 f"document.body.appendChild(box{i});"
+                 f"setInterval(function () {{ box{i}.innerHTML = ''; for (var j = 0; j < 50; j++) {{"
+                 f" var d = document.createElement('div'); d.textContent = 'Iklan {i} ' + Math.random();"
+                 f" box{i}.appendChild(d); }} }}, 250);\n",
+                 "application/javascript", max_age=0)
+        add_page(f"/articles/img/{i}.gif", gif + b"\0" * 40000, "image/gif")
+    # Efek scroll yang memaksa layout setiap event (layout thrash)
+    thrash = ("<script>window.addEventListener('scroll', function () {"
+              " var ps = document.querySelectorAll('p');"
+              " for (var i = 0; i < ps.length; i++) { ps[i].style.paddingLeft = (ps[i].offsetTop % 3) + 'px'; }"
+              "});</script>")
+    nav = "".join(f"<li><a href='/articles/{n}.html'>Menu {n}</a></li>" for n in range(60))
+    related = "".join(f"<li><a href='/articles/{n % 3}.html'>Berita terkait {n}</a></li>" for n in range(40))
+    for a, path in enumerate(ARTICLES):
+        paragraphs = "".join(
+            f"<p>Paragraf {n} artikel {a}: {'Kalimat isi artikel, dengan koma, yang cukup panjang untuk dibaca. ' * 12}</p>"
+            + (f"<figure><img src='/articles/img/{n % 12}.gif' alt='Gambar {n}'></figure>" if n % 8 == 0 else "")
+            + (f"<script src='/articles/ads/ad{n % 12}.js'></script>" if n % 5 == 0 else "")
+            for n in range(60))
+        add_page(path,
+                 f"<html lang='id'><head><meta charset='utf-8'><title>Artikel {a}</title>"
+                 "<link rel='stylesheet' href='/css/site.css'></head><body>"
+                 f"<header class='masthead'><nav class='menu'><ul>{nav}</ul></nav></header>"
+                 f"<div class='layout'><div class='content'><article class='post'><h1>Artikel {a}</h1>"
+                 f"<div class='byline'>Penulis Fixture</div>{paragraphs}</article></div>"
+                 f"<aside class='sidebar'><ul>{related}</ul></aside></div>"
+                 f"<footer class='footer'>Hak cipta</footer>{thrash}</body></html>", max_age=0)
+
+
+# Halaman sintetis untuk mode batch / bench_pageload.py
+SUITE = (
+    "/suite/text.html",
+    "/suite/heavy-js.html",
+    "/suite/images.html",
+    "/suite/small-requests.html",
+)
+
+
+def _build_suite(gif):
+    add_page("/suite/text.html",
+             "<html><head><meta charset='utf-8'><title>Teks</title></head><body>"
+             + "".join(f"<h2>Bagian {i}</h2><p>{'Teks panjang untuk diukur. ' * 80}</p>" for i in range(100))
+             + "</body></html>", max_age=0)
+
+    # JavaScript berat: skrip besar yang juga menghitung dan membangun DOM
+    for i in range(8):
+        add_page(f"/suite/js/heavy{i}.js",
+                 f"var h{i} = 0; for (var i = 0; i < 3e6; i++) {{ h{i} = (h{i} + i * 31) % 1000003; }}\n"
+                 f"var f{i} = document.createDocumentFragment();\n"
+                 f"for (var j = 0; j < 500; j++) {{ var d = document.createElement('div'); "
+                 f"d.textContent = 'baris ' + j; f{i}.appendChild(d); }}\n"
+                 f"document.addEventListener('DOMContentLoaded', function () {{ document.body.appendChild(f{i}); }});\n"
+                 + "//" + "x" * 200000 + "\n",
+                 "application/javascript", max_age=0)
+    add_page("/suite/heavy-js.html",
+             "<html><head><meta charset='utf-8'><title>JS Berat</title>"
+             + "".join(f'<script src="/suite/js/heavy{i}.js"></script>' for i in range(8))
+             + "</head><body><h1>JS Berat</h1></body></html>", max_age=0)
+
+    # Banyak gambar dengan ukuran bervariasi (padding setelah trailer GIF)
+    for i in range(300):
+        add_page(f"/suite/img/{i}.gif", gif + b"\0" * (2048 + (i * 977) % 18000), "image/gif", max_age=0)
+    add_page("/suite/images.html",
+             "<html><head><meta charset='utf-8'><title>Gambar</title></head><body>"
+             + "".join(f'<img src="/suite/img/{i}.gif" width="32" height="32">' for i in range(300))
+             + "</body></html>", max_age=0)
+
+    # Banyak permintaan kecil
+    for i in range(250):
+        add_page(f"/suite/tiny/{i}.js", f"window.t{i} = {i};", "application/javascript", max_age=0)
+        add_page(f"/suite/tiny/{i}.css", f".t{i} {{ color: #{i:03x}; }}", "text/css", max_age=0)
+    add_page("/suite/small-requests.html",
+             "<html><head><meta charset='utf-8'><title>Permintaan Kecil</title>"
+             + "".join(f'<link rel="stylesheet" href="/suite/tiny/{i}.css">' for i in range(250))
+             + "".join(f'<script src="/suite/tiny/{i}.js"></script>' for i in range(250))
+             + "</head><body><h1>Permintaan Kecil</h1></body></html>", max_age=0)
+
+
+_build_pages()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path in FILES:
+            with _stats_lock:
+                FILE_STATS["requests"] += 1
+                FILE_STATS["active"] += 1
+                FILE_STATS["max_active"] = max(FILE_STATS["max_active"], FILE_STATS["active"])
+            try:
+                self.send_file(FILES[path])
+            except (BrokenPipeError, ConnectionResetError):
+                # Klien membatalkan unduhan
+                self.close_connection = True
+            finally:
+                with _stats_lock:
+                    FILE_STATS["active"] -= 1
+            return
+        page = PAGES.get(path)
+        if page is None:
+            self.send_error(404)
+            return
+        content_type, body, max_age, delay = page
+        if delay:
+            time.sleep(delay)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", f"max-age={max_age}" if max_age else "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_file(self, file):
+        size = file["size"]
+        start, end = 0, size
+        match = _RANGE.match(self.headers.get("Range", ""))
+        if_range = self.headers.get("If-Range")
+        ranged = match is not None and file["ranges"] and (if_range is None or if_range == file["etag"])
+        if ranged:
+            start = int(match.group(1))
+            end = min(size, int(match.group(2)) + 1) if match.group(2) else size
+            if start >= size:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+            with _stats_lock:
+                FILE_STATS["ranged"] += 1
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end - start))
+        self.send_header("ETag", file["etag"])
+        if file["ranges"]:
+            self.send_header("Accept-Ranges", "bytes")
+        if file["filename"]:
+            self.send_header("Content-Disposition", f'attachment; filename="{file["filename"]}"')
+        self.end_headers()
+        began = time.monotonic()
+        sent = 0
+        for chunk in file_chunks(start, end):
+            if file["rate"]:
+                ahead = sent / file["rate"] - (time.monotonic() - began)
+                if ahead > 0:
+                    time.sleep(ahead)
+            pos = start + sent
+            drops = [d for d in file["drop_after"] if pos < d <= pos + len(chunk)]
+            if drops:
+                file["drop_after"].remove(drops[0])
+                self.wfile.write(chunk[:drops[0] - pos])
+                with _stats_lock:
+                    FILE_STATS["bytes"] += drops[0] - pos
+                self.close_connection = True
+                return
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            with _stats_lock:
+                FILE_STATS["bytes"] += len(chunk)
+
+    def log_message(self, *args):
+        pass
+
+
+def start(port=0):
+    """Menjalankan server di thread latar, mengembalikan objek server."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FixtureHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def base_url(server):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), FixtureHandler)
+    print(f"Menyajikan fixture di {base_url(server)}")
+    server.serve_forever()
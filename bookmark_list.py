@@ -0,0 +1,137 @@
+"""Dialog daftar bookmark berbasis model.
+
+Baris dibuat dari Gio.ListStore lewat Gtk.ListBox.bind_model. Model hanya
+berisi satu halaman hasil pencarian dan ditambah saat daftar digulir ke
+bawah, sehingga membuka dialog tidak membuat ribuan baris sekaligus, dan
+menghapus bookmark hanya membuang satu item dari model.
+"""
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gio, GLib, GObject, Pango
+
+PAGE_SIZE = 100
+
+
+class BookmarkItem(GObject.Object):
+    def __init__(self, bookmark):
+        super().__init__()
+        self.bookmark = bookmark
+
+
+class BookmarkDialog(Gtk.Dialog):
+    def __init__(self, parent, store, open_callback, close_on_open=False):
+        super().__init__(title="Daftar Bookmark", transient_for=parent, flags=0)
+        self.add_buttons(Gtk.STOCK_CLOSE, Gtk.ResponseType.CLOSE)
+        self.set_default_size(600, 450)
+        self.store = store
+        self.open_callback = open_callback
+        self.close_on_open = close_on_open
+        self._matches = []
+        self._shown = 0
+
+        content_area = self.get_content_area()
+
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_placeholder_text("Cari bookmark...")
+        self.search_entry.set_margin_start(10)
+        self.search_entry.set_margin_end(10)
+        self.search_entry.set_margin_top(10)
+        self.search_entry.connect("search-changed", self.on_search_changed)
+        content_area.pack_start(self.search_entry, False, False, 0)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_vexpand(True)
+        scrolled.set_hexpand(True)
+        scrolled.connect("edge-reached", self.on_edge_reached)
+        content_area.pack_start(scrolled, True, True, 0)
+
+        self.model = Gio.ListStore(item_type=BookmarkItem)
+        self.listbox = Gtk.ListBox()
+        self.listbox.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.listbox.bind_model(self.model, self.create_row)
+        self.placeholder = Gtk.Label(label="Belum ada bookmark.")
+        self.placeholder.set_margin_top(20)
+        self.placeholder.show()
+        self.listbox.set_placeholder(self.placeholder)
+        scrolled.add(self.listbox)
+
+        self.apply_filter("")
+
+    # --- model ---
+    def apply_filter(self, query):
+        self._matches = self.store.search(query)
+        self._shown = 0
+        items = self._next_page()
+        self.model.splice(0, self.model.get_n_items(), items)
+        if query.strip():
+            self.placeholder.set_text("Tidak ada bookmark yang cocok.")
+        else:
+            self.placeholder.set_text("Belum ada bookmark.")
+
+    def _next_page(self):
+        page = self._matches[self._shown:self._shown + PAGE_SIZE]
+        self._shown += len(page)
+        return [BookmarkItem(bm) for bm in page]
+
+    def on_search_changed(self, entry):
+        self.apply_filter(entry.get_text())
+
+    def on_edge_reached(self, scrolled, pos):
+        if pos == Gtk.PositionType.BOTTOM and self._shown < len(self._matches):
+            self.model.splice(self.model.get_n_items(), 0, self._next_page())
+
+    # --- baris ---
+    def create_row(self, item):
+        bm = item.bookmark
+        row = Gtk.ListBoxRow()
+        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        hbox.set_border_width(10)
+        row.add(hbox)
+
+        vbox_text = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        title_lbl = Gtk.Label(label=f"<b>{GLib.markup_escape_text(bm.title)}</b>")
+        title_lbl.set_use_markup(True)
+        title_lbl.set_xalign(0)
+        title_lbl.set_ellipsize(Pango.EllipsizeMode.END)
+        title_lbl.set_max_width_chars(50)
+
+        url_lbl = Gtk.Label(label=f"<span color='gray' size='small'>{GLib.markup_escape_text(bm.url)}</span>")
+        url_lbl.set_use_markup(True)
+        url_lbl.set_xalign(0)
+        url_lbl.set_ellipsize(Pango.EllipsizeMode.END)
+        url_lbl.set_max_width_chars(40)
+
+        vbox_text.pack_start(title_lbl, False, False, 0)
+        vbox_text.pack_start(url_lbl, False, False, 0)
+        hbox.pack_start(vbox_text, True, True, 0)
+
+        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        btn_open = Gtk.Button.new_from_icon_name("document-open-symbolic", Gtk.IconSize.BUTTON)
+        btn_open.set_tooltip_text("Buka")
+        btn_open.connect("clicked", lambda w: self.open_item(item))
+        btn_del = Gtk.Button.new_from_icon_name("edit-delete-symbolic", Gtk.IconSize.BUTTON)
+        btn_del.set_tooltip_text("Hapus")
+        btn_del.connect("clicked", lambda w: self.delete_item(item))
+        btn_box.pack_start(btn_open, False, False, 0)
+        btn_box.pack_start(btn_del, False, False, 0)
+        hbox.pack_end(btn_box, False, False, 0)
+
+        row.show_all()
+        return row
+
+    def open_item(self, item):
+        self.open_callback(item.bookmark.url)
+        if self.close_on_open:
+            self.response(Gtk.ResponseType.CLOSE)
+
+    def delete_item(self, item):
+        """Menghapus satu bookmark tanpa membangun ulang baris lain."""
+        bm = item.bookmark
+        if not self.store.remove(bm.url):
+            return
+        found, position = self.model.find(item)
+        if found:
+            self.model.remove(position)
+            del self._matches[position]
+            self._shown -= 1
@@ -0,0 +1,209 @@
+"""Penyimpanan bookmark berindeks dengan penulisan inkremental.
+
+Semua bookmark dimuat ke dict berurutan (URL -> Bookmark) sehingga cek
+duplikat, pencarian dan penghapusan O(1). Setiap perubahan ditulis ke
+SQLite sebagai satu perintah kecil oleh thread penulis, tidak lagi
+menulis ulang seluruh file di main thread.
+"""
+import json
+import os
+import sqlite3
+import time
+
+from dbwriter import SQLiteWriter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bookmarks (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    folder TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bookmarks_folder ON bookmarks(folder);
+"""
+
+TAG_SEP = ","
+
+
+class Bookmark:
+    __slots__ = ("url", "title", "folder", "tags", "created")
+
+    def __init__(self, url, title, folder="", tags=(), created=None):
+        self.url = url
+        self.title = title
+        self.folder = folder
+        self.tags = tuple(tags)
+        self.created = created if created is not None else time.time()
+
+    def __repr__(self):
+        return f"Bookmark({self.url!r}, {self.title!r})"
+
+
+def _clean_tags(tags):
+    return tuple(dict.fromkeys(t.strip() for t in tags if t.strip() and TAG_SEP not in t))
+
+
+class BookmarkStore:
+    def __init__(self, path, legacy_json=None):
+        self.path = path
+        self._by_url = {}
+        self._by_folder = {}
+        self._by_tag = {}
+        # Teks pencarian huruf kecil (judul + URL), dihitung sekali per bookmark
+        self._search_text = {}
+        self._last_query = ""
+        self._last_result = None
+        self.writer = SQLiteWriter(path, SCHEMA)
+        self._load()
+        if legacy_json:
+            self.migrate_json(legacy_json)
+
+    def _load(self):
+        conn = sqlite3.connect(self.path)
+        try:
+            rows = conn.execute(
+                "SELECT url, title, folder, tags, created FROM bookmarks ORDER BY rowid"
+            ).fetchall()
+        finally:
+            conn.close()
+        for url, title, folder, tags, created in rows:
+            self._index(Bookmark(url, title, folder, tags.split(TAG_SEP) if tags else (), created))
+
+    def _index(self, bm):
+        self._by_url[bm.url] = bm
+        self._search_text[bm.url] = f"{bm.title}\n{bm.url}".lower()
+        self._last_result = None
+        self._index_groups(bm)
+
+    def _unindex(self, bm):
+        del self._by_url[bm.url]
+        del self._search_text[bm.url]
+        self._unindex_groups(bm)
+
+    def _index_groups(self, bm):
+        self._by_folder.setdefault(bm.folder, {})[bm.url] = bm
+        for tag in bm.tags:
+            self._by_tag.setdefault(tag, {})[bm.url] = bm
+
+    def _unindex_groups(self, bm):
+        folder = self._by_folder[bm.folder]
+        del folder[bm.url]
+        if not folder:
+            del self._by_folder[bm.folder]
+        for tag in bm.tags:
+            tagged = self._by_tag[tag]
+            del tagged[bm.url]
+            if not tagged:
+                del self._by_tag[tag]
+
+    # --- akses ---
+    def __len__(self):
+        return len(self._by_url)
+
+    def __iter__(self):
+        return iter(list(self._by_url.values()))
+
+    def __contains__(self, url):
+        return url in self._by_url
+
+    def get(self, url):
+        return self._by_url.get(url)
+
+    def folders(self):
+        return sorted(self._by_folder)
+
+    def tags(self):
+        return sorted(self._by_tag)
+
+    def in_folder(self, folder):
+        return list(self._by_folder.get(folder, {}).values())
+
+    def with_tag(self, tag):
+        return list(self._by_tag.get(tag, {}).values())
+
+    def search(self, query):
+        """Bookmark yang judul atau URL-nya mengandung query.
+
+        Jika query baru memperpanjang query sebelumnya (pengguna sedang
+        mengetik), hanya hasil sebelumnya yang disaring ulang.
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(self._by_url.values())
+        if self._last_result is not None and query.startswith(self._last_query):
+            candidates = self._last_result
+        else:
+            candidates = self._search_text
+        text = self._search_text
+        urls = [u for u in candidates if query in text.get(u, "")]
+        self._last_query = query
+        self._last_result = urls
+        return [self._by_url[u] for u in urls]
+
+    # --- perubahan ---
+    def add(self, url, title, folder="", tags=()):
+        """Menambah bookmark; mengembalikan None jika URL sudah ada."""
+        if not url or url in self._by_url:
+            return None
+        bm = Bookmark(url, title or url, folder, _clean_tags(tags))
+        self._index(bm)
+        self.writer.execute(
+            "INSERT OR REPLACE INTO bookmarks (url, title, folder, tags, created) VALUES (?, ?, ?, ?, ?)",
+            (bm.url, bm.title, bm.folder, TAG_SEP.join(bm.tags), bm.created)
+        )
+        return bm
+
+    def remove(self, url):
+        bm = self._by_url.get(url)
+        if bm is None:
+            return False
+        self._unindex(bm)
+        self.writer.execute("DELETE FROM bookmarks WHERE url = ?", (url,))
+        return True
+
+    def update(self, url, title=None, folder=None, tags=None):
+        bm = self._by_url.get(url)
+        if bm is None:
+            return None
+        self._unindex_groups(bm)
+        if title is not None:
+            bm.title = title
+            self._search_text[url] = f"{bm.title}\n{bm.url}".lower()
+            self._last_result = None
+        if folder is not None:
+            bm.folder = folder
+        if tags is not None:
+            bm.tags = _clean_tags(tags)
+        self._index_groups(bm)
+        self.writer.execute(
+            "UPDATE bookmarks SET title = ?, folder = ?, tags = ? WHERE url = ?",
+            (bm.title, bm.folder, TAG_SEP.join(bm.tags), url)
+        )
+        return bm
+
+    def migrate_json(self, json_path):
+        """Impor satu kali dari bookmarks.json lama, lalu ganti nama filenya."""
+        if not os.path.exists(json_path):
+            return 0
+        try:
+            with open(json_path, 'r') as f:
+                items = json.load(f)
+        except Exception as e:
+            print(f"Gagal membaca {json_path}: {e}")
+            return 0
+        count = 0
+        for item in items:
+            if isinstance(item, dict) and self.add(item.get("url"), item.get("title")):
+                count += 1
+        self.writer.flush()
+        if self.writer.error is None:
+            os.replace(json_path, json_path + ".migrated")
+        print(f"{count} bookmark dipindahkan dari {json_path}")
+        return count
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.writer.close()
@@ -4,6 +4,15 @@ gi.require_version('WebKit2', '4.1')
 from gi.repository import Gtk, WebKit2, Gio, Gdk, Soup, GLib, Pango
 import os
 import json  
+import threading
+
+from config import load_config
+from bookmark_list import BookmarkDialog
+from bookmark_store import BookmarkStore
+from context_pool import ContextPool
+from cookie_store import prepare_cookie_file, prune_expired
+from internal_pages import InternalPages, NEWTAB_URI, is_internal
+from profiles import apply_context, apply_settings
 
 class ASGBrowser(Gtk.Window):
     def __init__(self):
@@ -20,13 +29,28 @@ class ASGBrowser(Gtk.Window):
             local_storage_directory=os.path.join(base_dir, "localstorage"),
             indexeddb_directory=os.path.join(base_dir, "indexeddb")
         )
+        self.config = load_config(base_dir)
+        self.context_pool = ContextPool(
+            self.data_manager,
+            self.config["process_model"],
+            self.config["web_process_limit"]
+        )
+        # Model cache & Settings dari profil performa, satu Settings untuk semua tab
+        self.context_pool.context_setup.append(lambda context: apply_context(context, self.config))
+        self.settings = WebKit2.Settings()
+        apply_settings(self.settings, self.config)
+        self.settings.set_javascript_can_open_windows_automatically(True)
+        self.settings.set_user_agent("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
-        # Lokasi file bookmark
+        # Lokasi file bookmark (bookmarks.json lama dimigrasikan sekali)
         self.bookmarks_file = os.path.join(base_dir, "bookmarks.json")
         
         self.setup_persistent_cookies()
-        self.load_bookmarks() # Memuat bookmark dari file saat startup
+        self.bookmarks = BookmarkStore(os.path.join(base_dir, "bookmarks.sqlite"), self.bookmarks_file)
         self.homepage_html = self.get_default_homepage()
+        self.pages = InternalPages()
+        self.pages.set_page("newtab", self.homepage_html)
+        self.context_pool.context_setup.append(self.pages.register)
 
         # 2. Header Bar Setup
         header = Gtk.HeaderBar()
@@ -91,141 +115,48 @@ class ASGBrowser(Gtk.Window):
         vbox.pack_start(self.stack, True, True, 0)
 
         self.new_tab()
-        self.connect("destroy", Gtk.main_quit)
+        self.connect("destroy", self.on_destroy)
         self.show_all()
 
     # --- PENGEMBANGAN SISTEM BOOKMARK ---
-    def load_bookmarks(self):
-        """Memuat daftar bookmark dari file JSON."""
-        if os.path.exists(self.bookmarks_file):
-            try:
-                with open(self.bookmarks_file, 'r') as f:
-                    self.bookmarks = json.load(f)
-            except Exception:
-                self.bookmarks = []
-        else:
-            self.bookmarks = []
-
-    def save_bookmarks(self):
-        """Menyimpan daftar bookmark ke file JSON."""
-        try:
-            with open(self.bookmarks_file, 'w') as f:
-                json.dump(self.bookmarks, f, indent=4)
-        except Exception as e:
-            print(f"Gagal menyimpan bookmark: {e}")
+    def on_destroy(self, *_):
+        self.bookmarks.close() # Tunggu penulisan bookmark selesai
+        Gtk.main_quit()
 
     def on_add_bookmark(self, action, param):
         webview = self.get_current_webview()
         uri = webview.get_uri()
-        if uri and not uri.startswith("file://"):
+        if uri and not is_internal(uri):
             # Cek apakah sudah ada untuk menghindari duplikat
-            if not any(bm['url'] == uri for bm in self.bookmarks):
-                self.bookmarks.append({"title": webview.get_title(), "url": uri})
-                self.save_bookmarks() # Simpan ke disk
+            if uri not in self.bookmarks:
+                self.bookmarks.add(uri, webview.get_title())
                 self.show_info_dialog("Sukses", "Bookmark disimpan permanen")
             else:
                 self.show_info_dialog("Info", "Halaman ini sudah ada di bookmark")
 
     def on_bookmark_list(self, action, param):
-        # Membuat jendela pop-up baru
-        dialog = Gtk.Dialog(title="Daftar Bookmark", transient_for=self, flags=0)
-        dialog.add_buttons(Gtk.STOCK_CLOSE, Gtk.ResponseType.CLOSE)
-        dialog.set_default_size(500, 450) # Ukuran default diperbesar sedikit
-
-        # Container ScrolledWindow
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        
-        # --- PERBAIKAN UTAMA DI SINI ---
-        scrolled.set_vexpand(True)  # Memaksa scrollbar mengambil ruang vertikal yang tersisa
-        scrolled.set_hexpand(True)  # Memaksa scrollbar mengambil ruang horizontal yang tersisa
-        scrolled.set_propagate_natural_height(True) # Memastikan konten tidak terpotong
-        # -------------------------------
-
-        # Masukkan scrolled ke area konten dialog dengan opsi 'expand' True
-        content_area = dialog.get_content_area()
-        content_area.pack_start(scrolled, True, True, 0)
-
-        # ListBox untuk menampung baris bookmark
-        listbox = Gtk.ListBox()
-        listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        scrolled.add(listbox)
-
-        if not self.bookmarks:
-            label = Gtk.Label(label="Belum ada bookmark.")
-            label.set_margin_top(20)
-            listbox.add(label)
-        else:
-            for bm in self.bookmarks:
-                row = Gtk.ListBoxRow()
-                hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-                hbox.set_border_width(10)
-                row.add(hbox)
-
-                # Label Judul & URL
-                vbox_text = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-                
-                # Tambahkan judul dengan pembatasan karakter agar tidak merusak layout
-                clean_title = (bm['title'][:50] + '..') if len(bm['title']) > 50 else bm['title']
-                title_lbl = Gtk.Label(label=f"<b>{clean_title}</b>")
-                title_lbl.set_use_markup(True)
-                title_lbl.set_xalign(0)
-                
-                url_lbl = Gtk.Label(label=f"<span color='gray' size='small'>{bm['url']}</span>")
-                url_lbl.set_use_markup(True)
-                url_lbl.set_xalign(0)
-                url_lbl.set_ellipsize(Pango.EllipsizeMode.END)
-                url_lbl.set_max_width_chars(40) # Mencegah URL memanjangkan jendela secara berlebih
-                
-                vbox_text.pack_start(title_lbl, False, False, 0)
-                vbox_text.pack_start(url_lbl, False, False, 0)
-                hbox.pack_start(vbox_text, True, True, 0)
-
-                # Tombol Aksi (Buka & Hapus)
-                btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
-                
-                btn_open = Gtk.Button.new_from_icon_name("document-open-symbolic", Gtk.IconSize.BUTTON)
-                btn_open.connect("clicked", lambda w, url=bm['url']: self._open_bookmark(url, dialog))
-                
-                btn_del = Gtk.Button.new_from_icon_name("edit-delete-symbolic", Gtk.IconSize.BUTTON)
-                btn_del.connect("clicked", lambda w, b=bm: self._delete_bookmark(b, dialog))
-                
-                btn_box.pack_start(btn_open, False, False, 0)
-                btn_box.pack_start(btn_del, False, False, 0)
-                hbox.pack_end(btn_box, False, False, 0)
-
-                listbox.add(row)
-
+        # Baris dibuat dari model secara bertahap, bukan sekaligus
+        dialog = BookmarkDialog(self, self.bookmarks, self._open_bookmark, close_on_open=True)
         dialog.show_all()
         dialog.run()
         dialog.destroy()
 
-    def _delete_bookmark(self, bookmark, dialog):
-        if bookmark in self.bookmarks:
-            self.bookmarks.remove(bookmark)
-            self.save_bookmarks()
-            dialog.destroy()
-            self.on_bookmark_list(None, None) # Refresh list
-
     # --- Sisa Script Asli (Tidak Berubah) ---
     def setup_persistent_cookies(self):
         cookie_manager = self.data_manager.get_cookie_manager()
-        cookie_file = os.path.join(self.data_manager.get_base_data_directory(), "cookies.sqlite")
-        cookie_manager.set_persistent_storage(cookie_file, WebKit2.CookiePersistentStorage.SQLITE)
+        # Backend sama dengan browser.py; cookies.txt lama ikut dipindahkan ke SQLite
+        backend, cookie_file = prepare_cookie_file(self.data_manager.get_base_data_directory(),
+                                                   self.config["cookie_backend"])
+        if backend == "sqlite":
+            cookie_manager.set_persistent_storage(cookie_file, WebKit2.CookiePersistentStorage.SQLITE)
+            threading.Thread(target=prune_expired, args=(cookie_file,), daemon=True).start()
+        else:
+            cookie_manager.set_persistent_storage(cookie_file, WebKit2.CookiePersistentStorage.TEXT)
         cookie_manager.set_accept_policy(Soup.CookieJarAcceptPolicy.ALWAYS)
 
     def create_webview(self):
-        context = WebKit2.WebContext.new_with_website_data_manager(self.data_manager)
-        context.set_cache_model(WebKit2.CacheModel.WEB_BROWSER)
-        context.set_process_model(WebKit2.ProcessModel.MULTIPLE_SECONDARY_PROCESSES)
-        settings = WebKit2.Settings()
-        settings.set_enable_webgl(True)
-        settings.set_enable_accelerated_2d_canvas(True)
-        settings.set_enable_smooth_scrolling(True)
-        settings.set_javascript_can_open_windows_automatically(True)
-        settings.set_user_agent("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        webview = WebKit2.WebView.new_with_context(context)
-        webview.set_settings(settings)
+        webview = self.context_pool.create_webview()
+        webview.set_settings(self.settings)
         webview.connect("load-changed", self.on_load_changed)
         webview.connect("notify::estimated-load-progress", self.on_progress_changed)
         webview.show()
@@ -254,7 +185,7 @@ class ASGBrowser(Gtk.Window):
 
     def load_url(self, entry):
         url = entry.get_text().strip()
-        if not url.startswith(("http", "file")):
+        if not url.startswith(("http", "file", "asg")):
             url = f"https://www.google.com/search?q={url}" if " " in url else f"https://{url}"
         self.get_current_webview().load_uri(url)
 
@@ -265,24 +196,23 @@ class ASGBrowser(Gtk.Window):
     def go_forward(self, *_): self.get_current_webview().go_forward()
     def reload_page(self, *_): self.get_current_webview().reload()
     def go_home(self, *_): self.load_start_page(self.get_current_webview())
-    def load_start_page(self, webview): webview.load_html(self.homepage_html, "file:///")
+    def load_start_page(self, webview): webview.load_uri(NEWTAB_URI)
 
     def on_load_changed(self, webview, event):
         if event == WebKit2.LoadEvent.FINISHED:
             self.progress.set_visible(False)
             if webview == self.get_current_webview():
                 uri = webview.get_uri() or ""
-                self.url_entry.set_text("" if uri.startswith("file://") else uri)
+                self.url_entry.set_text("" if uri == NEWTAB_URI else uri)
         elif event == WebKit2.LoadEvent.STARTED:
             self.progress.set_visible(True)
 
     def on_progress_changed(self, webview, pspec):
         self.progress.set_fraction(webview.get_estimated_load_progress())
 
-    def _open_bookmark(self, url, dialog):
+    def _open_bookmark(self, url):
         webview = self.get_current_webview()
         if webview: webview.load_uri(url)
-        dialog.destroy()
 
     def on_settings(self, action, param):
       dialog = Gtk.Dialog(title="Pengaturan", transient_for=self, flags=0)
@@ -311,6 +241,7 @@ class ASGBrowser(Gtk.Window):
       if response == Gtk.ResponseType.OK:
           custom_html = entry.get_text().strip()
           self.homepage_html = custom_html if custom_html else self.get_default_homepage()
+          self.pages.set_page("newtab", self.homepage_html)
           self.show_info_dialog("Pengaturan disimpan", "Homepage telah diperbarui.")
       dialog.destroy()
     
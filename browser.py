@@ -1,38 +1,120 @@
+from startup_trace import trace
+
 import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('WebKit2', '4.1')
-from gi.repository import Gtk, WebKit2, Gio, Gdk, Soup
+from gi.repository import Gtk, WebKit2, Gio, Gdk
 from gi.repository import Pango
 from gi.repository import GLib
+import argparse
 import json
 import os
+import sys
+import time
+from urllib.parse import urlsplit
+
+from batch import BatchRunner, read_url_file
+from bookmark_list import BookmarkDialog
+from config import PROFILES
+from download_list import DownloadPanel
+from fileutil import atomic_write
+from hibernation import HibernationManager
+from internal_pages import NEWTAB_URI, SCHEME, is_internal
+from netlog import NetLog
+from offline_archive import archive_uri
+from omnibox import Omnibox
+from prerender import Prerenderer
+from reader_mode import ReaderTab
+from services import BrowserServices, data_dir
+from session import decode_state, encode_state
+from site_policy import PolicyStore
+from tab import Tab
+from tab_strip import TabStrip
+from ui_scheduler import UIScheduler, LOADING, PROGRESS, TITLE, URI
+
+trace.mark("imports")
+
+VERSION = "1.0"
+# Nama unik di D-Bus: peluncuran kedua meneruskan URL-nya ke instance ini
+APP_ID = "io.github.alisitadev.AsgBrowser"
+
+
+def strip_url(text):
+    """URL tanpa skema & "www." untuk mencocokkan ketikan di url_entry."""
+    text = text.strip().lower()
+    for prefix in ("https://", "http://", "www."):
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+    return text
+
+
+def normalize_url(text):
+    """Teks dari url_entry / baris perintah menjadi URL (atau kueri pencarian)."""
+    url = text.strip()
+    if url and not url.startswith(("http://", "https://", "file://", "asg://")):
+        if " " in url:
+            url = "https://www.google.com/search?q=" + url.replace(" ", "+")
+        else:
+            url = "https://" + url
+    return url
 
-class ASGBrowser(Gtk.Window):
-    def __init__(self):
-        super().__init__()
-        self.set_default_size(1100, 650)
-        self.set_title("ASG Browser")
 
-        # Setup WebsiteDataManager (untuk localStorage, IndexedDB, cache, dll)
-        self.data_manager = self.get_data_manager()
+# Jenis navigasi WebKit -> jenis transisi di riwayat
+NAVIGATION_TRANSITIONS = {
+    WebKit2.NavigationType.LINK_CLICKED: "link",
+    WebKit2.NavigationType.FORM_SUBMITTED: "form",
+    WebKit2.NavigationType.FORM_RESUBMITTED: "form",
+    WebKit2.NavigationType.BACK_FORWARD: "back_forward",
+    WebKit2.NavigationType.RELOAD: "reload",
+}
 
-        # >>> AKTIFKAN PENYIMPANAN COOKIE PERMANEN <<<
-        self.setup_persistent_cookies()
 
-        # Daftar bookmark (disimpan di memori)
-        self.bookmarks = []
+class ASGBrowser(Gtk.Window):
+    def __init__(self, services=None, batch=False, profile=None, uris=(), application=None):
+        super().__init__(application=application)
+        # Tanpa aplikasi (mode batch, benchmark) jendela punya layanan sendiri
+        self.services = services or BrowserServices(profile, batch)
+        self.services.add_window(self)
+        # Mode batch: jendela tidak ditampilkan, sesi & riwayat tidak disentuh
+        self.batch = batch
+        # Kapan jendela terakhir aktif, untuk tab aktif di sesi
+        self.focus_time = time.monotonic()
+        self.set_default_size(1100, 650)
+        self.set_title("ASG Browser")
 
-        # Homepage default
-        self.homepage_html = self.get_default_homepage()
+        # Layanan bersama semua jendela
+        self.data_manager = self.services.data_manager
+        self.settings = self.services.settings
+        self.context_pool = self.services.context_pool
+        self.content_blocker = self.services.content_blocker
+        self.prefetcher = self.services.prefetcher
+        self.storage = self.services.storage
+        self.pages = self.services.pages
+        self.session = self.services.session
+        self._typing_timer = None
+        self.omnibox = None
+        self.download_panel = None
 
         # ================= HEADER BAR =================
         header = Gtk.HeaderBar()
         header.set_show_close_button(True)
         self.set_titlebar(header)
 
-        self.stack_switcher = Gtk.StackSwitcher()
-        self.stack_switcher.set_hexpand(True)
-        header.set_custom_title(self.stack_switcher)
+        # Stack dibuat di sini karena deretan tab perlu mengenalnya
+        self.stack = Gtk.Stack()
+        # Perpindahan tab instan kecuali animasi diaktifkan di konfigurasi
+        self.stack.set_transition_type(
+            Gtk.StackTransitionType.SLIDE_LEFT_RIGHT if self.config["tab_switch_animation"]
+            else Gtk.StackTransitionType.NONE)
+        self.tab_strip = TabStrip(self.stack, self.close_tab)
+        self.tab_strip.set_hexpand(True)
+        header.set_custom_title(self.tab_strip)
+
+        # Ctrl+Shift+A membuka pencarian tab
+        accel = Gtk.AccelGroup()
+        accel.connect(Gdk.KEY_a, Gdk.ModifierType.CONTROL_MASK | Gdk.ModifierType.SHIFT_MASK,
+                      0, lambda *_: self.tab_strip.search_button.set_active(True) or True)
+        self.add_accel_group(accel)
 
         self.btn_new_tab = Gtk.Button.new_from_icon_name("list-add-symbolic", Gtk.IconSize.BUTTON)
         self.btn_new_tab.set_relief(Gtk.ReliefStyle.NONE)
@@ -67,6 +149,13 @@ class ASGBrowser(Gtk.Window):
         self.btn_reload.connect("clicked", self.reload_page)
         toolbar.pack_start(self.btn_reload, False, False, 0)
 
+        self.btn_reader = Gtk.ToggleButton()
+        self.btn_reader.set_image(Gtk.Image.new_from_icon_name("format-justify-fill-symbolic",
+                                                               Gtk.IconSize.BUTTON))
+        self.btn_reader.set_tooltip_text("Mode baca")
+        self._reader_handler = self.btn_reader.connect("toggled", self.on_reader_toggled)
+        toolbar.pack_start(self.btn_reader, False, False, 0)
+
         self.btn_home = Gtk.Button.new_from_icon_name("go-home-symbolic", Gtk.IconSize.BUTTON)
         self.btn_home.set_tooltip_text("Home")
         self.btn_home.connect("clicked", self.go_home)
@@ -75,170 +164,381 @@ class ASGBrowser(Gtk.Window):
         self.url_entry = Gtk.Entry()
         self.url_entry.set_placeholder_text("Masukkan URL lalu tekan Enter")
         self.url_entry.connect("activate", self.load_url)
+        self.url_entry.connect("changed", self.on_url_entry_changed)
         toolbar.pack_start(self.url_entry, True, True, 0)
 
-        # Tombol menu (⋮)
-        menu_btn = Gtk.MenuButton()
-        menu_btn.set_image(Gtk.Image.new_from_icon_name("view-more-symbolic", Gtk.IconSize.BUTTON))
-        menu_btn.set_relief(Gtk.ReliefStyle.NONE)
-        menu_btn.set_tooltip_text("Menu")
+        # Tombol menu (⋮), isinya dibuat di setup_menu()
+        self.menu_btn = Gtk.MenuButton()
+        self.menu_btn.set_image(Gtk.Image.new_from_icon_name("view-more-symbolic", Gtk.IconSize.BUTTON))
+        self.menu_btn.set_relief(Gtk.ReliefStyle.NONE)
+        self.menu_btn.set_tooltip_text("Menu")
+        toolbar.pack_start(self.menu_btn, False, False, 0)
+
+        # ================= PROGRESS BAR =================
+        self.progress = Gtk.ProgressBar()
+        self.progress.set_visible(False)
+        vbox.pack_start(self.progress, False, False, 0)
+
+        # ================= STACK =================
+        vbox.pack_start(self.stack, True, True, 0)
+
+        # Prerender navigasi berikutnya di WebView tersembunyi (opt-in)
+        self.prerenderer = None
+        if self.config["prerender"] and not batch:
+            self.prerenderer = Prerenderer(self, self.config["prerender_hover_ms"])
+
+        # Pembaruan UI dari sinyal WebView digabung & diterapkan sekali per frame
+        self.ui = UIScheduler(self, self.get_current_tab, self.apply_tab_state, self.apply_toolbar_state)
+
+        # Hibernasi tab latar belakang yang lama tidak dilihat
+        self.hibernation = HibernationManager(
+            self,
+            self.config["hibernate_idle_timeout"],
+            self.config["hibernate_max_live_tabs"],
+            self.config["hibernate_memory_budget_mb"]
+        )
+
+        trace.mark("widget tree")
+
+        # Tab pertama: sesi sebelumnya (hanya jendela pertama) lalu URL yang
+        # diminta; tab sesi tetap placeholder jika ada URL yang dibuka
+        restored = not batch and self.restore_session(activate=not uris)
+        for uri in uris:
+            self.new_tab(uri=uri, transition="link")
+        if not restored and not uris:
+            self.new_tab()
+        self._visible_tab = self.get_current_tab()
+        self.stack.connect("notify::visible-child", self.on_tab_switched)
+        trace.mark("first webview")
+
+        if self.services.history is not None:
+            self.setup_omnibox()
+        self.connect("notify::is-active", self.on_active_changed)
+        self.connect("destroy", self.on_destroy)
+        if batch:
+            return
+        self.connect_after("draw", self.on_first_draw)
+        self.show_all()
+        self.present()
+        trace.mark("window shown")
+
+        # Pekerjaan yang tidak dibutuhkan untuk paint pertama
+        # Layanan bersama hanya disiapkan oleh jendela pertama
+        self.run_deferred([
+            ("menu", self.setup_menu),
+            ("hibernation", self.hibernation.start),
+        ] + self.services.deferred_steps())
+
+    # ================= STARTUP =================
+    def on_first_draw(self, widget, cr):
+        self.disconnect_by_func(self.on_first_draw)
+        trace.mark("first paint")
+        return False
+
+    def run_deferred(self, steps):
+        """Menjalankan satu langkah per iterasi idle agar UI tetap responsif."""
+        steps = list(steps)
+
+        def run_step():
+            name, func = steps.pop(0)
+            func()
+            trace.mark(f"deferred: {name}")
+            if steps:
+                return True
+            trace.write()
+            if trace.exit_after_paint:
+                self.destroy()
+            return False
+
+        GLib.idle_add(run_step, priority=GLib.PRIORITY_LOW)
+
+    # ================= LAYANAN BERSAMA =================
+    @property
+    def config(self):
+        return self.services.config
+
+    @property
+    def bookmarks(self):
+        return self.services.bookmarks
+
+    @property
+    def history(self):
+        return self.services.history
+
+    @property
+    def homepage_html(self):
+        return self.services.homepage_html
+
+    def setup_omnibox(self):
+        self.omnibox = Omnibox(self.url_entry, self.history, self.load_url)
+
+    def apply_config(self):
+        """Menerapkan konfigurasi baru (profil performa) ke jendela ini."""
+        self.hibernation.idle_timeout = self.config["hibernate_idle_timeout"]
+        self.hibernation.max_live_tabs = self.config["hibernate_max_live_tabs"]
+        self.hibernation.memory_budget_kb = self.config["hibernate_memory_budget_mb"] * 1024
+
+    def setup_menu(self):
         menu = Gio.Menu()
+        menu.append("Jendela Baru", "app.new_window")
         menu.append("Add To Bookmark", "app.add_bookmark")
+        menu.append("Simpan untuk Offline", "app.save_offline")
+        menu.append("Mode Offline", "app.offline_mode")
+        menu.append("Arsip Offline", "app.offline_archive")
+        menu.append("Cari Isi Halaman", "app.search_pages")
+        menu.append("Unduhan", "app.downloads")
         menu.append("Bookmark List", "app.bookmark_list")
+        menu.append("Nyalakan/Matikan Pemblokir di Situs Ini", "app.toggle_site_blocking")
+        menu.append("Jaringan Tab Ini", "app.network_log")
+        menu.append("Ekspor HAR…", "app.export_har")
+        menu.append("Penyimpanan", "app.storage")
+        menu.append("Memori", "app.memory")
         menu.append("Pengaturan", "app.settings")
         menu.append("Tentang", "app.about")
-        menu_btn.set_menu_model(menu)
-        toolbar.pack_start(menu_btn, False, False, 0)
+        self.menu_btn.set_menu_model(menu)
 
         # Action group
         actions = Gio.SimpleActionGroup()
+        new_window_action = Gio.SimpleAction.new("new_window", None)
+        new_window_action.connect("activate", self.on_new_window)
+        actions.add_action(new_window_action)
+
         add_bookmark_action = Gio.SimpleAction.new("add_bookmark", None)
         add_bookmark_action.connect("activate", self.on_add_bookmark)
         actions.add_action(add_bookmark_action)
 
-        bookmark_list_action = Gio.SimpleAction.new("bookmark_list", None)
-        bookmark_list_action.connect("activate", self.on_bookmark_list)
-        actions.add_action(bookmark_list_action)
+        save_offline_action = Gio.SimpleAction.new("save_offline", None)
+        save_offline_action.connect("activate", self.on_save_offline)
+        actions.add_action(save_offline_action)
 
-        settings_action = Gio.SimpleAction.new("settings", None)
-        settings_action.connect("activate", self.on_settings)
-        actions.add_action(settings_action)
+        # Status dibagi semua jendela lewat services.set_offline_mode()
+        self.offline_action = Gio.SimpleAction.new_stateful(
+            "offline_mode", None, GLib.Variant.new_boolean(self.config["offline_mode"]))
+        self.offline_action.connect("change-state", self.on_offline_mode)
+        actions.add_action(self.offline_action)
 
-        about_action = Gio.SimpleAction.new("about", None)
-        about_action.connect("activate", self.on_about)
-        actions.add_action(about_action)
+        offline_archive_action = Gio.SimpleAction.new("offline_archive", None)
+        offline_archive_action.connect("activate", lambda *_: self.new_tab(uri=f"{SCHEME}://offline"))
+        actions.add_action(offline_archive_action)
 
-        self.insert_action_group("app", actions)
+        search_action = Gio.SimpleAction.new("search_pages", None)
+        search_action.connect("activate", lambda *_: self.new_tab(uri=f"{SCHEME}://search"))
+        actions.add_action(search_action)
 
-        # ================= PROGRESS BAR =================
-        self.progress = Gtk.ProgressBar()
-        self.progress.set_visible(False)
-        vbox.pack_start(self.progress, False, False, 0)
+        downloads_action = Gio.SimpleAction.new("downloads", None)
+        downloads_action.connect("activate", self.show_downloads)
+        actions.add_action(downloads_action)
 
-        # ================= STACK =================
-        self.stack = Gtk.Stack()
-        self.stack.set_transition_type(Gtk.StackTransitionType.SLIDE_LEFT_RIGHT)
-        self.stack_switcher.set_stack(self.stack)
-        vbox.pack_start(self.stack, True, True, 0)
+        bookmark_list_action = Gio.SimpleAction.new("bookmark_list", None)
+        bookmark_list_action.connect("activate", self.on_bookmark_list)
+        actions.add_action(bookmark_list_action)
 
-        # Tab pertama
-        self.new_tab()
+        blocking_action = Gio.SimpleAction.new("toggle_site_blocking", None)
+        blocking_action.connect("activate", self.on_toggle_site_blocking)
+        actions.add_action(blocking_action)
 
-        self.connect("destroy", Gtk.main_quit)
-        self.show_all()
+        network_action = Gio.SimpleAction.new("network_log", None)
+        network_action.connect("activate", self.on_network_log)
+        actions.add_action(network_action)
 
-    def get_data_manager(self):
-        base_dir = os.path.join(GLib.get_user_data_dir(), "asg-browser")
-        os.makedirs(base_dir, exist_ok=True)
-        return WebKit2.WebsiteDataManager(
-            base_data_directory=base_dir,
-            base_cache_directory=os.path.join(base_dir, "cache")
-        )
+        har_action = Gio.SimpleAction.new("export_har", None)
+        har_action.connect("activate", self.on_export_har)
+        actions.add_action(har_action)
 
-    def setup_persistent_cookies(self):
-        """Aktifkan penyimpanan cookie permanen agar login tetap bertahan"""
-        cookie_manager = self.data_manager.get_cookie_manager()
+        storage_action = Gio.SimpleAction.new("storage", None)
+        storage_action.connect("activate", lambda *_: self.new_tab(uri=f"{SCHEME}://storage"))
+        actions.add_action(storage_action)
 
-        # Pilih salah satu format penyimpanan:
-        # 1. TEXT (mudah dibaca, cocok untuk debug)
-        # 2. SQLITE (lebih efisien untuk jumlah cookie banyak)
+        memory_action = Gio.SimpleAction.new("memory", None)
+        memory_action.connect("activate", lambda *_: self.new_tab(uri=f"{SCHEME}://memory"))
+        actions.add_action(memory_action)
 
-        cookie_file = os.path.join(
-            self.data_manager.get_base_data_directory(),
-            "cookies.txt"   # atau "cookies.sqlite" jika pakai SQLITE
-        )
+        settings_action = Gio.SimpleAction.new("settings", None)
+        settings_action.connect("activate", self.on_settings)
+        actions.add_action(settings_action)
 
-        cookie_manager.set_persistent_storage(
-            cookie_file,
-            WebKit2.CookiePersistentStorage.TEXT   # ganti ke .SQLITE jika ingin
-        )
+        about_action = Gio.SimpleAction.new("about", None)
+        about_action.connect("activate", self.on_about)
+        actions.add_action(about_action)
 
-        # Izinkan semua cookie (termasuk third-party jika situs butuh)
-        # Alternatif: Soup.CookieJarAcceptPolicy.NO_THIRD_PARTY untuk lebih aman
-        cookie_manager.set_accept_policy(Soup.CookieJarAcceptPolicy.ALWAYS)
-
-        print(f"Cookie disimpan permanen di: {cookie_file}")
-
-    def get_default_homepage(self):
-        return """
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {
-                    font-family: sans-serif;
-                    text-align: center;
-                    margin: 0;
-                    padding: 0;
-                    height: 100vh;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: center;
-                    align-items: center;
-                    background: #f9f9f9;
-                    color: #333;
-                }
-                h1 { font-size: 3em; margin-bottom: 0.2em; }
-                p { font-size: 1.3em; color: #666; }
-            </style>
-        </head>
-        <body>
-            <h1>Selamat Datang di ASG Browser</h1>
-            <p>Tab baru siap digunakan. Ketik alamat di address bar untuk memulai browsing.</p>
-        </body>
-        </html>
-        """
+        self.insert_action_group("app", actions)
 
     # ================= TAB MANAGEMENT =================
-    def new_tab(self, *_):
-        webview = self.create_webview()
-
-        tab_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        tab_box.set_margin_start(4)
-        tab_box.set_margin_end(4)
-
-        label = Gtk.Label(label="New Tab")
-        label.set_ellipsize(Pango.EllipsizeMode.END)
-        tab_box.pack_start(label, True, True, 0)
-
-        close_btn = Gtk.Button()
-        close_btn.set_relief(Gtk.ReliefStyle.NONE)
-        close_btn.add(Gtk.Image.new_from_icon_name("window-close-symbolic", Gtk.IconSize.SMALL_TOOLBAR))
-        close_btn.set_tooltip_text("Tutup tab")
-        close_btn.connect("clicked", self.close_tab, webview)
-        tab_box.pack_start(close_btn, False, False, 0)
-
-        tab_box.show_all()
-
-        self.stack.add_titled(webview, str(id(webview)), "New Tab")
-        self.stack.child_set_property(webview, "title", "New Tab")
-        self.stack.child_set_property(webview, "tab", tab_box)
-
-        webview.connect("notify::title", self.on_title_changed, label)
-        self.stack.set_visible_child(webview)
-        self.load_start_page(webview)
+    def new_tab(self, *_, uri=None, transition=None):
+        tab = Tab("New Tab")
+        tab.transition = transition
+        prerendered, committed = None, False
+        if uri and self.prerenderer is not None:
+            prerendered, committed = self.prerenderer.take(uri)
+        if prerendered is not None:
+            self.add_tab(tab)
+            self.adopt_prerender(tab, prerendered, committed)
+            self.stack.set_visible_child(tab)
+            return
+        webview = self.create_webview(uri)
+        self.attach_webview(tab, webview)
+        self.add_tab(tab)
 
-    def close_tab(self, button, webview):
-        self.stack.remove(webview)
+        self.stack.set_visible_child(tab)
+        if uri:
+            webview.load_uri(uri)
+        else:
+            self.load_start_page(webview)
+
+    def add_tab(self, tab):
+        if self.config["network_log_size"]:
+            tab.netlog = NetLog(self.config["network_log_size"])
+        tab.show()
+        self.stack.add_named(tab, str(id(tab)))
+        self.tab_strip.add_tab(tab, tab.display_title(), tab.uri)
+        self.session.schedule()
+
+    def attach_webview(self, tab, webview):
+        tab.attach(webview)
+        webview.connect("notify::title", self.on_title_changed, tab)
+        webview.connect("notify::uri", self.on_uri_changed, tab)
+
+    def close_tab(self, button, tab):
+        self.ui.forget(tab)
+        self.tab_strip.remove_tab(tab)
+        self.stack.remove(tab)
+        if tab.webview is not None:
+            webview = tab.detach()
+            self.context_pool.release(webview)
+            webview.destroy()
+        tab.destroy()
         if self.stack.get_visible_child() is None:
             self.new_tab()
+        self.session.schedule()
 
-    def get_current_webview(self):
+    def get_current_tab(self):
         return self.stack.get_visible_child()
 
-    def on_title_changed(self, webview, param, label_widget):
-        title = webview.get_title() or "New Tab"
-        label_widget.set_text(title)
-        self.stack.child_set_property(webview, "title", title)
+    def get_current_webview(self):
+        tab = self.get_current_tab()
+        return tab.webview if tab else None
+
+    def on_title_changed(self, webview, param, tab):
+        tab.title = webview.get_title() or "New Tab"
+        self.ui.update(tab, "title", tab.title)
+        uri = webview.get_uri() or ""
+        if self.history and uri.startswith(("http://", "https://")):
+            self.history.update_title(uri, webview.get_title())
+        self.session.schedule()
+
+    def on_uri_changed(self, webview, param, tab):
+        self.ui.update(tab, "uri", tab.page_uri() or "")
+
+    def apply_tab_state(self, tab, state, flags):
+        """Menerapkan perubahan ke widget milik tab (label judul & indeks pencarian)."""
+        if flags & TITLE:
+            self.update_tab_label(tab)
+            return 1
+        if flags & URI:
+            self.tab_strip.update_tab(tab, tab.display_title(), state.uri)
+        return 0
+
+    def apply_toolbar_state(self, tab, state, flags):
+        """Menerapkan perubahan tab yang terlihat ke toolbar & progress bar."""
+        applied = 0
+        if flags & LOADING:
+            self.progress.set_visible(state.loading)
+            applied += 1
+        if flags & PROGRESS:
+            self.progress.set_fraction(state.progress)
+            applied += 1
+        # Jangan timpa teks yang sedang diketik pengguna
+        if flags & URI and not self.url_entry.has_focus():
+            self.url_entry.set_text("" if state.uri == NEWTAB_URI else state.uri)
+            applied += 1
+        if flags & URI:
+            self.sync_reader_button(tab)
+        return applied
+
+    def update_tab_label(self, tab):
+        title = tab.display_title()
+        tab.label.set_text(title)
+        self.tab_strip.update_tab(tab, title, tab.ui_state.uri or tab.uri)
+
+    def on_tab_switched(self, stack, pspec):
+        # Catat waktu terakhir tab lama terlihat untuk urutan LRU
+        if self._visible_tab is not None:
+            self._visible_tab.touch()
+        tab = stack.get_visible_child()
+        self._visible_tab = tab
+        if tab is None:
+            return
+        tab.touch()
+        self.tab_strip.set_active(tab)
+        if tab.hibernated:
+            self.hibernation.restore(tab)
+        # Toolbar menampilkan keadaan tab yang baru terlihat
+        self.ui.mark(tab, LOADING | PROGRESS | URI)
+        self.session.schedule()
+
+    # ================= SESSION =================
+    def restore_session(self, activate=True):
+        """Memulihkan tab dari sesi terakhir (hanya di jendela pertama).
+
+        Hanya tab aktif yang langsung memuat halaman (kecuali activate
+        False); tab lain menjadi placeholder yang baru membuat WebView
+        saat pertama kali dipilih.
+        """
+        data = self.services.take_session()
+        if not data:
+            return False
+        tabs = []
+        for saved in data["tabs"]:
+            tab = Tab(saved.get("title") or "New Tab")
+            tab.uri = saved.get("uri") or ""
+            tab.session_state = decode_state(saved.get("state"))
+            self.add_tab(tab)
+            tabs.append(tab)
+        active = tabs[min(max(data.get("active", 0), 0), len(tabs) - 1)]
+        self.stack.set_visible_child(active)
+        if activate:
+            self.hibernation.restore(active)
+        return True
+
+    def tab_snapshot(self, tab):
+        tab.snapshot()
+        return {
+            "uri": tab.uri,
+            "title": tab.title,
+            "state": encode_state(tab.session_state),
+        }
+
+    # ================= JENDELA =================
+    def on_new_window(self, action, param):
+        ASGBrowser(self.services, application=self.get_application())
+
+    def on_active_changed(self, window, pspec):
+        if self.is_active():
+            self.focus_time = time.monotonic()
+
+    def on_destroy(self, *_):
+        if self.prerenderer is not None:
+            self.prerenderer.cancel()
+        self.hibernation.stop()
+        last = self.services.remove_window(self)
+        # Gtk.Application keluar sendiri setelah jendela terakhir ditutup
+        if last and self.get_application() is None:
+            Gtk.main_quit()
 
     # ================= WEBVIEW =================
-    def create_webview(self):
-        context = WebKit2.WebContext.new_with_website_data_manager(self.data_manager)
-        webview = WebKit2.WebView.new_with_context(context)
+    def create_webview(self, uri=None):
+        webview = self.context_pool.create_webview(uri)
+        webview.set_settings(self.settings)
 
         webview.connect("load-changed", self.on_load_changed)
+        webview.connect("load-failed", self.on_load_failed)
         webview.connect("notify::estimated-load-progress", self.on_progress_changed)
         webview.connect("context-menu", self.on_context_menu)
+        webview.connect("decide-policy", self.on_decide_policy)
+        webview.connect("mouse-target-changed", self.on_mouse_target_changed)
+        if self.config["network_log_size"]:
+            webview.connect("resource-load-started", self.on_resource_load_started)
+        self.content_blocker.attach(webview, self.on_request_blocked)
         webview.show()
         return webview
 
@@ -259,26 +559,223 @@ class ASGBrowser(Gtk.Window):
     def open_link_in_new_tab(self, url):
         if not url:
             return
-        self.new_tab()
-        current_webview = self.get_current_webview()
-        if current_webview:
-            current_webview.load_uri(url)
+        self.new_tab(uri=url, transition="link")
+
+    def on_decide_policy(self, webview, decision, decision_type):
+        if decision_type == WebKit2.PolicyDecisionType.NAVIGATION_ACTION:
+            tab = webview.get_parent()
+            action = decision.get_navigation_action()
+            nav_type = action.get_navigation_type()
+            if (nav_type == WebKit2.NavigationType.LINK_CLICKED and self.prerenderer is not None
+                    and self.prerenderer.matches(action.get_request().get_uri())
+                    and self.can_swap_prerender(tab)):
+                # Tukar di luar handler sinyal WebView yang akan diganti
+                decision.ignore()
+                GLib.idle_add(self.use_prerender, tab, action.get_request().get_uri(), "link")
+                return True
+            transition = NAVIGATION_TRANSITIONS.get(nav_type, "other")
+            # Jangan timpa transisi yang sudah diketahui (misalnya "typed")
+            if tab is not None and (transition != "other" or tab.transition is None):
+                tab.transition = transition
+            if tab is not None and tab.reader is not None and webview is tab.webview:
+                return self.decide_reader_navigation(tab, action.get_request().get_uri(), decision)
+        return False
+
+    # ================= MODE BACA =================
+    def on_reader_toggled(self, button):
+        tab = self.get_current_tab()
+        if tab is None or tab.webview is None or button.get_active() == (tab.reader is not None):
+            return
+        if tab.reader is not None:
+            self.services.reader.remember(tab.reader.uri, False)
+            self.exit_reader(tab)
+        else:
+            self.enter_reader(tab, quiet=False)
+
+    def sync_reader_button(self, tab):
+        if tab is not self.get_current_tab():
+            return
+        uri = tab.page_uri() if tab is not None else ""
+        self.btn_reader.set_sensitive(bool(uri) and uri.startswith(("http://", "https://")))
+        self.btn_reader.handler_block(self._reader_handler)
+        self.btn_reader.set_active(tab is not None and tab.reader is not None)
+        self.btn_reader.handler_unblock(self._reader_handler)
+
+    def enter_reader(self, tab, quiet):
+        """Mengambil isi artikel tab lalu menampilkannya di WebView tanpa JavaScript.
+
+        WebView asli dilepas; halaman aslinya (URI & riwayat back/forward)
+        disimpan di tab.reader untuk exit_reader() dan sesi.
+        quiet=True (situs yang diingat) tidak menampilkan dialog jika
+        halaman bukan artikel.
+        """
+        webview = tab.webview
+        uri = webview.get_uri() or ""
+
+        def on_article(article):
+            # Tab sudah berpindah halaman / ditutup selama ekstraksi
+            if tab.webview is not webview or (webview.get_uri() or "") != uri:
+                return
+            if article is None:
+                if not quiet:
+                    self.sync_reader_button(tab)
+                    self.show_info_dialog("Mode baca", "Tidak ditemukan isi artikel di halaman ini.")
+                return
+            article_id, reader_uri = self.services.reader.add_article(article, uri)
+            reader_view = self.create_webview(reader_uri)
+            reader_view.set_settings(self.services.reader.settings)
+            old = tab.detach()
+            tab.reader = ReaderTab(tab.uri, tab.title, tab.session_state, article_id)
+            self.attach_webview(tab, reader_view)
+            reader_view.load_uri(reader_uri)
+            self.context_pool.release(old)
+            old.destroy()
+            if not quiet:
+                self.services.reader.remember(uri, True)
+            self.sync_reader_button(tab)
+            self.session.schedule()
+
+        self.services.reader.extract(webview, on_article)
+
+    def exit_reader(self, tab, uri=None):
+        """Kembali ke halaman asli, atau langsung ke uri (link yang diklik di mode baca)."""
+        if tab.reader is None or tab.get_parent() is None:
+            return False
+        article_id = tab.reader.article_id
+        webview = tab.detach()
+        self.context_pool.release(webview)
+        webview.destroy()
+        self.services.reader.drop_article(article_id)
+        if uri is None:
+            self.hibernation.restore(tab)
+        else:
+            webview = self.create_webview(uri)
+            self.attach_webview(tab, webview)
+            # Halaman asli tetap bisa dicapai dengan tombol Kembali
+            if tab.session_state is not None:
+                webview.restore_session_state(tab.session_state)
+            tab.session_state = None
+            tab.transition = "link"
+            webview.load_uri(uri)
+            self.update_tab_label(tab)
+        self.sync_reader_button(tab)
+        self.session.schedule()
+        return False
+
+    def decide_reader_navigation(self, tab, uri, decision):
+        """WebView mode baca hanya memuat asg://reader; link lain keluar dari mode baca."""
+        if self.services.reader.is_reader_uri(uri):
+            return False
+        decision.ignore()
+        # Ganti WebView di luar handler sinyalnya
+        GLib.idle_add(self.exit_reader, tab, uri)
+        return True
 
     # ================= NAVIGATION =================
     def load_start_page(self, webview):
-        webview.load_html(self.homepage_html, "file:///")
+        webview.load_uri(NEWTAB_URI)
+
+    def on_mouse_target_changed(self, webview, hit_test_result, modifiers):
+        link = hit_test_result.get_link_uri() if hit_test_result.context_is_link() else None
+        if self.prefetcher is not None and link:
+            self.prefetcher.hint(link)
+        if self.prerenderer is not None:
+            self.prerenderer.hover(link)
+
+    def on_url_entry_changed(self, entry):
+        # Teks yang diisi program (URL halaman) bukan ketikan pengguna
+        if (self.prefetcher is None and self.prerenderer is None) or not entry.has_focus():
+            return
+        if self._typing_timer is not None:
+            GLib.source_remove(self._typing_timer)
+        # Tunggu jeda mengetik agar host setengah jadi tidak ikut di-resolve
+        self._typing_timer = GLib.timeout_add(250, self.on_typing_pause)
+
+    def on_typing_pause(self):
+        self._typing_timer = None
+        text = self.url_entry.get_text()
+        if self.prefetcher is not None:
+            self.prefetcher.hint(text)
+        if self.prerenderer is not None and self.can_swap_prerender(self.get_current_tab()):
+            self.prerender_typed(text)
+        return False
+
+    def prerender_typed(self, text):
+        """Prerender bookmark jika ketikan hanya cocok dengan satu URL."""
+        query = strip_url(text)
+        match = None
+        if self.bookmarks is not None and len(query) >= 4:
+            urls = {bm.url for bm in self.bookmarks.search(query) if strip_url(bm.url).startswith(query)}
+            if len(urls) == 1:
+                match = urls.pop()
+        if match is not None:
+            self.prerenderer.start(match, "typed")
+        elif self.prerenderer.source == "typed":
+            # Ketikan tidak lagi cocok dengan halaman yang di-prerender
+            self.prerenderer.cancel()
+
+    def can_swap_prerender(self, tab):
+        """True jika WebView tab boleh diganti WebView prerender.
+
+        Riwayat back/forward tidak bisa dipindahkan ke WebView prerender
+        (WebKitGTK tidak punya API untuk menambah item ke daftarnya), jadi
+        penggantian hanya dilakukan di tab tanpa riwayat: kosong atau hanya
+        berisi halaman tab baru. Di tab lain prerender tetap berguna untuk
+        link yang dibuka di tab baru (new_tab).
+        """
+        webview = tab.webview if tab is not None else None
+        if webview is None or tab.reader is not None:
+            return False
+        return (webview.get_back_forward_list().get_length() <= 1
+                and (webview.get_uri() or NEWTAB_URI) == NEWTAB_URI)
+
+    def use_prerender(self, tab, uri, transition):
+        """Mengganti WebView tab dengan hasil prerender untuk uri, jika ada."""
+        if tab is not None and tab.webview is not None and not self.can_swap_prerender(tab):
+            # Tab mendapat riwayat sejak link diklik: navigasi biasa
+            tab.transition = transition
+            tab.webview.load_uri(uri)
+            return False
+        webview, committed = self.prerenderer.take(uri)
+        if webview is None or tab is None or tab.get_parent() is None:
+            if webview is not None:
+                self.context_pool.release(webview)
+                webview.destroy()
+            return False
+        old = tab.detach()
+        if old is not None:
+            self.context_pool.release(old)
+            old.destroy()
+        tab.transition = transition
+        self.adopt_prerender(tab, webview, committed)
+        return False
+
+    def adopt_prerender(self, tab, webview, committed):
+        self.attach_webview(tab, webview)
+        if tab.netlog is not None:
+            tab.netlog.page_started(webview.get_uri() or "")
+        self.on_title_changed(webview, None, tab)
+        self.ui.update(tab, "uri", webview.get_uri() or "")
+        self.ui.update(tab, "loading", webview.is_loading())
+        self.ui.update(tab, "progress", webview.get_estimated_load_progress())
+        self.ui.mark(tab)
+        # Commit yang terjadi saat masih tersembunyi belum masuk riwayat
+        if committed:
+            self.record_history(webview)
+        self.session.schedule()
 
     def load_url(self, entry):
-        url = entry.get_text().strip()
+        url = normalize_url(entry.get_text())
         if not url:
             return
-        if not url.startswith(("http://", "https://", "file://")):
-            if " " in url:
-                url = "https://www.google.com/search?q=" + url.replace(" ", "+")
-            else:
-                url = "https://" + url
         webview = self.get_current_webview()
+        if webview and self.prerenderer is not None:
+            if self.prerenderer.matches(url) and self.can_swap_prerender(self.get_current_tab()):
+                self.use_prerender(self.get_current_tab(), url, "typed")
+                return
+            self.prerenderer.cancel()
         if webview:
+            self.get_current_tab().transition = "typed"
             webview.load_uri(url)
 
     def go_back(self, *_):
@@ -303,93 +800,198 @@ class ASGBrowser(Gtk.Window):
 
     # ================= EVENTS =================
     def on_load_changed(self, webview, event):
+        tab = webview.get_parent()
+        if self.prerenderer is not None and self.prerenderer.is_prerender(webview):
+            # Halaman tersembunyi: belum dihitung sebagai navigasi / riwayat
+            if event == WebKit2.LoadEvent.STARTED:
+                self.content_blocker.navigate(webview, webview.get_uri())
+            if event in (WebKit2.LoadEvent.STARTED, WebKit2.LoadEvent.REDIRECTED):
+                self.services.site_settings.apply(webview, webview.get_uri())
+            return
+        uri = webview.get_uri()
+        if event == WebKit2.LoadEvent.STARTED and self.config["offline_mode"] and self.archived(uri):
+            # Mode offline: main frame yang ada di arsip langsung diganti
+            # salinannya (iframe tidak memicu load-changed, jadi dibiarkan)
+            webview.stop_loading()
+            GLib.idle_add(webview.load_uri, archive_uri(uri))
+            return
+        if event in (WebKit2.LoadEvent.STARTED, WebKit2.LoadEvent.REDIRECTED):
+            # load-changed hanya untuk main frame: kebijakan situs tujuan
+            # diterapkan sebelum halaman di-commit, iframe tidak mengubahnya
+            self.services.site_settings.apply(webview, webview.get_uri())
         if event == WebKit2.LoadEvent.STARTED:
-            self.progress.set_visible(True)
+            self.content_blocker.navigate(webview, webview.get_uri())
+            if self.prefetcher is not None:
+                self.prefetcher.navigated(webview.get_uri() or "")
+            if tab is not None:
+                self.ui.update(tab, "loading", True)
+                tab.blocked_requests = 0
+                tab.label.set_tooltip_text(None)
+                if tab.netlog is not None:
+                    tab.netlog.page_started(webview.get_uri() or "")
+        elif event == WebKit2.LoadEvent.COMMITTED:
+            if tab is not None and tab.netlog is not None:
+                tab.netlog.milestone("committed")
+            self.session.schedule()
+            self.record_history(webview)
         elif event == WebKit2.LoadEvent.FINISHED:
-            self.progress.set_visible(False)
-            if webview == self.get_current_webview():
+            if tab is not None:
+                if tab.netlog is not None:
+                    tab.netlog.milestone("finished", webview.get_title())
+                self.ui.update(tab, "loading", False)
+                self.ui.update(tab, "uri", tab.page_uri() or "")
+                if not self.batch:
+                    self.services.index_page(webview)
+                # Situs yang diingat langsung dibuka dalam mode baca
                 uri = webview.get_uri() or ""
-                if uri.startswith("file://"):
-                    self.url_entry.set_text("")
-                else:
-                    self.url_entry.set_text(uri)
+                if (tab.reader is None and webview is tab.webview and uri.startswith(("http://", "https://"))
+                        and self.services.reader.remembered(uri)):
+                    self.enter_reader(tab, quiet=True)
+
+    def on_load_failed(self, webview, event, uri, error):
+        """Navigasi gagal: pakai salinan arsip offline jika ada."""
+        if error.matches(WebKit2.NetworkError.quark(), WebKit2.NetworkError.CANCELLED) \
+                or error.matches(WebKit2.PolicyError.quark(), WebKit2.PolicyError.FRAME_LOAD_INTERRUPTED_BY_POLICY_CHANGE):
+            return False
+        if not self.archived(uri):
+            return False
+        print(f"Memuat {uri} dari arsip offline: {error.message}")
+        webview.load_uri(archive_uri(uri))
+        return True
+
+    def archived(self, uri):
+        return (bool(uri) and uri.startswith(("http://", "https://")) and self.services.offline is not None
+                and self.services.offline.get(uri) is not None)
+
+    def on_resource_load_started(self, webview, resource, request):
+        tab = webview.get_parent()
+        if tab is not None and tab.netlog is not None:
+            tab.netlog.request_started(resource, request)
+
+    def on_request_blocked(self, webview, url):
+        tab = webview.get_parent()
+        if tab is not None:
+            tab.blocked_requests += 1
+            tab.label.set_tooltip_text(f"{tab.blocked_requests} permintaan diblokir")
+
+    def record_history(self, webview):
+        uri = webview.get_uri() or ""
+        if self.batch or not uri.startswith(("http://", "https://")):
+            return
+        tab = webview.get_parent()
+        transition = "other"
+        if tab is not None:
+            transition = tab.transition or "other"
+            tab.transition = None
+        self.services.record_visit(uri, webview.get_title() or "", transition)
 
     def on_progress_changed(self, webview, pspec):
-        self.progress.set_fraction(webview.get_estimated_load_progress())
+        tab = webview.get_parent()
+        if tab is not None:
+            self.ui.update(tab, "progress", webview.get_estimated_load_progress())
 
     # ================= MENU ACTIONS =================
     def on_add_bookmark(self, action, param):
         webview = self.get_current_webview()
         if webview:
             title = webview.get_title() or "Tanpa Judul"
-            uri = webview.get_uri() or ""
-            if uri.startswith("file://"):
+            # Dalam mode baca yang disimpan adalah halaman aslinya
+            uri = self.get_current_tab().page_uri() or ""
+            if is_internal(uri):
                 uri = ""
-            if uri and not any(b['url'] == uri for b in self.bookmarks):
-                self.bookmarks.append({"title": title, "url": uri})
+            if uri and uri not in self.bookmarks:
+                self.bookmarks.add(uri, title)
                 self.show_info_dialog("Bookmark ditambahkan!", f"{title}\n{uri}")
             elif uri:
                 self.show_info_dialog("Informasi", "Halaman ini sudah ada di bookmark.")
 
-    def on_bookmark_list(self, action, param):
-        dialog = Gtk.Dialog(title="Daftar Bookmark", transient_for=self, flags=0)
-        dialog.add_buttons(Gtk.STOCK_CLOSE, Gtk.ResponseType.CLOSE)
-        dialog.set_default_size(600, 400)
-
-        scrolled = Gtk.ScrolledWindow()
-        dialog.get_content_area().add(scrolled)
-        listbox = Gtk.ListBox()
-        scrolled.add(listbox)
-
-        if not self.bookmarks:
-            label = Gtk.Label(label="Belum ada bookmark.")
-            label.set_padding(20, 20)
-            listbox.add(label)
-        else:
-            for bm in self.bookmarks:
-                row = self._create_bookmark_row(bm, listbox)
-                listbox.add(row)
+    def on_network_log(self, action, param):
+        tab = self.get_current_tab()
+        if tab is not None:
+            self.new_tab(uri=f"{SCHEME}://network?tab={id(tab)}")
 
-        dialog.show_all()
-        dialog.run()
+    def on_export_har(self, action, param):
+        tab = self.get_current_tab()
+        if tab is None or tab.netlog is None:
+            self.show_info_dialog("Informasi", "Log jaringan dimatikan di konfigurasi.")
+            return
+        dialog = Gtk.FileChooserDialog(title="Ekspor HAR", transient_for=self,
+                                       action=Gtk.FileChooserAction.SAVE)
+        dialog.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+                           Gtk.STOCK_SAVE, Gtk.ResponseType.OK)
+        dialog.set_do_overwrite_confirmation(True)
+        uri = (tab.webview.get_uri() if tab.webview else tab.uri) or ""
+        dialog.set_current_name((urlsplit(uri).hostname or "halaman") + ".har")
+        if dialog.run() == Gtk.ResponseType.OK:
+            path = dialog.get_filename()
+            try:
+                atomic_write(path, json.dumps(tab.netlog.to_har(VERSION), indent=1))
+            except OSError as e:
+                self.show_info_dialog("Gagal mengekspor HAR", str(e))
         dialog.destroy()
 
-    def _create_bookmark_row(self, bm, listbox):
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        row.set_margin_start(10)
-        row.set_margin_end(10)
-        row.set_margin_top(5)
-        row.set_margin_bottom(5)
+    def on_save_offline(self, action, param):
+        tab = self.get_current_tab()
+        webview = tab.webview if tab else None
+        uri = tab.page_uri() if tab else ""
+        if webview is None or not uri or not uri.startswith(("http://", "https://")):
+            self.show_info_dialog("Informasi", "Hanya halaman web yang bisa disimpan untuk offline.")
+            return
+        if self.services.offline is None:
+            self.show_info_dialog("Informasi", "Arsip offline belum siap, coba lagi sebentar.")
+            return
+        title = webview.get_title() or uri
 
-        label = Gtk.Label(label=f"<b>{bm['title']}</b>\n<small>{bm['url']}</small>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
-        row.pack_start(label, True, True, 0)
+        def on_saved(page, new):
+            if page is None:
+                self.show_info_dialog("Gagal", "Halaman tidak bisa disimpan untuk offline.")
+            elif new:
+                self.show_info_dialog("Disimpan untuk offline", f"{title}\n{uri}")
+            else:
+                self.show_info_dialog("Disimpan untuk offline", f"{title}\nIsi sama dengan salinan yang sudah ada.")
 
-        btn_open = Gtk.Button.new_with_label("Buka")
-        btn_open.connect("clicked", lambda w, url=bm['url']: self.open_bookmark(url))
-        row.pack_end(btn_open, False, False, 0)
+        self.services.save_offline(webview, uri, title, on_saved)
 
-        btn_del = Gtk.Button.new_from_icon_name("edit-delete-symbolic", Gtk.IconSize.BUTTON)
-        btn_del.connect("clicked", lambda w, item=bm: self.delete_bookmark(item, listbox))
-        row.pack_end(btn_del, False, False, 0)
+    def on_offline_mode(self, action, value):
+        self.services.set_offline_mode(value.get_boolean())
 
-        return row
+    def sync_offline_action(self):
+        self.offline_action.set_state(GLib.Variant.new_boolean(self.config["offline_mode"]))
+
+    def on_bookmark_list(self, action, param):
+        dialog = BookmarkDialog(self, self.bookmarks, self.open_bookmark)
+        dialog.show_all()
+        dialog.run()
+        dialog.destroy()
+
+    def show_downloads(self, *_):
+        """Panel unduhan jendela ini (non-modal, dibuat sekali)."""
+        self.services.setup_downloads()
+        if self.download_panel is None:
+            self.download_panel = DownloadPanel(self, self.services)
+            self.download_panel.connect("destroy", self.on_download_panel_destroy)
+            self.download_panel.show_all()
+        self.download_panel.present()
+
+    def on_download_panel_destroy(self, panel):
+        self.download_panel = None
 
     def open_bookmark(self, url):
-        self.new_tab()
-        current = self.get_current_webview()
-        if current:
-            current.load_uri(url)
-
-    def delete_bookmark(self, bookmark_item, listbox):
-        self.bookmarks.remove(bookmark_item)
-        for child in listbox.get_children():
-            listbox.remove(child)
-        for bm in self.bookmarks:
-            row = self._create_bookmark_row(bm, listbox)
-            listbox.add(row)
-        listbox.show_all()
+        self.new_tab(uri=url, transition="bookmark")
+
+    def on_toggle_site_blocking(self, action, param):
+        webview = self.get_current_webview()
+        uri = webview.get_uri() if webview else ""
+        host = urlsplit(uri or "").hostname
+        if not host:
+            return
+        allowed = not self.content_blocker.is_allowed(uri)
+        self.content_blocker.set_allowed(host, allowed)
+        webview.reload()
+        if allowed:
+            self.show_info_dialog("Pemblokir dimatikan", f"Konten di {host} tidak lagi diblokir.")
+        else:
+            self.show_info_dialog("Pemblokir dinyalakan", f"Konten di {host} kembali diblokir.")
 
     def on_settings(self, action, param):
         dialog = Gtk.Dialog(title="Pengaturan", transient_for=self, flags=0)
@@ -413,12 +1015,60 @@ class ASGBrowser(Gtk.Window):
         entry = Gtk.Entry()
         grid.attach(entry, 0, 1, 2, 1)
 
+        profile_label = Gtk.Label(label="Profil performa:")
+        profile_label.set_halign(Gtk.Align.START)
+        grid.attach(profile_label, 0, 2, 1, 1)
+
+        profile_combo = Gtk.ComboBoxText()
+        for name in PROFILES:
+            profile_combo.append(name, name)
+        profile_combo.set_active_id(self.config["profile"])
+        grid.attach(profile_combo, 1, 2, 1, 1)
+
+        fulltext_check = Gtk.CheckButton(label="Indeks isi halaman yang dikunjungi (Cari Isi Halaman)")
+        fulltext_check.set_active(self.config["fulltext_index"])
+        grid.attach(fulltext_check, 0, 3, 2, 1)
+
+        download_dir_label = Gtk.Label(label="Folder unduhan:")
+        download_dir_label.set_halign(Gtk.Align.START)
+        grid.attach(download_dir_label, 0, 4, 1, 1)
+
+        download_dir_button = Gtk.FileChooserButton(title="Folder unduhan",
+                                                    action=Gtk.FileChooserAction.SELECT_FOLDER)
+        download_dir_button.set_filename(self.services.download_dir())
+        grid.attach(download_dir_button, 1, 4, 1, 1)
+
+        parallel_label = Gtk.Label(label="Unduhan berjalan sekaligus:")
+        parallel_label.set_halign(Gtk.Align.START)
+        grid.attach(parallel_label, 0, 5, 1, 1)
+
+        parallel_spin = Gtk.SpinButton.new_with_range(1, 10, 1)
+        parallel_spin.set_value(self.config["download_parallel"])
+        grid.attach(parallel_spin, 1, 5, 1, 1)
+
         dialog.show_all()
         response = dialog.run()
         if response == Gtk.ResponseType.OK:
             custom_html = entry.get_text().strip()
-            self.homepage_html = custom_html if custom_html else self.get_default_homepage()
-            self.show_info_dialog("Pengaturan disimpan", "Homepage telah diperbarui.")
+            self.services.set_homepage(custom_html)
+            messages = ["Homepage telah diperbarui."]
+            if fulltext_check.get_active() != self.config["fulltext_index"]:
+                self.services.set_fulltext_index(fulltext_check.get_active())
+                messages.append("Indeks isi halaman " + ("dinyalakan." if fulltext_check.get_active()
+                                                          else "dimatikan."))
+            download_dir = download_dir_button.get_filename() or ""
+            if download_dir == self.services.download_dir() and not self.config["download_dir"]:
+                download_dir = ""
+            parallel = parallel_spin.get_value_as_int()
+            if download_dir != self.config["download_dir"] or parallel != self.config["download_parallel"]:
+                self.services.set_download_options(download_dir, parallel)
+                messages.append("Pengaturan unduhan diperbarui.")
+            profile = profile_combo.get_active_id()
+            if profile and profile != self.config["profile"]:
+                messages.append(f"Profil performa diganti ke {profile}.")
+                if self.services.set_profile(profile):
+                    messages.append("Model proses baru berlaku setelah browser dijalankan ulang.")
+            self.show_info_dialog("Pengaturan disimpan", "\n".join(messages))
         dialog.destroy()
 
     def on_about(self, action, param):
@@ -426,7 +1076,7 @@ class ASGBrowser(Gtk.Window):
         about_dialog.set_transient_for(self)
         about_dialog.set_modal(True)
         about_dialog.set_program_name("ASG Browser")
-        about_dialog.set_version("1.0")
+        about_dialog.set_version(VERSION)
         about_dialog.set_copyright("© 2026 ASG Browser")
         about_dialog.set_comments("Browser ringan dan sederhana berbasis WebKitGTK.\nDibuat dengan Python dan PyGObject.")
         about_dialog.set_website("https://github.com/alisitaDEV/asg-browser-py")
@@ -448,6 +1098,94 @@ class ASGBrowser(Gtk.Window):
         dlg.destroy()
 
 
+class ASGApplication(Gtk.Application):
+    """Satu instance per sesi pengguna; semua jendela berbagi BrowserServices.
+
+    Peluncuran berikutnya (misalnya dari aplikasi lain dengan URL) tidak
+    memulai browser baru: GApplication mengirim URL-nya lewat D-Bus ke
+    instance yang sedang berjalan, yang membukanya sebagai tab baru.
+    """
+
+    def __init__(self, profile=None, unique=True):
+        flags = Gio.ApplicationFlags.HANDLES_OPEN
+        if not unique:
+            flags |= Gio.ApplicationFlags.NON_UNIQUE
+        super().__init__(application_id=APP_ID, flags=flags)
+        self.profile = profile
+        self.services = None
+
+    def do_startup(self):
+        Gtk.Application.do_startup(self)
+        self.services = BrowserServices(self.profile)
+
+    def do_activate(self):
+        window = self.get_active_window() or ASGBrowser(self.services, application=self)
+        window.present()
+
+    def do_open(self, files, n_files, hint):
+        uris = [f.get_uri() for f in files]
+        window = self.get_active_window()
+        if window is None:
+            window = ASGBrowser(self.services, uris=uris, application=self)
+        else:
+            for uri in uris:
+                window.new_tab(uri=uri, transition="link")
+        window.present()
+
+
+def command_line_uri(arg):
+    """Argumen baris perintah menjadi URI: file lokal atau URL."""
+    if os.path.exists(arg):
+        return Gio.File.new_for_path(arg).get_uri()
+    return normalize_url(arg)
+
+
 if __name__ == "__main__":
-    ASGBrowser()
-    Gtk.main()
+    parser = argparse.ArgumentParser(description="ASG Browser")
+    parser.add_argument("urls", nargs="*", metavar="URL",
+                        help="buka sebagai tab baru (di jendela yang sudah berjalan jika ada)")
+    parser.add_argument("--new-instance", action="store_true",
+                        help="jangan teruskan ke instance yang sedang berjalan")
+    parser.add_argument("--trace-startup", nargs="?", const="-", metavar="FILE",
+                        help="catat waktu startup per fase ke FILE (JSON) atau stderr")
+    parser.add_argument("--profile", choices=list(PROFILES),
+                        help="profil performa untuk sesi ini (tidak disimpan)")
+    parser.add_argument("--import-site-policies", metavar="FILE",
+                        help="tambahkan kebijakan per situs dari FILE lalu keluar "
+                             "(berlaku setelah browser dijalankan ulang)")
+    parser.add_argument("--export-site-policies", metavar="FILE",
+                        help="tulis kebijakan per situs ke FILE lalu keluar")
+    parser.add_argument("--batch", metavar="URLFILE",
+                        help="muat URL dari URLFILE tanpa interaksi dan tulis metrik JSONL")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="jumlah WebView yang memuat bersamaan di mode batch")
+    parser.add_argument("--output", default="-", metavar="FILE",
+                        help="file JSONL hasil mode batch (- = stdout)")
+    parser.add_argument("--timeout", type=int, default=30,
+                        help="batas waktu per URL di mode batch (detik)")
+    args = parser.parse_args()
+    if args.trace_startup:
+        trace.enable(args.trace_startup)
+
+    if args.import_site_policies or args.export_site_policies:
+        policies = PolicyStore(os.path.join(data_dir(), "site_policies.json"))
+        try:
+            if args.import_site_policies:
+                print(f"{policies.import_file(args.import_site_policies)} aturan diimpor")
+            if args.export_site_policies:
+                print(f"{policies.export_file(args.export_site_policies)} aturan diekspor")
+        except (OSError, ValueError) as e:
+            sys.exit(f"Gagal: {e}")
+        sys.exit(0)
+
+    if args.batch:
+        output = sys.stdout if args.output == "-" else open(args.output, "w")
+        runner = BatchRunner(ASGBrowser(batch=True, profile=args.profile), read_url_file(args.batch),
+                             args.concurrency, output, args.timeout)
+        runner.run()
+        print(json.dumps(runner.summary()), file=sys.stderr)
+        sys.exit(1 if runner.summary()["failed"] else 0)
+
+    # --profile hanya berlaku jika instance ini yang pertama
+    app = ASGApplication(args.profile, unique=not args.new_instance)
+    sys.exit(app.run([sys.argv[0]] + [command_line_uri(url) for url in args.urls if url.strip()]))
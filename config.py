@@ -0,0 +1,156 @@
+"""Konfigurasi ASG Browser yang disimpan di ``config.json``.
+
+File berada di direktori data browser (``~/.local/share/asg-browser``).
+Kunci yang tidak ada di file memakai nilai dari profil performa yang
+dipilih (``PROFILES``), lalu dari ``DEFAULTS``.
+"""
+import json
+import os
+
+from fileutil import atomic_write
+
+DEFAULTS = {
+    # Profil performa (lihat PROFILES); kunci di config.json tetap menang
+    "profile": "balanced",
+    # Model proses web: "shared" (semua tab berbagi satu web process),
+    # "per-site" (satu web process per situs), "capped" (maksimal
+    # web_process_limit proses) atau "per-tab" (perilaku lama, satu
+    # WebContext per tab).
+    "process_model": "shared",
+    "web_process_limit": 4,
+    # Hibernasi tab latar belakang (0 = tidak dibatasi)
+    "hibernate_idle_timeout": 1800,
+    "hibernate_max_live_tabs": 0,
+    "hibernate_memory_budget_mb": 0,
+    # Model cache WebContext: "document_viewer", "document_browser", "web_browser"
+    "cache_model": "web_browser",
+    # Akselerasi hardware: "always", "never" atau "on-demand"
+    "hardware_acceleration": "on-demand",
+    "webgl": True,
+    "accelerated_2d_canvas": False,
+    "smooth_scrolling": True,
+    # Bawaan JavaScript & media untuk setiap tab
+    "javascript": True,
+    "media_autoplay": True,
+    # Back/forward cache (halaman sebelumnya tetap di memori)
+    "page_cache": True,
+    # Pemblokiran konten dari filter list di direktori "filters"
+    "content_blocking": True,
+    # Penyimpanan cookie: "sqlite" (bawaan) atau "text" (cookies.txt)
+    "cookie_backend": "sqlite",
+    # Kuota cache disk & data situs (MB, 0 = tanpa batas); situs yang paling
+    # lama dikunjungi diusir lebih dulu. Diperiksa tiap storage_check_interval detik
+    "cache_quota_mb": 256,
+    "storage_quota_mb": 512,
+    "storage_check_interval": 600,
+    # Jumlah permintaan terakhir yang dicatat per tab untuk asg://network
+    # dan ekspor HAR (0 = log jaringan mati)
+    "network_log_size": 500,
+    # Prefetch DNS host link yang di-hover / diketik di url_entry
+    "dns_prefetch": True,
+    # Prerender spekulatif (opt-in): URL bookmark yang cocok dengan ketikan
+    # atau link yang di-hover lebih lama dari prerender_hover_ms
+    "prerender": False,
+    "prerender_hover_ms": 500,
+    # Pemantau memori: sampel tiap memory_check_interval detik (0 = mati).
+    # Tahap sedang/tinggi/kritis tercapai jika MemAvailable di bawah persen
+    # berikut atau PSI some avg10 di atas persen berikut
+    "memory_check_interval": 10,
+    "memory_pressure_available_pct": [20, 10, 5],
+    "memory_pressure_psi": [10, 25, 50],
+    # Batas memori per web process untuk MemoryPressureSettings WebKit
+    # (MB, 0 = bawaan WebKit)
+    "web_process_memory_limit_mb": 0,
+    # Animasi geser saat berpindah tab (mati = perpindahan instan)
+    "tab_switch_animation": False,
+    # Arsip halaman offline (MB, 0 = tanpa batas; yang paling lama tidak
+    # dibuka dibuang lebih dulu). Mode offline menyajikan salinan arsip
+    # tanpa mencoba jaringan
+    "offline_archive_mb": 256,
+    "offline_mode": False,
+    # Indeks teks lengkap halaman yang dikunjungi untuk asg://search (opt-in)
+    "fulltext_index": False,
+    # Unduhan: direktori tujuan (kosong = folder Unduhan pengguna) dan
+    # jumlah transfer yang berjalan sekaligus; sisanya mengantri
+    "download_dir": "",
+    "download_parallel": 3,
+}
+
+# Profil performa: kumpulan nilai yang menukar memori dengan kecepatan.
+# "balanced" sama dengan DEFAULTS.
+PROFILES = {
+    "low-memory": {
+        "process_model": "shared",
+        "web_process_limit": 1,
+        "cache_model": "document_viewer",
+        "hardware_acceleration": "never",
+        "webgl": False,
+        "accelerated_2d_canvas": False,
+        "smooth_scrolling": False,
+        "javascript": True,
+        "media_autoplay": False,
+        "page_cache": False,
+        "hibernate_idle_timeout": 300,
+        "hibernate_max_live_tabs": 4,
+        "hibernate_memory_budget_mb": 512,
+        "web_process_memory_limit_mb": 512,
+    },
+    "balanced": {},
+    "throughput": {
+        "process_model": "per-site",
+        "web_process_limit": 8,
+        "cache_model": "web_browser",
+        "hardware_acceleration": "always",
+        "webgl": True,
+        "accelerated_2d_canvas": True,
+        "smooth_scrolling": True,
+        "javascript": True,
+        "media_autoplay": True,
+        "page_cache": True,
+        "hibernate_idle_timeout": 0,
+        "hibernate_max_live_tabs": 0,
+        "hibernate_memory_budget_mb": 0,
+    },
+}
+
+
+def config_path(base_dir):
+    return os.path.join(base_dir, "config.json")
+
+
+def read_user_config(base_dir):
+    """Isi config.json apa adanya (hanya kunci yang diatur pengguna)."""
+    path = config_path(base_dir)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Gagal membaca konfigurasi: {e}")
+        return {}
+
+
+def load_config(base_dir, profile=None):
+    """Menggabungkan DEFAULTS, profil dan config.json.
+
+    ``profile`` (misalnya dari --profile) menggantikan profil di config.json
+    tanpa menyimpannya.
+    """
+    user = read_user_config(base_dir)
+    profile = profile or user.get("profile", DEFAULTS["profile"])
+    if profile not in PROFILES:
+        print(f"Profil tidak dikenal: {profile!r}, memakai 'balanced'")
+        profile = "balanced"
+    config = dict(DEFAULTS)
+    config.update(PROFILES[profile])
+    config.update(user)
+    config["profile"] = profile
+    return config
+
+
+def save_config(base_dir, changes):
+    """Menyimpan perubahan ke config.json (atomik), kunci lain tidak disentuh."""
+    user = read_user_config(base_dir)
+    user.update(changes)
+    atomic_write(config_path(base_dir), json.dumps(user, indent=2))
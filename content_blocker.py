@@ -0,0 +1,350 @@
+"""Pemblokiran konten dengan filter list gaya EasyList/AdBlock.
+
+Filter list (*.txt di direktori ``filters``) diubah ke format content
+rule WebKit lalu dikompilasi oleh WebKit2.UserContentFilterStore. Hasil
+kompilasi disimpan di disk dengan identifier berupa hash isi list,
+sehingga kompilasi ulang hanya terjadi jika list berubah.
+
+Permintaan yang diblokir WebKit tidak terlihat dari proses UI, jadi
+jumlahnya dihitung dari event ``error`` elemen (img, script, link) yang
+dikirim user script lalu dicocokkan dengan FilterMatcher.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from urllib.parse import urlsplit
+
+import gi
+gi.require_version('WebKit2', '4.1')
+from gi.repository import GLib, WebKit2
+
+from fileutil import atomic_write
+
+# Naikkan jika cara konversi berubah agar cache lama tidak dipakai
+CONVERTER_VERSION = 1
+
+RESOURCE_TYPES = {
+    "script": "script",
+    "image": "image",
+    "stylesheet": "style-sheet",
+    "font": "font",
+    "media": "media",
+    "object": "media",
+    "xmlhttprequest": "raw",
+    "websocket": "raw",
+    "ping": "raw",
+    "other": "raw",
+    "subdocument": "document",
+    "popup": "popup",
+}
+
+_HOST_RULE = re.compile(r"^\|\|([a-z0-9.-]+)\^?$")
+
+ERROR_REPORTER_JS = """
+(function () {
+    window.addEventListener('error', function (e) {
+        var t = e.target;
+        if (!t || t === window) return;
+        var url = t.currentSrc || t.src || t.href;
+        var handlers = window.webkit && window.webkit.messageHandlers;
+        if (url && handlers && handlers.asgResourceError)
+            handlers.asgResourceError.postMessage(String(url));
+    }, true);
+})();
+"""
+
+
+def pattern_to_regex(pattern):
+    """Mengubah pola AdBlock ke regex yang didukung content rule WebKit."""
+    regex = ""
+    if pattern.startswith("||"):
+        regex = r"^[^:]+://+([^:/]+\.)?"
+        pattern = pattern[2:]
+    elif pattern.startswith("|"):
+        regex = "^"
+        pattern = pattern[1:]
+    end = ""
+    if pattern.endswith("|"):
+        end = "$"
+        pattern = pattern[:-1]
+    for ch in pattern:
+        if ch == "*":
+            regex += ".*"
+        elif ch == "^":
+            regex += "[/:?=&]"
+        elif ch.isalnum() or ch in "_-/:%=&;,@~!'":
+            regex += ch
+        else:
+            regex += "\\" + ch
+    return (regex + end) or ".*"
+
+
+def _domains(value, sep):
+    """Memisah daftar domain menjadi (if-domain, unless-domain)."""
+    include, exclude = [], []
+    for domain in value.split(sep):
+        domain = domain.strip().lower()
+        if domain.startswith("~"):
+            exclude.append("*" + domain[1:])
+        elif domain:
+            include.append("*" + domain)
+    return include, exclude
+
+
+def parse_filter_list(text):
+    """Mengembalikan (rules, exceptions, matcher_patterns) dari isi filter list.
+
+    Aturan yang tidak didukung dilewati begitu saja.
+    """
+    rules, exceptions = [], []
+    hosts, patterns = set(), []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("!", "[")) or "#@#" in line or "#?#" in line or "#$#" in line:
+            continue
+
+        # Aturan kosmetik: sembunyikan elemen
+        if "##" in line:
+            domains, selector = line.split("##", 1)
+            trigger = {"url-filter": ".*"}
+            if domains:
+                include, exclude = _domains(domains, ",")
+                if include and exclude:
+                    continue
+                if include:
+                    trigger["if-domain"] = include
+                if exclude:
+                    trigger["unless-domain"] = exclude
+            rules.append({"trigger": trigger, "action": {"type": "css-display-none", "selector": selector}})
+            continue
+
+        exception = line.startswith("@@")
+        if exception:
+            line = line[2:]
+        pattern, _, options = line.partition("$")
+        if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 1:
+            continue  # regex mentah tidak didukung
+
+        trigger = {"url-filter": pattern_to_regex(pattern)}
+        types, supported, page_exception = [], True, False
+        for option in filter(None, options.split(",")):
+            option = option.strip().lower()
+            if option == "third-party":
+                trigger["load-type"] = ["third-party"]
+            elif option == "~third-party":
+                trigger["load-type"] = ["first-party"]
+            elif option == "match-case":
+                trigger["url-filter-is-case-sensitive"] = True
+            elif option.startswith("domain="):
+                include, exclude = _domains(option[7:], "|")
+                if include and exclude:
+                    supported = False
+                if include:
+                    trigger["if-domain"] = include
+                if exclude:
+                    trigger["unless-domain"] = exclude
+            elif option in ("document", "elemhide", "generichide") and exception:
+                page_exception = True
+            elif option in RESOURCE_TYPES:
+                types.append(RESOURCE_TYPES[option])
+            else:
+                supported = False
+        if not supported:
+            continue
+        if types:
+            trigger["resource-type"] = sorted(set(types))
+
+        if exception:
+            if page_exception:
+                # @@||situs^$document: seluruh halaman di situs itu dikecualikan
+                match = _HOST_RULE.match(pattern)
+                if not match:
+                    continue
+                trigger = {"url-filter": ".*", "if-domain": ["*" + match.group(1)]}
+            exceptions.append({"trigger": trigger, "action": {"type": "ignore-previous-rules"}})
+            continue
+
+        rules.append({"trigger": trigger, "action": {"type": "block"}})
+        match = _HOST_RULE.match(pattern)
+        if match:
+            hosts.add(match.group(1))
+        else:
+            patterns.append(trigger["url-filter"])
+    return rules, exceptions, (hosts, patterns)
+
+
+class FilterMatcher:
+    """Pencocokan sisi Python, hanya untuk menghitung permintaan yang diblokir."""
+
+    CHUNK = 500
+
+    def __init__(self, hosts=(), patterns=()):
+        self.hosts = set(hosts)
+        self._regexes = []
+        patterns = list(patterns)
+        for i in range(0, len(patterns), self.CHUNK):
+            try:
+                self._regexes.append(re.compile("|".join(patterns[i:i + self.CHUNK]), re.IGNORECASE))
+            except re.error:
+                pass
+
+    def matches(self, url):
+        host = (urlsplit(url).hostname or "").lower()
+        labels = host.split(".")
+        for i in range(len(labels)):
+            if ".".join(labels[i:]) in self.hosts:
+                return True
+        return any(regex.search(url) for regex in self._regexes)
+
+
+def host_allowed(host, allowlist):
+    """True jika host atau salah satu domain induknya ada di allowlist."""
+    labels = (host or "").lower().split(".")
+    return any(".".join(labels[i:]) in allowlist for i in range(len(labels)))
+
+
+class ContentBlocker:
+    def __init__(self, base_dir, enabled=True):
+        self.enabled = enabled
+        self.lists_dir = os.path.join(base_dir, "filters")
+        self.allowlist_path = os.path.join(base_dir, "content_allowlist.json")
+        os.makedirs(self.lists_dir, exist_ok=True)
+        self.store = WebKit2.UserContentFilterStore.new(os.path.join(base_dir, "content-filters"))
+        self.filter = None
+        self.identifier = None
+        self.matcher = FilterMatcher()
+        self.allowlist = self._load_allowlist()
+        self._managers = []
+        self._filtered = set()
+
+    # --- allowlist per situs ---
+    def _load_allowlist(self):
+        try:
+            with open(self.allowlist_path, 'r') as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            print(f"Gagal membaca allowlist: {e}")
+            return set()
+
+    def is_allowed(self, uri):
+        return host_allowed(urlsplit(uri or "").hostname, self.allowlist)
+
+    def set_allowed(self, host, allowed):
+        host = host.lower()
+        if host.startswith("www."):
+            host = host[4:]
+        if allowed:
+            self.allowlist.add(host)
+        else:
+            self.allowlist.discard(host)
+        try:
+            atomic_write(self.allowlist_path, json.dumps(sorted(self.allowlist)))
+        except Exception as e:
+            print(f"Gagal menyimpan allowlist: {e}")
+
+    # --- kompilasi ---
+    def load(self):
+        """Membaca & mengubah filter list di thread latar, lalu memuat/kompilasi."""
+        if self.enabled:
+            threading.Thread(target=self._prepare, name="content-blocker", daemon=True).start()
+
+    def _prepare(self):
+        texts = []
+        for name in sorted(os.listdir(self.lists_dir)):
+            if name.endswith(".txt"):
+                try:
+                    with open(os.path.join(self.lists_dir, name), encoding="utf-8", errors="replace") as f:
+                        texts.append(f.read())
+                except OSError as e:
+                    print(f"Gagal membaca filter list {name}: {e}")
+        if not texts:
+            return
+        content = "\n".join(texts)
+        digest = hashlib.sha256(f"{CONVERTER_VERSION}\n{content}".encode("utf-8")).hexdigest()
+        rules, exceptions, (hosts, patterns) = parse_filter_list(content)
+        matcher = FilterMatcher(hosts, patterns)
+        source = json.dumps(rules + exceptions)
+        GLib.idle_add(self._load_compiled, "asg-" + digest[:32], source, matcher, len(rules))
+
+    def _load_compiled(self, identifier, source, matcher, count):
+        self.identifier = identifier
+        self.matcher = matcher
+
+        def on_loaded(store, result):
+            try:
+                self._set_filter(store.load_finish(result))
+            except GLib.Error:
+                print(f"Mengompilasi {count} aturan pemblokiran konten...")
+                store.save(identifier, GLib.Bytes.new(source.encode("utf-8")), None, on_saved)
+
+        def on_saved(store, result):
+            try:
+                self._set_filter(store.save_finish(result))
+            except GLib.Error as e:
+                print(f"Gagal mengompilasi filter list: {e.message}")
+                return
+            store.fetch_identifiers(None, on_identifiers)
+
+        def on_identifiers(store, result):
+            # Buang hasil kompilasi list versi lama
+            for old in store.fetch_identifiers_finish(result):
+                if old != identifier:
+                    store.remove(old, None, lambda s, r: s.remove_finish(r))
+
+        self.store.load(identifier, None, on_loaded)
+        return False
+
+    def _set_filter(self, content_filter):
+        self.filter = content_filter
+        for manager, uri in list(self._managers):
+            self._apply(manager, uri)
+
+    # --- per WebView ---
+    def attach(self, webview, on_blocked):
+        """Memasang filter & pelapor error ke UserContentManager WebView."""
+        manager = webview.get_user_content_manager()
+        manager.add_script(WebKit2.UserScript.new(
+            ERROR_REPORTER_JS,
+            WebKit2.UserContentInjectedFrames.ALL_FRAMES,
+            WebKit2.UserScriptInjectionTime.START,
+            None, None
+        ))
+        manager.register_script_message_handler("asgResourceError")
+        manager.connect("script-message-received::asgResourceError",
+                        self._on_resource_error, webview, on_blocked)
+        self._managers.append([manager, ""])
+        webview.connect("destroy", self._on_destroyed, manager)
+        self._apply(manager, "")
+
+    def _on_destroyed(self, webview, manager):
+        self._managers = [m for m in self._managers if m[0] is not manager]
+        self._filtered.discard(manager)
+
+    def _on_resource_error(self, manager, js_result, webview, on_blocked):
+        if self.filter is None or manager not in self._filtered:
+            return
+        url = js_result.get_js_value().to_string()
+        if self.matcher.matches(url):
+            on_blocked(webview, url)
+
+    def navigate(self, webview, uri):
+        """Dipanggil sebelum navigasi main frame untuk menerapkan allowlist."""
+        manager = webview.get_user_content_manager()
+        for entry in self._managers:
+            if entry[0] is manager:
+                entry[1] = uri
+        self._apply(manager, uri)
+
+    def _apply(self, manager, uri):
+        want = self.enabled and self.filter is not None and not self.is_allowed(uri)
+        if want and manager not in self._filtered:
+            manager.add_filter(self.filter)
+            self._filtered.add(manager)
+        elif not want and manager in self._filtered:
+            # Hanya filter ini; filter lain (font per situs) tetap terpasang
+            manager.remove_filter(self.filter)
+            self._filtered.discard(manager)
@@ -0,0 +1,136 @@
+"""Pembagian WebContext dan web process antar tab.
+
+Dulu setiap tab membuat WebContext sendiri, sehingga setiap tab punya
+network process, memory cache dan DNS cache masing-masing. ContextPool
+membagikan satu WebContext ke semua tab dan mengelompokkan WebView ke
+web process lewat properti ``related-view`` sesuai model proses:
+
+- ``shared``: semua tab berbagi satu web process.
+- ``per-site``: tab dengan host yang sama berbagi web process.
+- ``capped``: maksimal ``web_process_limit`` web process, tab baru masuk
+  ke kelompok dengan tab paling sedikit.
+- ``per-tab``: perilaku lama (satu WebContext per tab), untuk
+  perbandingan benchmark.
+"""
+import itertools
+from urllib.parse import urlsplit
+
+import gi
+gi.require_version('WebKit2', '4.1')
+from gi.repository import WebKit2
+
+PROCESS_MODELS = ("shared", "per-site", "capped", "per-tab")
+
+
+def site_key(uri):
+    """Kunci situs sederhana: host tanpa awalan 'www.'."""
+    if not uri:
+        return ""
+    host = urlsplit(uri).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class ContextPool:
+    def __init__(self, data_manager, process_model="shared", web_process_limit=4,
+                 memory_pressure_settings=None):
+        if process_model not in PROCESS_MODELS:
+            print(f"Model proses tidak dikenal: {process_model!r}, memakai 'shared'")
+            process_model = "shared"
+        self.data_manager = data_manager
+        self.process_model = process_model
+        self.web_process_limit = max(1, int(web_process_limit))
+        # WebKit2.MemoryPressureSettings untuk web process (None = bawaan WebKit)
+        self.memory_pressure_settings = memory_pressure_settings
+        # Diatur pemantau memori saat tekanan kritis
+        self.prewarm_blocked = False
+        self.context = None
+        self.contexts = []
+        # Fungsi yang dipanggil untuk setiap WebContext baru (skema URI, sinyal)
+        self.context_setup = []
+        # kunci kelompok -> daftar WebView yang berbagi web process
+        self._groups = {}
+        self._group_of = {}
+        # Kunci kelompok baru di model capped; tidak pernah dipakai ulang
+        self._next_group = itertools.count()
+
+    def _new_context(self):
+        if self.memory_pressure_settings is not None:
+            context = WebKit2.WebContext(website_data_manager=self.data_manager,
+                                         memory_pressure_settings=self.memory_pressure_settings)
+        else:
+            context = WebKit2.WebContext.new_with_website_data_manager(self.data_manager)
+        for setup in self.context_setup:
+            setup(context)
+        self.contexts.append(context)
+        return context
+
+    def get_context(self):
+        """WebContext bersama, dibuat saat pertama kali diminta."""
+        if self.context is None:
+            self.context = self._new_context()
+        return self.context
+
+    def _group_key(self, uri):
+        if self.process_model == "per-site":
+            return site_key(uri)
+        if self.process_model == "capped":
+            if len(self._groups) < self.web_process_limit:
+                return next(self._next_group)
+            return min(self._groups, key=lambda k: len(self._groups[k]))
+        return "shared"
+
+    def create_webview(self, uri=None):
+        """Membuat WebView baru sesuai model proses."""
+        if self.process_model == "per-tab":
+            return WebKit2.WebView.new_with_context(self._new_context())
+
+        key = self._group_key(uri)
+        group = self._groups.setdefault(key, [])
+        if group:
+            # UserContentManager sendiri agar filter per tab tidak ikut
+            # terbagi ke tab lain dalam kelompok yang sama.
+            webview = WebKit2.WebView(
+                related_view=group[0],
+                user_content_manager=WebKit2.UserContentManager()
+            )
+        else:
+            webview = WebKit2.WebView.new_with_context(self.get_context())
+        group.append(webview)
+        self._group_of[webview] = key
+        return webview
+
+    def prewarm(self):
+        """Menyiapkan web process lebih awal agar tab berikutnya cepat dibuka."""
+        if self.prewarm_blocked:
+            return
+        self.get_context().prewarm()
+
+    def group_key(self, webview):
+        """Kunci kelompok web process WebView (model per-tab: WebView itu sendiri)."""
+        if self.process_model == "per-tab":
+            return webview
+        return self._group_of.get(webview)
+
+    def release(self, webview):
+        """Melepas WebView dari kelompoknya (dipanggil saat tab ditutup)."""
+        if self.process_model == "per-tab":
+            context = webview.get_context()
+            if context in self.contexts:
+                self.contexts.remove(context)
+            return
+        key = self._group_of.pop(webview, None)
+        group = self._groups.get(key)
+        if group is None:
+            return
+        if webview in group:
+            group.remove(webview)
+        if not group:
+            del self._groups[key]
+
+    def stats(self):
+        return {
+            "process_model": self.process_model,
+            "contexts": len(self.contexts),
+            "groups": len(self._groups),
+            "webviews": len(self._group_of),
+        }
@@ -0,0 +1,131 @@
+"""Penyimpanan cookie: pilihan backend, migrasi cookies.txt -> SQLite, pembersihan.
+
+File SQLite memakai skema ``moz_cookies`` milik libsoup sehingga bisa
+langsung dibuka oleh CookieManager WebKit. Modul ini tidak memakai gi
+agar bisa dijalankan di thread latar dan di benchmark.
+"""
+import os
+import sqlite3
+import time
+
+BACKENDS = ("sqlite", "text")
+FILENAMES = {"sqlite": "cookies.sqlite", "text": "cookies.txt"}
+
+# Skema yang dibuat libsoup (soup-cookie-jar-db.c), termasuk kolom sameSite
+SCHEMA = ("CREATE TABLE IF NOT EXISTS moz_cookies (id INTEGER PRIMARY KEY, name TEXT, value TEXT, "
+          "host TEXT, path TEXT, expiry INTEGER, lastAccessed INTEGER, isSecure INTEGER, "
+          "isHttpOnly INTEGER, sameSite INTEGER)")
+
+HTTP_ONLY_PREFIX = "#HttpOnly_"
+SAME_SITE = {"none": 0, "lax": 1, "strict": 2}
+
+
+def cookie_file(base_dir, backend):
+    return os.path.join(base_dir, FILENAMES[backend])
+
+
+def iter_text_cookies(path):
+    """Membaca cookies.txt (format Mozilla/libsoup) baris demi baris.
+
+    Menghasilkan tuple (name, value, host, path, expiry, secure, http_only, same_site).
+    """
+    with open(path, 'r', encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            http_only = line.startswith(HTTP_ONLY_PREFIX)
+            if http_only:
+                line = line[len(HTTP_ONLY_PREFIX):]
+            elif not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) < 7:
+                continue
+            host, _, cookie_path, secure, expiry, name, value = fields[:7]
+            same_site = SAME_SITE.get(fields[7].lower(), 1) if len(fields) > 7 else 1
+            try:
+                expiry = int(expiry)
+            except ValueError:
+                continue
+            yield (name, value, host, cookie_path, expiry, int(secure == "TRUE"), int(http_only), same_site)
+
+
+def migrate_text_to_sqlite(text_path, db_path, now=None, batch_size=1000):
+    """Memindahkan cookies.txt ke SQLite sekali; mengembalikan jumlah cookie.
+
+    Baris dibaca dan ditulis per kelompok sehingga memori tetap kecil.
+    Jika cookies.sqlite sudah ada (misalnya dari browser-1.1.py), cookie
+    dari teks digabungkan tanpa menimpa cookie yang sudah ada. Setelah
+    selesai cookies.txt diganti nama menjadi ``.migrated``.
+    """
+    if not os.path.exists(text_path):
+        return 0
+    now = int(now if now is not None else time.time())
+    merge = os.path.exists(db_path)
+    # Database baru ditulis ke file sementara lalu di-rename (atomik)
+    target = db_path if merge else db_path + ".tmp"
+    if not merge and os.path.exists(target):
+        os.unlink(target)
+    count = 0
+    conn = sqlite3.connect(target, timeout=10)
+    try:
+        conn.execute(SCHEMA)
+        existing = set(conn.execute("SELECT name, host, path FROM moz_cookies")) if merge else set()
+        batch = []
+        for cookie in iter_text_cookies(text_path):
+            # Cookie kedaluwarsa tidak perlu ikut dipindahkan
+            if cookie[4] <= now or (cookie[0], cookie[2], cookie[3]) in existing:
+                continue
+            batch.append(cookie)
+            if len(batch) >= batch_size:
+                count += _insert(conn, batch)
+                batch = []
+        count += _insert(conn, batch)
+        conn.commit()
+    except BaseException:
+        conn.close()
+        if not merge:
+            os.unlink(target)
+        raise
+    conn.close()
+    if not merge:
+        os.replace(target, db_path)
+    os.replace(text_path, text_path + ".migrated")
+    return count
+
+
+def _insert(conn, batch):
+    conn.executemany(
+        "INSERT INTO moz_cookies (name, value, host, path, expiry, lastAccessed, isSecure, isHttpOnly, sameSite) "
+        "VALUES (?, ?, ?, ?, ?, NULL, ?, ?, ?)", batch)
+    return len(batch)
+
+
+def prune_expired(db_path, now=None):
+    """Menghapus semua cookie kedaluwarsa dalam satu transaksi; mengembalikan jumlahnya."""
+    if not os.path.exists(db_path):
+        return 0
+    now = int(now if now is not None else time.time())
+    # libsoup bisa sedang menulis ke file yang sama, jadi tunggu kuncinya
+    conn = sqlite3.connect(db_path, timeout=10)
+    try:
+        with conn:
+            removed = conn.execute("DELETE FROM moz_cookies WHERE expiry <= ?", (now,)).rowcount
+    finally:
+        conn.close()
+    return removed
+
+
+def prepare_cookie_file(base_dir, backend):
+    """Path file cookie untuk backend, setelah migrasi dari cookies.txt bila perlu."""
+    if backend not in BACKENDS:
+        print(f"Backend cookie tidak dikenal: {backend}, memakai sqlite")
+        backend = "sqlite"
+    path = cookie_file(base_dir, backend)
+    if backend == "sqlite":
+        try:
+            count = migrate_text_to_sqlite(cookie_file(base_dir, "text"), path)
+            if count:
+                print(f"{count} cookie dipindahkan dari cookies.txt ke cookies.sqlite")
+        except Exception as e:
+            print(f"Gagal memindahkan cookies.txt: {e}")
+    return backend, path
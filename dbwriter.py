@@ -0,0 +1,119 @@
+"""Thread penulis SQLite di luar main thread GTK.
+
+Operasi tulis dimasukkan ke antrian lalu dieksekusi berkelompok dalam
+satu transaksi, sehingga banyak perubahan kecil hanya butuh satu commit.
+Setiap operasi berjalan di SAVEPOINT sendiri: operasi yang gagal hanya
+membatalkan perubahannya sendiri, bukan seluruh kelompok.
+"""
+import queue
+import sqlite3
+import threading
+
+_STOP = object()
+
+
+class SQLiteWriter(threading.Thread):
+    def __init__(self, path, schema="", batch_size=1000, queue_size=0, synchronous="FULL"):
+        """queue_size > 0 membatasi antrian; offer() lalu menolak operasi saat penuh.
+
+        Galat saat membuka database atau membuat skema dilempar ulang di sini.
+        """
+        super().__init__(name=f"sqlite-writer:{path}", daemon=True)
+        self.path = path
+        self.schema = schema
+        self.batch_size = batch_size
+        self.synchronous = synchronous
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._ready = threading.Event()
+        self.error = None
+        self.start()
+        self._ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        return conn
+
+    def run(self):
+        try:
+            conn = self.connect()
+            if self.schema:
+                conn.executescript(self.schema)
+        except Exception as e:
+            self.error = e
+            return
+        finally:
+            self._ready.set()
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # _STOP ditangani di luar transaksi agar galat operasi lain di
+            # kelompok yang sama tidak membuat close() menunggu selamanya
+            ops = [op for op in batch if op is not _STOP]
+            stop = len(ops) < len(batch)
+            try:
+                if ops:
+                    with conn:
+                        conn.execute("BEGIN")
+                        for op in ops:
+                            self._apply(conn, op)
+            except Exception as e:
+                self.error = e
+                print(f"Gagal menulis ke {self.path}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    def _apply(self, conn, op):
+        conn.execute("SAVEPOINT op")
+        try:
+            if callable(op):
+                op(conn)
+            else:
+                conn.execute(*op)
+        except Exception as e:
+            conn.execute("ROLLBACK TO op")
+            self.error = e
+            print(f"Gagal menulis ke {self.path}: {e}")
+        finally:
+            conn.execute("RELEASE op")
+
+    def execute(self, sql, params=()):
+        """Menjadwalkan satu perintah SQL."""
+        self._queue.put((sql, params))
+
+    def call(self, func):
+        """Menjadwalkan func(conn) di thread penulis."""
+        self._queue.put(func)
+
+    def offer(self, func):
+        """Seperti call(), tetapi False (tidak dijadwalkan) jika antrian terbatas penuh."""
+        try:
+            self._queue.put_nowait(func)
+            return True
+        except queue.Full:
+            return False
+
+    def full(self):
+        return self._queue.full()
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def flush(self):
+        """Menunggu sampai semua operasi di antrian selesai ditulis."""
+        self._queue.join()
+
+    def close(self):
+        if self.is_alive():
+            self._queue.put(_STOP)
+            self.join()
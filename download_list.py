@@ -0,0 +1,225 @@
+"""Panel unduhan: progres, jeda/lanjut, batal dan buka file.
+
+Jendela non-modal per jendela browser; baris dibuat dari Gio.ListStore
+lewat Gtk.ListBox.bind_model seperti daftar bookmark. Baris hanya
+diperbarui saat DownloadManager melapor (paling sering beberapa kali per
+detik per unduhan), bukan per potongan data yang diterima.
+"""
+import os
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gio, GLib, GObject, Pango
+
+from downloads import CANCELLED, DONE, FAILED, PAUSED, QUEUED, RUNNING, format_size
+
+
+class DownloadItem(GObject.Object):
+    def __init__(self, download):
+        super().__init__()
+        self.download = download
+
+
+class DownloadRow:
+    __slots__ = ("item", "name", "status", "bar", "toggle", "stop", "open", "folder")
+
+
+def _duration(seconds):
+    if seconds is None:
+        return None
+    if seconds < 60:
+        return f"{seconds:.0f} dtk"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f} mnt"
+    return f"{seconds / 3600:.1f} jam"
+
+
+def status_text(d):
+    done = f"{format_size(d.received)} dari {format_size(d.total)}"
+    if d.state == RUNNING:
+        parts = [done, f"{format_size(d.speed)}/s"]
+        remaining = _duration(d.remaining_seconds())
+        if remaining:
+            parts.append(f"sisa {remaining}")
+        if d.retries:
+            parts.append(f"percobaan ulang {d.retries}")
+        return " · ".join(parts)
+    if d.state == QUEUED:
+        return "Mengantri"
+    if d.state == PAUSED:
+        return f"Dijeda · {done}"
+    if d.state == FAILED:
+        return f"Gagal: {d.error or 'tidak diketahui'}"
+    if d.state == DONE:
+        return f"Selesai · {format_size(d.total)}"
+    return "Dibatalkan"
+
+
+class DownloadPanel(Gtk.Window):
+    def __init__(self, parent, services):
+        super().__init__(title="Unduhan", transient_for=parent)
+        self.set_default_size(600, 420)
+        self.set_destroy_with_parent(True)
+        self.services = services
+        self._rows = {}
+
+        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        vbox.set_border_width(10)
+        self.add(vbox)
+
+        top = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        self.summary = Gtk.Label()
+        self.summary.set_xalign(0)
+        top.pack_start(self.summary, True, True, 0)
+        btn_folder = Gtk.Button(label="Buka Folder")
+        btn_folder.connect("clicked", lambda w: self.launch(self.services.downloads.directory))
+        btn_clear = Gtk.Button(label="Bersihkan")
+        btn_clear.set_tooltip_text("Hapus unduhan yang selesai atau dibatalkan dari daftar")
+        btn_clear.connect("clicked", self.on_clear)
+        top.pack_end(btn_clear, False, False, 0)
+        top.pack_end(btn_folder, False, False, 0)
+        vbox.pack_start(top, False, False, 0)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_vexpand(True)
+        vbox.pack_start(scrolled, True, True, 0)
+
+        self.model = Gio.ListStore(item_type=DownloadItem)
+        self.listbox = Gtk.ListBox()
+        self.listbox.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.listbox.bind_model(self.model, self.create_row)
+        placeholder = Gtk.Label(label="Belum ada unduhan.")
+        placeholder.set_margin_top(20)
+        placeholder.show()
+        self.listbox.set_placeholder(placeholder)
+        scrolled.add(self.listbox)
+
+        self.model.splice(0, 0, [DownloadItem(d) for d in self.services.downloads.recent()])
+        self.update_summary()
+        self.services.download_listeners.append(self.on_download_changed)
+        self.connect("destroy", self.on_destroy)
+
+    def on_destroy(self, *_):
+        if self.on_download_changed in self.services.download_listeners:
+            self.services.download_listeners.remove(self.on_download_changed)
+
+    # --- laporan DownloadManager (main thread) ---
+    def on_download_changed(self, download):
+        row = self._rows.get(download.id)
+        if row is None:
+            if self.services.downloads.get(download.id) is download:
+                self.model.insert(0, DownloadItem(download))
+        else:
+            self.update_row(row)
+        self.update_summary()
+
+    def update_summary(self):
+        stats = self.services.downloads.stats()
+        text = f"{stats[RUNNING]} berjalan · {stats[QUEUED]} mengantri"
+        if stats[RUNNING]:
+            text += f" · {format_size(stats['speed'])}/s"
+        self.summary.set_text(text)
+
+    # --- baris ---
+    def create_row(self, item):
+        d = item.download
+        row = DownloadRow()
+        row.item = item
+        widget = Gtk.ListBoxRow()
+        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        hbox.set_border_width(8)
+        widget.add(hbox)
+
+        vbox_text = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
+        row.name = Gtk.Label()
+        row.name.set_xalign(0)
+        row.name.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
+        row.name.set_tooltip_text(d.url)
+        row.bar = Gtk.ProgressBar()
+        row.status = Gtk.Label()
+        row.status.set_xalign(0)
+        row.status.set_ellipsize(Pango.EllipsizeMode.END)
+        vbox_text.pack_start(row.name, False, False, 0)
+        vbox_text.pack_start(row.bar, False, False, 0)
+        vbox_text.pack_start(row.status, False, False, 0)
+        hbox.pack_start(vbox_text, True, True, 0)
+
+        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        row.toggle = Gtk.Button.new_from_icon_name("media-playback-pause-symbolic", Gtk.IconSize.BUTTON)
+        row.toggle.connect("clicked", lambda w: self.toggle_item(item))
+        row.stop = Gtk.Button.new_from_icon_name("process-stop-symbolic", Gtk.IconSize.BUTTON)
+        row.stop.connect("clicked", lambda w: self.stop_item(item))
+        row.open = Gtk.Button.new_from_icon_name("document-open-symbolic", Gtk.IconSize.BUTTON)
+        row.open.set_tooltip_text("Buka")
+        row.open.connect("clicked", lambda w: self.launch(item.download.path))
+        row.folder = Gtk.Button.new_from_icon_name("folder-open-symbolic", Gtk.IconSize.BUTTON)
+        row.folder.set_tooltip_text("Buka folder")
+        row.folder.connect("clicked", lambda w: self.launch(os.path.dirname(item.download.path)))
+        for button in (row.toggle, row.open, row.folder, row.stop):
+            btn_box.pack_start(button, False, False, 0)
+        hbox.pack_end(btn_box, False, False, 0)
+
+        widget.show_all()
+        self._rows[d.id] = row
+        self.update_row(row)
+        return widget
+
+    def update_row(self, row):
+        d = row.item.download
+        row.name.set_markup(f"<b>{GLib.markup_escape_text(d.name)}</b>")
+        row.status.set_markup(f"<span color='gray' size='small'>{GLib.markup_escape_text(status_text(d))}</span>")
+        fraction = d.fraction()
+        if d.state == DONE:
+            row.bar.set_fraction(1.0)
+        elif fraction is not None:
+            row.bar.set_fraction(fraction)
+        elif d.state == RUNNING:
+            row.bar.pulse()
+        row.bar.set_visible(d.state not in (DONE, CANCELLED))
+
+        active = d.state in (QUEUED, RUNNING)
+        row.toggle.set_visible(d.state not in (DONE, CANCELLED))
+        row.toggle.set_image(Gtk.Image.new_from_icon_name(
+            "media-playback-pause-symbolic" if active else "media-playback-start-symbolic", Gtk.IconSize.BUTTON))
+        row.toggle.set_tooltip_text("Jeda" if active else ("Coba lagi" if d.state == FAILED else "Lanjutkan"))
+        row.stop.set_image(Gtk.Image.new_from_icon_name(
+            "process-stop-symbolic" if active or d.state == PAUSED else "edit-delete-symbolic", Gtk.IconSize.BUTTON))
+        row.stop.set_tooltip_text("Batalkan" if active or d.state == PAUSED else "Hapus dari daftar")
+        row.open.set_visible(d.state == DONE)
+        row.folder.set_visible(d.state == DONE)
+
+    def toggle_item(self, item):
+        d = item.download
+        if d.state in (QUEUED, RUNNING):
+            self.services.downloads.pause(d.id)
+        else:
+            self.services.resume_download(d.id)
+
+    def stop_item(self, item):
+        d = item.download
+        if d.state in (QUEUED, RUNNING, PAUSED):
+            self.services.downloads.cancel(d.id)
+        else:
+            self.remove_item(item)
+
+    def remove_item(self, item):
+        self.services.downloads.remove(item.download.id)
+        found, position = self.model.find(item)
+        if found:
+            self.model.remove(position)
+        self._rows.pop(item.download.id, None)
+        self.update_summary()
+
+    def on_clear(self, button):
+        for row in list(self._rows.values()):
+            if row.item.download.state in (DONE, CANCELLED):
+                self.remove_item(row.item)
+
+    def launch(self, path):
+        if not path or not os.path.exists(path):
+            return
+        try:
+            Gio.AppInfo.launch_default_for_uri(GLib.filename_to_uri(path), None)
+        except GLib.Error as e:
+            print(f"Gagal membuka {path}: {e}")
@@ -0,0 +1,575 @@
+"""Pengelola unduhan: antrian paralel terbatas, lanjut unduh dan progres yang diredam.
+
+WebKit hanya memulai unduhan (sinyal ``download-started``); services
+membatalkan unduhan WebKit lalu menyerahkan URL beserta cookie, user
+agent dan referer ke DownloadManager. Paling banyak ``max_parallel``
+transfer berjalan sekaligus, masing-masing di thread pekerja. Data
+ditulis ke ``<nama>.part`` dan baru diganti nama setelah lengkap. Jika
+koneksi putus dan server mendukung Range, transfer dilanjutkan dari byte
+terakhir (dengan If-Range agar file yang sudah berubah di server tidak
+tersambung dengan potongan lama). Ruang disk diperiksa sebelum byte
+pertama ditulis. Progres dikirim lewat dispatch paling sering tiap
+``progress_interval`` detik per unduhan, bukan per potongan data. Daftar
+unduhan disimpan di ``downloads.json`` agar unduhan yang terputus bisa
+dilanjutkan setelah browser dibuka ulang. Modul ini tidak memakai gi.
+"""
+import http.client
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import unquote, urlsplit
+
+from fileutil import atomic_write
+
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+FAILED = "failed"
+DONE = "done"
+CANCELLED = "cancelled"
+STATE_NAMES = {
+    QUEUED: "mengantri",
+    RUNNING: "mengunduh",
+    PAUSED: "dijeda",
+    FAILED: "gagal",
+    DONE: "selesai",
+    CANCELLED: "dibatalkan",
+}
+FINISHED = (DONE, CANCELLED, FAILED)
+
+PART_SUFFIX = ".part"
+CHUNK_SIZE = 256 * 1024
+PROGRESS_INTERVAL = 0.25
+# Ruang yang tetap dibiarkan kosong di disk tujuan
+DISK_RESERVE = 64 * 1024 * 1024
+TIMEOUT = 30
+# Percobaan ulang otomatis setelah koneksi putus (jeda 1, 2, 4, ... detik)
+MAX_RETRIES = 5
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+# Unduhan selesai/dibatalkan yang tetap dicatat di downloads.json
+MAX_KEPT = 200
+# Header yang hanya dikirim ke host asal (tidak ikut redirect) dan tidak
+# disimpan ke disk
+PRIVATE_HEADERS = ("Cookie", "Authorization")
+
+# Galat jaringan yang layak dicoba ulang (dilanjutkan dengan Range)
+RETRIABLE = (urllib.error.URLError, http.client.HTTPException, ConnectionError, TimeoutError)
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+_UNSAFE_NAME = re.compile(r'[\x00-\x1f/\\:*?"<>|]+')
+
+
+class DownloadError(Exception):
+    """Galat yang tidak akan hilang dengan mencoba ulang (4xx, disk penuh)."""
+
+
+def format_size(n):
+    if n is None:
+        return "?"
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GB"
+
+
+def safe_filename(name):
+    """Nama file dari server/URL tanpa pemisah direktori & karakter kontrol."""
+    name = _UNSAFE_NAME.sub("_", os.path.basename(name or "")).strip(" .")
+    if len(name) > 200:
+        stem, ext = os.path.splitext(name)
+        name = stem[:200 - len(ext)] + ext
+    return name or "unduhan"
+
+
+def url_filename(url):
+    return safe_filename(unquote(urlsplit(url).path.rsplit("/", 1)[-1]))
+
+
+def parse_content_range(value):
+    """(awal, total atau None) dari header Content-Range, None jika tidak valid."""
+    match = _CONTENT_RANGE.match(value or "")
+    if match is None:
+        return None
+    total = match.group(3)
+    return int(match.group(1)), None if total == "*" else int(total)
+
+
+class Download:
+    __slots__ = ("id", "url", "headers", "filename", "directory", "path", "state", "received", "total",
+                 "resumable", "validator", "error", "created", "finished", "speed", "retries",
+                 "_stop", "_stop_state", "_last_report", "_last_bytes")
+
+    def __init__(self, id, url, headers=None, filename=None, directory=None):
+        self.id = id
+        self.url = url
+        self.headers = dict(headers or {})
+        # Nama yang disarankan; path final ditentukan saat respons pertama
+        self.filename = filename
+        self.directory = directory
+        self.path = None
+        self.state = QUEUED
+        self.received = 0
+        self.total = None
+        self.resumable = False
+        # ETag kuat atau Last-Modified untuk If-Range
+        self.validator = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        # Byte/detik, dihaluskan
+        self.speed = 0.0
+        self.retries = 0
+        self._stop = threading.Event()
+        self._stop_state = None
+        self._last_report = 0.0
+        self._last_bytes = 0
+
+    @property
+    def part_path(self):
+        return self.path + PART_SUFFIX if self.path else None
+
+    @property
+    def name(self):
+        return os.path.basename(self.path) if self.path else (self.filename or url_filename(self.url))
+
+    def fraction(self):
+        """Bagian yang sudah diunduh (0-1) atau None jika ukuran belum diketahui."""
+        if not self.total:
+            return None
+        return min(1.0, self.received / self.total)
+
+    def remaining_seconds(self):
+        if not self.total or self.speed <= 0:
+            return None
+        return max(0.0, (self.total - self.received) / self.speed)
+
+    def to_json(self):
+        return {
+            "id": self.id, "url": self.url, "filename": self.filename, "directory": self.directory,
+            "path": self.path, "state": self.state, "received": self.received, "total": self.total,
+            "resumable": self.resumable, "validator": self.validator, "error": self.error,
+            "created": self.created, "finished": self.finished,
+            "headers": {k: v for k, v in self.headers.items() if k not in PRIVATE_HEADERS},
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        download = cls(data["id"], data["url"], data.get("headers"), data.get("filename"), data.get("directory"))
+        for key in ("path", "state", "received", "total", "resumable", "validator", "error", "created",
+                    "finished"):
+            if key in data:
+                setattr(download, key, data[key])
+        return download
+
+
+class DownloadManager:
+    def __init__(self, directory, max_parallel=3, state_path=None, dispatch=lambda func, *args: func(*args),
+                 on_change=None, progress_interval=PROGRESS_INTERVAL, reserve_bytes=DISK_RESERVE,
+                 retry_delay=RETRY_DELAY):
+        """dispatch(func, *args) menjalankan on_change(download) di thread pemanggil (GLib.idle_add)."""
+        self.directory = directory
+        self.max_parallel = max(1, max_parallel)
+        self.state_path = state_path
+        self.dispatch = dispatch
+        self.on_change = on_change
+        self.progress_interval = progress_interval
+        self.reserve_bytes = reserve_bytes
+        self.retry_delay = retry_delay
+        self.opener = urllib.request.build_opener()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._save_lock = threading.Lock()
+        self._threads = {}
+        self.downloads = {}
+        self._next_id = 1
+        # Jumlah laporan progres yang dikirim & potongan data yang diterima
+        self.reports = 0
+        self.chunks = 0
+        self._load()
+
+    def _load(self):
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, 'r') as f:
+                items = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Gagal membaca daftar unduhan: {e}")
+            return
+        for data in items:
+            try:
+                download = Download.from_json(data)
+            except (KeyError, TypeError) as e:
+                print(f"Gagal membaca unduhan: {e}")
+                continue
+            if download.state in (QUEUED, RUNNING):
+                # Terputus saat browser ditutup; dilanjutkan oleh pengguna
+                download.state = PAUSED
+            if download.part_path and os.path.exists(download.part_path):
+                download.received = os.path.getsize(download.part_path)
+            self.downloads[download.id] = download
+            self._next_id = max(self._next_id, download.id + 1)
+
+    def _save(self):
+        if not self.state_path:
+            return
+        with self._lock:
+            items = list(self.downloads.values())
+        finished = [d for d in items if d.state in (DONE, CANCELLED)]
+        if len(finished) > MAX_KEPT:
+            dropped = {d.id for d in sorted(finished, key=lambda d: d.created)[:len(finished) - MAX_KEPT]}
+            items = [d for d in items if d.id not in dropped]
+        data = json.dumps([d.to_json() for d in items], indent=1)
+        with self._save_lock:
+            try:
+                atomic_write(self.state_path, data)
+            except OSError as e:
+                print(f"Gagal menyimpan daftar unduhan: {e}")
+
+    def _notify(self, download):
+        with self._changed:
+            self._changed.notify_all()
+        if self.on_change is not None:
+            self.reports += 1
+            self.dispatch(self.on_change, download)
+
+    # ================= API =================
+    def add(self, url, headers=None, filename=None, directory=None):
+        """Mengantrikan unduhan url; mengembalikan Download."""
+        with self._lock:
+            download = Download(self._next_id, url, headers, filename and safe_filename(filename), directory)
+            self._next_id += 1
+            self.downloads[download.id] = download
+        self._save()
+        self._notify(download)
+        self._schedule()
+        return download
+
+    def get(self, download_id):
+        with self._lock:
+            return self.downloads.get(download_id)
+
+    def recent(self):
+        """Semua unduhan, yang terbaru lebih dulu."""
+        with self._lock:
+            return sorted(self.downloads.values(), key=lambda d: d.id, reverse=True)
+
+    def pause(self, download_id):
+        self._stop(download_id, PAUSED)
+
+    def cancel(self, download_id):
+        """Membatalkan unduhan & menghapus file .part-nya."""
+        self._stop(download_id, CANCELLED)
+
+    def _stop(self, download_id, state):
+        with self._lock:
+            download = self.downloads.get(download_id)
+            if download is None or download.state in (DONE, CANCELLED):
+                return
+            if download.state == RUNNING:
+                # Thread pekerja berhenti di potongan berikutnya
+                download._stop_state = state
+                download._stop.set()
+                return
+            if state == PAUSED and download.state != QUEUED:
+                return
+            download.state = state
+        if state == CANCELLED:
+            self._discard_part(download)
+        self._save()
+        self._notify(download)
+
+    def resume(self, download_id, headers=None):
+        """Mengantrikan lagi unduhan yang dijeda/gagal; headers menggantikan yang lama (cookie baru)."""
+        with self._lock:
+            download = self.downloads.get(download_id)
+            if download is None or download.state not in (PAUSED, FAILED):
+                return
+            if headers:
+                download.headers.update(headers)
+            download.state = QUEUED
+            download.error = None
+            download.retries = 0
+        self._save()
+        self._notify(download)
+        self._schedule()
+
+    def remove(self, download_id):
+        """Menghapus unduhan yang tidak berjalan dari daftar (file yang selesai tidak dihapus)."""
+        with self._lock:
+            download = self.downloads.get(download_id)
+            if download is None or download.state in (QUEUED, RUNNING):
+                return
+            del self.downloads[download_id]
+        if download.state != DONE:
+            self._discard_part(download)
+        self._save()
+
+    def set_max_parallel(self, n):
+        self.max_parallel = max(1, n)
+        self._schedule()
+
+    def active(self):
+        """Jumlah unduhan yang berjalan atau mengantri."""
+        with self._lock:
+            return sum(1 for d in self.downloads.values() if d.state in (QUEUED, RUNNING))
+
+    def stats(self):
+        with self._lock:
+            items = list(self.downloads.values())
+        counts = {state: 0 for state in STATE_NAMES}
+        for d in items:
+            counts[d.state] += 1
+        counts["speed"] = sum(d.speed for d in items if d.state == RUNNING)
+        counts["reports"] = self.reports
+        counts["chunks"] = self.chunks
+        return counts
+
+    def wait(self, timeout=None):
+        """Menunggu sampai tidak ada unduhan yang berjalan/mengantri; False jika timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while any(d.state in (QUEUED, RUNNING) for d in self.downloads.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+        return True
+
+    def close(self, timeout=5.0):
+        """Menjeda transfer yang berjalan (bisa dilanjutkan nanti) lalu menyimpan daftar."""
+        with self._lock:
+            for download in self.downloads.values():
+                if download.state == QUEUED:
+                    download.state = PAUSED
+                elif download.state == RUNNING:
+                    download._stop_state = PAUSED
+                    download._stop.set()
+            threads = list(self._threads.values())
+        for thread in threads:
+            thread.join(timeout)
+        self._save()
+
+    # ================= PEKERJA =================
+    def _schedule(self):
+        started = []
+        with self._lock:
+            running = sum(1 for d in self.downloads.values() if d.state == RUNNING)
+            for download in sorted(self.downloads.values(), key=lambda d: d.id):
+                if running >= self.max_parallel:
+                    break
+                if download.state != QUEUED:
+                    continue
+                download.state = RUNNING
+                download._stop.clear()
+                download._stop_state = None
+                thread = threading.Thread(target=self._run, args=(download,), name=f"download-{download.id}",
+                                          daemon=True)
+                self._threads[download.id] = thread
+                started.append((download, thread))
+                running += 1
+        for download, thread in started:
+            self._notify(download)
+            thread.start()
+
+    def _run(self, download):
+        state, error = DONE, None
+        while True:
+            before = download.received
+            try:
+                self._transfer(download)
+                state, error = download._stop_state if download._stop.is_set() else DONE, None
+                break
+            except (DownloadError, ValueError) as e:
+                state, error = FAILED, str(e)
+                break
+            except urllib.error.HTTPError as e:
+                if e.code < 500:
+                    state, error = FAILED, f"HTTP {e.code} {e.reason}"
+                    break
+                error = f"HTTP {e.code} {e.reason}"
+            except RETRIABLE as e:
+                error = str(getattr(e, "reason", e)) or type(e).__name__
+            except OSError as e:
+                # Menulis file gagal (disk penuh, izin): mencoba ulang tidak membantu
+                state, error = FAILED, f"Gagal menulis {download.part_path}: {e.strerror or e}"
+                break
+            if download._stop.is_set():
+                state, error = download._stop_state, None
+                break
+            if download.received > before:
+                # Ada kemajuan sejak percobaan terakhir: hitungan ulang dari nol
+                download.retries = 0
+            if download.retries >= MAX_RETRIES:
+                state = FAILED
+                break
+            download.retries += 1
+            # Jeda sebelum mencoba ulang; pause/cancel membangunkan lebih awal
+            delay = min(MAX_RETRY_DELAY, self.retry_delay * 2 ** (download.retries - 1))
+            print(f"Unduhan {download.name} terputus ({error}), dilanjutkan dalam {delay:.0f} s")
+            if download._stop.wait(delay):
+                state, error = download._stop_state, None
+                break
+        self._finish(download, state, error)
+
+    def _finish(self, download, state, error):
+        if state == CANCELLED:
+            self._discard_part(download)
+        with self._lock:
+            download.state = state
+            download.error = error
+            download.speed = 0.0
+            if state in FINISHED:
+                download.finished = time.time()
+            self._threads.pop(download.id, None)
+        if error:
+            print(f"Gagal mengunduh {download.url}: {error}")
+        self._save()
+        self._notify(download)
+        self._schedule()
+
+    def _transfer(self, download):
+        offset = 0
+        if download.part_path and os.path.exists(download.part_path):
+            offset = os.path.getsize(download.part_path)
+        request = urllib.request.Request(download.url)
+        for key, value in download.headers.items():
+            if key in PRIVATE_HEADERS:
+                request.add_unredirected_header(key, value)
+            else:
+                request.add_header(key, value)
+        if offset and download.resumable:
+            request.add_header("Range", f"bytes={offset}-")
+            if download.validator:
+                request.add_header("If-Range", download.validator)
+        try:
+            response = self.opener.open(request, timeout=TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if e.code != 416:
+                raise
+            e.close()
+            # Range di luar ukuran file: .part sudah lengkap, atau file di
+            # server berubah dan lebih pendek; ulangi dari awal jika ragu
+            if download.total and offset == download.total:
+                self._complete(download)
+                return
+            self._discard_part(download)
+            download.resumable = False
+            raise ConnectionError("Range tidak valid, mengunduh ulang dari awal")
+        with response:
+            headers = response.headers
+            if response.status == 206:
+                content_range = parse_content_range(headers.get("Content-Range"))
+                if content_range is None or content_range[0] > offset:
+                    download.resumable = False
+                    raise ConnectionError("Content-Range tidak valid, mengunduh ulang dari awal")
+                offset, total = content_range
+            else:
+                # Server mengabaikan Range (atau file berubah): mulai dari awal
+                offset = 0
+                length = headers.get("Content-Length")
+                total = int(length) if length and length.isdigit() else None
+            download.resumable = response.status == 206 or headers.get("Accept-Ranges", "").lower() == "bytes"
+            etag = headers.get("ETag")
+            # ETag lemah tidak boleh dipakai untuk If-Range
+            download.validator = etag if etag and not etag.startswith("W/") else headers.get("Last-Modified")
+            if download.path is None:
+                download.path = self._claim_path(download, headers.get_filename())
+            download.total = total
+            self._check_space(download, (total - offset) if total else 0)
+            self._receive(download, response, offset)
+        if download._stop.is_set():
+            return
+        if download.total is not None and download.received < download.total:
+            raise ConnectionError(f"terputus di {format_size(download.received)} dari {format_size(download.total)}")
+        self._complete(download)
+
+    def _receive(self, download, response, offset):
+        mode = "r+b" if offset and os.path.exists(download.part_path) else "wb"
+        buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(download.part_path, mode) as f:
+            f.seek(offset)
+            f.truncate()
+            download.received = offset
+            download._last_bytes = offset
+            download._last_report = time.monotonic()
+            self._notify(download)
+            while not download._stop.is_set():
+                n = response.readinto(buffer)
+                if not n:
+                    break
+                f.write(view[:n])
+                download.received += n
+                self.chunks += 1
+                self._progress(download)
+
+    def _progress(self, download):
+        """Laporan progres paling sering tiap progress_interval detik."""
+        now = time.monotonic()
+        elapsed = now - download._last_report
+        if elapsed < self.progress_interval:
+            return
+        rate = (download.received - download._last_bytes) / elapsed
+        download.speed = rate if download.speed == 0 else 0.7 * download.speed + 0.3 * rate
+        download._last_report = now
+        download._last_bytes = download.received
+        self._notify(download)
+
+    def _complete(self, download):
+        if download.total is None:
+            download.total = download.received
+        download.received = download.total
+        # Nama final bisa sudah dipakai file lain sejak unduhan dimulai
+        final = download.path
+        if os.path.exists(final):
+            with self._lock:
+                final = self._unique_path(os.path.dirname(final), os.path.basename(final), exclude=download)
+        os.replace(download.part_path, final)
+        download.path = final
+
+    def _claim_path(self, download, server_name):
+        directory = download.directory or self.directory
+        os.makedirs(directory, exist_ok=True)
+        name = download.filename or (server_name and safe_filename(server_name)) or url_filename(download.url)
+        with self._lock:
+            return self._unique_path(directory, name, exclude=download)
+
+    def _unique_path(self, directory, name, exclude=None):
+        """Path di directory yang belum dipakai file lain maupun unduhan lain."""
+        taken = {d.path for d in self.downloads.values() if d is not exclude and d.path}
+        stem, ext = os.path.splitext(name)
+        if stem.endswith(".tar"):
+            stem, ext = stem[:-4], ".tar" + ext
+        n = 0
+        while True:
+            path = os.path.join(directory, name if n == 0 else f"{stem} ({n}){ext}")
+            if path not in taken and not os.path.exists(path) and not os.path.exists(path + PART_SUFFIX):
+                return path
+            n += 1
+
+    def _check_space(self, download, needed):
+        """DownloadError jika sisa disk tidak cukup untuk byte yang belum diunduh."""
+        free = shutil.disk_usage(os.path.dirname(download.path)).free
+        if free - needed < self.reserve_bytes:
+            raise DownloadError(f"Ruang disk tidak cukup: perlu {format_size(needed)}, "
+                                f"tersedia {format_size(max(0, free - self.reserve_bytes))}")
+
+    def _discard_part(self, download):
+        if download.part_path:
+            try:
+                os.unlink(download.part_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Gagal menghapus {download.part_path}: {e}")
+        download.received = 0
@@ -0,0 +1,26 @@
+"""Utilitas file bersama."""
+import os
+import tempfile
+
+
+def atomic_write(path, data):
+    """Menulis data ke path secara atomik (file sementara + fsync + rename).
+
+    Jika proses mati di tengah penulisan, file lama tetap utuh.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
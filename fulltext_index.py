@@ -0,0 +1,247 @@
+"""Indeks teks lengkap halaman yang dikunjungi (opt-in), pencarian ``asg://search``.
+
+Teks halaman diambil setelah halaman selesai dimuat lalu dimasukkan ke
+antrian terbatas; thread SQLiteWriter menulisnya ke tabel FTS5 SQLite
+secara berkelompok. Jika antrian penuh, halaman dilewati alih-alih
+menahan main thread. Kunjungan ulang ke halaman yang isinya tidak berubah
+dikenali dari hash teks dan tidak ditulis ulang. Pencarian memakai
+koneksi baca sendiri (WAL), diperingkat BM25 dengan bobot judul lebih
+besar, dan mengembalikan cuplikan teks. Modul ini tidak memakai gi.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from html import escape
+
+from dbwriter import SQLiteWriter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL,
+    hash TEXT NOT NULL,
+    indexed REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(
+    title, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+"""
+
+# Teks halaman yang diambil dibatasi agar satu halaman raksasa tidak
+# memenuhi indeks
+MAX_TEXT = 200000
+QUEUE_SIZE = 64
+BATCH_SIZE = 100
+# Bobot BM25 kolom judul & isi
+TITLE_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+# Kata yang sangat umum cocok dengan hampir semua halaman; hanya sekian
+# halaman terbaru yang cocok yang diperingkat BM25
+MAX_RANKED = 10000
+# Cache halaman SQLite koneksi pencarian (KiB)
+SEARCH_CACHE_KB = 32768
+# Panjang cuplikan hasil pencarian (karakter)
+SNIPPET_CHARS = 200
+
+# Teks yang terlihat di halaman, dipanggil lewat run_javascript
+EXTRACT_JS = f"(document.body ? document.body.innerText : '').slice(0, {MAX_TEXT})"
+
+_SPACE = re.compile(r"\s+")
+_TOKEN = re.compile(r"(\w+)(\*?)", re.UNICODE)
+_MARK_START, _MARK_END = "\x02", "\x03"
+
+
+def fts_query(text):
+    """Ketikan pengguna -> query FTS5: semua kata wajib, ``kata*`` sebagai awalan.
+
+    Awalan tidak otomatis: awalan pendek dari kata umum cocok dengan
+    ratusan kata lain dan membuat peringkat & cuplikan jauh lebih lambat.
+    """
+    return " ".join(f'"{word}"{star}' for word, star in _TOKEN.findall(text))
+
+
+def make_snippet(text, query_text, width=SNIPPET_CHARS):
+    """Potongan text di sekitar kata query pertama, kata yang cocok ditandai.
+
+    Dibuat di Python dari isi yang sudah diambil: snippet() FTS5 harus
+    mengurai ulang query untuk setiap baris, mahal untuk query awalan.
+    """
+    terms = [re.escape(word) + (r"\w*" if star else r"\b") for word, star in _TOKEN.findall(query_text)]
+    if not text or not terms:
+        return text[:width]
+    pattern = re.compile(r"\b(?:" + "|".join(terms) + ")", re.IGNORECASE)
+    first = pattern.search(text)
+    start = 0
+    if first is not None and first.start() > width // 3:
+        start = text.find(" ", first.start() - width // 3) + 1
+    end = start + width
+    if end < len(text):
+        end = max(text.rfind(" ", start, end), start + width // 2)
+    snippet = pattern.sub(lambda m: _MARK_START + m.group(0) + _MARK_END, text[start:end])
+    return ("…" if start else "") + snippet + ("…" if end < len(text) else "")
+
+
+def text_hash(title, text):
+    return hashlib.sha1((title + "\0" + text).encode("utf-8")).hexdigest()
+
+
+class SearchResult:
+    __slots__ = ("url", "title", "snippet", "indexed", "rank")
+
+    def __init__(self, url, title, snippet, indexed, rank):
+        self.url = url
+        self.title = title
+        self.snippet = snippet
+        self.indexed = indexed
+        self.rank = rank
+
+
+class FullTextIndex:
+    """Indeks teks; penulisan lewat SQLiteWriter dengan antrian terbatas."""
+
+    def __init__(self, path, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE):
+        self.path = path
+        self.writer = SQLiteWriter(path, SCHEMA, batch_size=batch_size, queue_size=queue_size,
+                                   synchronous="NORMAL")
+        self.indexed = 0
+        self.unchanged = 0
+        self.dropped = 0
+        self._search_conn = None
+        self._search_lock = threading.Lock()
+
+    @property
+    def error(self):
+        return self.writer.error
+
+    def _index(self, conn, url, title, text, visit_time):
+        text = _SPACE.sub(" ", text[:MAX_TEXT]).strip()
+        digest = text_hash(title, text)
+        row = conn.execute("SELECT id, hash FROM docs WHERE url = ?", (url,)).fetchone()
+        if row is not None and row[1] == digest:
+            self.unchanged += 1
+            return
+        if row is not None:
+            # Isi berubah: id baru agar urutan rowid tetap urutan pengindeksan
+            conn.execute("DELETE FROM pages WHERE rowid = ?", (row[0],))
+            conn.execute("DELETE FROM docs WHERE id = ?", (row[0],))
+        doc_id = conn.execute("INSERT INTO docs (url, hash, indexed) VALUES (?, ?, ?)",
+                              (url, digest, visit_time)).lastrowid
+        conn.execute("INSERT INTO pages (rowid, title, body) VALUES (?, ?, ?)", (doc_id, title, text))
+        self.indexed += 1
+
+    # ================= API =================
+    def submit(self, url, title, text, visit_time=None):
+        """Menjadwalkan satu halaman; False (dilewati) jika antrian penuh."""
+        item = (url, title or "", text or "", visit_time or time.time())
+        if self.writer.offer(lambda conn: self._index(conn, *item)):
+            return True
+        self.dropped += 1
+        return False
+
+    def full(self):
+        """True jika antrian penuh; pemanggil sebaiknya tidak mengambil teks halaman."""
+        return self.writer.full()
+
+    def remove(self, url):
+        def op(conn):
+            row = conn.execute("SELECT id FROM docs WHERE url = ?", (url,)).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM pages WHERE rowid = ?", row)
+                conn.execute("DELETE FROM docs WHERE id = ?", row)
+        self.writer.call(op)
+
+    def clear(self):
+        def op(conn):
+            conn.execute("DELETE FROM docs")
+            conn.execute("DELETE FROM pages")
+        self.writer.call(op)
+
+    def optimize(self):
+        """Menggabungkan segmen FTS5 (setelah banyak penulisan)."""
+        self.writer.call(lambda conn: conn.execute("INSERT INTO pages (pages) VALUES ('optimize')"))
+
+    def search(self, text, limit=20, offset=0):
+        """Hasil berperingkat untuk ketikan pengguna; boleh dipanggil dari thread mana pun."""
+        query = fts_query(text)
+        if not query:
+            return []
+        with self._search_lock:
+            conn = self._reader()
+            # Batas bawah rowid: hanya MAX_RANKED halaman terbaru yang cocok
+            # (iterasi rowid menurun tidak butuh perhitungan BM25)
+            row = conn.execute("SELECT rowid FROM pages WHERE pages MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                               (query, MAX_RANKED)).fetchone()
+            lowest = row[0] if row is not None else 0
+            # Dua langkah: peringkat saja untuk yang cocok, lalu isi & URL
+            # hanya untuk hasil yang ditampilkan
+            ranked = conn.execute(
+                f"SELECT rowid, bm25(pages, {TITLE_WEIGHT}, {BODY_WEIGHT}) AS score FROM pages "
+                "WHERE pages MATCH ? AND rowid > ? ORDER BY score LIMIT ? OFFSET ?",
+                (query, lowest, limit, offset)).fetchall()
+            if not ranked:
+                return []
+            ids = ",".join(str(rowid) for rowid, _ in ranked)
+            rows = conn.execute(
+                "SELECT p.rowid, d.url, p.title, p.body, d.indexed "
+                f"FROM pages p JOIN docs d ON d.id = p.rowid WHERE p.rowid IN ({ids})").fetchall()
+        found = {rowid: (url, title, make_snippet(body, text), indexed)
+                 for rowid, url, title, body, indexed in rows}
+        return [SearchResult(*found[rowid], rank) for rowid, rank in ranked if rowid in found]
+
+    def _reader(self):
+        """Koneksi baca bersama (dipakai di bawah _search_lock), cache tetap hangat."""
+        if self._search_conn is None:
+            self._search_conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._search_conn.execute(f"PRAGMA cache_size = -{SEARCH_CACHE_KB}")
+        return self._search_conn
+
+    def count(self):
+        with self._search_lock:
+            return self._reader().execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def stats(self):
+        return {"indexed": self.indexed, "unchanged": self.unchanged, "dropped": self.dropped,
+                "queued": self.writer.pending()}
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.writer.close()
+        with self._search_lock:
+            if self._search_conn is not None:
+                self._search_conn.close()
+                self._search_conn = None
+
+
+# ================= HALAMAN asg://search =================
+def _snippet_html(snippet):
+    return escape(snippet or "").replace(_MARK_START, "<b>").replace(_MARK_END, "</b>")
+
+
+def render_search_page(text, results, total, elapsed_ms, enabled=True):
+    head = ("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Cari Isi Halaman</title><style>"
+            "body { font: 14px sans-serif; margin: 16px; max-width: 52em; color: #222; }"
+            "input[name=q] { width: 30em; font-size: 15px; padding: 4px; }"
+            ".r { margin: 14px 0; } .r a { font-size: 15px; } .u { color: #080; font-size: 12px; }"
+            ".s { color: #444; } .meta { color: #777; font-size: 12px; }"
+            "</style></head><body><h2>Cari Isi Halaman</h2>"
+            f"<form action='asg://search'><input name='q' value='{escape(text, quote=True)}' autofocus> "
+            "<button>Cari</button> <small>akhiri kata dengan * untuk mencari awalan</small></form>")
+    if not enabled:
+        return head + ("<p>Indeks isi halaman mati. Nyalakan di Pengaturan; halaman yang dikunjungi "
+                       "setelah itu bisa dicari di sini.</p></body></html>")
+    meta = f"<p class='meta'>{total} halaman terindeks"
+    if text:
+        meta += f" · {len(results)} hasil dalam {elapsed_ms:.1f} ms"
+    meta += "</p>"
+    items = "".join(
+        f"<div class='r'><a href='{escape(r.url, quote=True)}'>{escape(r.title or r.url)}</a>"
+        f"<div class='u'>{escape(r.url)} · {time.strftime('%Y-%m-%d', time.localtime(r.indexed))}</div>"
+        f"<div class='s'>{_snippet_html(r.snippet)}</div></div>"
+        for r in results)
+    if text and not results:
+        items = "<p>Tidak ada halaman yang cocok.</p>"
+    return head + meta + items + "</body></html>"
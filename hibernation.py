@@ -0,0 +1,140 @@
+"""Hibernasi tab latar belakang berdasarkan LRU.
+
+Tab yang tidak terlihat melewati batas waktu idle, atau saat jumlah tab
+hidup / total memori web process melewati anggaran, dibuang WebView-nya
+mulai dari yang paling lama tidak dilihat. URL, judul dan session state
+tetap disimpan di Tab sehingga riwayat back/forward kembali utuh saat tab
+dipilih lagi.
+"""
+import time
+
+from gi.repository import GLib
+
+import procstat
+from internal_pages import NEWTAB_URI
+
+
+def select_victims(tabs, visible, now, idle_timeout=0, max_live_tabs=0,
+                   memory_kb=0, memory_budget_kb=0):
+    """Memilih tab yang perlu dihibernasi, urut dari yang paling lama idle.
+
+    ``tabs`` berisi objek dengan atribut ``last_active`` dan ``hibernated``.
+    Nilai batas 0 berarti batas tersebut tidak dipakai.
+    """
+    live = [t for t in tabs if not t.hibernated and t is not visible]
+    live.sort(key=lambda t: t.last_active)
+    victims = []
+
+    if idle_timeout:
+        victims = [t for t in live if now - t.last_active >= idle_timeout]
+    remaining = [t for t in live if t not in victims]
+
+    # Tab yang terlihat selalu hidup dan ikut dihitung
+    live_count = len(remaining) + (1 if visible is not None else 0)
+    if max_live_tabs and live_count > max_live_tabs:
+        extra = remaining[:live_count - max_live_tabs]
+        victims += extra
+        remaining = remaining[len(extra):]
+        live_count -= len(extra)
+
+    if memory_budget_kb and memory_kb > memory_budget_kb and live_count:
+        # Perkiraan kasar: memori web process dibagi rata ke tab hidup
+        per_tab_kb = memory_kb / (live_count + len(victims))
+        projected = memory_kb - per_tab_kb * len(victims)
+        while remaining and projected > memory_budget_kb:
+            victims.append(remaining.pop(0))
+            projected -= per_tab_kb
+    return victims
+
+
+class HibernationManager:
+    def __init__(self, browser, idle_timeout=1800, max_live_tabs=0,
+                 memory_budget_mb=0, interval=30):
+        self.browser = browser
+        self.idle_timeout = idle_timeout
+        self.max_live_tabs = max_live_tabs
+        self.memory_budget_kb = memory_budget_mb * 1024
+        self.interval = interval
+        self._timer = None
+
+        # Penghitung untuk diagnosa
+        self.discarded_tabs = 0
+        self.restored_tabs = 0
+        self.freed_kb = 0
+
+    def start(self):
+        if self._timer is None:
+            self._timer = GLib.timeout_add_seconds(self.interval, self._on_timer)
+
+    def stop(self):
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+            self._timer = None
+
+    def _on_timer(self):
+        self.check()
+        return True
+
+    def check(self):
+        """Menghibernasi tab yang melewati batas idle atau anggaran."""
+        memory_kb = 0
+        if self.memory_budget_kb:
+            memory_kb = sum(procstat.read_rss_kb(p) for p in procstat.web_process_pids())
+        victims = select_victims(
+            self.browser.stack.get_children(),
+            self.browser.stack.get_visible_child(),
+            time.monotonic(),
+            self.idle_timeout,
+            self.max_live_tabs,
+            memory_kb,
+            self.memory_budget_kb
+        )
+        self.hibernate(victims)
+        return victims
+
+    def hibernate(self, tabs):
+        """Membuang WebView dari tab-tab tersebut dan mencatat memori yang lepas."""
+        tabs = [t for t in tabs if not t.hibernated]
+        if not tabs:
+            return
+        before_kb = procstat.tree_rss_kb()
+        for tab in tabs:
+            webview = tab.detach()
+            self.browser.context_pool.release(webview)
+            webview.destroy()
+            self.browser.update_tab_label(tab)
+        self.discarded_tabs += len(tabs)
+        # Web process butuh waktu untuk benar-benar melepas memori
+        GLib.timeout_add_seconds(2, self._measure_freed, before_kb)
+
+    def _measure_freed(self, before_kb):
+        self.freed_kb += max(0, before_kb - procstat.tree_rss_kb())
+        return False
+
+    def restore(self, tab):
+        """Membuat ulang WebView tab dan memulihkan riwayat back/forward."""
+        if not tab.hibernated:
+            return
+        webview = self.browser.create_webview(tab.uri)
+        self.browser.attach_webview(tab, webview)
+        if not tab.uri or tab.uri == NEWTAB_URI:
+            self.browser.load_start_page(webview)
+        elif tab.session_state is not None:
+            webview.restore_session_state(tab.session_state)
+            item = webview.get_back_forward_list().get_current_item()
+            if item is not None:
+                webview.go_to_back_forward_list_item(item)
+            else:
+                webview.load_uri(tab.uri)
+        else:
+            webview.load_uri(tab.uri)
+        tab.session_state = None
+        self.restored_tabs += 1
+        self.browser.update_tab_label(tab)
+
+    def stats(self):
+        return {
+            "discarded_tabs": self.discarded_tabs,
+            "restored_tabs": self.restored_tabs,
+            "freed_kb": self.freed_kb,
+        }
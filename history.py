@@ -0,0 +1,333 @@
+"""Riwayat kunjungan dan pencarian omnibox berperingkat frecency.
+
+Kunjungan ditulis ke SQLite lewat SQLiteWriter (berkelompok, di luar main
+thread). Untuk autocomplete, seluruh URL dimuat ke HistoryIndex di memori
+oleh HistoryWorker; semua pencarian berjalan di thread itu dan query lama
+dibatalkan begitu ada ketikan baru.
+"""
+import bisect
+import heapq
+import queue
+import sqlite3
+import threading
+import time
+
+from dbwriter import SQLiteWriter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    visit_count INTEGER NOT NULL DEFAULT 0,
+    typed_count INTEGER NOT NULL DEFAULT 0,
+    last_visit REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS visits (
+    id INTEGER PRIMARY KEY,
+    url_id INTEGER NOT NULL,
+    visit_time REAL NOT NULL,
+    transition TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS visits_url ON visits(url_id);
+"""
+
+# Jenis transisi yang dicatat per kunjungan
+TRANSITIONS = ("typed", "link", "bookmark", "form", "back_forward", "reload", "other")
+
+# Bobot umur kunjungan terakhir (hari, bobot), mirip frecency Firefox
+_AGE_WEIGHTS = ((4, 1.0), (14, 0.7), (31, 0.5), (90, 0.3))
+_OLD_WEIGHT = 0.1
+
+# Batas pencarian substring agar tetap beberapa milidetik
+MAX_SCAN = 20000
+CHECK_EVERY = 4096
+
+
+def normalize(text):
+    """Huruf kecil tanpa skema dan awalan 'www.' untuk pencocokan awalan."""
+    text = text.strip().lower()
+    for scheme in ("https://", "http://"):
+        if text.startswith(scheme):
+            text = text[len(scheme):]
+            break
+    if text.startswith("www."):
+        text = text[4:]
+    return text
+
+
+def frecency(visit_count, typed_count, last_visit, now):
+    age_days = (now - last_visit) / 86400
+    weight = _OLD_WEIGHT
+    for days, w in _AGE_WEIGHTS:
+        if age_days < days:
+            weight = w
+            break
+    return (visit_count + 2 * typed_count) * weight
+
+
+class HistoryEntry:
+    __slots__ = ("url", "title", "text", "visit_count", "typed_count", "last_visit", "score")
+
+    def __init__(self, url, title, visit_count, typed_count, last_visit, now):
+        self.url = url
+        self.title = title
+        # URL ternormalisasi diikuti judul, agar awalan & substring cukup satu string
+        self.text = normalize(url) + "\n" + title.lower()
+        self.visit_count = visit_count
+        self.typed_count = typed_count
+        self.last_visit = last_visit
+        self.score = frecency(visit_count, typed_count, last_visit, now)
+
+
+class HistoryIndex:
+    """Indeks di memori; tidak thread-safe, dipakai dari satu thread saja."""
+
+    def __init__(self):
+        self.entries = {}
+        self._sorted = []     # (text, url) terurut untuk pencarian awalan
+        self._by_score = []   # entri urut frecency menurun
+        self._recent = []     # entri baru yang belum masuk _by_score
+        self._dirty = False
+
+    def load(self, path):
+        now = time.time()
+        conn = sqlite3.connect(path)
+        try:
+            rows = conn.execute(
+                "SELECT url, title, visit_count, typed_count, last_visit FROM urls"
+            ).fetchall()
+        finally:
+            conn.close()
+        for url, title, visits, typed, last in rows:
+            self.entries[url] = HistoryEntry(url, title, visits, typed, last, now)
+        self._sorted = sorted((e.text, e.url) for e in self.entries.values())
+        self._by_score = sorted(self.entries.values(), key=lambda e: e.score, reverse=True)
+        self._recent = []
+        self._dirty = False
+
+    def add_visit(self, url, title, transition, visit_time):
+        entry = self.entries.get(url)
+        typed = 1 if transition == "typed" else 0
+        if entry is None:
+            entry = HistoryEntry(url, title, 1, typed, visit_time, visit_time)
+            self.entries[url] = entry
+            bisect.insort(self._sorted, (entry.text, url))
+            self._recent.append(entry)
+        else:
+            entry.visit_count += 1
+            entry.typed_count += typed
+            entry.last_visit = visit_time
+            entry.score = frecency(entry.visit_count, entry.typed_count, visit_time, visit_time)
+            if title and title != entry.title:
+                self.set_title(url, title)
+            if entry not in self._recent:
+                self._recent.append(entry)
+        self._dirty = True
+
+    def set_title(self, url, title):
+        entry = self.entries.get(url)
+        if entry is None or not title or title == entry.title:
+            return
+        i = bisect.bisect_left(self._sorted, (entry.text, url))
+        if i < len(self._sorted) and self._sorted[i] == (entry.text, url):
+            del self._sorted[i]
+        entry.title = title
+        entry.text = normalize(url) + "\n" + title.lower()
+        bisect.insort(self._sorted, (entry.text, url))
+
+    def needs_resort(self):
+        return len(self._recent) > 500
+
+    def resort(self):
+        """Mengurutkan ulang berdasarkan frecency (dipanggil saat senggang)."""
+        if self._dirty:
+            now = time.time()
+            for entry in self.entries.values():
+                entry.score = frecency(entry.visit_count, entry.typed_count, entry.last_visit, now)
+            self._by_score = sorted(self.entries.values(), key=lambda e: e.score, reverse=True)
+            self._recent = []
+            self._dirty = False
+
+    def domain_last_visits(self):
+        """Kunjungan terakhir per domain, termasuk setiap domain induknya.
+
+        "a.b.example.com" juga dihitung untuk "b.example.com" dan
+        "example.com", sehingga cocok dengan nama situs di WebsiteData.
+        """
+        hosts = {}
+        for entry in self.entries.values():
+            parts = entry.url.split("/", 3)
+            if len(parts) < 3:
+                continue
+            host = parts[2].rsplit("@", 1)[-1].split(":", 1)[0].lower()
+            if hosts.get(host, 0) < entry.last_visit:
+                hosts[host] = entry.last_visit
+        domains = {}
+        for host, last in hosts.items():
+            labels = host.split(".")
+            for i in range(len(labels) - 1):
+                domain = ".".join(labels[i:])
+                if domains.get(domain, 0) < last:
+                    domains[domain] = last
+        return domains
+
+    def search(self, text, limit=8, cancelled=None):
+        """URL yang cocok awalan lalu substring, berperingkat frecency.
+
+        ``cancelled`` adalah fungsi tanpa argumen; jika mengembalikan True
+        pencarian dihentikan dan hasilnya None.
+        """
+        q = normalize(text)
+        if not q:
+            return []
+        results = []
+        seen = set()
+
+        lo = bisect.bisect_left(self._sorted, (q,))
+        hi = bisect.bisect_left(self._sorted, (q + "\uffff",))
+        if hi - lo <= MAX_SCAN // 10:
+            prefix = (self.entries[url] for _, url in self._sorted[lo:hi])
+            for entry in heapq.nlargest(limit, prefix, key=lambda e: e.score):
+                results.append(entry)
+                seen.add(entry.url)
+        else:
+            # Banyak yang cocok: telusuri urut frecency, berhenti setelah cukup
+            results = self._scan(lambda e: e.text.startswith(q), limit, seen, cancelled)
+            if results is None:
+                return None
+
+        if len(results) < limit:
+            more = self._scan(lambda e: q in e.text, limit - len(results), seen, cancelled)
+            if more is None:
+                return None
+            results += more
+        return [(e.url, e.title) for e in results]
+
+    def _scan(self, match, limit, seen, cancelled):
+        """Menelusuri maksimal MAX_SCAN entri urut frecency."""
+        found = []
+        recent = sorted(self._recent, key=lambda e: e.score, reverse=True)
+        skip = set(recent)
+        chunks = [recent] + [self._by_score[i:i + CHECK_EVERY]
+                             for i in range(0, min(MAX_SCAN, len(self._by_score)), CHECK_EVERY)]
+        for chunk in chunks:
+            if cancelled and cancelled():
+                return None
+            for entry in chunk:
+                if match(entry) and entry.url not in seen and (chunk is recent or entry not in skip):
+                    found.append(entry)
+                    seen.add(entry.url)
+                    if len(found) >= limit:
+                        return found
+        return found
+
+
+class HistoryWorker(threading.Thread):
+    """Thread pemilik HistoryIndex; hasil query dikirim lewat dispatch."""
+
+    def __init__(self, path, dispatch):
+        super().__init__(name="history-index", daemon=True)
+        self.path = path
+        self.dispatch = dispatch
+        self.index = HistoryIndex()
+        self.ready = False
+        self._queue = queue.Queue()
+        self._generation = 0
+        self.start()
+
+    def run(self):
+        try:
+            self.index.load(self.path)
+        except Exception as e:
+            print(f"Gagal memuat riwayat: {e}")
+        self.ready = True
+        while True:
+            try:
+                msg = self._queue.get(timeout=30)
+            except queue.Empty:
+                self.index.resort()
+                continue
+            kind = msg[0]
+            if kind == "stop":
+                break
+            if kind == "visit":
+                self.index.add_visit(*msg[1:])
+                if self.index.needs_resort():
+                    self.index.resort()
+            elif kind == "title":
+                self.index.set_title(*msg[1:])
+            elif kind == "query":
+                self._run_query(*msg[1:])
+            elif kind == "domains":
+                self.dispatch(msg[1], self.index.domain_last_visits())
+
+    def _run_query(self, generation, text, limit, callback):
+        if generation != self._generation:
+            return  # sudah ada ketikan yang lebih baru
+        results = self.index.search(text, limit, lambda: generation != self._generation)
+        if results is not None:
+            self.dispatch(callback, generation, text, results)
+
+    def query(self, text, callback, limit=8):
+        """Menjadwalkan query; query sebelumnya otomatis dibatalkan."""
+        self._generation += 1
+        self._queue.put(("query", self._generation, text, limit, callback))
+        return self._generation
+
+    def is_current(self, generation):
+        return generation == self._generation
+
+    def add_visit(self, url, title, transition, visit_time):
+        self._queue.put(("visit", url, title, transition, visit_time))
+
+    def set_title(self, url, title):
+        self._queue.put(("title", url, title))
+
+    def domain_last_visits(self, callback):
+        """callback(dict domain -> waktu kunjungan terakhir) lewat dispatch."""
+        self._queue.put(("domains", callback))
+
+    def stop(self):
+        self._queue.put(("stop",))
+
+
+class HistoryStore:
+    def __init__(self, path, dispatch):
+        self.path = path
+        self.writer = SQLiteWriter(path, SCHEMA)
+        self.worker = HistoryWorker(path, dispatch)
+
+    def record_visit(self, url, title="", transition="other", visit_time=None):
+        if transition not in TRANSITIONS:
+            transition = "other"
+        visit_time = visit_time or time.time()
+        typed = 1 if transition == "typed" else 0
+        self.writer.execute(
+            "INSERT INTO urls (url, title, visit_count, typed_count, last_visit) VALUES (?, ?, 1, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET visit_count = visit_count + 1, "
+            "typed_count = typed_count + excluded.typed_count, last_visit = excluded.last_visit, "
+            "title = CASE WHEN excluded.title != '' THEN excluded.title ELSE title END",
+            (url, title or "", typed, visit_time)
+        )
+        self.writer.execute(
+            "INSERT INTO visits (url_id, visit_time, transition) SELECT id, ?, ? FROM urls WHERE url = ?",
+            (visit_time, transition, url)
+        )
+        self.worker.add_visit(url, title or "", transition, visit_time)
+
+    def update_title(self, url, title):
+        if not title:
+            return
+        self.writer.execute("UPDATE urls SET title = ? WHERE url = ?", (title, url))
+        self.worker.set_title(url, title)
+
+    def query(self, text, callback, limit=8):
+        return self.worker.query(text, callback, limit)
+
+    def domain_last_visits(self, callback):
+        self.worker.domain_last_visits(callback)
+
+    def close(self):
+        self.worker.stop()
+        self.writer.close()
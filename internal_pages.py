@@ -0,0 +1,119 @@
+"""Halaman internal browser lewat skema URI ``asg://``.
+
+Isi halaman dikompilasi sekali menjadi GLib.Bytes dan disajikan dari
+cache di memori dengan ETag; permintaan dengan If-None-Match yang cocok
+dijawab 304 tanpa isi. Sumber di bawah ``asg://res/`` dianggap
+immutable sehingga WebKit bisa memakai salinan di cache-nya.
+"""
+import hashlib
+from urllib.parse import urlsplit, parse_qs
+
+import gi
+gi.require_version('WebKit2', '4.1')
+gi.require_version('Soup', '3.0')
+from gi.repository import Gio, GLib, Soup, WebKit2
+
+SCHEME = "asg"
+NEWTAB_URI = "asg://newtab"
+
+
+def is_internal(uri):
+    return bool(uri) and uri.startswith(SCHEME + "://")
+
+
+class Resource:
+    __slots__ = ("data", "content_type", "etag", "immutable")
+
+    def __init__(self, body, content_type, immutable=False):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.data = GLib.Bytes.new(body)
+        self.content_type = content_type
+        self.etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        self.immutable = immutable
+
+
+class InternalPages:
+    def __init__(self):
+        self._resources = {}
+        self._handlers = {}
+
+    def set_page(self, name, body, content_type="text/html; charset=utf-8"):
+        """Menyimpan halaman statis, misalnya set_page("newtab", html)."""
+        self._resources[name] = Resource(body, content_type)
+
+    def set_resource(self, name, body, content_type):
+        """Sumber immutable di asg://res/<name>; mengembalikan URI berversi."""
+        resource = Resource(body, content_type, immutable=True)
+        self._resources["res/" + name] = resource
+        return f"{SCHEME}://res/{name}?v={resource.etag.strip(chr(34))}"
+
+    def add_handler(self, name, func):
+        """Halaman dinamis: func(request, query) mengembalikan (body, content_type).
+
+        func boleh mengembalikan None lalu menyelesaikan request sendiri
+        dengan finish_request() (misalnya setelah kerja di thread lain).
+        """
+        self._handlers[name] = func
+
+    def register(self, context):
+        context.register_uri_scheme(SCHEME, self.on_request)
+        # Halaman web biasa tidak boleh memuat asg://
+        security = context.get_security_manager()
+        security.register_uri_scheme_as_local(SCHEME)
+        security.register_uri_scheme_as_secure(SCHEME)
+
+    def on_request(self, request):
+        parts = urlsplit(request.get_uri())
+        name = (parts.netloc + parts.path).rstrip("/")
+        resource = self._resources.get(name)
+        if resource is not None:
+            self._finish(request, resource.data, resource.content_type, resource.etag, resource.immutable)
+            return
+        handler = self._handlers.get(name)
+        if handler is None:
+            request.finish_error(GLib.Error.new_literal(
+                WebKit2.NetworkError.quark(), f"Halaman internal tidak ditemukan: {name}",
+                WebKit2.NetworkError.FILE_DOES_NOT_EXIST))
+            return
+        try:
+            result = handler(request, parse_qs(parts.query))
+        except Exception as e:
+            result = (f"<h1>Kesalahan</h1><pre>{GLib.markup_escape_text(str(e))}</pre>",
+                      "text/html; charset=utf-8")
+        if result is not None:
+            self.finish_request(request, *result)
+
+    def finish_request(self, request, body, content_type="text/html; charset=utf-8"):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self._finish(request, GLib.Bytes.new(body), content_type, None, False)
+
+    def _not_modified(self, request, etag):
+        """True jika If-None-Match permintaan sudah memuat ETag ini."""
+        headers = request.get_http_headers()
+        if not etag or headers is None:
+            return False
+        value = headers.get_one("If-None-Match")
+        if not value:
+            return False
+        tags = [tag.strip() for tag in value.split(",")]
+        return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+    def _finish(self, request, data, content_type, etag, immutable):
+        if self._not_modified(request, etag):
+            response = WebKit2.URISchemeResponse.new(Gio.MemoryInputStream.new(), 0)
+            response.set_status(304, "Not Modified")
+        else:
+            stream = Gio.MemoryInputStream.new_from_bytes(data)
+            response = WebKit2.URISchemeResponse.new(stream, data.get_size())
+            response.set_content_type(content_type)
+        headers = Soup.MessageHeaders.new(Soup.MessageHeadersType.RESPONSE)
+        if etag:
+            headers.append("ETag", etag)
+        if immutable:
+            headers.append("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            headers.append("Cache-Control", "no-cache")
+        response.set_http_headers(headers)
+        request.finish_with_response(response)
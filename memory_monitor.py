@@ -0,0 +1,216 @@
+"""Pemantau tekanan memori untuk proses UI dan web process.
+
+Setiap sampel membaca MemAvailable dari /proc/meminfo, PSI dari
+/proc/pressure/memory (jika kernel mendukung) dan RSS proses browser.
+Tekanan dipetakan ke tahap 0-3; browser bereaksi bertahap saat tahap
+naik: membersihkan cache memori, melepas tab latar belakang, lalu
+menolak prewarm web process baru. Tahap baru turun setelah beberapa
+sampel berturut-turut tenang. Modul ini tidak memakai gi sehingga
+tahapnya bisa digerakkan dengan SyntheticPressure di benchmark.
+"""
+import os
+import time
+from html import escape
+
+import procstat
+
+PSI_PATH = "/proc/pressure/memory"
+
+NORMAL = 0
+CLEAR_CACHES = 1
+RELEASE_TABS = 2
+REFUSE_PREWARM = 3
+STAGE_NAMES = ("normal", "sedang", "tinggi", "kritis")
+
+
+class MemorySample:
+    __slots__ = ("time", "total_kb", "available_kb", "psi_some", "psi_full", "ui_kb", "web_kb")
+
+    def __init__(self, total_kb, available_kb, psi_some=None, psi_full=None, ui_kb=0, web_kb=None):
+        self.time = time.time()
+        self.total_kb = total_kb
+        self.available_kb = available_kb
+        # avg10 PSI (persen waktu tertahan), None jika tidak tersedia
+        self.psi_some = psi_some
+        self.psi_full = psi_full
+        self.ui_kb = ui_kb
+        # pid web process -> RSS (KiB)
+        self.web_kb = web_kb or {}
+
+    @property
+    def available_pct(self):
+        return 100.0 * self.available_kb / self.total_kb if self.total_kb else 100.0
+
+    @property
+    def browser_kb(self):
+        return self.ui_kb + sum(self.web_kb.values())
+
+
+def read_meminfo(path="/proc/meminfo"):
+    """(MemTotal, MemAvailable) dalam KiB."""
+    values = {}
+    with open(path) as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("MemTotal", "MemAvailable"):
+                values[key] = int(rest.split()[0])
+    return values.get("MemTotal", 0), values.get("MemAvailable", 0)
+
+
+def read_psi(path=PSI_PATH):
+    """(some avg10, full avg10) dari PSI, atau (None, None) jika tidak ada."""
+    result = {"some": None, "full": None}
+    try:
+        with open(path) as f:
+            for line in f:
+                kind, *fields = line.split()
+                for field in fields:
+                    if field.startswith("avg10="):
+                        result[kind] = float(field[6:])
+    except (OSError, ValueError):
+        pass
+    return result["some"], result["full"]
+
+
+def read_sample(pid=None):
+    """Sampel memori sistem dan proses browser saat ini."""
+    pid = pid or os.getpid()
+    total_kb, available_kb = read_meminfo()
+    psi_some, psi_full = read_psi()
+    web = {p: procstat.read_rss_kb(p) for p in procstat.web_process_pids(pid)}
+    return MemorySample(total_kb, available_kb, psi_some, psi_full, procstat.read_rss_kb(pid), web)
+
+
+def pressure_stage(sample, available_pct=(20, 10, 5), psi_some=(10, 25, 50)):
+    """Tahap tekanan 0-3 dari sisa memori (persen) atau PSI some avg10."""
+    stage = NORMAL
+    for i in range(REFUSE_PREWARM):
+        if sample.available_pct < available_pct[i]:
+            stage = i + 1
+        elif sample.psi_some is not None and sample.psi_some >= psi_some[i]:
+            stage = i + 1
+    return stage
+
+
+class SyntheticPressure:
+    """Sumber sampel buatan: tekanan diatur dengan set() tanpa menghabiskan RAM."""
+
+    def __init__(self, total_mb=8192):
+        self.total_kb = total_mb * 1024
+        self.available_pct = 100.0
+        self.psi_some = 0.0
+
+    def set(self, available_pct=None, psi_some=None):
+        if available_pct is not None:
+            self.available_pct = available_pct
+        if psi_some is not None:
+            self.psi_some = psi_some
+
+    def __call__(self):
+        return MemorySample(self.total_kb, int(self.total_kb * self.available_pct / 100),
+                            self.psi_some, 0.0)
+
+
+class MemoryMonitor:
+    def __init__(self, react, source=read_sample, available_pct=(20, 10, 5),
+                 psi_some=(10, 25, 50), recover_samples=3):
+        """react(old, new, sample) dipanggil setiap kali tahap berubah."""
+        self.react = react
+        self.source = source
+        self.available_pct = tuple(available_pct)
+        self.psi_some = tuple(psi_some)
+        self.recover_samples = recover_samples
+        self.stage = NORMAL
+        self.sample = None
+        self._calm = 0
+
+        self.samples = 0
+        self.entered = [0] * len(STAGE_NAMES)
+        self.events = []         # (waktu, tahap lama, tahap baru), terbaru di akhir
+
+    def check(self):
+        """Mengambil satu sampel dan memperbarui tahap; mengembalikan tahap."""
+        sample = self.source()
+        self.sample = sample
+        self.samples += 1
+        level = pressure_stage(sample, self.available_pct, self.psi_some)
+        if level > self.stage:
+            self._change(level, sample)
+        elif level < self.stage:
+            # Turun hanya setelah beberapa sampel tenang agar tidak bolak-balik
+            self._calm += 1
+            if self._calm >= self.recover_samples:
+                self._change(level, sample)
+        else:
+            self._calm = 0
+        return self.stage
+
+    def _change(self, level, sample):
+        old, self.stage = self.stage, level
+        self._calm = 0
+        for stage in range(old + 1, level + 1):
+            self.entered[stage] += 1
+        self.events.append((sample.time, old, level))
+        del self.events[:-50]
+        self.react(old, level, sample)
+
+    def stats(self):
+        return {
+            "stage": STAGE_NAMES[self.stage],
+            "samples": self.samples,
+            "entered": dict(zip(STAGE_NAMES[1:], self.entered[1:])),
+        }
+
+
+def estimate_tab_memory(web_kb, groups):
+    """Perkiraan memori per tab: web_kb dibagi rata ke kelompok proses,
+    lalu ke tab di dalam kelompok. groups: kunci -> daftar tab."""
+    groups = {key: tabs for key, tabs in groups.items() if tabs}
+    if not groups:
+        return {}
+    per_group = web_kb / len(groups)
+    estimates = {}
+    for tabs in groups.values():
+        for tab in tabs:
+            estimates[tab] = per_group / len(tabs)
+    return estimates
+
+
+# ================= HALAMAN asg://memory =================
+def _mb(kb):
+    return f"{kb / 1024:.1f} MB"
+
+
+def render_memory_page(monitor, rows):
+    """rows: (judul, uri, status, perkiraan KiB atau None) per tab."""
+    head = ("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Memori</title><style>"
+            "body { font: 13px sans-serif; margin: 16px; color: #222; }"
+            "table { border-collapse: collapse; } td, th { padding: 2px 8px; text-align: left; }"
+            "tr:nth-child(even) { background: #f4f4f4; } .high { color: #c00; }"
+            "</style></head><body><h2>Memori</h2>")
+    sample = monitor.sample
+    if sample is None:
+        return head + "<p>Belum ada sampel memori.</p></body></html>"
+    cls = " class='high'" if monitor.stage else ""
+    psi = f"{sample.psi_some:.1f}%" if sample.psi_some is not None else "tidak tersedia"
+    lines = [
+        f"<p{cls}>Tekanan: {STAGE_NAMES[monitor.stage]}</p>",
+        f"<p>Memori tersedia: {_mb(sample.available_kb)} dari {_mb(sample.total_kb)} "
+        f"({sample.available_pct:.0f}%) · PSI some avg10: {psi}</p>",
+        f"<p>Proses UI: {_mb(sample.ui_kb)} · {len(sample.web_kb)} web process: "
+        f"{_mb(sum(sample.web_kb.values()))}</p>",
+    ]
+    tab_rows = "".join(
+        f"<tr><td>{escape(title)}</td><td>{escape(uri)}</td><td>{state}</td>"
+        f"<td>{_mb(kb) if kb is not None else '-'}</td></tr>"
+        for title, uri, state, kb in rows)
+    events = "".join(
+        f"<li>{time.strftime('%H:%M:%S', time.localtime(t))} · "
+        f"{STAGE_NAMES[old]} → {STAGE_NAMES[new]}</li>"
+        for t, old, new in reversed(monitor.events[-20:]))
+    return (head + "".join(lines)
+            + "<table><tr><th>Tab</th><th>URL</th><th>Status</th><th>Perkiraan</th></tr>"
+            + tab_rows + "</table>"
+            + "<p>Perkiraan: memori web process dibagi rata ke kelompok proses lalu ke tab hidup.</p>"
+            + (f"<h3>Perubahan tahap</h3><ul>{events}</ul>" if events else "")
+            + "</body></html>")
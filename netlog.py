@@ -0,0 +1,243 @@
+"""Log jaringan per tab: waterfall ``asg://network`` dan ekspor HAR 1.2.
+
+Setiap tab memegang NetLog berukuran tetap (ring buffer). Permintaan
+dicatat dari sinyal ``resource-load-started`` WebView dan sinyal
+``received-data``/``failed``/``finished`` milik WebKitWebResource;
+tonggak muat halaman (STARTED/COMMITTED/FINISHED) dicatat di timeline
+yang sama.
+"""
+import time
+from collections import deque
+from datetime import datetime, timezone
+from html import escape
+
+
+class RequestEntry:
+    __slots__ = ("page", "url", "method", "start", "first_byte", "end",
+                 "bytes", "mime", "status", "error")
+
+    def __init__(self, page, url, method, start):
+        self.page = page
+        self.url = url
+        self.method = method
+        self.start = start
+        self.first_byte = None
+        self.end = None
+        self.bytes = 0
+        self.mime = ""
+        self.status = 0
+        self.error = None
+
+
+class PageLoad:
+    __slots__ = ("id", "uri", "title", "start", "committed", "finished")
+
+    def __init__(self, page_id, uri, start):
+        self.id = page_id
+        self.uri = uri
+        self.title = ""
+        self.start = start
+        self.committed = None
+        self.finished = None
+
+
+class NetLog:
+    def __init__(self, capacity=500, max_pages=20):
+        self.entries = deque(maxlen=capacity)
+        self.pages = deque(maxlen=max_pages)
+        self._page_seq = 0
+        # Titik acuan untuk mengubah waktu monotonic ke waktu dinding
+        self._mono0 = time.monotonic()
+        self._wall0 = time.time()
+
+    @property
+    def current_page(self):
+        return self.pages[-1] if self.pages else None
+
+    def page_started(self, uri):
+        self._page_seq += 1
+        page = PageLoad(f"page_{self._page_seq}", uri, time.monotonic())
+        self.pages.append(page)
+        return page
+
+    def milestone(self, name, title=None):
+        """name: "committed" atau "finished"."""
+        page = self.current_page
+        if page is None:
+            return
+        setattr(page, name, time.monotonic())
+        if title:
+            page.title = title
+
+    def request_started(self, resource, request):
+        page = self.current_page
+        entry = RequestEntry(page.id if page else None, resource.get_uri(),
+                             request.get_http_method() or "GET", time.monotonic())
+        self.entries.append(entry)
+        resource.connect("received-data", self._on_received_data, entry)
+        resource.connect("failed", self._on_failed, entry)
+        resource.connect("finished", self._on_finished, entry)
+        return entry
+
+    def _on_received_data(self, resource, length, entry):
+        if entry.first_byte is None:
+            entry.first_byte = time.monotonic()
+        entry.bytes += length
+
+    def _on_failed(self, resource, error, entry):
+        entry.error = error.message
+
+    def _on_finished(self, resource, entry):
+        entry.end = time.monotonic()
+        response = resource.get_response()
+        if response is not None:
+            entry.status = response.get_status_code()
+            entry.mime = response.get_mime_type() or ""
+            if not entry.bytes:
+                entry.bytes = max(response.get_content_length(), 0)
+
+    def page_entries(self, page):
+        return [e for e in self.entries if e.page == page.id]
+
+    def summary(self, page):
+        """Ringkasan satu muat halaman (dipakai juga oleh mode batch)."""
+        entries = self.page_entries(page)
+        return {
+            "requests": len(entries),
+            "bytes": sum(e.bytes for e in entries),
+            "failures": sum(1 for e in entries if e.error or e.status >= 400),
+            "commit_ms": _ms(page.start, page.committed),
+            "finish_ms": _ms(page.start, page.finished),
+        }
+
+    def wall_time(self, mono):
+        return self._wall0 + (mono - self._mono0)
+
+    def to_har(self, creator_version=""):
+        """Seluruh isi log dalam format HAR 1.2 (dict siap json.dump)."""
+        pages = []
+        for page in self.pages:
+            pages.append({
+                "startedDateTime": _iso(self.wall_time(page.start)),
+                "id": page.id,
+                "title": page.title or page.uri,
+                "pageTimings": {
+                    # DOMContentLoaded tidak terlihat dari proses UI
+                    "onContentLoad": -1,
+                    "onLoad": _ms(page.start, page.finished, -1),
+                    "_onCommit": _ms(page.start, page.committed, -1),
+                },
+            })
+        entries = []
+        for e in self.entries:
+            end = e.end if e.end is not None else e.start
+            first_byte = e.first_byte if e.first_byte is not None else end
+            entry = {
+                "startedDateTime": _iso(self.wall_time(e.start)),
+                "time": _ms(e.start, end),
+                "request": {
+                    "method": e.method, "url": e.url, "httpVersion": "",
+                    "cookies": [], "headers": [], "queryString": [],
+                    "headersSize": -1, "bodySize": -1,
+                },
+                "response": {
+                    "status": e.status, "statusText": "", "httpVersion": "",
+                    "cookies": [], "headers": [],
+                    "content": {"size": e.bytes, "mimeType": e.mime},
+                    "redirectURL": "", "headersSize": -1, "bodySize": e.bytes,
+                },
+                "cache": {},
+                "timings": {
+                    "send": 0,
+                    "wait": _ms(e.start, first_byte),
+                    "receive": _ms(first_byte, end),
+                },
+            }
+            if e.page is not None:
+                entry["pageref"] = e.page
+            if e.error:
+                entry["_error"] = e.error
+            entries.append(entry)
+        return {"log": {
+            "version": "1.2",
+            "creator": {"name": "ASG Browser", "version": creator_version},
+            "pages": pages,
+            "entries": entries,
+        }}
+
+
+def _ms(start, end, missing=None):
+    if start is None or end is None:
+        return missing
+    return round((end - start) * 1000, 1)
+
+
+def _iso(wall):
+    return datetime.fromtimestamp(wall, timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _size(n):
+    if n >= 1024 * 1024:
+        return f"{n / 1024 / 1024:.1f} MB"
+    if n >= 1024:
+        return f"{n / 1024:.1f} KB"
+    return f"{n} B"
+
+
+WATERFALL_CSS = """
+body { font: 13px sans-serif; margin: 16px; color: #222; }
+table { border-collapse: collapse; width: 100%; }
+td, th { padding: 2px 6px; text-align: left; white-space: nowrap; }
+tr:nth-child(even) { background: #f4f4f4; }
+td.url { max-width: 420px; overflow: hidden; text-overflow: ellipsis; }
+td.bar { width: 40%; position: relative; }
+.wait { position: absolute; top: 4px; height: 10px; background: #c8d8f0; }
+.recv { position: absolute; top: 4px; height: 10px; background: #3874d8; }
+.mark { position: absolute; top: 0; bottom: 0; width: 1px; }
+.committed { background: #2a2; } .finished { background: #d22; }
+.err { color: #c00; }
+"""
+
+
+def render_waterfall(log, title="Jaringan"):
+    """HTML waterfall untuk muat halaman terakhir di log."""
+    page = log.current_page
+    head = (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{escape(title)}</title>"
+            f"<style>{WATERFALL_CSS}</style></head><body>")
+    if page is None:
+        return head + "<p>Belum ada aktivitas jaringan di tab ini.</p></body></html>"
+
+    entries = log.page_entries(page)
+    now = time.monotonic()
+    ends = [e.end or now for e in entries] + [page.finished or page.start]
+    span = max(max(ends) - page.start, 0.001)
+
+    def pos(t):
+        return max(0.0, min(100.0, (t - page.start) / span * 100))
+
+    summary = log.summary(page)
+    rows = []
+    for e in entries:
+        end = e.end or now
+        first_byte = e.first_byte or end
+        status = escape(e.error) if e.error else (e.status or "…")
+        cls = " class='err'" if e.error or e.status >= 400 else ""
+        rows.append(
+            f"<tr{cls}><td class='url' title='{escape(e.url)}'>{escape(e.url)}</td>"
+            f"<td>{status}</td><td>{escape(e.mime)}</td><td>{_size(e.bytes)}</td>"
+            f"<td>{_ms(e.start, end):.0f} ms</td><td class='bar'>"
+            f"<div class='wait' style='left:{pos(e.start):.2f}%;width:{pos(first_byte) - pos(e.start):.2f}%'></div>"
+            f"<div class='recv' style='left:{pos(first_byte):.2f}%;width:{max(pos(end) - pos(first_byte), 0.3):.2f}%'></div>"
+            + "".join(f"<div class='mark {name}' style='left:{pos(t):.2f}%'></div>"
+                      for name, t in (("committed", page.committed), ("finished", page.finished)) if t)
+            + "</td></tr>")
+
+    finish = f"{summary['finish_ms']:.0f} ms" if summary["finish_ms"] is not None else "belum selesai"
+    commit = f"{summary['commit_ms']:.0f} ms" if summary["commit_ms"] is not None else "-"
+    return (head
+            + f"<h2>{escape(page.title or page.uri)}</h2>"
+            + f"<p>{summary['requests']} permintaan · {_size(summary['bytes'])} · "
+              f"{summary['failures']} gagal · commit {commit} · selesai {finish}</p>"
+            + "<table><tr><th>URL</th><th>Status</th><th>Tipe</th><th>Ukuran</th>"
+              "<th>Waktu</th><th>Timeline</th></tr>"
+            + "".join(rows) + "</table></body></html>")
@@ -0,0 +1,270 @@
+"""Arsip halaman offline (MHTML) dengan penyimpanan beralamat isi.
+
+Setiap salinan disimpan sekali di ``offline/blobs/<2 hex>/<sha256>.mhtml``
+(isi yang sama dari URL atau simpanan berbeda berbagi satu file), dan
+indeks SQLite mencatat versi per URL beserta waktu simpannya. Ukuran
+total dihitung dari blob; jika melewati kuota, blob yang paling lama
+tidak dibuka dibuang lebih dulu (LRU). Penulisan (hash, file, indeks,
+pemangkasan) berjalan di thread SQLiteWriter; versi terbaru per URL
+disimpan di memori agar pemeriksaan saat navigasi tidak menyentuh disk.
+Modul ini tidak memakai gi; halaman disajikan lewat ``asg://offline``.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from html import escape
+from urllib.parse import quote, urlsplit, urlunsplit
+
+from dbwriter import SQLiteWriter
+from fileutil import atomic_write
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    hash TEXT NOT NULL,
+    saved REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_url ON pages(url, saved);
+CREATE INDEX IF NOT EXISTS pages_saved ON pages(saved);
+CREATE INDEX IF NOT EXISTS pages_hash ON pages(hash);
+"""
+
+OFFLINE_URI = "asg://offline"
+MHTML_TYPE = "multipart/related"
+# Versi per URL yang disimpan, termasuk yang terbaru
+MAX_VERSIONS = 5
+
+
+def archive_key(url):
+    """URL tanpa fragmen (#...), kunci indeks arsip."""
+    parts = urlsplit(url or "")
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, parts.query, ""))
+
+
+def archive_uri(url):
+    return f"{OFFLINE_URI}/page?url={quote(archive_key(url), safe='')}"
+
+
+class ArchivedPage:
+    __slots__ = ("url", "title", "hash", "saved", "size", "versions")
+
+    def __init__(self, url, title, hash, saved, size, versions=1):
+        self.url = url
+        self.title = title
+        self.hash = hash
+        self.saved = saved
+        self.size = size
+        self.versions = versions
+
+
+class OfflineArchive:
+    def __init__(self, directory, quota_bytes, dispatch=lambda func, *args: func(*args)):
+        """dispatch(func, *args) menjalankan callback di thread pemanggil (GLib.idle_add)."""
+        self.directory = directory
+        self.blob_dir = os.path.join(directory, "blobs")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.quota_bytes = quota_bytes
+        self.dispatch = dispatch
+        self.path = os.path.join(directory, "index.sqlite")
+        self.writer = SQLiteWriter(self.path, SCHEMA)
+        self._lock = threading.Lock()
+        self.latest = {}
+        self.total_bytes = 0
+        self.pruned_blobs = 0
+        self._load()
+
+    def _load(self):
+        conn = sqlite3.connect(self.path)
+        try:
+            self.total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            rows = conn.execute(
+                "SELECT p.url, p.title, p.hash, p.saved, b.size, "
+                "(SELECT COUNT(*) FROM pages v WHERE v.url = p.url) "
+                "FROM pages p JOIN blobs b ON b.hash = p.hash "
+                "WHERE p.saved = (SELECT MAX(saved) FROM pages l WHERE l.url = p.url)").fetchall()
+        finally:
+            conn.close()
+        self.latest = {row[0]: ArchivedPage(*row) for row in rows}
+
+    def blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest + ".mhtml")
+
+    # ================= MEMBACA =================
+    def get(self, url):
+        """Versi terbaru url di arsip (ArchivedPage) atau None."""
+        with self._lock:
+            return self.latest.get(archive_key(url))
+
+    def pages(self):
+        """Semua halaman (versi terbaru), yang terakhir disimpan lebih dulu."""
+        with self._lock:
+            return sorted(self.latest.values(), key=lambda p: p.saved, reverse=True)
+
+    def read(self, url):
+        """Isi MHTML terbaru url (bytes) atau None; boleh dipanggil dari thread lain.
+
+        Waktu akses blob diperbarui untuk urutan LRU.
+        """
+        page = self.get(url)
+        if page is None:
+            return None
+        try:
+            with open(self.blob_path(page.hash), 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Gagal membaca arsip offline {url}: {e}")
+            return None
+        self.writer.execute("UPDATE blobs SET last_access = ? WHERE hash = ?", (time.time(), page.hash))
+        return data
+
+    def stats(self):
+        with self._lock:
+            pages = list(self.latest.values())
+        return {
+            "pages": len(pages),
+            "versions": sum(p.versions for p in pages),
+            "bytes": self.total_bytes,
+            "quota_bytes": self.quota_bytes,
+            "pruned_blobs": self.pruned_blobs,
+        }
+
+    # ================= MENYIMPAN =================
+    def store(self, url, title, data, callback=None):
+        """Menyimpan salinan MHTML url; callback(ArchivedPage, baru) lewat dispatch.
+
+        baru False jika isi yang sama sudah ada di arsip (tidak ada file
+        yang ditulis).
+        """
+        url = archive_key(url)
+
+        def op(conn):
+            digest = hashlib.sha256(data).hexdigest()
+            now = time.time()
+            new = conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone() is None
+            if new:
+                path = self.blob_path(digest)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                atomic_write(path, data)
+                conn.execute("INSERT INTO blobs (hash, size, last_access) VALUES (?, ?, ?)",
+                             (digest, len(data), now))
+                self.total_bytes += len(data)
+            else:
+                conn.execute("UPDATE blobs SET last_access = ? WHERE hash = ?", (now, digest))
+            latest = self.get(url)
+            if latest is not None and latest.hash == digest:
+                # Isi tidak berubah: cukup perbarui waktu simpan versi terakhir
+                conn.execute("UPDATE pages SET saved = ?, title = ? WHERE url = ? AND saved = ?",
+                             (now, title or "", url, latest.saved))
+            else:
+                conn.execute("INSERT INTO pages (url, title, hash, saved) VALUES (?, ?, ?, ?)",
+                             (url, title or "", digest, now))
+                old = conn.execute("SELECT id, hash FROM pages WHERE url = ? ORDER BY saved DESC LIMIT -1 OFFSET ?",
+                                   (url, MAX_VERSIONS)).fetchall()
+                for page_id, old_hash in old:
+                    conn.execute("DELETE FROM pages WHERE id = ?", (page_id,))
+                    self._drop_if_unused(conn, old_hash)
+            self._refresh(conn, url)
+            self.prune(conn, keep=digest)
+            if callback is not None:
+                self.dispatch(callback, self.get(url), new)
+
+        self.writer.call(op)
+
+    def remove(self, url):
+        """Menghapus semua versi url dari arsip."""
+        url = archive_key(url)
+
+        def op(conn):
+            hashes = [row[0] for row in conn.execute("SELECT DISTINCT hash FROM pages WHERE url = ?", (url,))]
+            conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+            for digest in hashes:
+                self._drop_if_unused(conn, digest)
+            self._refresh(conn, url)
+
+        self.writer.call(op)
+
+    def prune(self, conn, keep=None):
+        """Membuang blob yang paling lama tidak dibuka sampai di bawah kuota."""
+        if not self.quota_bytes or self.total_bytes <= self.quota_bytes:
+            return
+        rows = conn.execute("SELECT hash FROM blobs ORDER BY last_access").fetchall()
+        for (digest,) in rows:
+            if self.total_bytes <= self.quota_bytes:
+                break
+            if digest == keep:
+                continue
+            urls = [row[0] for row in conn.execute("SELECT DISTINCT url FROM pages WHERE hash = ?", (digest,))]
+            conn.execute("DELETE FROM pages WHERE hash = ?", (digest,))
+            self._drop_blob(conn, digest)
+            self.pruned_blobs += 1
+            for url in urls:
+                self._refresh(conn, url)
+
+    def _drop_if_unused(self, conn, digest):
+        if conn.execute("SELECT 1 FROM pages WHERE hash = ? LIMIT 1", (digest,)).fetchone() is None:
+            self._drop_blob(conn, digest)
+
+    def _drop_blob(self, conn, digest):
+        row = conn.execute("SELECT size FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            return
+        conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        self.total_bytes -= row[0]
+        try:
+            os.unlink(self.blob_path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _refresh(self, conn, url):
+        """Memperbarui versi terbaru url di memori dari indeks."""
+        row = conn.execute(
+            "SELECT p.title, p.hash, p.saved, b.size FROM pages p JOIN blobs b ON b.hash = p.hash "
+            "WHERE p.url = ? ORDER BY p.saved DESC LIMIT 1", (url,)).fetchone()
+        versions = conn.execute("SELECT COUNT(*) FROM pages WHERE url = ?", (url,)).fetchone()[0]
+        with self._lock:
+            if row is None:
+                self.latest.pop(url, None)
+            else:
+                self.latest[url] = ArchivedPage(url, *row, versions)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.writer.close()
+
+
+# ================= HALAMAN asg://offline =================
+def _size(n):
+    return f"{n / 1048576:.1f} MB" if n >= 1048576 else f"{n / 1024:.0f} KB"
+
+
+def render_offline_page(archive, offline_mode):
+    stats = archive.stats()
+    quota = _size(stats["quota_bytes"]) if stats["quota_bytes"] else "tanpa batas"
+    rows = "".join(
+        f"<tr><td><a href='{escape(archive_uri(p.url), quote=True)}'>{escape(p.title or p.url)}</a></td>"
+        f"<td>{escape(p.url)}</td>"
+        f"<td>{time.strftime('%Y-%m-%d %H:%M', time.localtime(p.saved))}</td>"
+        f"<td>{p.versions}</td><td>{_size(p.size)}</td></tr>"
+        for p in archive.pages())
+    return ("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Arsip Offline</title><style>"
+            "body { font: 13px sans-serif; margin: 16px; color: #222; }"
+            "table { border-collapse: collapse; } td, th { padding: 2px 8px; text-align: left; }"
+            "tr:nth-child(even) { background: #f4f4f4; }"
+            "</style></head><body><h2>Arsip Offline</h2>"
+            f"<p>Mode offline: {'nyala' if offline_mode else 'mati'} · {stats['pages']} halaman, "
+            f"{stats['versions']} versi · {_size(stats['bytes'])} dari {quota} · "
+            f"{stats['pruned_blobs']} salinan dibuang (LRU) sejak dibuka</p>"
+            + ("<table><tr><th>Judul</th><th>URL</th><th>Disimpan</th><th>Versi</th><th>Ukuran</th></tr>"
+               + rows + "</table>" if rows else "<p>Belum ada halaman yang disimpan.</p>")
+            + "</body></html>")
@@ -0,0 +1,59 @@
+"""Autocomplete riwayat untuk url_entry lewat Gtk.EntryCompletion.
+
+Setiap ketikan mengirim query ke HistoryWorker; hasil dari query yang
+sudah usang (ada ketikan lebih baru) diabaikan.
+"""
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, GLib
+
+
+class Omnibox:
+    COL_URL = 0
+    COL_MARKUP = 1
+
+    def __init__(self, entry, history, activate_callback):
+        self.entry = entry
+        self.history = history
+        self.activate_callback = activate_callback
+        self._generation = 0
+
+        self.model = Gtk.ListStore(str, str)
+        self.completion = Gtk.EntryCompletion()
+        self.completion.set_model(self.model)
+        # Hasil sudah disaring & diurutkan oleh indeks riwayat
+        self.completion.set_match_func(lambda *args: True)
+        self.completion.set_popup_set_width(True)
+        self.completion.set_minimum_key_length(1)
+        cell = Gtk.CellRendererText()
+        self.completion.pack_start(cell, True)
+        self.completion.add_attribute(cell, "markup", self.COL_MARKUP)
+        self.completion.connect("match-selected", self.on_match_selected)
+        entry.set_completion(self.completion)
+        entry.connect("changed", self.on_changed)
+
+    def on_changed(self, entry):
+        # Abaikan set_text() dari program (misalnya saat halaman selesai dimuat)
+        if not entry.has_focus():
+            return
+        text = entry.get_text().strip()
+        if not text:
+            self.model.clear()
+            return
+        self._generation = self.history.query(text, self.on_results)
+
+    def on_results(self, generation, text, results):
+        if generation != self._generation:
+            return False
+        self.model.clear()
+        for url, title in results:
+            markup = f"{GLib.markup_escape_text(title or url)}\n<small>{GLib.markup_escape_text(url)}</small>"
+            self.model.append([url, markup])
+        if results:
+            self.completion.complete()
+        return False
+
+    def on_match_selected(self, completion, model, it):
+        self.entry.set_text(model[it][self.COL_URL])
+        self.activate_callback(self.entry)
+        return True
@@ -0,0 +1,102 @@
+"""Prefetch DNS untuk navigasi yang kemungkinan besar terjadi berikutnya.
+
+Host dari link yang di-hover atau yang sedang diketik di url_entry
+diteruskan ke ``WebContext.prefetch_dns``. Setiap host hanya di-prefetch
+sekali per TTL dan jumlah prefetch per detik dibatasi. Navigasi yang
+host-nya sudah di-prefetch dihitung sebagai hit.
+"""
+import ipaddress
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+
+def host_of(text):
+    """Host dari URL atau teks ketikan ("example.com/abc"), None jika bukan host."""
+    text = text.strip()
+    if not text or " " in text:
+        return None
+    if "://" not in text:
+        text = "http://" + text
+    parts = urlsplit(text)
+    if parts.scheme not in ("http", "https"):
+        return None
+    try:
+        host = parts.hostname
+    except ValueError:
+        return None
+    # Ketikan setengah jadi ("exam") atau alamat IP tidak perlu di-resolve
+    if not host or "." not in host or host.endswith("."):
+        return None
+    try:
+        ipaddress.ip_address(host)
+        return None
+    except ValueError:
+        return host
+
+
+class DNSPrefetcher:
+    def __init__(self, prefetch_func, ttl=60, rate=10, max_hosts=256, clock=time.monotonic):
+        self.prefetch_func = prefetch_func
+        self.ttl = ttl
+        self.rate = rate
+        self.max_hosts = max_hosts
+        self.clock = clock
+        # host -> waktu prefetch terakhir, urut dari yang paling lama
+        self._recent = OrderedDict()
+        self._tokens = float(rate)
+        self._last_refill = clock()
+
+        self.requested = 0
+        self.deduplicated = 0
+        self.rate_limited = 0
+        self.navigations = 0
+        self.hits = 0
+
+    def hint(self, text):
+        """Memberi petunjuk bahwa host di text mungkin segera dikunjungi."""
+        host = host_of(text)
+        if host is None:
+            return False
+        now = self.clock()
+        last = self._recent.get(host)
+        if last is not None and now - last < self.ttl:
+            self.deduplicated += 1
+            return False
+
+        # Token bucket: paling banyak `rate` prefetch per detik
+        self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        if self._tokens < 1:
+            self.rate_limited += 1
+            return False
+        self._tokens -= 1
+
+        self._recent[host] = now
+        self._recent.move_to_end(host)
+        while len(self._recent) > self.max_hosts:
+            self._recent.popitem(last=False)
+        self.requested += 1
+        self.prefetch_func(host)
+        return True
+
+    def navigated(self, uri):
+        """Mencatat navigasi sungguhan untuk menghitung hit prefetch."""
+        host = host_of(uri)
+        if host is None:
+            return False
+        self.navigations += 1
+        last = self._recent.get(host)
+        if last is not None and self.clock() - last < self.ttl:
+            self.hits += 1
+            return True
+        return False
+
+    def stats(self):
+        return {
+            "requested": self.requested,
+            "deduplicated": self.deduplicated,
+            "rate_limited": self.rate_limited,
+            "navigations": self.navigations,
+            "hits": self.hits,
+        }
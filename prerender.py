@@ -0,0 +1,132 @@
+"""Prerender spekulatif navigasi berikutnya di WebView tersembunyi.
+
+Paling banyak satu halaman di-prerender sekaligus, di WebView bisu dalam
+Gtk.OffscreenWindow (tetap dirender, tidak terlihat). Jika pengguna
+benar-benar membuka URL itu, WebView-nya dipindahkan ke tab sehingga
+halaman langsung tampil. Riwayat back/forward tab tidak bisa dipindahkan
+ke WebView itu, jadi tab yang sudah punya riwayat tidak diganti; di sana
+prerender hanya dipakai untuk link yang dibuka di tab baru. Prerender
+yang tidak terpakai dihitung sebagai terbuang.
+"""
+import gi
+gi.require_version('Gtk', '3.0')
+gi.require_version('WebKit2', '4.1')
+from gi.repository import GLib, Gtk, WebKit2
+
+from tab import Tab
+
+
+def same_page(a, b):
+    return bool(a) and bool(b) and a.rstrip("/") == b.rstrip("/")
+
+
+class Prerenderer:
+    def __init__(self, browser, hover_delay_ms=500):
+        self.browser = browser
+        self.hover_delay_ms = hover_delay_ms
+        self.uri = None
+        # Asal prerender: "typed" (omnibox) atau "hover"
+        self.source = None
+        self.webview = None
+        self.committed = False
+        self._holder = None
+        self._window = None
+        self._hover_uri = None
+        self._hover_timer = None
+
+        self.started = 0
+        self.hits = 0
+        self.wasted = 0
+
+    def is_prerender(self, webview):
+        return webview is not None and webview is self.webview
+
+    def start(self, uri, source):
+        if not uri.startswith(("http://", "https://")) or same_page(uri, self.uri):
+            return
+        # Tekanan memori kritis: jangan menambah web process
+        if self.browser.context_pool.prewarm_blocked:
+            return
+        current = self.browser.get_current_webview()
+        if current is not None and same_page(uri, current.get_uri()):
+            return
+        self.cancel()
+
+        self._holder = Tab()
+        self._window = Gtk.OffscreenWindow()
+        width = self.browser.stack.get_allocated_width()
+        height = self.browser.stack.get_allocated_height()
+        self._window.set_default_size(max(width, 800), max(height, 600))
+        self._window.add(self._holder)
+
+        self.webview = self.browser.create_webview(uri)
+        self.webview.set_is_muted(True)
+        self.webview.connect("load-changed", self._on_load_changed)
+        self._holder.attach(self.webview)
+        self._window.show_all()
+
+        self.uri = uri
+        self.source = source
+        self.committed = False
+        self.started += 1
+        self.webview.load_uri(uri)
+
+    def _on_load_changed(self, webview, event):
+        if event == WebKit2.LoadEvent.COMMITTED:
+            self.committed = True
+
+    def matches(self, uri):
+        if self.webview is None:
+            return False
+        return same_page(uri, self.uri) or same_page(uri, self.webview.get_uri())
+
+    def take(self, uri):
+        """WebView prerender untuk uri beserta status commit-nya, atau (None, False)."""
+        if not self.matches(uri):
+            return None, False
+        webview, committed = self.webview, self.committed
+        webview.disconnect_by_func(self._on_load_changed)
+        self._release()
+        webview.set_is_muted(False)
+        self.hits += 1
+        return webview, committed
+
+    def cancel(self):
+        """Membuang prerender yang sedang berjalan (jika ada)."""
+        if self.webview is None:
+            return
+        webview = self.webview
+        self._release()
+        webview.stop_loading()
+        self.browser.context_pool.release(webview)
+        webview.destroy()
+        self.wasted += 1
+
+    def _release(self):
+        self._holder.detach()
+        self.browser.ui.forget(self._holder)
+        self._window.destroy()
+        self._holder = self._window = self.webview = None
+        self.uri = self.source = None
+        self.committed = False
+
+    # ================= HOVER =================
+    def hover(self, uri):
+        """Dipanggil saat kursor berpindah; uri None jika tidak di atas link."""
+        if uri == self._hover_uri:
+            return
+        if self._hover_timer is not None:
+            GLib.source_remove(self._hover_timer)
+            self._hover_timer = None
+        self._hover_uri = uri
+        if uri:
+            self._hover_timer = GLib.timeout_add(self.hover_delay_ms, self._on_hover_timeout)
+
+    def _on_hover_timeout(self):
+        self._hover_timer = None
+        if self._hover_uri:
+            self.start(self._hover_uri, "hover")
+        return False
+
+    def stats(self):
+        return {"started": self.started, "hits": self.hits, "wasted": self.wasted}
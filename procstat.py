@@ -0,0 +1,78 @@
+"""Membaca pemakaian memori proses dari /proc (khusus Linux)."""
+import os
+
+WEB_PROCESS_NAME = "WebKitWebProces"  # comm dipotong kernel jadi 15 karakter
+
+
+def read_rss_kb(pid):
+    """RSS proses dalam KiB, atau 0 jika proses tidak bisa dibaca."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def read_cpu_seconds(pid):
+    """Waktu CPU (user + system) proses dalam detik, atau 0.0 jika tidak bisa dibaca."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return 0.0
+    fields = stat[stat.rfind(")") + 2:].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def read_comm(pid):
+    try:
+        with open(f"/proc/{pid}/comm") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _parent_map():
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Nama proses bisa mengandung spasi, jadi ambil setelah ')' terakhir
+        fields = stat[stat.rfind(")") + 2:].split()
+        parents[int(entry)] = int(fields[1])
+    return parents
+
+
+def descendants(pid):
+    """Semua turunan pid (anak, cucu, dst)."""
+    parents = _parent_map()
+    children = {}
+    for child, parent in parents.items():
+        children.setdefault(parent, []).append(child)
+    result = []
+    todo = [pid]
+    while todo:
+        for child in children.get(todo.pop(), []):
+            result.append(child)
+            todo.append(child)
+    return result
+
+
+def web_process_pids(pid=None):
+    """PID web process WebKit milik proses UI ini."""
+    pid = pid or os.getpid()
+    return [p for p in descendants(pid) if read_comm(p) == WEB_PROCESS_NAME]
+
+
+def tree_rss_kb(pid=None):
+    """Total RSS proses UI beserta semua proses turunannya."""
+    pid = pid or os.getpid()
+    return read_rss_kb(pid) + sum(read_rss_kb(p) for p in descendants(pid))
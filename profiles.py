@@ -0,0 +1,161 @@
+"""Menerapkan profil performa (lihat config.PROFILES) ke WebKit.
+
+Semua tab memakai satu WebKit2.Settings bersama, sehingga mengubah profil
+langsung berlaku untuk tab yang sudah terbuka. Model cache diterapkan ke
+setiap WebContext; model proses hanya berlaku untuk tab baru setelah
+browser dijalankan ulang. Situs dengan kebijakan sendiri (site_policy)
+mendapat salinan Settings bersama yang ditimpa sesuai kebijakannya.
+"""
+import json
+import os
+from urllib.parse import urlsplit
+
+import gi
+gi.require_version('WebKit2', '4.1')
+from gi.repository import GLib, GObject, WebKit2
+
+CACHE_MODELS = {
+    "document_viewer": WebKit2.CacheModel.DOCUMENT_VIEWER,
+    "document_browser": WebKit2.CacheModel.DOCUMENT_BROWSER,
+    "web_browser": WebKit2.CacheModel.WEB_BROWSER,
+}
+
+_Policy = WebKit2.HardwareAccelerationPolicy
+ACCELERATION = {
+    "always": _Policy.ALWAYS,
+    "never": _Policy.NEVER,
+    # ON_DEMAND tidak ada lagi di WebKitGTK yang lebih baru
+    "on-demand": getattr(_Policy, "ON_DEMAND", _Policy.ALWAYS),
+}
+
+# Kunci konfigurasi yang hanya berlaku setelah browser dijalankan ulang
+RESTART_KEYS = ("process_model", "web_process_limit", "web_process_memory_limit_mb")
+
+
+def apply_settings(settings, config):
+    """Mengisi Settings bersama dari konfigurasi (boleh dipanggil ulang)."""
+    settings.set_hardware_acceleration_policy(
+        ACCELERATION.get(config["hardware_acceleration"], ACCELERATION["on-demand"]))
+    settings.set_enable_webgl(config["webgl"])
+    settings.set_enable_accelerated_2d_canvas(config["accelerated_2d_canvas"])
+    settings.set_enable_smooth_scrolling(config["smooth_scrolling"])
+    settings.set_enable_javascript(config["javascript"])
+    settings.set_media_playback_requires_user_gesture(not config["media_autoplay"])
+    settings.set_enable_page_cache(config["page_cache"])
+
+
+def apply_context(context, config):
+    context.set_cache_model(CACHE_MODELS.get(config["cache_model"], WebKit2.CacheModel.WEB_BROWSER))
+
+
+def memory_pressure_settings(config):
+    """MemoryPressureSettings dari konfigurasi, atau None (bawaan WebKit /
+    WebKitGTK sebelum 2.34 yang belum punya API ini)."""
+    limit = config["web_process_memory_limit_mb"]
+    settings_class = getattr(WebKit2, "MemoryPressureSettings", None)
+    if not limit or settings_class is None:
+        return None
+    settings = settings_class.new()
+    settings.set_memory_limit(limit)
+    if config["memory_check_interval"]:
+        settings.set_poll_interval(config["memory_check_interval"])
+    return settings
+
+
+def needs_restart(old, new):
+    return any(old.get(key) != new.get(key) for key in RESTART_KEYS)
+
+
+# ================= KEBIJAKAN PER SITUS =================
+# Content rule WebKit yang memblokir semua font web
+FONT_BLOCK_RULES = json.dumps([{"trigger": {"url-filter": ".*", "resource-type": ["font"]},
+                                "action": {"type": "block"}}])
+FONT_FILTER_ID = "asg-block-fonts"
+
+
+def copy_settings(settings):
+    """Salinan Settings dengan semua properti yang bisa ditulis."""
+    copy = WebKit2.Settings()
+    for pspec in settings.list_properties():
+        flags = pspec.flags
+        if flags & GObject.ParamFlags.READABLE and flags & GObject.ParamFlags.WRITABLE \
+                and not flags & GObject.ParamFlags.CONSTRUCT_ONLY:
+            copy.set_property(pspec.name, settings.get_property(pspec.name))
+    return copy
+
+
+class SiteSettings:
+    """Memilih Settings per navigasi main frame dari PolicyStore."""
+
+    def __init__(self, store, settings, filters_dir):
+        self.store = store
+        self.settings = settings
+        # Satu Settings per kombinasi kebijakan, bukan per tab
+        self._cache = {}
+        self.font_filter = None
+        self._font_store = WebKit2.UserContentFilterStore.new(filters_dir)
+        self._font_store.save(FONT_FILTER_ID, GLib.Bytes.new(FONT_BLOCK_RULES.encode("utf-8")),
+                              None, self._on_font_filter)
+        self.applied = 0
+
+    def _on_font_filter(self, store, result):
+        try:
+            self.font_filter = store.save_finish(result)
+        except GLib.Error as e:
+            print(f"Gagal mengompilasi filter font: {e.message}")
+
+    def refresh(self):
+        """Dipanggil setelah Settings bersama berubah (ganti profil)."""
+        self._cache = {}
+
+    def settings_for(self, policy):
+        if policy.is_default():
+            return self.settings
+        key = policy.key()
+        settings = self._cache.get(key)
+        if settings is None:
+            settings = copy_settings(self.settings)
+            if policy.javascript is not None:
+                settings.set_enable_javascript(policy.javascript)
+            if policy.webgl is not None:
+                settings.set_enable_webgl(policy.webgl)
+            if policy.images is not None:
+                settings.set_auto_load_images(policy.images)
+            if policy.autoplay is not None:
+                settings.set_media_playback_requires_user_gesture(not policy.autoplay)
+            self._cache[key] = settings
+        return settings
+
+    def apply(self, webview, uri):
+        """Menerapkan kebijakan situs uri saat navigasi main frame dimulai.
+
+        Dipanggil dari load-changed (STARTED/REDIRECTED) yang hanya terjadi
+        untuk main frame: decide-policy juga dipanggil untuk navigasi iframe
+        dan tidak bisa membedakannya. Autoplay diatur lewat Settings
+        (media_playback_requires_user_gesture), sebelum halaman di-commit.
+        Halaman selain http(s) tidak disentuh: asg://reader memakai
+        Settings mode baca sendiri yang tidak boleh ditimpa.
+        """
+        parts = urlsplit(uri or "")
+        if parts.scheme not in ("http", "https"):
+            return
+        policy = self.store.lookup(parts.hostname)
+        settings = self.settings_for(policy)
+        if webview.get_settings() is not settings:
+            webview.set_settings(settings)
+        self._apply_fonts(webview, policy.fonts is False)
+        if not policy.is_default():
+            self.applied += 1
+
+    def _apply_fonts(self, webview, block):
+        if self.font_filter is None:
+            return
+        manager = webview.get_user_content_manager()
+        if block:
+            manager.add_filter(self.font_filter)
+        else:
+            manager.remove_filter(self.font_filter)
+
+
+def site_filters_dir(base_dir):
+    return os.path.join(base_dir, "policy-filters")
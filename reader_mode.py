@@ -0,0 +1,227 @@
+"""Mode baca: isi artikel ditampilkan ulang tanpa skrip halaman.
+
+Konten utama diambil dari DOM halaman dengan skor gaya Readability
+(``run_javascript``), lalu disajikan dari ``asg://reader`` di WebView
+baru dengan JavaScript mati dan stylesheet kecil yang di-cache
+(``asg://res/reader.css``). WebView asli dilepas sehingga iklan dan
+skripnya tidak lagi memakan memori. Situs tempat mode baca dinyalakan
+diingat di ``reader_sites.json``.
+"""
+import json
+import os
+from collections import OrderedDict
+from html import escape
+from urllib.parse import urlsplit
+
+import gi
+gi.require_version('WebKit2', '4.1')
+from gi.repository import GLib
+
+from fileutil import atomic_write
+from internal_pages import SCHEME
+from profiles import copy_settings
+
+READER_URI = f"{SCHEME}://reader"
+# Artikel lebih pendek dari ini dianggap bukan artikel
+MIN_TEXT_LENGTH = 500
+MAX_ARTICLES = 20
+
+EXTRACT_JS = r"""
+(function () {
+    var POSITIVE = /article|body|content|entry|main|page|post|text|blog|story/i;
+    var NEGATIVE = /comment|combx|contact|foot|footer|footnote|masthead|media|meta|outbrain|promo|related|scroll|share|shoutbox|sidebar|skyscraper|sponsor|shopping|tags|tool|widget|ad-|ads|banner|nav|menu/i;
+    function classWeight(el) {
+        var w = 0, s = (el.className && el.className.baseVal === undefined ? el.className : '') + ' ' + (el.id || '');
+        if (NEGATIVE.test(s)) w -= 25;
+        if (POSITIVE.test(s)) w += 25;
+        return w;
+    }
+    function linkDensity(el) {
+        var len = el.textContent.length || 1, links = 0;
+        el.querySelectorAll('a').forEach(function (a) { links += a.textContent.length; });
+        return links / len;
+    }
+    var scores = new Map();
+    function add(el, score) {
+        if (!el || !el.tagName || el === document.documentElement) return;
+        if (!scores.has(el)) scores.set(el, classWeight(el) + (el.tagName === 'ARTICLE' ? 10 : 0));
+        scores.set(el, scores.get(el) + score);
+    }
+    document.querySelectorAll('p, pre, td, blockquote').forEach(function (p) {
+        var text = p.textContent.trim();
+        if (text.length < 25) return;
+        var score = 1 + text.split(',').length + Math.min(Math.floor(text.length / 100), 3);
+        add(p.parentElement, score);
+        if (p.parentElement) add(p.parentElement.parentElement, score / 2);
+    });
+    var top = null, topScore = 0;
+    scores.forEach(function (score, el) {
+        score *= 1 - linkDensity(el);
+        if (score > topScore) { top = el; topScore = score; }
+    });
+    if (!top) return JSON.stringify(null);
+
+    // Saudara kandidat yang cukup mirip ikut diambil
+    var parts = [], threshold = Math.max(10, topScore * 0.2);
+    Array.prototype.forEach.call(top.parentElement ? top.parentElement.children : [top], function (el) {
+        var score = scores.has(el) ? scores.get(el) * (1 - linkDensity(el)) : 0;
+        if (el === top || score >= threshold ||
+                (el.tagName === 'P' && el.textContent.length > 80 && linkDensity(el) < 0.25))
+            parts.push(el.cloneNode(true));
+    });
+
+    var KEEP = {href: 1, src: 1, alt: 1, title: 1, colspan: 1, rowspan: 1};
+    var DROP = 'script, style, noscript, iframe, object, embed, form, button, input, select, textarea, nav, aside, footer, header, svg, canvas, video, audio';
+    var html = parts.map(function (root) {
+        root.querySelectorAll(DROP).forEach(function (el) { el.remove(); });
+        [root].concat(Array.prototype.slice.call(root.querySelectorAll('*'))).forEach(function (el) {
+            if (el.tagName === 'A' && el.href) el.setAttribute('href', el.href);
+            if (el.tagName === 'IMG') {
+                var src = el.currentSrc || el.src;
+                if (src) el.setAttribute('src', src);
+            }
+            Array.prototype.slice.call(el.attributes).forEach(function (a) {
+                if (!KEEP[a.name]) el.removeAttribute(a.name);
+            });
+        });
+        return root.outerHTML;
+    }).join('\n');
+    var byline = document.querySelector('[rel=author], .byline, .author, [itemprop=author]');
+    return JSON.stringify({
+        title: document.title,
+        byline: byline ? byline.textContent.trim().slice(0, 200) : '',
+        lang: document.documentElement.lang || '',
+        html: html,
+        length: parts.reduce(function (n, el) { return n + el.textContent.length; }, 0)
+    });
+})();
+"""
+
+READER_CSS = """
+body { max-width: 42em; margin: 2em auto; padding: 0 1em; font: 19px/1.6 Georgia, serif;
+       color: #222; background: #fbfaf7; }
+h1 { font: bold 1.6em/1.25 sans-serif; margin-bottom: 0.2em; }
+.byline { color: #777; font: 0.8em sans-serif; margin-bottom: 2em; }
+.source { color: #777; font: 0.75em sans-serif; }
+img { max-width: 100%; height: auto; }
+pre { overflow-x: auto; font-size: 0.8em; background: #f0eee9; padding: 0.6em; }
+a { color: #2a5db0; }
+table { border-collapse: collapse; } td, th { border: 1px solid #ddd; padding: 0.2em 0.4em; }
+"""
+
+
+def render_article(article, uri, css_uri):
+    title = escape(article.get("title") or "")
+    byline = escape(article.get("byline") or "")
+    lang = escape(article.get("lang") or "", quote=True)
+    return (f"<!DOCTYPE html><html lang='{lang}'><head><meta charset='utf-8'><title>{title}</title>"
+            f"<link rel='stylesheet' href='{css_uri}'></head><body>"
+            f"<h1>{title}</h1>" + (f"<div class='byline'>{byline}</div>" if byline else "")
+            + article.get("html", "")
+            + f"<p class='source'>Sumber: <a href='{escape(uri, quote=True)}'>{escape(uri)}</a></p>"
+            + "</body></html>")
+
+
+def site_of(uri):
+    host = (urlsplit(uri or "").hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class ReaderTab:
+    """Keadaan halaman asli tab yang sedang dalam mode baca."""
+    __slots__ = ("uri", "title", "session_state", "article_id")
+
+    def __init__(self, uri, title, session_state, article_id):
+        self.uri = uri
+        self.title = title
+        self.session_state = session_state
+        self.article_id = article_id
+
+
+class ReaderMode:
+    def __init__(self, base_dir, pages, settings):
+        self.sites_path = os.path.join(base_dir, "reader_sites.json")
+        self.sites = self._load_sites()
+        self.pages = pages
+        self.shared_settings = settings
+        self.settings = None
+        self.refresh()
+        self.css_uri = pages.set_resource("reader.css", READER_CSS, "text/css")
+        pages.add_handler("reader", self.reader_page)
+        self._articles = OrderedDict()
+        self._next_id = 0
+
+    def refresh(self):
+        """Settings mode baca: salinan Settings bersama tanpa JavaScript halaman.
+
+        Yang dimatikan adalah JavaScript markup (<script>, atribut onclick,
+        javascript:), sehingga run_javascript() dari browser tetap jalan.
+        """
+        self.settings = copy_settings(self.shared_settings)
+        self.settings.set_enable_javascript_markup(False)
+        self.settings.set_enable_webgl(False)
+        self.settings.set_media_playback_requires_user_gesture(True)
+
+    # ================= SITUS YANG DIINGAT =================
+    def _load_sites(self):
+        try:
+            with open(self.sites_path, 'r') as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            print(f"Gagal membaca situs mode baca: {e}")
+            return set()
+
+    def remembered(self, uri):
+        return site_of(uri) in self.sites
+
+    def remember(self, uri, enabled):
+        site = site_of(uri)
+        if not site or (site in self.sites) == enabled:
+            return
+        if enabled:
+            self.sites.add(site)
+        else:
+            self.sites.discard(site)
+        try:
+            atomic_write(self.sites_path, json.dumps(sorted(self.sites)))
+        except OSError as e:
+            print(f"Gagal menyimpan situs mode baca: {e}")
+
+    # ================= EKSTRAKSI =================
+    def extract(self, webview, callback):
+        """callback(article dict atau None) setelah konten utama diambil."""
+        def on_finished(webview, result):
+            try:
+                value = webview.run_javascript_finish(result).get_js_value().to_string()
+                article = json.loads(value)
+            except (GLib.Error, ValueError) as e:
+                print(f"Gagal mengambil isi artikel: {e}")
+                article = None
+            if article is not None and article.get("length", 0) < MIN_TEXT_LENGTH:
+                article = None
+            callback(article)
+
+        webview.run_javascript(EXTRACT_JS, None, on_finished)
+
+    def add_article(self, article, uri):
+        """Menyimpan artikel untuk asg://reader; mengembalikan (id, URI)."""
+        self._next_id += 1
+        self._articles[self._next_id] = render_article(article, uri, self.css_uri)
+        while len(self._articles) > MAX_ARTICLES:
+            self._articles.popitem(last=False)
+        return self._next_id, f"{READER_URI}?id={self._next_id}"
+
+    def drop_article(self, article_id):
+        self._articles.pop(article_id, None)
+
+    def is_reader_uri(self, uri):
+        return bool(uri) and uri.startswith(READER_URI)
+
+    def reader_page(self, request, query):
+        try:
+            body = self._articles[int(query.get("id", ["0"])[0])]
+        except (KeyError, ValueError):
+            body = "<p>Artikel tidak tersedia lagi. Muat ulang halaman aslinya.</p>"
+        return body, "text/html; charset=utf-8"
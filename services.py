@@ -0,0 +1,625 @@
+"""Layanan yang dipakai bersama oleh semua jendela browser.
+
+Satu WebsiteDataManager, WebContext (ContextPool), Settings, pemblokir
+konten, penyimpanan cookie, kuota, riwayat, bookmark, halaman internal
+dan sesi per proses. ASGApplication membuat satu BrowserServices dan
+memberikannya ke setiap jendela; ASGBrowser yang dibuat tanpa aplikasi
+(mode batch, benchmark) membuat miliknya sendiri.
+"""
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+import gi
+gi.require_version('WebKit2', '4.1')
+from gi.repository import Gio, GLib, Soup, WebKit2
+
+from startup_trace import trace
+from bookmark_store import BookmarkStore
+from config import load_config, save_config
+from content_blocker import ContentBlocker
+from context_pool import ContextPool
+from cookie_store import prepare_cookie_file, prune_expired
+from downloads import DownloadManager
+from fulltext_index import EXTRACT_JS, FullTextIndex, render_search_page
+from history import HistoryStore
+from hibernation import select_victims
+from internal_pages import InternalPages
+from memory_monitor import (CLEAR_CACHES, RELEASE_TABS, REFUSE_PREWARM, STAGE_NAMES, MemoryMonitor,
+                            estimate_tab_memory, render_memory_page)
+from netlog import render_waterfall
+from offline_archive import MHTML_TYPE, OfflineArchive, render_offline_page
+from prefetch import DNSPrefetcher
+from reader_mode import ReaderMode
+from profiles import (SiteSettings, apply_context, apply_settings, memory_pressure_settings, needs_restart,
+                      site_filters_dir)
+from session import SessionStore
+from site_policy import PolicyStore
+from storage_quota import StorageManager, render_storage_page
+
+COOKIE_STORAGE = {
+    "sqlite": WebKit2.CookiePersistentStorage.SQLITE,
+    "text": WebKit2.CookiePersistentStorage.TEXT,
+}
+
+DEFAULT_HOMEPAGE = """
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <style>
+                body {
+                    font-family: sans-serif;
+                    text-align: center;
+                    margin: 0;
+                    padding: 0;
+                    height: 100vh;
+                    display: flex;
+                    flex-direction: column;
+                    justify-content: center;
+                    align-items: center;
+                    background: #f9f9f9;
+                    color: #333;
+                }
+                h1 { font-size: 3em; margin-bottom: 0.2em; }
+                p { font-size: 1.3em; color: #666; }
+            </style>
+        </head>
+        <body>
+            <h1>Selamat Datang di ASG Browser</h1>
+            <p>Tab baru siap digunakan. Ketik alamat di address bar untuk memulai browsing.</p>
+        </body>
+        </html>
+        """
+
+
+def data_dir():
+    """Direktori data browser (~/.local/share/asg-browser), dibuat jika belum ada."""
+    base_dir = os.path.join(GLib.get_user_data_dir(), "asg-browser")
+    os.makedirs(base_dir, exist_ok=True)
+    return base_dir
+
+
+def get_data_manager():
+    base_dir = data_dir()
+    return WebKit2.WebsiteDataManager(
+        base_data_directory=base_dir,
+        base_cache_directory=os.path.join(base_dir, "cache")
+    )
+
+
+class BrowserServices:
+    def __init__(self, profile=None, batch=False):
+        # Mode batch: sesi & riwayat tidak disentuh
+        self.batch = batch
+        # Jendela yang terbuka, urut dari yang pertama dibuat
+        self.windows = []
+
+        # Setup WebsiteDataManager (untuk localStorage, IndexedDB, cache, dll)
+        self.data_manager = get_data_manager()
+        self.base_dir = self.data_manager.get_base_data_directory()
+        self.config = load_config(self.base_dir, profile)
+
+        # Satu Settings untuk semua tab, diisi dari profil performa
+        self.settings = WebKit2.Settings()
+        apply_settings(self.settings, self.config)
+
+        # Satu WebContext untuk semua tab, pembagian web process sesuai config
+        self.context_pool = ContextPool(
+            self.data_manager,
+            self.config["process_model"],
+            self.config["web_process_limit"],
+            memory_pressure_settings(self.config)
+        )
+        self.context_pool.context_setup.append(self.configure_context)
+        trace.mark("data manager")
+
+        # Kebijakan per situs (JS, WebGL, autoplay, gambar, font) di atas Settings bersama
+        self.site_policies = PolicyStore(os.path.join(self.base_dir, "site_policies.json"))
+        self.site_settings = SiteSettings(self.site_policies, self.settings, site_filters_dir(self.base_dir))
+
+        # Pemblokir konten (filter list dikompilasi sekali, di-cache di disk)
+        self.content_blocker = ContentBlocker(self.base_dir, self.config["content_blocking"])
+        self.content_blocker.load()
+
+        # Prefetch DNS untuk link yang di-hover & host yang sedang diketik
+        self.prefetcher = None
+        if self.config["dns_prefetch"]:
+            # Lewat lambda agar WebContext tidak dibuat sebelum context_setup lengkap
+            self.prefetcher = DNSPrefetcher(lambda host: self.context_pool.get_context().prefetch_dns(host))
+
+        # >>> AKTIFKAN PENYIMPANAN COOKIE PERMANEN <<<
+        self.setup_persistent_cookies()
+        trace.mark("cookies")
+
+        # Kuota cache & data situs, diperiksa di latar belakang
+        self.storage = StorageManager(
+            self.data_manager,
+            self.config["cache_quota_mb"],
+            self.config["storage_quota_mb"],
+            self.config["storage_check_interval"],
+            self.site_last_visits,
+            self.open_sites
+        )
+
+        # Pemantau tekanan memori; sumber sampel bisa diganti dengan
+        # memory_monitor.SyntheticPressure untuk menguji reaksinya
+        self.memory = MemoryMonitor(
+            self.on_memory_pressure,
+            available_pct=self.config["memory_pressure_available_pct"],
+            psi_some=self.config["memory_pressure_psi"]
+        )
+        self._memory_timer = None
+
+        # Bookmark & riwayat dimuat setelah jendela pertama tampil
+        self.bookmarks = None
+        self.history = None
+        self._pending_visits = []
+        self._started = False
+        # Arsip offline & indeks teks halaman juga dibuka setelah paint pertama
+        self.offline = None
+        self.fulltext = None
+        # Unduhan diambil alih dari WebKit (download-started) oleh DownloadManager;
+        # panel unduhan mendaftarkan diri di download_listeners
+        self.downloads = None
+        self.download_listeners = []
+
+        # Halaman internal asg:// (tab baru dll), didaftarkan ke setiap WebContext
+        self.homepage_html = DEFAULT_HOMEPAGE
+        self.pages = InternalPages()
+        self.pages.set_page("newtab", self.homepage_html)
+        self.pages.add_handler("network", self.network_page)
+        self.pages.add_handler("storage", self.storage_page)
+        self.pages.add_handler("memory", self.memory_page)
+        self.pages.add_handler("offline", self.offline_page)
+        self.pages.add_handler("offline/page", self.offline_copy)
+        self.pages.add_handler("search", self.search_page)
+        self.context_pool.context_setup.append(self.pages.register)
+
+        # Mode baca: artikel di asg://reader, diingat per situs
+        self.reader = ReaderMode(self.base_dir, self.pages, self.settings)
+
+        # Sesi tab semua jendela disimpan tertunda & atomik
+        self.session = SessionStore(
+            None if batch else os.path.join(self.base_dir, "session.json"),
+            self.session_snapshot
+        )
+        self._session_restored = False
+
+    # ================= STARTUP =================
+    def deferred_steps(self):
+        """Langkah setelah paint pertama; hanya diberikan ke jendela pertama."""
+        if self._started:
+            return []
+        self._started = True
+        return [
+            ("bookmarks", self.setup_bookmarks),
+            ("history", self.setup_history),
+            ("offline", self.setup_offline_archive),
+            ("fulltext", self.setup_fulltext_index),
+            ("downloads", self.setup_downloads),
+            ("cookies", self.prune_cookies),
+            ("storage", self.storage.start),
+            ("memory", self.start_memory_monitor),
+            ("prewarm", self.context_pool.prewarm),
+        ]
+
+    def setup_bookmarks(self):
+        # Bookmark disimpan di SQLite (bookmarks.json lama dimigrasikan sekali)
+        self.bookmarks = BookmarkStore(
+            os.path.join(self.base_dir, "bookmarks.sqlite"),
+            os.path.join(self.base_dir, "bookmarks.json")
+        )
+
+    def setup_history(self):
+        # Riwayat kunjungan (ditulis berkelompok, diindeks di thread latar)
+        self.history = HistoryStore(os.path.join(self.base_dir, "history.sqlite"), GLib.idle_add)
+        for window in self.windows:
+            window.setup_omnibox()
+        for visit in self._pending_visits:
+            self.history.record_visit(*visit)
+        self._pending_visits = []
+
+    def setup_offline_archive(self):
+        self.offline = OfflineArchive(os.path.join(self.base_dir, "offline"),
+                                      self.config["offline_archive_mb"] * 1024 * 1024, GLib.idle_add)
+
+    def setup_fulltext_index(self):
+        if self.config["fulltext_index"] and not self.batch and self.fulltext is None:
+            self.fulltext = FullTextIndex(os.path.join(self.base_dir, "fulltext.sqlite"))
+
+    def record_visit(self, uri, title, transition):
+        if self.batch:
+            return
+        if self.history is None:
+            self._pending_visits.append((uri, title, transition))
+        else:
+            self.history.record_visit(uri, title, transition)
+
+    # ================= COOKIE =================
+    def setup_persistent_cookies(self):
+        """Aktifkan penyimpanan cookie permanen agar login tetap bertahan"""
+        cookie_manager = self.data_manager.get_cookie_manager()
+
+        # Format penyimpanan dari config "cookie_backend":
+        # 1. "sqlite" (bawaan, efisien untuk jumlah cookie banyak; cookies.txt
+        #    lama dipindahkan otomatis saat pertama kali dijalankan)
+        # 2. "text" (mudah dibaca, cocok untuk debug)
+        self.cookie_backend, cookie_file = prepare_cookie_file(self.base_dir, self.config["cookie_backend"])
+
+        cookie_manager.set_persistent_storage(cookie_file, COOKIE_STORAGE[self.cookie_backend])
+        self.cookie_file = cookie_file
+
+        # Izinkan semua cookie (termasuk third-party jika situs butuh)
+        # Alternatif: Soup.CookieJarAcceptPolicy.NO_THIRD_PARTY untuk lebih aman
+        cookie_manager.set_accept_policy(Soup.CookieJarAcceptPolicy.ALWAYS)
+
+        print(f"Cookie disimpan permanen di: {cookie_file}")
+
+    def prune_cookies(self):
+        """Menghapus cookie kedaluwarsa dari cookies.sqlite di thread latar."""
+        if self.cookie_backend != "sqlite":
+            return
+
+        def run():
+            try:
+                removed = prune_expired(self.cookie_file)
+                if removed:
+                    print(f"{removed} cookie kedaluwarsa dihapus")
+            except Exception as e:
+                print(f"Gagal membersihkan cookie: {e}")
+
+        threading.Thread(target=run, name="cookie-prune", daemon=True).start()
+
+    # ================= KONFIGURASI =================
+    def configure_context(self, context):
+        apply_context(context, self.config)
+        context.connect("download-started", self.on_download_started)
+
+    def set_profile(self, name):
+        """Mengganti profil performa & menyimpannya; True jika perlu restart."""
+        save_config(self.base_dir, {"profile": name})
+        old = self.config
+        self.config = load_config(self.base_dir)
+        apply_settings(self.settings, self.config)
+        self.site_settings.refresh()
+        self.reader.refresh()
+        for context in self.context_pool.contexts:
+            apply_context(context, self.config)
+        for window in self.windows:
+            window.apply_config()
+        return needs_restart(old, self.config)
+
+    def set_homepage(self, html):
+        """Homepage kustom untuk asg://newtab; kosong = homepage default."""
+        self.homepage_html = html or DEFAULT_HOMEPAGE
+        self.pages.set_page("newtab", self.homepage_html)
+
+    # ================= MEMORI =================
+    def start_memory_monitor(self):
+        interval = self.config["memory_check_interval"]
+        if interval and self._memory_timer is None:
+            self._memory_timer = GLib.timeout_add_seconds(interval, self._on_memory_timer)
+
+    def _on_memory_timer(self):
+        self.check_memory()
+        return True
+
+    def check_memory(self):
+        """Satu sampel memori; tab latar belakang dilepas selama tekanan tinggi."""
+        stage = self.memory.check()
+        if stage >= RELEASE_TABS:
+            self.release_background_tabs()
+        return stage
+
+    def on_memory_pressure(self, old, new, sample):
+        if new > old:
+            print(f"Tekanan memori {STAGE_NAMES[new]}: tersedia {sample.available_kb // 1024} MB")
+        if old < CLEAR_CACHES <= new:
+            self.data_manager.clear(WebKit2.WebsiteDataTypes.MEMORY_CACHE, 0, None, None)
+        # Web process baru (prewarm, prerender) ditolak selama tekanan kritis
+        self.context_pool.prewarm_blocked = new >= REFUSE_PREWARM
+        if new >= REFUSE_PREWARM:
+            for window in self.windows:
+                if window.prerenderer is not None:
+                    window.prerenderer.cancel()
+
+    def release_background_tabs(self):
+        """Menghibernasi semua tab hidup kecuali yang terlihat di tiap jendela."""
+        for window in self.windows:
+            victims = select_victims(window.stack.get_children(), window.stack.get_visible_child(),
+                                     0, max_live_tabs=1)
+            window.hibernation.hibernate(victims)
+
+    def memory_page(self, request, query):
+        """asg://memory: sampel terbaru, tahap tekanan dan perkiraan memori per tab.
+
+        Hanya membaca sampel terakhir pemantau; check() tidak dipanggil di
+        sini agar membuka halaman ini tidak memicu reaksi tekanan memori.
+        """
+        sample = self.memory.sample
+        groups = {}
+        for tab in self.all_tabs():
+            if tab.webview is not None:
+                groups.setdefault(self.context_pool.group_key(tab.webview), []).append(tab)
+        estimates = estimate_tab_memory(sum(sample.web_kb.values()), groups) if sample is not None else {}
+        rows = []
+        for tab in self.all_tabs():
+            uri = (tab.webview.get_uri() if tab.webview else tab.uri) or ""
+            rows.append((tab.title, uri, "dihibernasi" if tab.hibernated else "hidup", estimates.get(tab)))
+        return render_memory_page(self.memory, rows), "text/html; charset=utf-8"
+
+    # ================= ARSIP OFFLINE =================
+    def set_offline_mode(self, enabled):
+        """Mode offline: URL yang ada di arsip langsung disajikan dari arsip."""
+        self.config["offline_mode"] = enabled
+        save_config(self.base_dir, {"offline_mode": enabled})
+        for window in self.windows:
+            window.sync_offline_action()
+
+    def save_offline(self, webview, uri, title, callback):
+        """Menyimpan halaman webview sebagai MHTML; callback(ArchivedPage atau None, baru)."""
+        def on_saved(webview, result):
+            try:
+                stream = webview.save_finish(result)
+            except GLib.Error as e:
+                print(f"Gagal menyimpan halaman: {e}")
+                callback(None, False)
+                return
+            output = Gio.MemoryOutputStream.new_resizable()
+            output.splice_async(stream, Gio.OutputStreamSpliceFlags.CLOSE_SOURCE
+                                | Gio.OutputStreamSpliceFlags.CLOSE_TARGET,
+                                GLib.PRIORITY_DEFAULT, None, on_spliced)
+
+        def on_spliced(output, result):
+            try:
+                output.splice_finish(result)
+            except GLib.Error as e:
+                print(f"Gagal membaca salinan halaman: {e}")
+                callback(None, False)
+                return
+            self.offline.store(uri, title, output.steal_as_bytes().get_data(), callback)
+
+        webview.save(WebKit2.SaveMode.MHTML, None, on_saved)
+
+    def offline_page(self, request, query):
+        """asg://offline: daftar halaman arsip, ukuran & kuota."""
+        if self.offline is None:
+            return "<p>Arsip offline belum dimuat.</p>", "text/html; charset=utf-8"
+        return render_offline_page(self.offline, self.config["offline_mode"]), "text/html; charset=utf-8"
+
+    def offline_copy(self, request, query):
+        """asg://offline/page?url=...: salinan MHTML terbaru, dibaca di thread latar."""
+        url = query.get("url", [""])[0]
+        if self.offline is None or self.offline.get(url) is None:
+            return "<p>Halaman ini tidak ada di arsip offline.</p>", "text/html; charset=utf-8"
+
+        def run():
+            data = self.offline.read(url)
+            if data is None:
+                GLib.idle_add(self.pages.finish_request, request, "<p>Salinan arsip tidak terbaca.</p>")
+            else:
+                GLib.idle_add(self.pages.finish_request, request, data, MHTML_TYPE)
+
+        threading.Thread(target=run, name="offline-read", daemon=True).start()
+        return None
+
+    # ================= INDEKS TEKS HALAMAN =================
+    def set_fulltext_index(self, enabled):
+        """Menyalakan/mematikan indeks teks; indeks yang sudah ada tidak dihapus."""
+        self.config["fulltext_index"] = enabled
+        save_config(self.base_dir, {"fulltext_index": enabled})
+        if enabled:
+            self.setup_fulltext_index()
+        elif self.fulltext is not None:
+            self.fulltext.close()
+            self.fulltext = None
+
+    def index_page(self, webview):
+        """Mengambil teks halaman yang selesai dimuat lalu mengantrikannya ke indeks."""
+        uri = webview.get_uri() or ""
+        if self.fulltext is None or self.fulltext.full() or not uri.startswith(("http://", "https://")):
+            return
+        # Halaman galat (muat gagal, 4xx/5xx) tidak diindeks
+        resource = webview.get_main_resource()
+        response = resource.get_response() if resource is not None else None
+        if response is None or response.get_status_code() >= 400:
+            return
+        title = webview.get_title() or ""
+
+        def on_text(webview, result):
+            try:
+                text = webview.run_javascript_finish(result).get_js_value().to_string()
+            except GLib.Error as e:
+                print(f"Gagal mengambil teks halaman: {e}")
+                return
+            if self.fulltext is not None:
+                self.fulltext.submit(uri, title, text)
+
+        webview.run_javascript(EXTRACT_JS, None, on_text)
+
+    def search_page(self, request, query):
+        """asg://search?q=...: hasil berperingkat dengan cuplikan, dicari di thread latar."""
+        text = query.get("q", [""])[0].strip()
+        index = self.fulltext
+        if index is None:
+            return render_search_page(text, [], 0, 0, enabled=False), "text/html; charset=utf-8"
+
+        def run():
+            start = time.perf_counter()
+            try:
+                results = index.search(text)
+            except sqlite3.Error as e:
+                print(f"Gagal mencari indeks teks: {e}")
+                results = []
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            GLib.idle_add(self.pages.finish_request, request,
+                          render_search_page(text, results, index.count(), elapsed_ms))
+
+        threading.Thread(target=run, name="fulltext-search", daemon=True).start()
+        return None
+
+    # ================= UNDUHAN =================
+    def setup_downloads(self):
+        if self.downloads is None:
+            self.downloads = DownloadManager(
+                self.download_dir(), self.config["download_parallel"],
+                None if self.batch else os.path.join(self.base_dir, "downloads.json"),
+                GLib.idle_add, self.on_download_changed)
+
+    def download_dir(self):
+        return (self.config["download_dir"]
+                or GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DOWNLOAD)
+                or os.path.join(GLib.get_home_dir(), "Downloads"))
+
+    def set_download_options(self, directory, parallel):
+        """Direktori tujuan (kosong = folder Unduhan) & batas transfer paralel."""
+        self.config["download_dir"] = directory
+        self.config["download_parallel"] = parallel
+        save_config(self.base_dir, {"download_dir": directory, "download_parallel": parallel})
+        if self.downloads is not None:
+            self.downloads.directory = self.download_dir()
+            self.downloads.set_max_parallel(parallel)
+
+    def on_download_started(self, context, download):
+        """Unduhan GET http(s) diambil alih DownloadManager; selain itu tetap oleh WebKit."""
+        request = download.get_request()
+        uri = request.get_uri() or ""
+        if not uri.startswith(("http://", "https://")) or (request.get_http_method() or "GET") != "GET":
+            # blob:, data: dan hasil kirim formulir tidak bisa diminta ulang
+            return
+        download.cancel()
+        headers = {"User-Agent": self.settings.get_user_agent()}
+        webview = download.get_web_view()
+        referer = webview.get_uri() if webview is not None else None
+        if referer and referer.startswith(("http://", "https://")):
+            headers["Referer"] = referer
+        window = webview.get_toplevel() if webview is not None else None
+        self.start_download(uri, headers, window if window in self.windows else None)
+
+    def start_download(self, uri, headers=None, window=None):
+        """Mengantrikan uri beserta cookie situsnya; panel unduhan window ditampilkan."""
+        self.setup_downloads()
+
+        def add(cookie_headers):
+            self.downloads.add(uri, dict(headers or {}, **cookie_headers))
+            if window is not None:
+                window.show_downloads()
+
+        self.cookie_headers(uri, add)
+
+    def resume_download(self, download_id):
+        """Melanjutkan unduhan yang dijeda/gagal dengan cookie terbaru (cookie tidak disimpan ke disk)."""
+        download = self.downloads.get(download_id)
+        if download is not None:
+            self.cookie_headers(download.url, lambda headers: self.downloads.resume(download_id, headers))
+
+    def cookie_headers(self, uri, callback):
+        """callback({"Cookie": ...} atau {}) dengan cookie WebKit untuk uri."""
+        def on_cookies(manager, result):
+            try:
+                cookies = manager.get_cookies_finish(result)
+            except GLib.Error as e:
+                print(f"Gagal membaca cookie unduhan: {e}")
+                cookies = []
+            callback({"Cookie": Soup.cookies_to_cookie_header(cookies)} if cookies else {})
+
+        self.data_manager.get_cookie_manager().get_cookies(uri, None, on_cookies)
+
+    def on_download_changed(self, download):
+        for listener in list(self.download_listeners):
+            listener(download)
+
+    # ================= TAB DI SEMUA JENDELA =================
+    def all_tabs(self):
+        for window in self.windows:
+            yield from window.stack.get_children()
+
+    def find_tab(self, tab_id):
+        for tab in self.all_tabs():
+            if str(id(tab)) == tab_id:
+                return tab
+        return None
+
+    def network_page(self, request, query):
+        """asg://network?tab=<id>: waterfall muat halaman terakhir tab itu."""
+        tab = self.find_tab(query.get("tab", [""])[0])
+        if tab is None or tab.netlog is None:
+            return "<p>Tab tidak ditemukan atau log jaringan dimatikan.</p>", "text/html; charset=utf-8"
+        return render_waterfall(tab.netlog, f"Jaringan - {tab.title}"), "text/html; charset=utf-8"
+
+    def storage_page(self, request, query):
+        """asg://storage: pemakaian per situs, diukur ulang setiap kali dibuka."""
+        self.storage.measure(
+            lambda report: self.pages.finish_request(request, render_storage_page(self.storage, report)))
+        return None
+
+    def site_last_visits(self, callback):
+        if self.history is None:
+            callback({})
+        else:
+            self.history.domain_last_visits(callback)
+
+    def open_sites(self):
+        """Host tab yang terbuka beserta domain induknya (tidak boleh diusir)."""
+        sites = set()
+        for tab in self.all_tabs():
+            uri = tab.webview.get_uri() if tab.webview else tab.uri
+            labels = (urlsplit(uri or "").hostname or "").split(".")
+            for i in range(len(labels) - 1):
+                sites.add(".".join(labels[i:]))
+        return sites
+
+    # ================= SESSION =================
+    def take_session(self):
+        """Sesi terakhir untuk dipulihkan jendela pertama, selain itu None."""
+        if self._session_restored:
+            return None
+        self._session_restored = True
+        return self.session.load()
+
+    def session_snapshot(self):
+        """Tab semua jendela berurutan; tab aktif dari jendela yang terakhir aktif."""
+        tabs = []
+        active = 0
+        focused = max(self.windows, key=lambda w: w.focus_time, default=None)
+        for window in self.windows:
+            current = window.get_current_tab()
+            for tab in window.stack.get_children():
+                if window is focused and tab is current:
+                    active = len(tabs)
+                tabs.append(window.tab_snapshot(tab))
+        return tabs, active
+
+    # ================= JENDELA =================
+    def add_window(self, window):
+        self.windows.append(window)
+
+    def remove_window(self, window):
+        """Melepas jendela yang ditutup; True jika itu jendela terakhir."""
+        if len(self.windows) == 1:
+            # Simpan sesi selagi tab jendela terakhir masih ada
+            self.session.flush()
+        self.windows.remove(window)
+        if self.windows:
+            self.session.schedule()
+            return False
+        self.shutdown()
+        return True
+
+    def shutdown(self):
+        self.storage.stop()
+        if self._memory_timer is not None:
+            GLib.source_remove(self._memory_timer)
+            self._memory_timer = None
+        if self.bookmarks:
+            self.bookmarks.close()
+        if self.history:
+            self.history.close()
+        if self.offline:
+            self.offline.close()
+        if self.fulltext:
+            self.fulltext.close()
+        if self.downloads:
+            self.downloads.close()
@@ -0,0 +1,82 @@
+"""Penyimpanan sesi tab (daftar tab, session state dan tab aktif).
+
+Penulisan ditunda (debounce) agar navigasi beruntun tidak terus-menerus
+menulis ke disk, dan dilakukan secara atomik lewat fileutil.atomic_write.
+"""
+import base64
+import json
+import os
+
+import gi
+gi.require_version('WebKit2', '4.1')
+from gi.repository import GLib, WebKit2
+
+from fileutil import atomic_write
+
+SESSION_VERSION = 1
+
+
+def encode_state(state):
+    if state is None:
+        return None
+    return base64.b64encode(state.serialize().get_data()).decode("ascii")
+
+
+def decode_state(data):
+    if not data:
+        return None
+    try:
+        return WebKit2.WebViewSessionState.new(GLib.Bytes.new(base64.b64decode(data)))
+    except Exception as e:
+        print(f"Session state tab rusak, diabaikan: {e}")
+        return None
+
+
+class SessionStore:
+    def __init__(self, path, snapshot_func, delay=2):
+        self.path = path
+        self.snapshot_func = snapshot_func
+        self.delay = delay
+        self._pending = None
+
+    def load(self):
+        """Membaca sesi terakhir, atau None jika tidak ada / rusak."""
+        if self.path is None or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Gagal membaca sesi: {e}")
+            return None
+        if data.get("version") != SESSION_VERSION or not data.get("tabs"):
+            return None
+        return data
+
+    def schedule(self, *_):
+        """Menjadwalkan penyimpanan; panggilan beruntun digabung jadi satu."""
+        if self._pending is None:
+            self._pending = GLib.timeout_add_seconds(self.delay, self._on_timeout)
+
+    def _on_timeout(self):
+        self._pending = None
+        self.save()
+        return False
+
+    def flush(self):
+        """Menyimpan sekarang juga jika ada penyimpanan yang tertunda."""
+        if self._pending is not None:
+            GLib.source_remove(self._pending)
+            self._pending = None
+            self.save()
+
+    def save(self):
+        # path None: sesi tidak disimpan (mode batch)
+        if self.path is None:
+            return
+        tabs, active = self.snapshot_func()
+        data = {"version": SESSION_VERSION, "active": active, "tabs": tabs}
+        try:
+            atomic_write(self.path, json.dumps(data))
+        except Exception as e:
+            print(f"Gagal menyimpan sesi: {e}")
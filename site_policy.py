@@ -0,0 +1,201 @@
+"""Kebijakan performa per situs: JavaScript, WebGL, autoplay, gambar, font web.
+
+Aturan dikunci dengan host persis (``news.example.com``) atau akhiran
+domain (``*.example.com``, juga cocok untuk example.com sendiri) dan
+disimpan di ``site_policies.json``. Pencarian memakai trie label domain
+terbalik (com -> example -> news), sehingga biayanya sebanding dengan
+jumlah label host, bukan jumlah aturan. Modul ini tidak memakai gi;
+penerapannya ke WebKit ada di profiles.SiteSettings.
+"""
+import json
+import os
+
+from fileutil import atomic_write
+
+FORMAT_VERSION = 1
+# Fitur yang bisa diatur; None di aturan berarti ikut aturan yang lebih umum
+FEATURES = ("javascript", "webgl", "autoplay", "images", "fonts")
+
+
+class SitePolicy:
+    __slots__ = FEATURES
+
+    def __init__(self, **features):
+        for name in FEATURES:
+            setattr(self, name, features.get(name))
+
+    def merged(self, other):
+        """Salinan dengan nilai other (yang tidak None) menimpa nilai ini."""
+        policy = SitePolicy()
+        for name in FEATURES:
+            value = getattr(other, name)
+            setattr(policy, name, getattr(self, name) if value is None else value)
+        return policy
+
+    def key(self):
+        return tuple(getattr(self, name) for name in FEATURES)
+
+    def is_default(self):
+        return all(value is None for value in self.key())
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in FEATURES if getattr(self, name) is not None}
+
+
+def parse_site(site):
+    """'*.example.com' / '.example.com' -> ('example.com', True); host -> (host, False)."""
+    site = site.strip().lower().rstrip(".")
+    if site.startswith("*."):
+        return site[2:], True
+    if site.startswith("."):
+        return site[1:], True
+    return site, False
+
+
+class _Node:
+    __slots__ = ("children", "exact", "suffix")
+
+    def __init__(self):
+        self.children = {}
+        self.exact = None
+        self.suffix = None
+
+
+class DomainTrie:
+    """Trie label domain terbalik; setiap node bisa memegang aturan host & akhiran."""
+
+    def __init__(self):
+        self.root = _Node()
+        self.size = 0
+
+    def _node(self, domain, create):
+        node = self.root
+        for label in reversed(domain.split(".")):
+            child = node.children.get(label)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[label] = _Node()
+            node = child
+        return node
+
+    def insert(self, site, value):
+        domain, suffix = parse_site(site)
+        node = self._node(domain, True)
+        slot = "suffix" if suffix else "exact"
+        if getattr(node, slot) is None:
+            self.size += 1
+        setattr(node, slot, value)
+
+    def remove(self, site):
+        domain, suffix = parse_site(site)
+        node = self._node(domain, False)
+        slot = "suffix" if suffix else "exact"
+        if node is not None and getattr(node, slot) is not None:
+            setattr(node, slot, None)
+            self.size -= 1
+
+    def matches(self, host):
+        """Nilai yang cocok untuk host, dari yang paling umum ke paling spesifik."""
+        found = []
+        node = self.root
+        labels = (host or "").lower().rstrip(".").split(".")
+        for label in reversed(labels):
+            node = node.children.get(label)
+            if node is None:
+                return found
+            if node.suffix is not None:
+                found.append(node.suffix)
+        if node.exact is not None:
+            found.append(node.exact)
+        return found
+
+
+class PolicyStore:
+    def __init__(self, path):
+        self.path = path
+        self.rules = {}          # site -> SitePolicy, urutan disisipkan
+        self.trie = DomainTrie()
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                rules = parse_rules(json.load(f))
+        except Exception as e:
+            print(f"Gagal membaca kebijakan situs: {e}")
+            return
+        self.add_rules(rules)
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            atomic_write(self.path, json.dumps(self.export_data(), indent=1))
+        except OSError as e:
+            print(f"Gagal menyimpan kebijakan situs: {e}")
+
+    def add_rules(self, rules):
+        """Menambah (site, SitePolicy) tanpa menyimpan ke disk."""
+        for site, policy in rules:
+            self.rules[site] = policy
+            self.trie.insert(site, policy)
+
+    def set_rule(self, site, policy):
+        site = site.strip().lower()
+        if policy.is_default():
+            self.remove_rule(site)
+            return
+        self.add_rules([(site, policy)])
+        self.save()
+
+    def remove_rule(self, site):
+        site = site.strip().lower()
+        if self.rules.pop(site, None) is not None:
+            self.trie.remove(site)
+            self.save()
+
+    def lookup(self, host):
+        """Kebijakan efektif untuk host (gabungan semua aturan yang cocok)."""
+        policy = SitePolicy()
+        for match in self.trie.matches(host):
+            policy = policy.merged(match)
+        return policy
+
+    # ================= IMPOR / EKSPOR =================
+    def export_data(self):
+        return {
+            "version": FORMAT_VERSION,
+            "rules": [dict(site=site, **policy.to_dict()) for site, policy in self.rules.items()],
+        }
+
+    def export_file(self, path):
+        atomic_write(path, json.dumps(self.export_data(), indent=1))
+        return len(self.rules)
+
+    def import_file(self, path, replace=False):
+        """Membaca aturan dari file ekspor; replace=True membuang aturan lama."""
+        with open(path, 'r') as f:
+            rules = parse_rules(json.load(f))
+        if replace:
+            self.rules = {}
+            self.trie = DomainTrie()
+        self.add_rules(rules)
+        self.save()
+        return len(rules)
+
+
+def parse_rules(data):
+    """Daftar (site, SitePolicy) dari data format ekspor; entri rusak dilewati."""
+    if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+        raise ValueError("format kebijakan situs tidak dikenal")
+    rules = []
+    for entry in data.get("rules", []):
+        site = entry.get("site") if isinstance(entry, dict) else None
+        if not isinstance(site, str) or not parse_site(site)[0]:
+            continue
+        features = {name: bool(entry[name]) for name in FEATURES if entry.get(name) is not None}
+        rules.append((site.strip().lower(), SitePolicy(**features)))
+    return rules
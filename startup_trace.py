@@ -0,0 +1,77 @@
+"""Pencatatan waktu startup per fase.
+
+Aktif jika variabel lingkungan ASG_STARTUP_TRACE diisi (path file JSON,
+atau "-" untuk stderr) atau browser dijalankan dengan --trace-startup.
+Tanda waktu selalu dicatat (murah); hasil hanya ditulis jika aktif.
+Impor modul ini sedini mungkin agar fase "imports" terukur.
+"""
+import json
+import os
+import sys
+import time
+
+_T0 = time.perf_counter()
+
+
+def _process_age():
+    """Detik sejak proses dimulai (membaca /proc), atau None."""
+    try:
+        with open("/proc/self/stat") as f:
+            stat = f.read()
+        start_ticks = int(stat[stat.rfind(")") + 2:].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTrace:
+    def __init__(self):
+        self.path = os.environ.get("ASG_STARTUP_TRACE") or None
+        # Keluar otomatis setelah paint pertama (dipakai benchmark startup)
+        self.exit_after_paint = os.environ.get("ASG_STARTUP_EXIT") == "1"
+        self.phases = []
+        self._last = _T0
+        age = _process_age()
+        if age is not None:
+            # Waktu interpreter Python sebelum modul ini diimpor
+            self.phases.append(("interpreter", max(0.0, age - (time.perf_counter() - _T0))))
+        self.written = False
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def enable(self, path="-"):
+        self.path = path
+
+    def mark(self, phase):
+        """Menutup fase yang sedang berjalan dengan nama phase."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def report(self):
+        total = 0.0
+        rows = []
+        for name, duration in self.phases:
+            total += duration
+            rows.append({"phase": name, "ms": round(duration * 1000, 2), "at_ms": round(total * 1000, 2)})
+        return {"phases": rows, "total_ms": round(total * 1000, 2)}
+
+    def write(self):
+        if not self.enabled or self.written:
+            return
+        self.written = True
+        report = self.report()
+        if self.path == "-":
+            for row in report["phases"]:
+                print(f"[startup] {row['phase']:<16} {row['ms']:>8.1f} ms  (t={row['at_ms']:.1f} ms)",
+                      file=sys.stderr)
+            return
+        with open(self.path, "w") as f:
+            json.dump(report, f)
+
+
+trace = StartupTrace()
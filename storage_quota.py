@@ -0,0 +1,268 @@
+"""Kuota cache disk & data situs dengan pengusiran situs yang paling lama dikunjungi.
+
+Pemakaian per situs diambil dengan ``WebsiteDataManager.fetch`` dan
+ukuran direktori di disk dihitung di thread latar. Jika melebihi kuota,
+situs yang kunjungan terakhirnya paling lama (menurut riwayat) dihapus
+datanya dengan ``WebsiteDataManager.remove``. Semua langkah asinkron
+sehingga main loop tidak pernah menunggu.
+"""
+import os
+import threading
+import time
+from html import escape
+
+import gi
+gi.require_version('WebKit2', '4.1')
+from gi.repository import Gio, GLib, WebKit2
+
+Types = WebKit2.WebsiteDataTypes
+
+TYPE_NAMES = (
+    (Types.DISK_CACHE, "Cache disk"),
+    (Types.LOCAL_STORAGE, "localStorage"),
+    (Types.INDEXEDDB_DATABASES, "IndexedDB"),
+    (Types.SERVICE_WORKER_REGISTRATIONS, "Service worker"),
+    (Types.DOM_CACHE, "Cache API"),
+    (Types.OFFLINE_APPLICATION_CACHE, "AppCache"),
+    (Types.COOKIES, "Cookie"),
+)
+
+# Data situs yang dihitung ke kuota penyimpanan; cookie tidak ikut diusir
+# agar pengguna tidak keluar dari akunnya
+STORAGE_TYPES = (Types.LOCAL_STORAGE | Types.INDEXEDDB_DATABASES | Types.SERVICE_WORKER_REGISTRATIONS
+                 | Types.DOM_CACHE | Types.OFFLINE_APPLICATION_CACHE)
+FETCH_TYPES = Types.DISK_CACHE | STORAGE_TYPES | Types.COOKIES
+
+# Getter direktori per jenis data di WebsiteDataManager (usang sejak
+# WebKitGTK 2.40 dan bisa mengembalikan None)
+_STORAGE_DIRS = ("get_local_storage_directory", "get_indexeddb_directory",
+                 "get_service_worker_registrations_directory", "get_dom_cache_directory",
+                 "get_offline_application_cache_directory")
+
+# Subdirektori milik browser sendiri di direktori data, bukan data situs
+OWN_DIRS = {"filters", "content-filters", "policy-filters", "offline"}
+
+
+def _directory(data_manager, getter):
+    func = getattr(data_manager, getter, None)
+    return func() if func is not None else None
+
+
+def dir_size(path):
+    """Ukuran total file di bawah path (byte); 0 jika tidak ada."""
+    total = 0
+    if not path or not os.path.isdir(path):
+        return 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class SiteUsage:
+    __slots__ = ("data", "name", "types", "cache_bytes", "last_visit")
+
+    def __init__(self, data, last_visit):
+        self.data = data
+        self.name = data.get_name()
+        self.types = data.get_types()
+        # WebKit hanya tahu ukuran per situs untuk cache disk
+        self.cache_bytes = data.get_size(Types.DISK_CACHE) if self.types & Types.DISK_CACHE else 0
+        self.last_visit = last_visit
+
+
+class StorageReport:
+    def __init__(self, sites, cache_bytes, storage_bytes):
+        self.sites = sites
+        self.cache_bytes = cache_bytes
+        self.storage_bytes = storage_bytes
+        self.time = time.time()
+
+
+def select_lru(sites, excess, size, protected=()):
+    """Situs yang paling lama dikunjungi sampai jumlah size(site) >= excess."""
+    victims = []
+    freed = 0
+    for site in sorted(sites, key=lambda s: s.last_visit):
+        if freed >= excess:
+            break
+        if site.name in protected:
+            continue
+        victims.append(site)
+        freed += size(site)
+    return victims
+
+
+class StorageManager:
+    def __init__(self, data_manager, cache_quota_mb=256, storage_quota_mb=512,
+                 interval=600, last_visits=None, protected_sites=None):
+        """last_visits(callback) memberi dict domain -> kunjungan terakhir,
+        protected_sites() mengembalikan nama situs yang sedang terbuka."""
+        self.data_manager = data_manager
+        self.cache_quota = cache_quota_mb * 1024 * 1024
+        self.storage_quota = storage_quota_mb * 1024 * 1024
+        self.interval = interval
+        self.last_visits = last_visits
+        self.protected_sites = protected_sites or (lambda: ())
+        self.report = None
+        self.evicted = []        # (waktu, situs, alasan), terbaru di akhir
+        self._cancellable = Gio.Cancellable()
+        self._running = False
+        self._waiting = []
+        self._timer = None
+
+    def start(self):
+        self.check()
+        if self.interval:
+            self._timer = GLib.timeout_add_seconds(self.interval, self._on_timer)
+
+    def stop(self):
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+            self._timer = None
+        self._cancellable.cancel()
+
+    def _on_timer(self):
+        self.check()
+        return True
+
+    # ================= PENGUKURAN =================
+    def measure(self, callback):
+        """Mengukur pemakaian lalu memanggil callback(StorageReport) di main thread."""
+        self._waiting.append(callback)
+        if self._running:
+            return
+        self._running = True
+        self.data_manager.fetch(FETCH_TYPES, self._cancellable, self._on_fetched)
+
+    def _on_fetched(self, data_manager, result):
+        try:
+            records = data_manager.fetch_finish(result)
+        except GLib.Error as e:
+            print(f"Gagal membaca data situs: {e.message}")
+            self._done(None)
+            return
+        if self.last_visits is not None:
+            self.last_visits(lambda visits: self._measure_disk(records, visits))
+        else:
+            self._measure_disk(records, {})
+
+    def _measure_disk(self, records, visits):
+        sites = [SiteUsage(data, visits.get(data.get_name().lower(), 0)) for data in records]
+        cache_dir = (_directory(self.data_manager, "get_disk_cache_directory")
+                     or self.data_manager.get_base_cache_directory())
+        storage_dirs = {d for d in (_directory(self.data_manager, g) for g in _STORAGE_DIRS) if d}
+        base_dir = self.data_manager.get_base_data_directory()
+
+        def run():
+            cache_bytes = dir_size(cache_dir)
+            if not storage_dirs:
+                # Tanpa getter: semua subdirektori data kecuali cache & milik browser
+                for name in os.listdir(base_dir):
+                    path = os.path.join(base_dir, name)
+                    if name not in OWN_DIRS and os.path.isdir(path) and path != cache_dir.rstrip("/"):
+                        storage_dirs.add(path)
+            storage_bytes = sum(dir_size(d) for d in storage_dirs)
+            GLib.idle_add(self._done, StorageReport(sites, cache_bytes, storage_bytes))
+
+        threading.Thread(target=run, name="storage-usage", daemon=True).start()
+
+    def _done(self, report):
+        self._running = False
+        if report is not None:
+            self.report = report
+        waiting, self._waiting = self._waiting, []
+        for callback in waiting:
+            callback(report)
+        return False
+
+    # ================= KUOTA =================
+    def check(self):
+        """Mengukur lalu mengusir situs jika kuota terlampaui."""
+        self.measure(self._enforce)
+
+    def _enforce(self, report):
+        if report is None:
+            return
+        protected = set(self.protected_sites())
+
+        if self.cache_quota and report.cache_bytes > self.cache_quota:
+            cached = [s for s in report.sites if s.types & Types.DISK_CACHE]
+            victims = select_lru(cached, report.cache_bytes - self.cache_quota,
+                                 lambda s: s.cache_bytes, protected)
+            self._remove(Types.DISK_CACHE, victims, "cache")
+
+        if self.storage_quota and report.storage_bytes > self.storage_quota:
+            # Ukuran per situs tidak diketahui WebKit: perkirakan rata-rata,
+            # lalu ukur ulang setelah penghapusan sampai di bawah kuota
+            stored = [s for s in report.sites if s.types & STORAGE_TYPES]
+            if stored:
+                average = report.storage_bytes / len(stored)
+                victims = select_lru(stored, report.storage_bytes - self.storage_quota,
+                                     lambda s: average, protected)
+                self._remove(STORAGE_TYPES, victims, "penyimpanan", recheck=True)
+
+    def _remove(self, types, sites, reason, recheck=False):
+        if not sites:
+            return
+        now = time.time()
+        self.evicted.extend((now, s.name, reason) for s in sites)
+        del self.evicted[:-200]
+
+        def on_removed(data_manager, result):
+            try:
+                data_manager.remove_finish(result)
+            except GLib.Error as e:
+                print(f"Gagal menghapus data situs: {e.message}")
+                return
+            if recheck:
+                GLib.timeout_add_seconds(5, lambda: self.check() and False)
+
+        self.data_manager.remove(types, [s.data for s in sites], self._cancellable, on_removed)
+
+
+# ================= HALAMAN asg://storage =================
+def _size(n):
+    if n >= 1024 * 1024:
+        return f"{n / 1024 / 1024:.1f} MB"
+    if n >= 1024:
+        return f"{n / 1024:.1f} KB"
+    return f"{n} B"
+
+
+def _when(t):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(t)) if t else "-"
+
+
+def render_storage_page(manager, report):
+    head = ("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Penyimpanan</title><style>"
+            "body { font: 13px sans-serif; margin: 16px; color: #222; }"
+            "table { border-collapse: collapse; } td, th { padding: 2px 8px; text-align: left; }"
+            "tr:nth-child(even) { background: #f4f4f4; } .over { color: #c00; }"
+            "</style></head><body><h2>Penyimpanan situs</h2>")
+    if report is None:
+        return head + "<p>Gagal membaca data situs.</p></body></html>"
+
+    def quota_line(label, used, quota):
+        cls = " class='over'" if quota and used > quota else ""
+        limit = _size(quota) if quota else "tanpa batas"
+        return f"<p{cls}>{label}: {_size(used)} dari {limit}</p>"
+
+    rows = []
+    for site in sorted(report.sites, key=lambda s: (-s.cache_bytes, s.name)):
+        kinds = ", ".join(name for flag, name in TYPE_NAMES if site.types & flag)
+        rows.append(f"<tr><td>{escape(site.name)}</td><td>{kinds}</td>"
+                    f"<td>{_size(site.cache_bytes)}</td><td>{_when(site.last_visit)}</td></tr>")
+    evicted = "".join(f"<li>{_when(t)} · {escape(name)} ({reason})</li>"
+                      for t, name, reason in reversed(manager.evicted[-20:]))
+    return (head
+            + quota_line("Cache disk", report.cache_bytes, manager.cache_quota)
+            + quota_line("Data situs (localStorage, IndexedDB, ...)", report.storage_bytes, manager.storage_quota)
+            + f"<p>{len(report.sites)} situs · diukur {_when(report.time)}</p>"
+            + "<table><tr><th>Situs</th><th>Jenis data</th><th>Cache disk</th><th>Kunjungan terakhir</th></tr>"
+            + "".join(rows) + "</table>"
+            + (f"<h3>Diusir terakhir</h3><ul>{evicted}</ul>" if evicted else "")
+            + "</body></html>")
@@ -0,0 +1,82 @@
+"""Tab browser: wadah di Gtk.Stack yang memegang satu WebView.
+
+WebView boleh dilepas (misalnya saat tab dihibernasi); URL, judul dan
+session state disimpan di tab agar WebView bisa dibuat ulang nanti.
+"""
+import time
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Pango
+
+from ui_scheduler import TabState
+
+HIBERNATED_MARK = "💤 "
+
+
+class Tab(Gtk.Box):
+    def __init__(self, title="New Tab"):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL)
+        self.webview = None
+        self.uri = ""
+        self.title = title
+        self.session_state = None
+        # Jenis transisi navigasi berikutnya untuk riwayat ("typed", "link", ...)
+        self.transition = None
+        # Jumlah permintaan yang diblokir pemblokir konten di halaman ini
+        self.blocked_requests = 0
+        # Log jaringan (netlog.NetLog), None jika dimatikan di konfigurasi
+        self.netlog = None
+        # Halaman asli saat tab dalam mode baca (reader_mode.ReaderTab), None jika tidak
+        self.reader = None
+        self.last_active = time.monotonic()
+        # Keadaan UI terakhir (progress, judul, URI, loading) untuk UIScheduler
+        self.ui_state = TabState()
+        self.ui_state.title = title
+
+        self.label = Gtk.Label(label=title)
+        self.label.set_ellipsize(Pango.EllipsizeMode.END)
+
+    @property
+    def hibernated(self):
+        return self.webview is None
+
+    def attach(self, webview):
+        self.webview = webview
+        self.pack_start(webview, True, True, 0)
+
+    def detach(self):
+        """Menyimpan keadaan WebView lalu melepasnya dari tab."""
+        webview = self.webview
+        if webview is None:
+            return None
+        self.snapshot()
+        self.remove(webview)
+        self.webview = None
+        self.reader = None
+        return webview
+
+    def snapshot(self):
+        if self.webview is None:
+            return
+        # Mode baca: yang disimpan tetap halaman aslinya
+        if self.reader is not None:
+            self.uri = self.reader.uri
+            self.title = self.reader.title
+            self.session_state = self.reader.session_state
+            return
+        self.uri = self.webview.get_uri() or self.uri
+        self.title = self.webview.get_title() or self.title
+        self.session_state = self.webview.get_session_state()
+
+    def page_uri(self):
+        """URI halaman yang ditampilkan ke pengguna (halaman asli dalam mode baca)."""
+        if self.reader is not None:
+            return self.reader.uri
+        return (self.webview.get_uri() if self.webview else None) or self.uri
+
+    def touch(self):
+        self.last_active = time.monotonic()
+
+    def display_title(self):
+        return HIBERNATED_MARK + self.title if self.hibernated else self.title
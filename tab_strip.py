@@ -0,0 +1,227 @@
+"""Deretan tab yang bisa digulir dan pencarian tab fuzzy.
+
+Menggantikan Gtk.StackSwitcher: setiap tab mendapat tombol dengan lebar
+tetap di dalam ScrolledWindow, sehingga perubahan judul satu tab tidak
+mengubah ukuran tombol lain dan ratusan tab tidak meluber keluar
+jendela. Popover "Cari tab" mencocokkan judul & URL secara fuzzy dari
+indeks teks per tab.
+"""
+import gi
+gi.require_version('Gtk', '3.0')
+gi.require_version('Gdk', '3.0')
+from gi.repository import Gdk, Gtk, Pango
+
+TAB_WIDTH = 180
+SEARCH_LIMIT = 20
+
+
+def fuzzy_score(query, text):
+    """Skor kecocokan query sebagai subsekuens text; None jika tidak cocok.
+
+    Substring utuh mendapat skor tertinggi, lalu huruf yang berurutan dan
+    huruf di awal kata.
+    """
+    if not query:
+        return 0
+    pos = text.find(query)
+    if pos >= 0:
+        return 1000 - pos
+    score = 0
+    last = -1
+    for ch in query:
+        i = text.find(ch, last + 1)
+        if i < 0:
+            return None
+        if i == last + 1:
+            score += 5
+        if i == 0 or not text[i - 1].isalnum():
+            score += 3
+        score -= min(i - last - 1, 10)
+        last = i
+    return score
+
+
+class TabIndex:
+    """Teks pencarian (judul + URL, huruf kecil) per tab."""
+
+    def __init__(self):
+        self._text = {}
+
+    def update(self, tab, title, uri):
+        self._text[tab] = f"{title}\n{uri}".lower()
+
+    def remove(self, tab):
+        self._text.pop(tab, None)
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        query = query.strip().lower()
+        scored = []
+        for tab, text in self._text.items():
+            score = fuzzy_score(query, text)
+            if score is not None:
+                scored.append((score, tab))
+        scored.sort(key=lambda item: -item[0])
+        return [tab for _, tab in scored[:limit]]
+
+
+class TabStrip(Gtk.Box):
+    def __init__(self, stack, close_callback):
+        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=2)
+        self.stack = stack
+        self.close_callback = close_callback
+        self.index = TabIndex()
+        self._buttons = {}
+        self._active = None
+
+        self.scroller = Gtk.ScrolledWindow()
+        self.scroller.set_policy(Gtk.PolicyType.EXTERNAL, Gtk.PolicyType.NEVER)
+        self.scroller.set_hexpand(True)
+        self.scroller.connect("scroll-event", self.on_scroll)
+        self.box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=2)
+        self.scroller.add(self.box)
+        self.pack_start(self.scroller, True, True, 0)
+
+        # Tombol & popover pencarian tab
+        self.search_button = Gtk.MenuButton()
+        self.search_button.set_image(Gtk.Image.new_from_icon_name("edit-find-symbolic", Gtk.IconSize.BUTTON))
+        self.search_button.set_relief(Gtk.ReliefStyle.NONE)
+        self.search_button.set_tooltip_text("Cari tab (Ctrl+Shift+A)")
+        self.pack_start(self.search_button, False, False, 0)
+
+        popover = Gtk.Popover()
+        popover.set_size_request(420, -1)
+        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        vbox.set_margin_start(8)
+        vbox.set_margin_end(8)
+        vbox.set_margin_top(8)
+        vbox.set_margin_bottom(8)
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_placeholder_text("Cari judul atau URL tab")
+        self.search_entry.connect("search-changed", self.on_search_changed)
+        self.search_entry.connect("activate", self.on_search_activate)
+        vbox.pack_start(self.search_entry, False, False, 0)
+        self.results = Gtk.ListBox()
+        self.results.connect("row-activated", self.on_result_activated)
+        vbox.pack_start(self.results, True, True, 0)
+        vbox.show_all()
+        popover.add(vbox)
+        popover.connect("show", lambda *_: self.on_search_changed(self.search_entry))
+        self.search_button.set_popover(popover)
+
+    # ================= TAB =================
+    def add_tab(self, tab, title, uri=""):
+        button = Gtk.Button()
+        button.set_relief(Gtk.ReliefStyle.NONE)
+        button.set_size_request(TAB_WIDTH, -1)
+        button.set_can_focus(False)
+        button.connect("clicked", lambda *_: self.stack.set_visible_child(tab))
+        button.connect("button-press-event", self.on_button_press, tab)
+
+        content = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        # Lebar label tetap agar perubahan judul tidak menggeser tab lain
+        tab.label.set_width_chars(1)
+        tab.label.set_max_width_chars(1)
+        tab.label.set_hexpand(True)
+        tab.label.set_xalign(0)
+        tab.label.set_ellipsize(Pango.EllipsizeMode.END)
+        content.pack_start(tab.label, True, True, 0)
+
+        close_btn = Gtk.Button()
+        close_btn.set_relief(Gtk.ReliefStyle.NONE)
+        close_btn.set_can_focus(False)
+        close_btn.add(Gtk.Image.new_from_icon_name("window-close-symbolic", Gtk.IconSize.MENU))
+        close_btn.set_tooltip_text("Tutup tab")
+        close_btn.connect("clicked", lambda *_: self.close_callback(None, tab))
+        content.pack_start(close_btn, False, False, 0)
+
+        button.add(content)
+        button.show_all()
+        self.box.pack_start(button, False, False, 0)
+        self._buttons[tab] = button
+        self.index.update(tab, title, uri)
+
+    def remove_tab(self, tab):
+        button = self._buttons.pop(tab, None)
+        if button is not None:
+            button.destroy()
+        self.index.remove(tab)
+        if tab is self._active:
+            self._active = None
+
+    def update_tab(self, tab, title, uri):
+        self.index.update(tab, title, uri)
+
+    def set_active(self, tab):
+        old = self._buttons.get(self._active)
+        if old is not None:
+            old.get_style_context().remove_class("active-tab")
+            old.set_relief(Gtk.ReliefStyle.NONE)
+        self._active = tab
+        button = self._buttons.get(tab)
+        if button is None:
+            return
+        button.get_style_context().add_class("active-tab")
+        button.set_relief(Gtk.ReliefStyle.NORMAL)
+        self.scroll_to(button)
+
+    def scroll_to(self, button):
+        alloc = button.get_allocation()
+        adjustment = self.scroller.get_hadjustment()
+        if alloc.width <= 1:
+            # Belum dialokasikan (tab baru): perkirakan dari urutan tombol
+            x = self.box.get_children().index(button) * (TAB_WIDTH + 2)
+            width = TAB_WIDTH
+        else:
+            x, width = alloc.x, alloc.width
+        adjustment.clamp_page(x, x + width)
+
+    def on_scroll(self, scroller, event):
+        # Roda mouse vertikal menggulir deretan tab ke samping
+        adjustment = self.scroller.get_hadjustment()
+        delta = 0
+        if event.direction == Gdk.ScrollDirection.UP:
+            delta = -1
+        elif event.direction == Gdk.ScrollDirection.DOWN:
+            delta = 1
+        elif event.direction == Gdk.ScrollDirection.SMOOTH:
+            _, dx, dy = event.get_scroll_deltas()
+            delta = dy or dx
+        if delta:
+            adjustment.set_value(adjustment.get_value() + delta * TAB_WIDTH / 2)
+            return True
+        return False
+
+    def on_button_press(self, button, event, tab):
+        # Klik tengah menutup tab
+        if event.button == 2:
+            self.close_callback(None, tab)
+            return True
+        return False
+
+    # ================= PENCARIAN =================
+    def on_search_changed(self, entry):
+        for row in self.results.get_children():
+            row.destroy()
+        for tab in self.index.search(entry.get_text()):
+            row = Gtk.ListBoxRow()
+            row.tab = tab
+            label = Gtk.Label(label=tab.display_title(), xalign=0)
+            label.set_ellipsize(Pango.EllipsizeMode.END)
+            uri = (tab.webview.get_uri() if tab.webview else tab.uri) or ""
+            label.set_tooltip_text(uri)
+            row.add(label)
+            row.show_all()
+            self.results.add(row)
+        first = self.results.get_row_at_index(0)
+        if first is not None:
+            self.results.select_row(first)
+
+    def on_search_activate(self, entry):
+        row = self.results.get_selected_row() or self.results.get_row_at_index(0)
+        if row is not None:
+            self.on_result_activated(self.results, row)
+
+    def on_result_activated(self, listbox, row):
+        self.search_button.get_popover().popdown()
+        self.search_entry.set_text("")
+        self.stack.set_visible_child(row.tab)
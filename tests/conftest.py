@@ -0,0 +1,5 @@
+"""Modul browser di root repo bisa diimpor dari tes tanpa instalasi."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,84 @@
+import sqlite3
+import threading
+
+import pytest
+
+from dbwriter import SQLiteWriter
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS t (k TEXT PRIMARY KEY, v INTEGER);"
+
+
+def rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return dict(conn.execute("SELECT k, v FROM t"))
+    finally:
+        conn.close()
+
+
+def close_within(writer, seconds=5):
+    thread = threading.Thread(target=writer.close, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    return not thread.is_alive()
+
+
+def test_failed_op_in_last_batch_does_not_hang_close(tmp_path):
+    path = str(tmp_path / "db.sqlite")
+    writer = SQLiteWriter(path, SCHEMA)
+    writer.flush()
+    # Thread penulis ditahan agar INSERT ganda & _STOP masuk satu kelompok
+    gate = threading.Event()
+    writer.call(lambda conn: gate.wait())
+    writer.execute("INSERT INTO t (k, v) VALUES ('a', 1)")
+    writer.execute("INSERT INTO t (k, v) VALUES ('a', 2)")
+    closer = threading.Thread(target=writer.close, daemon=True)
+    closer.start()
+    gate.set()
+    closer.join(5)
+    assert not closer.is_alive()
+    assert isinstance(writer.error, sqlite3.IntegrityError)
+    assert rows(path) == {"a": 1}
+
+
+def test_failed_op_only_rolls_back_itself(tmp_path):
+    path = str(tmp_path / "db.sqlite")
+    writer = SQLiteWriter(path, SCHEMA)
+    gate = threading.Event()
+    writer.call(lambda conn: gate.wait())
+    writer.execute("INSERT INTO t (k, v) VALUES ('a', 1)")
+
+    def partial(conn):
+        conn.execute("INSERT INTO t (k, v) VALUES ('b', 2)")
+        conn.execute("INSERT INTO t (k, v) VALUES ('a', 3)")
+
+    writer.call(partial)
+    writer.execute("INSERT INTO t (k, v) VALUES ('c', 4)")
+    gate.set()
+    writer.flush()
+    assert rows(path) == {"a": 1, "c": 4}
+    assert close_within(writer)
+
+
+def test_open_error_is_raised_from_constructor(tmp_path):
+    with pytest.raises(sqlite3.OperationalError):
+        SQLiteWriter(str(tmp_path / "tidak-ada" / "db.sqlite"), SCHEMA)
+
+
+def test_schema_error_is_raised_from_constructor(tmp_path):
+    with pytest.raises(sqlite3.Error):
+        SQLiteWriter(str(tmp_path / "db.sqlite"), "CREATE TABEL rusak;")
+
+
+def test_bounded_queue_offer(tmp_path):
+    writer = SQLiteWriter(str(tmp_path / "db.sqlite"), SCHEMA, queue_size=2)
+    started, gate = threading.Event(), threading.Event()
+    writer.call(lambda conn: started.set() or gate.wait())
+    # Operasi pertama sudah diambil thread penulis: antrian kosong
+    started.wait(5)
+    accepted = [writer.offer(lambda conn: None) for _ in range(5)]
+    gate.set()
+    writer.flush()
+    assert accepted == [True, True, False, False, False]
+    assert writer.full() is False
+    assert close_within(writer)
@@ -0,0 +1,191 @@
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from downloads import DONE, PAUSED, RUNNING, Download, DownloadManager
+
+KB = 1024
+_RANGE = re.compile(r"bytes=(\d+)-$")
+
+
+def content(seed, size):
+    return random.Random(seed).randbytes(size)
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    """Menyajikan server.files dengan Range/If-Range dan mencatat setiap permintaan."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        file = server.files[self.path]
+        data, etag = file["data"], file["etag"]
+        record = {"range": self.headers.get("Range"), "if_range": self.headers.get("If-Range")}
+        match = _RANGE.match(record["range"] or "")
+        start = 0
+        if match and (record["if_range"] is None or record["if_range"] == etag):
+            start = int(match.group(1))
+            if start >= len(data):
+                record["status"] = 416
+                server.requests.append(record)
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            record["status"] = 206
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        else:
+            record["status"] = 200
+            self.send_response(200)
+        server.requests.append(record)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.send_header("ETag", etag)
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        pos = start
+        while pos < len(data):
+            end = min(len(data), pos + 16 * KB)
+            if file["drop_after"] and pos < file["drop_after"][0] <= end:
+                # Koneksi putus; versi baru (jika ada) menggantikan file di server
+                end = file["drop_after"].pop(0)
+                self.wfile.write(data[pos:end])
+                server.sent += end - pos
+                if file["next"]:
+                    file["data"], file["etag"] = file["next"]
+                    file["next"] = None
+                self.close_connection = True
+                return
+            if file["delay"]:
+                time.sleep(file["delay"])
+            self.wfile.write(data[pos:end])
+            server.sent += end - pos
+            pos = end
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+    httpd.daemon_threads = True
+    httpd.files = {}
+    httpd.requests = []
+    httpd.sent = 0
+    httpd.base = "http://127.0.0.1:%d" % httpd.server_address[1]
+
+    def add(path, data, etag='"v1"', delay=0.0, drop_after=(), next=None):
+        httpd.files[path] = {"data": data, "etag": etag, "delay": delay, "drop_after": list(drop_after),
+                             "next": next}
+        return httpd.base + path
+
+    httpd.add = add
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_max_parallel_is_respected(server, tmp_path):
+    peak = []
+    mgr = DownloadManager(str(tmp_path), max_parallel=2, retry_delay=0.01)
+    mgr.on_change = lambda d: peak.append(mgr.stats()[RUNNING])
+    files = [content(i, 256 * KB) for i in range(6)]
+    # ~0.1 detik per file agar transfer saling tumpang tindih
+    urls = [server.add(f"/f{i}.bin", data, delay=0.005) for i, data in enumerate(files)]
+    downloads = [mgr.add(url) for url in urls]
+    assert mgr.wait(30)
+    assert max(peak) == 2
+    assert [d.state for d in downloads] == [DONE] * 6
+    assert [read(d.path) for d in downloads] == files
+    mgr.close()
+
+
+def test_dropped_connection_resumes_with_range(server, tmp_path):
+    data = content(1, 512 * KB)
+    url = server.add("/resume.bin", data, drop_after=[200 * KB, 400 * KB])
+    mgr = DownloadManager(str(tmp_path), retry_delay=0.01)
+    download = mgr.add(url)
+    assert mgr.wait(30)
+    assert download.state == DONE and read(download.path) == data
+    assert [r["range"] for r in server.requests] == [None, f"bytes={200 * KB}-", f"bytes={400 * KB}-"]
+    assert [r["if_range"] for r in server.requests[1:]] == ['"v1"', '"v1"']
+    assert [r["status"] for r in server.requests] == [200, 206, 206]
+    # Tidak ada byte yang diunduh dua kali
+    assert server.sent == len(data)
+    assert not os.path.exists(download.part_path)
+    mgr.close()
+
+
+def test_changed_validator_restarts_from_zero(server, tmp_path):
+    old, new = content(1, 512 * KB), content(2, 384 * KB)
+    url = server.add("/changed.bin", old, drop_after=[200 * KB], next=(new, '"v2"'))
+    mgr = DownloadManager(str(tmp_path), retry_delay=0.01)
+    download = mgr.add(url)
+    assert mgr.wait(30)
+    # Range dikirim dengan If-Range lama; server menjawab 200 dengan isi baru
+    assert server.requests[1]["range"] == f"bytes={200 * KB}-"
+    assert server.requests[1]["if_range"] == '"v1"'
+    assert server.requests[1]["status"] == 200
+    assert download.state == DONE and read(download.path) == new
+    assert download.total == len(new) and download.validator == '"v2"'
+    mgr.close()
+
+
+def test_416_on_complete_part_finishes(server, tmp_path):
+    data = content(1, 256 * KB)
+    url = server.add("/done.bin", data)
+    # Unduhan dijeda setelah byte terakhir ditulis tetapi sebelum diganti nama
+    saved = Download(1, url, directory=str(tmp_path))
+    saved.path = str(tmp_path / "done.bin")
+    saved.state = PAUSED
+    saved.total = len(data)
+    saved.resumable = True
+    saved.validator = '"v1"'
+    with open(saved.part_path, 'wb') as f:
+        f.write(data)
+    state = tmp_path / "downloads.json"
+    state.write_text(json.dumps([saved.to_json()]))
+
+    mgr = DownloadManager(str(tmp_path), state_path=str(state), retry_delay=0.01)
+    download = mgr.get(1)
+    assert download.received == len(data)
+    mgr.resume(1)
+    assert mgr.wait(30)
+    assert [(r["range"], r["status"]) for r in server.requests] == [(f"bytes={len(data)}-", 416)]
+    assert server.sent == 0
+    assert download.state == DONE and read(download.path) == data
+    assert not os.path.exists(download.part_path)
+    mgr.close()
+
+
+def test_progress_reports_are_bounded(server, tmp_path):
+    data = content(1, 8192 * KB)
+    url = server.add("/big.bin", data)
+    interval = 0.1
+    reports = []
+    mgr = DownloadManager(str(tmp_path), progress_interval=interval, on_change=reports.append,
+                          retry_delay=0.01)
+    start = time.monotonic()
+    download = mgr.add(url)
+    assert mgr.wait(30)
+    elapsed = time.monotonic() - start
+    # close() menunggu thread pekerja, termasuk laporan terakhirnya
+    mgr.close()
+    assert download.state == DONE and read(download.path) == data
+    # Selain laporan berkala: antri, mulai, respons pertama dan selesai
+    assert len(reports) <= elapsed / interval + 4
+    assert mgr.reports == len(reports) < mgr.chunks
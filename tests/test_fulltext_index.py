@@ -0,0 +1,79 @@
+import threading
+
+from fulltext_index import FullTextIndex, fts_query, make_snippet
+
+
+def close_within(index, seconds=5):
+    thread = threading.Thread(target=index.close, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    return not thread.is_alive()
+
+
+def test_index_and_search(tmp_path):
+    index = FullTextIndex(str(tmp_path / "fulltext.sqlite"))
+    index.submit("https://a.example/", "Resep rendang", "Daging dimasak lama dengan santan dan rempah.")
+    index.submit("https://b.example/", "Cuaca", "Hujan deras turun sepanjang sore.")
+    index.flush()
+    results = index.search("santan")
+    assert [r.url for r in results] == ["https://a.example/"]
+    assert "\x02santan\x03" in results[0].snippet
+    assert [r.url for r in index.search("huj*")] == ["https://b.example/"]
+    assert index.count() == 2
+    assert close_within(index)
+
+
+def test_title_outranks_body(tmp_path):
+    index = FullTextIndex(str(tmp_path / "fulltext.sqlite"))
+    index.submit("https://body.example/", "Lain", "kopi " + "teks " * 50)
+    index.submit("https://title.example/", "Kopi", "teks " * 50)
+    index.flush()
+    assert index.search("kopi")[0].url == "https://title.example/"
+    index.close()
+
+
+def test_unchanged_page_is_skipped_and_changed_page_replaced(tmp_path):
+    index = FullTextIndex(str(tmp_path / "fulltext.sqlite"))
+    index.submit("https://a.example/", "Judul", "isi lama")
+    index.submit("https://a.example/", "Judul", "isi  lama")
+    index.submit("https://a.example/", "Judul", "isi baru")
+    index.flush()
+    assert index.unchanged == 1
+    assert index.count() == 1
+    assert index.search("lama") == []
+    assert len(index.search("baru")) == 1
+    index.close()
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    index = FullTextIndex(str(tmp_path / "fulltext.sqlite"), queue_size=2)
+    started, gate = threading.Event(), threading.Event()
+    index.writer.call(lambda conn: started.set() or gate.wait())
+    started.wait(5)
+    accepted = [index.submit(f"https://a.example/{n}", "t", "isi") for n in range(5)]
+    gate.set()
+    index.flush()
+    assert accepted == [True, True, False, False, False]
+    assert index.dropped == 3 and index.count() == 2
+    index.close()
+
+
+def test_failed_write_before_close_does_not_hang(tmp_path):
+    index = FullTextIndex(str(tmp_path / "fulltext.sqlite"))
+    gate = threading.Event()
+    index.writer.call(lambda conn: gate.wait())
+    index.submit("https://a.example/", "t", "isi")
+    index.writer.execute("INSERT INTO docs (url, hash, indexed) VALUES ('https://a.example/', 'x', 0)")
+    closer = threading.Thread(target=index.close, daemon=True)
+    closer.start()
+    gate.set()
+    closer.join(5)
+    assert not closer.is_alive()
+    assert index.error is not None
+
+
+def test_query_helpers():
+    assert fts_query('kata "kutip" awal*') == '"kata" "kutip" "awal"*'
+    assert fts_query("  ") == ""
+    snippet = make_snippet("satu dua tiga empat", "tiga")
+    assert snippet == "satu dua \x02tiga\x03 empat"
@@ -0,0 +1,86 @@
+from memory_monitor import (CLEAR_CACHES, NORMAL, REFUSE_PREWARM, RELEASE_TABS, MemoryMonitor, MemorySample,
+                            SyntheticPressure, estimate_tab_memory, pressure_stage, read_meminfo, read_psi,
+                            render_memory_page)
+
+
+def monitor(**kwargs):
+    source = SyntheticPressure()
+    changes = []
+    mon = MemoryMonitor(lambda old, new, sample: changes.append((old, new)), source, **kwargs)
+    return mon, source, changes
+
+
+def run(mon, source, ramp):
+    stages = []
+    for pct in ramp:
+        source.set(available_pct=pct)
+        stages.append(mon.check())
+    return stages
+
+
+def test_pressure_stage_thresholds():
+    def stage(pct, psi=None):
+        return pressure_stage(MemorySample(1000, pct * 10, psi))
+    assert [stage(pct) for pct in (60, 20, 19, 10, 9, 5, 4)] == [0, 0, 1, 1, 2, 2, 3]
+    # PSI menaikkan tahap walaupun memori tersedia masih banyak
+    assert [stage(60, psi) for psi in (None, 9.9, 10, 25, 50)] == [0, 0, 1, 2, 3]
+    assert stage(15, 50) == REFUSE_PREWARM
+
+
+def test_stage_rises_at_once_and_recovers_after_calm_samples():
+    mon, source, changes = monitor()
+    ramp = [60, 30, 18, 15, 9, 8, 4, 3, 12, 12, 12, 25, 25, 25, 60]
+    assert run(mon, source, ramp) == [0, 0, 1, 1, 2, 2, 3, 3, 3, 3, 1, 1, 1, 0, 0]
+    assert changes == [(0, 1), (1, 2), (2, 3), (3, 1), (1, 0)]
+    assert mon.stats()["entered"] == {"sedang": 1, "tinggi": 1, "kritis": 1}
+    assert mon.samples == len(ramp)
+
+
+def test_jump_enters_every_stage_once_with_one_reaction():
+    mon, source, changes = monitor()
+    assert run(mon, source, [3]) == [REFUSE_PREWARM]
+    assert changes == [(NORMAL, REFUSE_PREWARM)]
+    assert mon.entered[CLEAR_CACHES:] == [1, 1, 1]
+
+
+def test_pressure_in_between_resets_recovery():
+    mon, source, changes = monitor(recover_samples=3)
+    # Sampel sibuk di tengah pemulihan: hitungan tenang mulai dari nol lagi
+    assert run(mon, source, [8, 60, 60, 8, 60, 60]) == [RELEASE_TABS] * 6
+    assert run(mon, source, [60]) == [NORMAL]
+    assert changes == [(NORMAL, RELEASE_TABS), (RELEASE_TABS, NORMAL)]
+
+
+def test_events_are_capped():
+    mon, source, changes = monitor(recover_samples=1)
+    run(mon, source, [3, 60] * 40)
+    assert len(changes) == 80
+    assert len(mon.events) == 50
+    assert [e[1:] for e in mon.events[-2:]] == [(NORMAL, REFUSE_PREWARM), (REFUSE_PREWARM, NORMAL)]
+
+
+def test_read_meminfo_and_psi(tmp_path):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16000 kB\nMemFree:  100 kB\nMemAvailable:    4000 kB\n")
+    assert read_meminfo(str(meminfo)) == (16000, 4000)
+    psi = tmp_path / "memory"
+    psi.write_text("some avg10=12.50 avg60=3.00 avg300=1.00 total=1\n"
+                   "full avg10=0.75 avg60=0.00 avg300=0.00 total=0\n")
+    assert read_psi(str(psi)) == (12.5, 0.75)
+    assert read_psi(str(tmp_path / "tidak-ada")) == (None, None)
+
+
+def test_estimate_tab_memory():
+    estimates = estimate_tab_memory(900, {"a": ["t1", "t2"], "b": ["t3"], "kosong": []})
+    assert estimates == {"t1": 225, "t2": 225, "t3": 450}
+    assert estimate_tab_memory(900, {}) == {}
+
+
+def test_render_memory_page():
+    mon, source, changes = monitor()
+    assert "Belum ada sampel" in render_memory_page(mon, [])
+    run(mon, source, [8])
+    html = render_memory_page(mon, [("<judul>", "https://a.example/", "hidup", 2048)])
+    assert "Tekanan: tinggi" in html and "&lt;judul&gt;" in html and "2.0 MB" in html
+    # Merender halaman tidak mengambil sampel baru
+    assert mon.samples == 1 and changes == [(NORMAL, RELEASE_TABS)]
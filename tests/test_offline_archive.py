@@ -0,0 +1,101 @@
+import os
+import time
+
+from offline_archive import MAX_VERSIONS, OfflineArchive, archive_key, archive_uri
+
+
+def blob_files(archive):
+    return sorted(name for _, _, files in os.walk(archive.blob_dir) for name in files)
+
+
+def stored(archive, url, title, data):
+    results = []
+    archive.store(url, title, data, lambda page, new: results.append((page, new)))
+    archive.flush()
+    return results[0]
+
+
+def test_store_and_lookup(tmp_path):
+    archive = OfflineArchive(str(tmp_path), 0)
+    page, new = stored(archive, "https://a.example/x?q=1#bagian", "Judul", b"isi")
+    assert new and page.url == "https://a.example/x?q=1" and page.size == 3
+    # Fragmen tidak ikut kunci
+    assert archive.get("https://a.example/x?q=1") is page
+    assert archive.get("https://a.example/x?q=1#lain") is page
+    assert archive.get("https://a.example/x") is None
+    assert archive.read("https://a.example/x?q=1#bagian") == b"isi"
+    assert archive.read("https://b.example/") is None
+    archive.close()
+
+
+def test_same_content_shares_one_blob(tmp_path):
+    archive = OfflineArchive(str(tmp_path), 0)
+    assert stored(archive, "https://a.example/", "A", b"sama")[1] is True
+    assert stored(archive, "https://b.example/", "B", b"sama")[1] is False
+    assert stored(archive, "https://a.example/", "A lagi", b"sama")[1] is False
+    assert len(blob_files(archive)) == 1
+    page = archive.get("https://a.example/")
+    assert page.versions == 1 and page.title == "A lagi"
+    assert archive.stats()["bytes"] == 4
+    archive.close()
+
+
+def test_old_versions_are_capped(tmp_path):
+    archive = OfflineArchive(str(tmp_path), 0)
+    for n in range(MAX_VERSIONS + 3):
+        stored(archive, "https://a.example/", "A", f"versi {n}".encode())
+    page = archive.get("https://a.example/")
+    assert page.versions == MAX_VERSIONS
+    assert archive.read("https://a.example/") == f"versi {MAX_VERSIONS + 2}".encode()
+    assert len(blob_files(archive)) == MAX_VERSIONS
+    archive.close()
+
+
+def test_lru_prune_keeps_recently_read(tmp_path):
+    archive = OfflineArchive(str(tmp_path), 250)
+    for name in ("a", "b"):
+        stored(archive, f"https://{name}.example/", name, name.encode() * 100)
+        time.sleep(0.01)
+    archive.read("https://a.example/")
+    archive.flush()
+    time.sleep(0.01)
+    stored(archive, "https://c.example/", "c", b"c" * 100)
+    assert archive.stats()["bytes"] <= 250
+    assert archive.get("https://b.example/") is None
+    assert archive.get("https://a.example/") is not None
+    assert archive.get("https://c.example/") is not None
+    assert archive.stats()["pruned_blobs"] == 1
+    archive.close()
+
+
+def test_remove_drops_unused_blob_only(tmp_path):
+    archive = OfflineArchive(str(tmp_path), 0)
+    stored(archive, "https://a.example/", "A", b"sama")
+    stored(archive, "https://b.example/", "B", b"sama")
+    stored(archive, "https://c.example/", "C", b"lain")
+    archive.remove("https://a.example/")
+    archive.remove("https://c.example/")
+    archive.flush()
+    assert archive.get("https://a.example/") is None
+    assert archive.read("https://b.example/") == b"sama"
+    assert len(blob_files(archive)) == 1
+    archive.close()
+
+
+def test_reopen_restores_latest(tmp_path):
+    archive = OfflineArchive(str(tmp_path), 0)
+    stored(archive, "https://a.example/", "A", b"satu")
+    stored(archive, "https://a.example/", "A2", b"dua")
+    stored(archive, "https://b.example/", "B", b"tiga")
+    archive.close()
+    reopened = OfflineArchive(str(tmp_path), 0)
+    assert sorted(p.url for p in reopened.pages()) == ["https://a.example/", "https://b.example/"]
+    page = reopened.get("https://a.example/")
+    assert page.title == "A2" and page.versions == 2
+    assert reopened.read("https://a.example/") == b"dua"
+    reopened.close()
+
+
+def test_archive_uri():
+    assert archive_key("https://a.example/p?x=1#f") == "https://a.example/p?x=1"
+    assert archive_uri("https://a.example/p?x=1#f") == "asg://offline/page?url=https%3A%2F%2Fa.example%2Fp%3Fx%3D1"
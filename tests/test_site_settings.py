@@ -0,0 +1,53 @@
+import pytest
+
+gi = pytest.importorskip("gi")
+try:
+    gi.require_version('WebKit2', '4.1')
+    from gi.repository import WebKit2
+except (ValueError, ImportError):
+    pytest.skip("WebKit2 4.1 tidak tersedia", allow_module_level=True)
+
+from internal_pages import InternalPages
+from profiles import SiteSettings
+from reader_mode import ReaderMode
+from site_policy import PolicyStore, SitePolicy
+
+
+class FakeWebView:
+    """Cukup untuk SiteSettings.apply tanpa display."""
+
+    def __init__(self, settings):
+        self.settings = settings
+
+    def get_settings(self):
+        return self.settings
+
+    def set_settings(self, settings):
+        self.settings = settings
+
+
+@pytest.fixture
+def site_settings(tmp_path):
+    store = PolicyStore(str(tmp_path / "site_policies.json"))
+    store.set_rule("*.lambat.example", SitePolicy(javascript=False))
+    return SiteSettings(store, WebKit2.Settings(), str(tmp_path / "filters"))
+
+
+def test_reader_settings_survive_reader_load(site_settings, tmp_path):
+    reader = ReaderMode(str(tmp_path), InternalPages(), site_settings.settings)
+    view = FakeWebView(reader.settings)
+    site_settings.apply(view, "asg://reader?id=1")
+    assert view.settings is reader.settings
+    assert not view.settings.get_enable_javascript_markup()
+    assert not view.settings.get_enable_webgl()
+    assert view.settings.get_media_playback_requires_user_gesture()
+
+
+def test_policy_applies_to_web_pages(site_settings):
+    view = FakeWebView(site_settings.settings)
+    site_settings.apply(view, "https://berita.lambat.example/artikel")
+    assert view.settings is not site_settings.settings
+    assert not view.settings.get_enable_javascript()
+    site_settings.apply(view, "https://lain.example/")
+    assert view.settings is site_settings.settings
+    assert site_settings.applied == 1
@@ -0,0 +1,84 @@
+"""Penggabungan pembaruan UI dari sinyal WebView.
+
+Sinyal progress, judul, URI dan status loading dari semua tab hanya
+mencatat perubahan ke TabState lalu menandai tab itu kotor. Sekali per
+frame (tick callback frame clock) perubahan diterapkan: label judul untuk
+tab yang berubah, sedangkan toolbar & progress bar hanya untuk tab yang
+sedang terlihat.
+"""
+PROGRESS = 1
+TITLE = 2
+URI = 4
+LOADING = 8
+ALL = PROGRESS | TITLE | URI | LOADING
+
+_FLAGS = {"progress": PROGRESS, "title": TITLE, "uri": URI, "loading": LOADING}
+
+
+class TabState:
+    __slots__ = ("progress", "title", "uri", "loading", "dirty")
+
+    def __init__(self):
+        self.progress = 0.0
+        self.title = ""
+        self.uri = ""
+        self.loading = False
+        self.dirty = 0
+
+
+class UIScheduler:
+    def __init__(self, widget, get_visible, apply_tab, apply_visible):
+        """apply_tab(tab, state, flags) untuk widget milik tab itu sendiri,
+        apply_visible(tab, state, flags) untuk widget bersama (toolbar)."""
+        self.widget = widget
+        self.get_visible = get_visible
+        self.apply_tab = apply_tab
+        self.apply_visible = apply_visible
+        self._dirty = {}
+        self._tick_id = None
+
+        # Penghitung untuk mengukur penghematan
+        self.signals_received = 0
+        self.updates_applied = 0
+        self.frames = 0
+
+    def update(self, tab, field, value):
+        self.signals_received += 1
+        state = tab.ui_state
+        if getattr(state, field) == value:
+            return
+        setattr(state, field, value)
+        self.mark(tab, _FLAGS[field])
+
+    def mark(self, tab, flags=ALL):
+        tab.ui_state.dirty |= flags
+        self._dirty[tab] = None
+        if self._tick_id is None:
+            self._tick_id = self.widget.add_tick_callback(self._on_tick)
+
+    def forget(self, tab):
+        self._dirty.pop(tab, None)
+
+    def _on_tick(self, widget, frame_clock):
+        self._tick_id = None
+        self.flush()
+        return False
+
+    def flush(self):
+        """Menerapkan semua perubahan yang tertunda sekarang juga."""
+        tabs, self._dirty = self._dirty, {}
+        visible = self.get_visible()
+        self.frames += 1
+        for tab in tabs:
+            state = tab.ui_state
+            flags, state.dirty = state.dirty, 0
+            self.updates_applied += self.apply_tab(tab, state, flags)
+            if tab is visible:
+                self.updates_applied += self.apply_visible(tab, state, flags)
+
+    def stats(self):
+        return {
+            "signals_received": self.signals_received,
+            "updates_applied": self.updates_applied,
+            "frames": self.frames,
+        }